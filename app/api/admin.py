@@ -6,16 +6,12 @@ import os
 
 from app.db.database import get_db, SessionLocal
 from scripts.calculate_scores import (
+    SCORE_CATEGORIES,
     calculate_all_scores,
-    calculate_participation_scores,
-    calculate_legislation_scores,
-    calculate_speech_scores,
-    calculate_voting_scores,
-    calculate_cooperation_scores,
-    calculate_overall_scores,
-    update_tiers,
-    update_rankings
+    calculate_category_scores,
+    finalize_scores
 )
+from app.services.stats_snapshot_service import rebuild_stats_snapshot, refresh_stats_snapshot
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 templates = Jinja2Templates(directory="app/templates")
@@ -57,86 +53,90 @@ async def admin_dashboard(request: Request, db: Session = Depends(get_db)):
     """관리자 대시보드 페이지"""
     return templates.TemplateResponse("admin/dashboard.html", {"request": request})
 
+@router.get("/score-status")
+async def api_score_status(db: Session = Depends(get_db)):
+    """
+    카테고리별 점수 최신 여부 조회 (원본 데이터가 바뀌어 다시 계산해야 하는 카테고리와 사유)
+    """
+    from app.services.data_version_service import get_stale_categories
+    
+    stale = get_stale_categories(db, list(SCORE_CATEGORIES))
+    return {
+        category: {"stale": category in stale, "reason": stale.get(category)}
+        for category in SCORE_CATEGORIES
+    }
+
+@router.get("/cache-status")
+async def api_cache_status():
+    """
+    메모리 캐시(공유 값, 화면 캐시)별 적중/미적중 횟수와 적중률 조회
+    """
+    from app.services.shared_cache import get_shared_cache_stats
+    from app.utils.page_cache import get_page_cache
+    
+    page_cache = get_page_cache()
+    return {
+        "shared_values": get_shared_cache_stats(),
+        "page_cache": dict(page_cache.stats, entries=len(page_cache.entries)) if page_cache else None
+    }
+
 async def calculate_scores_task(category: Optional[str] = None, force: bool = False):
     """
     백그라운드에서 실행될 점수 계산 작업
     
+    원본 데이터가 바뀐 카테고리만 병렬로 다시 계산하고, 하나라도 계산했으면 종합 점수/티어/순위를 갱신
+    
     Args:
-        category: 계산할 카테고리
-        force: 강제 재계산 여부
+        category: 계산할 카테고리 (None이면 전체)
+        force: 강제 재계산 여부 (데이터 변경 여부 무시)
     """
+    from app.services.data_version_service import get_stale_categories
+    
     db = SessionLocal()
     try:
-        if category:
-            # 특정 카테고리만 계산
-            if category == "participation":
-                need_update = check_data_changes(db, category) or force
-                if need_update:
-                    print("참여 점수 계산 시작...")
-                    calculate_participation_scores(db)
-            elif category == "legislation":
-                need_update = check_data_changes(db, category) or force
-                if need_update:
-                    print("입법활동 점수 계산 시작...")
-                    calculate_legislation_scores(db)
-            elif category == "speech":
-                need_update = check_data_changes(db, category) or force
-                if need_update:
-                    print("의정발언 점수 계산 시작...")
-                    calculate_speech_scores(db)
-            elif category == "voting":
-                need_update = check_data_changes(db, category) or force
-                if need_update:
-                    print("표결 책임성 점수 계산 시작...")
-                    calculate_voting_scores(db)
-            elif category == "cooperation":
-                need_update = check_data_changes(db, category) or force
-                if need_update:
-                    print("협치/초당적 활동 점수 계산 시작...")
-                    calculate_cooperation_scores(db)
-            elif category == "overall":
-                print("종합 점수 계산 시작...")
-                calculate_overall_scores(db)
-                update_tiers(db)
-                update_rankings(db)
-            else:
-                print(f"알 수 없는 카테고리: {category}")
-                return
-            
-            # 개별 카테고리 계산 후 종합 점수 자동 업데이트
-            if category != "overall":
-                print("종합 점수 업데이트...")
-                calculate_overall_scores(db)
-                update_tiers(db)
-                update_rankings(db)
-        else:
-            # 전체 점수 계산
+        if category == "overall":
+            print("종합 점수 계산 시작...")
+            finalize_scores(db)
+            rebuild_stats_snapshot(db)
+            print("점수 계산 완료!")
+            return
+        
+        if category and category not in SCORE_CATEGORIES:
+            print(f"알 수 없는 카테고리: {category}")
+            return
+        
+        categories = [category] if category else list(SCORE_CATEGORIES)
+        if not category:
             print("전체 점수 계산 시작...")
-            any_update = False
-            
-            # 각 카테고리별 데이터 변경 확인 및 계산
-            for cat in ["participation", "legislation", "speech", "voting", "cooperation"]:
-                need_update = check_data_changes(db, cat) or force
-                if need_update:
-                    any_update = True
-                    if cat == "participation":
-                        calculate_participation_scores(db)
-                    elif cat == "legislation":
-                        calculate_legislation_scores(db)
-                    elif cat == "speech":
-                        calculate_speech_scores(db)
-                    elif cat == "voting":
-                        calculate_voting_scores(db)
-                    elif cat == "cooperation":
-                        calculate_cooperation_scores(db)
-            
-            # 데이터 변경이 있거나 강제 재계산인 경우에만 종합 점수 계산
-            if any_update or force:
-                calculate_overall_scores(db)
-                update_tiers(db)
-                update_rankings(db)
-            else:
-                print("변경된 데이터가 없습니다. 점수 계산을 건너뜁니다.")
+        
+        # 원본 데이터가 바뀐 카테고리 확인
+        if force:
+            stale = {cat: "강제 재계산" for cat in categories}
+        else:
+            stale = get_stale_categories(db, categories)
+        
+        for cat in categories:
+            if cat in stale:
+                print(f"{SCORE_CATEGORIES[cat][0]} 점수 계산 시작... (사유: {stale[cat]})")
+        
+        # 다시 계산할 카테고리는 병렬로 계산하여 한 번에 저장
+        if stale:
+            calculate_category_scores(db, [cat for cat in categories if cat in stale])
+        
+        skipped = [SCORE_CATEGORIES[cat][0] for cat in categories if cat not in stale]
+        if skipped:
+            print(f"원본 데이터 변경이 없어 건너뜀: {', '.join(skipped)}")
+        
+        # 다시 계산한 카테고리가 있는 경우에만 종합 점수 갱신
+        if stale:
+            print("종합 점수 업데이트...")
+            finalize_scores(db)
+            rebuild_stats_snapshot(db)
+        else:
+            print("변경된 데이터가 없습니다. 점수 계산을 건너뜁니다.")
+            # 재산/위원회 등 점수와 무관한 통계 원본이 바뀐 경우에만 스냅샷 재생성
+            if refresh_stats_snapshot(db):
+                print("통계 원본 데이터 변경으로 스냅샷을 재생성했습니다.")
         
         print("점수 계산 완료!")
     except Exception as e:
@@ -150,6 +150,9 @@ def check_data_changes(db: Session, category: str) -> bool:
     """
     특정 카테고리와 관련된 데이터 변경 여부 확인
     
+    카테고리가 마지막 계산에 사용한 원본 테이블 버전과 현재 버전을 비교
+    (data_version_service 참고)
+    
     Args:
         db: 데이터베이스 세션
         category: 점수 카테고리
@@ -157,80 +160,13 @@ def check_data_changes(db: Session, category: str) -> bool:
     Returns:
         데이터 변경 여부 (True: 변경됨, False: 변경 없음)
     """
-    from app.models.legislator import Legislator
-    from app.models.bill import Bill, BillCoProposer
-    from app.models.attendance import Attendance
-    from app.models.vote import Vote, VoteResult
-    from app.models.speech import SpeechKeyword, SpeechByMeeting
+    from app.services.data_version_service import get_stale_categories
     
-    try:
-        # 전체 의원 수 (기준값)
-        total_legislators = db.query(Legislator).count()
-        
-        if category == "participation":
-            # 출석 데이터 확인
-            attendance_count = db.query(Attendance).count()
-            # 의원별 점수가 모두 계산되었는지 확인
-            calculated_count = db.query(Legislator).filter(
-                Legislator.participation_score != None
-            ).count()
-            
-            # 의원 수와 계산된 점수 수가 다르거나, 출석 데이터가 0인 경우 변경으로 판단
-            return calculated_count < total_legislators or attendance_count == 0
-            
-        elif category == "legislation":
-            # 법안 데이터 확인
-            bill_count = db.query(Bill).count()
-            co_proposer_count = db.query(BillCoProposer).count()
-            
-            # 점수가 계산된 의원 수 확인
-            calculated_count = db.query(Legislator).filter(
-                Legislator.legislation_score != None
-            ).count()
-            
-            # 의원 수와 계산된 점수 수가 다르거나, 법안 데이터가 0인 경우 변경으로 판단
-            return calculated_count < total_legislators or bill_count == 0
-            
-        elif category == "speech":
-            # 발언 데이터 확인
-            speech_count = db.query(SpeechByMeeting).count()
-            keyword_count = db.query(SpeechKeyword).count()
-            
-            # 점수가 계산된 의원 수 확인
-            calculated_count = db.query(Legislator).filter(
-                Legislator.speech_score != None
-            ).count()
-            
-            # 의원 수와 계산된 점수 수가 다르거나, 발언 데이터가 0인 경우 변경으로 판단
-            return calculated_count < total_legislators or speech_count == 0
-            
-        elif category == "voting":
-            # 표결 데이터 확인
-            vote_count = db.query(Vote).count()
-            vote_result_count = db.query(VoteResult).count()
-            
-            # 점수가 계산된 의원 수 확인
-            calculated_count = db.query(Legislator).filter(
-                Legislator.voting_score != None
-            ).count()
-            
-            # 의원 수와 계산된 점수 수가 다르거나, 표결 데이터가 0인 경우 변경으로 판단
-            return calculated_count < total_legislators or vote_count == 0
-            
-        elif category == "cooperation":
-            # 공동발의 데이터 확인
-            co_proposer_count = db.query(BillCoProposer).count()
-            
-            # 점수가 계산된 의원 수 확인
-            calculated_count = db.query(Legislator).filter(
-                Legislator.cooperation_score != None
-            ).count()
-            
-            # 의원 수와 계산된 점수 수가 다르거나, 공동발의 데이터가 0인 경우 변경으로 판단
-            return calculated_count < total_legislators or co_proposer_count == 0
-            
+    if category not in SCORE_CATEGORIES:
         return False  # 기본값: 변경 없음
-        
+    
+    try:
+        return category in get_stale_categories(db, [category])
     except Exception as e:
         print(f"데이터 변경 확인 중 오류 발생: {str(e)}")
-        return True  # 오류 발생 시 안전하게 변경됨으로 간주
\ No newline at end of file
+        return True  # 오류 발생 시 안전하게 변경됨으로 간주
@@ -114,6 +114,9 @@ async def champion_detail(
         co_bills_data = bill_service.get_co_sponsored_bills(db, legislator_id)
         tab_data["co_bills"] = co_bills_data["bills"]
         tab_data["co_bills_count"] = co_bills_data["total_count"]
+        # 함께 가장 많이 공동발의한 의원
+        from app.services import cooperation_service
+        tab_data["top_collaborators"] = cooperation_service.get_top_collaborators(db, legislator_id)
     elif tab == "asset_detail":
         return RedirectResponse(url=f"/misc-ranking/asset/detail/{legislator_id}")
     
@@ -1,13 +1,10 @@
 from fastapi import APIRouter, Depends, Request
-from sqlalchemy import func
 from sqlalchemy.orm import Session
 from typing import Optional
 from fastapi.templating import Jinja2Templates
 
 from app.db.database import get_db
-from app.models.legislator import Legislator
-from app.models.committee import Committee
-from app.services import stats_service, chart_service
+from app.services import stats_service, stats_snapshot_service, chart_service
 from app.services.get_asset_details import get_legislator_asset_details
 
 templates = Jinja2Templates(directory="app/templates")
@@ -25,11 +22,10 @@ async def misc_ranking_home(request: Request, db: Session = Depends(get_db)):
     Returns:
         템플릿 렌더링 응답
     """
-    # 정당별 평균 재산 조회
-    party_asset_stats = stats_service.get_party_average_stats(db, stat='asset')
-    
-    # 초선/재선별 평균 점수 조회
-    term_score_stats = stats_service.get_term_average_stats(db, stat='overall_score')
+    # 정당별 평균 재산, 초선/재선별 평균 점수 조회 (통계 스냅샷)
+    snapshot = stats_snapshot_service.get_stats_snapshot(db, "party_asset_stats", "term_score_stats")
+    party_asset_stats = snapshot["party_asset_stats"]
+    term_score_stats = snapshot["term_score_stats"]
     
     # 차트 데이터 생성
     party_asset_chart = chart_service.generate_party_asset_chart_data(party_asset_stats)
@@ -60,24 +56,13 @@ async def party_ranking(request: Request, db: Session = Depends(get_db), party_n
     Returns:
         템플릿 렌더링
     """
-    # 정당별 인원수로 정렬된 정당 목록 조회
-    party_counts_query = db.query(
-        Legislator.poly_nm,
-        func.count(Legislator.id).label("count")
-    ).group_by(
-        Legislator.poly_nm
-    ).order_by(
-        func.count(Legislator.id).desc()
-    ).all()
-    
-    # 정당명만 추출
-    parties = [party_name for party_name, count in party_counts_query if party_name]
-    
-    # 정당별 평균 종합점수 조회 (항상 필요)
-    party_scores = stats_service.get_party_average_scores(db)
-    
-    # 정당별 평균 대표발의안수 조회 (항상 필요)
-    party_bills = stats_service.get_party_average_bill_counts(db)
+    # 정당 목록(인원수 순), 정당별 평균 종합점수/대표발의안수, 정당 통계 요약 조회 (통계 스냅샷)
+    snapshot = stats_snapshot_service.get_stats_snapshot(
+        db, "parties", "party_scores", "party_bills", "party_stats_summary"
+    )
+    parties = snapshot["parties"]
+    party_scores = snapshot["party_scores"]
+    party_bills = snapshot["party_bills"]
     
     # 차트 데이터 생성 (항상 필요)
     scores_chart = chart_service.generate_party_scores_chart_data(party_scores)
@@ -104,8 +89,8 @@ async def party_ranking(request: Request, db: Session = Depends(get_db), party_n
                 {"request": request, "message": f"'{party_name}'이라는 정당을 찾을 수 없습니다."}
             )
         
-        # 정당 통계 요약 조회
-        party_stats = stats_service.get_party_stats_summary(db, party_name)
+        # 정당 통계 요약
+        party_stats = snapshot["party_stats_summary"][party_name]
         
         # 정당 소속 의원 목록 조회
         legislators = stats_service.get_legislators_by_party(db, party_name)
@@ -132,15 +117,13 @@ async def committee_ranking(request: Request, db: Session = Depends(get_db), com
     Returns:
         템플릿 렌더링 응답
     """
-    # 위원회 목록 미리 조회 (공통)
-    committee_query = db.query(Committee.dept_nm).distinct().all()
-    committees = [committee[0] for committee in committee_query]
-    
-    # 위원회별 처리 비율 조회 - 항상 필요
-    processing_ratios = stats_service.get_committee_processing_ratio(db)
-    
-    # 위원회별 평균 점수 조회 - 항상 필요
-    committee_scores = stats_service.get_committee_average_scores(db)
+    # 위원회 목록, 위원회별 처리 비율/평균 점수, 위원회 통계 요약 조회 (통계 스냅샷)
+    snapshot = stats_snapshot_service.get_stats_snapshot(
+        db, "committees", "committee_processing_ratios", "committee_scores", "committee_stats_summary"
+    )
+    committees = snapshot["committees"]
+    processing_ratios = snapshot["committee_processing_ratios"]
+    committee_scores = snapshot["committee_scores"]
     
     # 차트 데이터 생성 - 항상 필요
     processing_chart = chart_service.generate_committee_processing_chart_data(processing_ratios)
@@ -167,8 +150,8 @@ async def committee_ranking(request: Request, db: Session = Depends(get_db), com
                 {"request": request, "message": f"'{committee_name}'라는 위원회를 찾을 수 없습니다."}
             )
         
-        # 위원회 통계 요약 조회
-        committee_stats = stats_service.get_committee_stats_summary(db, committee_name)
+        # 위원회 통계 요약
+        committee_stats = snapshot["committee_stats_summary"][committee_name]
         
         # 위원회 소속 의원 목록 조회
         legislators = stats_service.get_legislators_by_committee(db, committee_name)
@@ -195,21 +178,13 @@ async def term_ranking(request: Request, db: Session = Depends(get_db), term: Op
     Returns:
         템플릿 렌더링 응답
     """
-    # 초선/재선 목록 미리 조회 (공통)
-    term_query = db.query(Legislator.reele_gbn_nm).distinct().all()
-    unsorted_terms = [term[0] for term in term_query if term[0]]
-    
-    # 선수 순서 정의 (초선부터 5선까지)
-    term_order = {"초선": 1, "재선": 2, "3선": 3, "4선": 4, "5선": 5, "6선": 6, "7선": 7, "8선": 8, "9선": 9}
-    
-    # 정렬된 선수 목록 생성
-    terms = sorted(unsorted_terms, key=lambda x: term_order.get(x, 999))
-    
-    # 선수별 티어 분포 조회 (항상 필요)
-    tier_distribution = stats_service.get_tier_distribution_by_term(db)
-    
-    # 선수별 평균 재산 조회 (항상 필요)
-    term_assets = stats_service.get_term_average_assets(db)
+    # 선수 목록(초선부터), 선수별 티어 분포/평균 재산, 선수별 통계 요약 조회 (통계 스냅샷)
+    snapshot = stats_snapshot_service.get_stats_snapshot(
+        db, "terms", "term_tier_distribution", "term_assets", "term_stats_summary"
+    )
+    terms = snapshot["terms"]
+    tier_distribution = snapshot["term_tier_distribution"]
+    term_assets = snapshot["term_assets"]
     
     # 차트 데이터 생성 (항상 필요)
     tier_chart = chart_service.generate_term_tier_chart_data(tier_distribution)
@@ -236,8 +211,8 @@ async def term_ranking(request: Request, db: Session = Depends(get_db), term: Op
                 {"request": request, "message": f"'{term}'(이)라는 선수를 찾을 수 없습니다."}
             )
         
-        # 선수별 통계 요약 조회
-        term_stats = stats_service.get_term_stats_summary(db, term)
+        # 선수별 통계 요약
+        term_stats = snapshot["term_stats_summary"][term]
         
         # 해당 선수 의원 목록 조회
         legislators = stats_service.get_legislators_by_term(db, term)
@@ -267,11 +242,10 @@ async def age_ranking(request: Request, db: Session = Depends(get_db), age_group
     # 나이대 목록 정의
     age_groups = ["30대 이하", "40대", "50대", "60대", "70대 이상"]
     
-    # 나이대별 평균 점수 조회 - 항상 필요
-    age_scores = stats_service.get_age_average_scores(db)
-    
-    # 나이대별 평균 재산 조회 - 항상 필요
-    age_assets = stats_service.get_age_average_assets(db)
+    # 나이대별 평균 점수/재산, 나이대별 통계 요약 조회 (통계 스냅샷)
+    snapshot = stats_snapshot_service.get_stats_snapshot(db, "age_scores", "age_assets", "age_stats_summary")
+    age_scores = snapshot["age_scores"]
+    age_assets = snapshot["age_assets"]
     
     # 차트 데이터 생성 - 항상 필요
     score_chart = chart_service.generate_age_score_chart_data(age_scores)
@@ -298,8 +272,8 @@ async def age_ranking(request: Request, db: Session = Depends(get_db), age_group
                 {"request": request, "message": f"'{age_group}'(이)라는 나이대를 찾을 수 없습니다."}
             )
         
-        # 나이대별 통계 요약 조회
-        age_stats = stats_service.get_age_stats_summary(db, age_group)
+        # 나이대별 통계 요약
+        age_stats = snapshot["age_stats_summary"][age_group]
         
         # 해당 나이대 의원 목록 조회
         legislators = stats_service.get_legislators_by_age_group(db, age_group)
@@ -326,18 +300,13 @@ async def gender_ranking(request: Request, db: Session = Depends(get_db), gender
     Returns:
         템플릿 렌더링 응답
     """
-    # 성별 목록 미리 조회 (공통)
-    gender_query = db.query(Legislator.sex_gbn_nm).distinct().all()
-    genders = [gender[0] for gender in gender_query if gender[0]]
-    # 성별을 '남', '여' 순서로 정렬
-    if '남' in genders and '여' in genders:
-        genders = ['남', '여']
-    
-    # 성별 티어 분포 조회 (항상 필요)
-    tier_distribution = stats_service.get_tier_distribution_by_gender(db)
-    
-    # 성별 평균 재산 조회 (항상 필요)
-    gender_assets = stats_service.get_gender_average_assets(db)
+    # 성별 목록('남', '여' 순서), 성별 티어 분포/평균 재산, 성별 통계 요약 조회 (통계 스냅샷)
+    snapshot = stats_snapshot_service.get_stats_snapshot(
+        db, "genders", "gender_tier_distribution", "gender_assets", "gender_stats_summary"
+    )
+    genders = snapshot["genders"]
+    tier_distribution = snapshot["gender_tier_distribution"]
+    gender_assets = snapshot["gender_assets"]
     
     # 차트 데이터 생성 (항상 필요)
     tier_chart = chart_service.generate_gender_tier_chart_data(tier_distribution)
@@ -364,8 +333,8 @@ async def gender_ranking(request: Request, db: Session = Depends(get_db), gender
                 {"request": request, "message": f"'{gender}'(이)라는 성별을 찾을 수 없습니다."}
             )
         
-        # 성별 통계 요약 조회
-        gender_stats = stats_service.get_gender_stats_summary(db, gender)
+        # 성별 통계 요약
+        gender_stats = snapshot["gender_stats_summary"][gender]
         
         # 해당 성별 의원 목록 조회
         legislators = stats_service.get_legislators_by_gender(db, gender)
@@ -395,14 +364,13 @@ async def asset_ranking(request: Request, db: Session = Depends(get_db), asset_g
     # 재산 구간 목록 정의 (백분위 기반)
     asset_groups = ["0-20 백분위", "20-40 백분위", "40-60 백분위", "60-80 백분위", "80-100 백분위"]
     
-    # 점수-재산 상관관계 조회 (차트용 - 일부 의원 제외)
-    chart_correlation_data = stats_service.get_score_asset_correlation(db, for_chart=True)
-    
-    # 점수-재산 상관관계 조회 (테이블용 - 모든 의원 포함)
-    table_correlation_data = stats_service.get_score_asset_correlation(db, for_chart=False)
-    
-    # 정당별 재산 비율 조회 (항상 필요)
-    party_asset_ratio = stats_service.get_party_asset_ratio(db)
+    # 점수-재산 상관관계(차트용/테이블용), 정당별 재산 비율, 재산 구간별 통계 요약 조회 (통계 스냅샷)
+    snapshot = stats_snapshot_service.get_stats_snapshot(
+        db, "asset_correlation_chart", "asset_correlation_table", "party_asset_ratio", "asset_stats_summary"
+    )
+    chart_correlation_data = snapshot["asset_correlation_chart"]  # 차트용 - 일부 의원 제외
+    table_correlation_data = snapshot["asset_correlation_table"]  # 테이블용 - 모든 의원 포함
+    party_asset_ratio = snapshot["party_asset_ratio"]
     
     # 차트 데이터 생성 (항상 필요)
     correlation_chart = chart_service.generate_score_asset_correlation_chart_data(chart_correlation_data)
@@ -429,8 +397,8 @@ async def asset_ranking(request: Request, db: Session = Depends(get_db), asset_g
                 {"request": request, "message": f"'{asset_group}'(이)라는 재산 구간을 찾을 수 없습니다."}
             )
         
-        # 재산 구간별 통계 요약 조회
-        asset_stats = stats_service.get_asset_stats_summary(db, asset_group)
+        # 재산 구간별 통계 요약
+        asset_stats = snapshot["asset_stats_summary"][asset_group]
         
         # 해당 재산 구간 의원 목록 조회
         legislators = stats_service.get_legislators_by_asset_group(db, asset_group)
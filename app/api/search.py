@@ -4,7 +4,7 @@ from fastapi.templating import Jinja2Templates
 from sqlalchemy.orm import Session
 
 from app.db.database import get_db
-from app.models.legislator import Legislator
+from app.services.legislator_store import get_legislator_store
 from app.utils.image_path_helper import ImagePathHelper  # 이미지 경로 헬퍼 추가
 
 router = APIRouter()
@@ -25,10 +25,8 @@ async def search_legislator(request: Request, name: str, db: Session = Depends(g
         - 결과 여러개: 검색 결과 목록 페이지
         - 결과 0개: 404 페이지
     """
-    # 국회의원 이름으로 DB 조회 (부분 일치 검색)
-    legislators = db.query(Legislator).filter(
-        Legislator.hg_nm.like(f"%{name}%")
-    ).order_by(Legislator.hg_nm).all()
+    # 국회의원 이름으로 조회 (부분 일치 검색, 메모리 사본 사용)
+    legislators = get_legislator_store(db).search(name)
     
     # 결과에 따른 분기 처리
     if len(legislators) == 1:
@@ -44,7 +44,57 @@ class Settings(BaseSettings):
         "vote_results": {"AGE": "22", "BILL_ID": None},  # 본회의 표결정보 - 대수 및 의안ID 필수
         "processed_bills_stats": {"ERACO": "제22대"}  # 처리 의안통계(위원회별) - 대수 필수
     }
-    
+
+    # HTTP 클라이언트 설정
+    HTTP_TIMEOUT: float = 10.0  # 요청 타임아웃(초)
+    HTTP_POOL_SIZE: int = 10  # keep-alive 커넥션 풀 크기
+    API_MAX_WORKERS: int = 4  # 페이지 병렬 요청 수 (1이면 순차 요청)
+
+    # HTTP 응답 캐시 설정
+    HTTP_CACHE_ENABLED: bool = True
+    HTTP_CACHE_PATH: str = "./data/http_cache.sqlite"
+    HTTP_CACHE_MAX_MB: float = 512  # 캐시 최대 크기(MB), 넘으면 오래 사용하지 않은 응답부터 삭제
+    HTTP_CACHE_OFFLINE: bool = False  # True이면 네트워크 요청 없이 캐시만 사용 (개발/재현용)
+    HTTP_CACHE_TTL: dict = {  # 분류별 캐시 유효 시간(초), 만료 후에는 조건부 요청으로 재검증
+        "default": 6 * 3600,          # Open API 기본
+        "vote_results": 30 * 86400,   # 본회의 표결 결과 (확정 후 변경 없음)
+        "co_proposers": 30 * 86400,   # 공동발의자 목록 페이지
+        "nanet_speech": 86400         # 회의록 발언 횟수 페이지
+    }
+
+    # 표결 정보 수집 설정
+    VOTE_FETCH_WORKERS: int = 4  # 표결 결과 동시 요청 수
+    VOTE_FETCH_RATE: float = 5.0  # 초당 최대 요청 수 (0이면 제한 없음)
+    VOTE_BATCH_SIZE: int = 50  # 한 트랜잭션에 저장할 법안 수
+
+    # 법안 정보 저장 설정
+    BILL_BATCH_SIZE: int = 500  # 한 번에 upsert/커밋할 법안 수
+    CO_PROPOSER_FETCH_WORKERS: int = 8  # 공동발의자 목록 페이지 동시 요청 수
+
+    # 회의록 발언 횟수 크롤링 설정
+    SPEECH_CRAWL_RATE: float = 1.0  # 초당 최대 요청 수 (기존 요청 간 1초 대기와 같은 수준)
+    SPEECH_CRAWL_WORKERS: int = 4  # 동시 요청 수
+    SPEECH_CRAWL_MAX_RETRIES: int = 3  # 실패 시 재시도 횟수
+    SPEECH_CRAWL_BACKOFF: float = 1.0  # 재시도 대기 시간 기준(초), 재시도마다 2배
+    SPEECH_CRAWL_CHECKPOINT: str = "./data/speech_crawl_checkpoint.json"  # 중단 후 이어서 수집하기 위한 체크포인트
+    SPEECH_CRAWL_CHECKPOINT_HOURS: int = 24  # 체크포인트 유효 시간
+
+    # 엑셀 파싱 설정
+    EXCEL_ENGINE: str = "auto"  # pandas.read_excel 엔진 (auto: calamine이 설치되어 있으면 사용, 아니면 openpyxl)
+
+    EXCEL_PARSE_WORKERS: int = 0  # 엑셀 파싱 프로세스 수 (0이면 CPU 코어 수, 1이면 순차 파싱)
+    EXCEL_CACHE_ENABLED: bool = True  # 파싱 결과를 캐시하여 바뀌지 않은 엑셀 파일은 다시 파싱하지 않음
+    EXCEL_CACHE_DIR: str = "./data/excel_cache"  # 파싱 결과 캐시 폴더 (원본 경로, 수정 시각, 내용 해시로 확인)
+    ASSET_BATCH_SIZE: int = 5000  # 재산 상세 데이터를 한 번에 저장/커밋할 행 수
+
+    # 점수 계산 설정
+    SCORE_WORKERS: int = 5  # 카테고리 점수 동시 계산 수 (1이면 순차 계산)
+
+    # 화면 캐시 설정
+    PAGE_CACHE_ENABLED: bool = True  # 렌더링한 HTML 화면을 메모리에 캐시 (데이터 버전이 바뀌면 무효화)
+    PAGE_CACHE_MAX_MB: float = 64  # 캐시 최대 크기(MB), 넘으면 오래 사용하지 않은 화면부터 삭제
+    PAGE_CACHE_MAX_ENTRIES: int = 2000  # 최대 화면 수
+
     # Pydantic 2.x에서 Config 클래스 대신 model_config 사용
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -16,6 +16,9 @@ from app.models.speech import SpeechKeyword, SpeechByMeeting
 from app.models.attendance import Attendance
 from app.models.bill import Bill, BillCoProposer
 from app.models.vote import Vote, VoteResult
+from app.models.sync_state import SyncState
+from app.models.data_version import DataVersion
+from app.models.stats_snapshot import StatsSnapshot
 
 def create_app():
     # FastAPI 앱 객체 생성
@@ -23,6 +26,7 @@ def create_app():
     
     # 라우터, 정적 파일, 템플릿 설정
     setup_routes(app)
+    setup_middleware(app)
     setup_static(app)
     setup_templates(app)
     
@@ -45,6 +49,11 @@ def setup_routes(app):
     from app.api import admin
     app.include_router(admin.router)
 
+def setup_middleware(app):
+    # 렌더링한 화면 캐시 (데이터 버전 기준으로 무효화, ETag/Last-Modified 조건부 요청 처리)
+    from app.utils.page_cache import page_cache_middleware
+    app.middleware("http")(page_cache_middleware)
+
 def setup_static(app):
     # 정적 파일 디렉토리 설정
     app.mount("/static", StaticFiles(directory="app/static"), name="static")
@@ -0,0 +1,14 @@
+from sqlalchemy import Column, Integer, String, DateTime
+
+from app.db.database import Base
+
+class DataVersion(Base):
+    # 테이블명 정의
+    __tablename__ = "data_versions"
+    
+    # 컬럼 정의
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String, unique=True, index=True)  # 원본 테이블명 또는 "score:<카테고리>"
+    version = Column(Integer, default=0)  # 원본 테이블 버전 (수집 시 증가)
+    consumed = Column(String)  # 점수 카테고리가 마지막 계산에 사용한 원본 버전 (JSON)
+    updated_at = Column(DateTime)  # 마지막 변경 시각
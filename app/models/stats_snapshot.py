@@ -0,0 +1,13 @@
+from sqlalchemy import Column, Integer, String, DateTime
+
+from app.db.database import Base
+
+class StatsSnapshot(Base):
+    # 테이블명 정의
+    __tablename__ = "stats_snapshots"
+    
+    # 컬럼 정의
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String, unique=True, index=True)  # 통계 항목명 (예: "party_scores")
+    payload = Column(String)  # 통계 결과 (JSON)
+    updated_at = Column(DateTime)  # 마지막 생성 시각
@@ -0,0 +1,15 @@
+from sqlalchemy import Column, Integer, String, DateTime
+
+from app.db.database import Base
+
+class SyncState(Base):
+    # 테이블명 정의
+    __tablename__ = "sync_states"
+    
+    # 컬럼 정의
+    id = Column(Integer, primary_key=True, index=True)
+    endpoint = Column(String, unique=True, index=True)  # 수집 대상 (API 엔드포인트 키)
+    watermark = Column(String)  # 마지막으로 반영한 기준값 (예: 최근 PROPOSE_DT)
+    total_count = Column(Integer)  # 마지막 수집 시 전체 건수 (list_total_count)
+    row_hash = Column(String)  # 마지막 수집 데이터의 해시
+    synced_at = Column(DateTime)  # 마지막 반영 시각
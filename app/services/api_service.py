@@ -1,29 +1,41 @@
+import math
 import requests
 import xmltodict
-from typing import List, Dict, Any, Optional
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Iterator, Tuple, Union
 
 from app.config import settings
-from app.utils.xml_parser import parse_xml_to_dict
+from app.utils.xml_parser import stream_xml_rows
+from app.utils.http_client import get_session
+from app.utils.http_cache import cached_get
 
 class ApiService:
-    def __init__(self, api_key=None):
+    def __init__(self, api_key=None, max_workers: Optional[int] = None):
         # API 키 설정 및 기본 URL 초기화
         self.api_key = api_key or settings.API_KEY
         self.base_url = settings.BASE_API_URL
         self.endpoints = settings.API_ENDPOINTS
         self.default_args = settings.DEFAULT_API_ARGS
         self.required_args = settings.API_REQUIRED_ARGS
+        
+        # 공유 세션(커넥션 재사용) 및 페이지 병렬 요청 수
+        self.session = get_session()
+        self.timeout = settings.HTTP_TIMEOUT
+        self.max_workers = max(1, max_workers or settings.API_MAX_WORKERS)
     
-    def _make_api_call(self, endpoint_key: str, additional_params: Optional[Dict[str, str]] = None) -> str:
+    def _make_api_call(self, endpoint_key: str, additional_params: Optional[Dict[str, str]] = None,
+                       as_bytes: bool = False) -> Union[str, bytes]:
         """
         공통 API 호출 메서드
         
         Args:
             endpoint_key: API 엔드포인트 키 (config에 정의된 키)
             additional_params: 추가 요청 인자
+            as_bytes: True이면 디코딩하지 않은 바이트 반환 (스트리밍 파서용)
                 
         Returns:
-            str: API 응답 (XML 문자열)
+            Union[str, bytes]: API 응답 (XML 문자열 또는 바이트, 오류 시 빈 값)
         """
         # 1. 엔드포인트 URL 구성
         endpoint = self.endpoints.get(endpoint_key)
@@ -48,16 +60,146 @@ class ApiService:
         if additional_params:
             params.update(additional_params)
         
-        # 5. API 호출 및 응답 받기
+        # 5. API 호출 및 응답 받기 (디스크 캐시 경유, 루트 태그까지 끝난 정상 응답(INFO-000)만 캐시에 저장)
+        closing_tag = f"</{endpoint}>".encode("utf-8")
         try:
-            response = requests.get(url, params=params)
+            response = cached_get(url, params=params, category=endpoint_key, timeout=self.timeout,
+                                  cacheable=lambda content: b"INFO-000" in content
+                                  and content.rstrip().endswith(closing_tag))
             response.raise_for_status()  # HTTP 오류 발생시 예외 발생
             
-            # 6. 응답 반환 (XML 문자열)
-            return response.text
+            # 6. 응답 반환 (XML 문자열 또는 바이트)
+            return response.content if as_bytes else response.text
         except requests.exceptions.RequestException as e:
             print(f"API 호출 오류 ({endpoint_key}): {str(e)}")
-            return ""
+            return b"" if as_bytes else ""
+
+    def _stream_rows(self, endpoint_key: str,
+                     additional_params: Optional[Dict[str, str]] = None) -> Optional[Tuple[Optional[int], Iterator[Dict[str, Any]]]]:
+        """
+        요청 하나의 응답을 스트리밍 파싱하여 총 개수와 row 이터레이터 반환
+        
+        응답 전체를 딕셔너리로 변환하지 않고 row를 하나씩 읽으므로 페이지 크기가 커도 메모리 사용량이 일정함
+        
+        Args:
+            endpoint_key: API 엔드포인트 키
+            additional_params: 추가 요청 인자
+        
+        Returns:
+            (list_total_count, row 이터레이터) 튜플, 응답 오류 시 None
+        """
+        # 응답의 루트 태그는 엔드포인트 코드와 같음
+        root_key = self.endpoints.get(endpoint_key)
+
+        response_content = self._make_api_call(endpoint_key, additional_params, as_bytes=True)
+
+        if not response_content:
+            print(f"{endpoint_key} 응답이 없습니다!")
+            return None
+
+        head, rows = stream_xml_rows(response_content)
+
+        # 오류 체크
+        if head["error"]:
+            print(f"API 오류: {head['message']}")
+            return None
+
+        if head["root"] != root_key:
+            print(f"예상한 구조({root_key})를 찾지 못했습니다.")
+            return None
+
+        return head["list_total_count"], rows
+
+    def _fetch_page(self, endpoint_key: str, page_index: int, page_size: int,
+                    additional_params: Optional[Dict[str, str]] = None) -> Optional[Tuple[Optional[int], List[Dict[str, Any]]]]:
+        """
+        페이지 하나를 요청하여 총 개수와 row 목록 반환
+
+        Args:
+            endpoint_key: API 엔드포인트 키
+            page_index: 페이지 번호 (pIndex)
+            page_size: 페이지 크기 (pSize)
+            additional_params: 추가 요청 인자
+
+        Returns:
+            (list_total_count, row 목록) 튜플, 응답 오류 시 None
+        """
+        params = dict(additional_params or {})
+        params["pIndex"] = str(page_index)
+        params["pSize"] = str(page_size)
+
+        result = self._stream_rows(endpoint_key, params)
+        if result is None:
+            print(f"페이지 {page_index} 응답이 없습니다!")
+            return None
+
+        total_count, rows = result
+        try:
+            return total_count, list(rows)
+        except ET.ParseError:
+            # 중간에 잘린 응답은 일부 row만 반환하지 않고 페이지 전체를 실패로 처리
+            print(f"페이지 {page_index} 응답이 올바른 XML이 아닙니다!")
+            return None
+
+    def _iter_pages(self, endpoint_key: str, additional_params: Optional[Dict[str, str]] = None,
+                    page_size: int = 100, label: str = "") -> Iterator[Tuple[int, List[Dict[str, Any]]]]:
+        """
+        페이징 API 공통 처리 - 첫 페이지에서 list_total_count를 읽은 뒤 나머지 페이지를 병렬 요청
+
+        max_workers개 페이지씩 묶어서 동시에 요청하고 페이지 순서대로 반환하므로,
+        호출하는 쪽에서 중간에 반복을 멈추면 이후 페이지는 요청하지 않음
+
+        Args:
+            endpoint_key: API 엔드포인트 키
+            additional_params: 추가 요청 인자
+            page_size: 페이지 크기
+            label: 로그 출력용 이름
+
+        Yields:
+            (페이지 번호, row 목록) 튜플
+        """
+        print(f"{label} 페이지 1 요청 중...")
+        first_page = self._fetch_page(endpoint_key, 1, page_size, additional_params)
+        if first_page is None:
+            return
+
+        total_count, items = first_page
+        if total_count is not None:
+            print(f"총 {label} 수: {total_count}")
+
+        if not items:
+            print(f"페이지 1에 항목이 없습니다. 종료합니다.")
+            return
+
+        yield 1, items
+
+        # 총 개수를 모르면 빈 페이지가 나올 때까지 계속 요청
+        total_pages = math.ceil(total_count / page_size) if total_count else None
+
+        def fetch(page_index):
+            print(f"{label} 페이지 {page_index} 요청 중...")
+            return self._fetch_page(endpoint_key, page_index, page_size, additional_params)
+
+        next_page = 2
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while total_pages is None or next_page <= total_pages:
+                last_page = next_page + self.max_workers - 1
+                if total_pages is not None:
+                    last_page = min(last_page, total_pages)
+                page_indexes = list(range(next_page, last_page + 1))
+
+                # 묶음 단위로 병렬 요청 (결과는 페이지 순서 유지)
+                for page_index, page in zip(page_indexes, executor.map(fetch, page_indexes)):
+                    if page is None:
+                        return
+                    if not page[1]:
+                        print(f"페이지 {page_index}에 항목이 없습니다. 종료합니다.")
+                        return
+                    yield page_index, page[1]
+
+                next_page = last_page + 1
+
+        print(f"모든 {label} 데이터를 가져왔습니다.")
 
     def fetch_legislators_info(self) -> List[Dict[str, Any]]:
         """
@@ -72,87 +214,28 @@ class ApiService:
             # 결과 리스트 초기화
             all_legislators = []
             
-            # 페이지 정보
-            page_index = 1
-            page_size = 100  # API 기본값
-            total_count = None
-            
-            # 전체 데이터를 가져올 때까지 반복
-            while True:
-                # 페이지 정보를 포함한 API 호출
-                additional_params = {
-                    "pIndex": str(page_index),
-                    "pSize": str(page_size)
-                }
-                
-                print(f"페이지 {page_index} 요청 중...")
-                response_text = self._make_api_call("legislator_info", additional_params)
-                
-                if not response_text:
-                    print(f"페이지 {page_index} 응답이 없습니다!")
-                    break
+            # 페이지 단위로 수집 (2페이지부터 병렬 요청)
+            for page_index, items in self._iter_pages("legislator_info", label="의원"):
+                print(f"페이지 {page_index}에서 {len(items)}명의 의원 정보 추출")
                 
-                # XML 응답 파싱
-                data_dict = parse_xml_to_dict(response_text)
-                
-                # 오류 체크
-                if data_dict.get('error'):
-                    print(f"API 오류: {data_dict.get('message')}")
-                    break
-                
-                # 'nwvrqwxyaytdsfvhu' 구조 처리
-                if 'nwvrqwxyaytdsfvhu' in data_dict:
-                    root = data_dict['nwvrqwxyaytdsfvhu']
-                    
-                    # 첫 페이지에서만 총 개수 정보 확인
-                    if total_count is None and 'head' in root:
-                        head = root['head']
-                        total_count = int(head.get('list_total_count', 0))
-                        print(f"총 의원 수: {total_count}")
-                    
-                    # 'row' 태그에서 의원 정보 추출
-                    items = root.get('row', [])
-                    
-                    # 단일 항목인 경우 리스트로 변환
-                    if isinstance(items, dict):
-                        items = [items]
-                    
-                    # 페이지에 항목이 없으면 종료
-                    if not items:
-                        print(f"페이지 {page_index}에 항목이 없습니다. 종료합니다.")
-                        break
-                    
-                    print(f"페이지 {page_index}에서 {len(items)}명의 의원 정보 추출")
-                    
-                    # 의원 정보 매핑 (모델에 있는 필드만 포함)
-                    for item in items:
-                        legislator = {
-                            "mona_cd": item.get("MONA_CD", ""),
-                            "hg_nm": item.get("HG_NM", ""),
-                            "eng_nm": item.get("ENG_NM", ""),
-                            "bth_date": item.get("BTH_DATE", ""),
-                            "job_res_nm": item.get("JOB_RES_NM", ""),
-                            "poly_nm": item.get("POLY_NM", ""),
-                            "orig_nm": item.get("ORIG_NM", ""),
-                            "cmit_nm": item.get("CMIT_NM", ""),
-                            "reele_gbn_nm": item.get("REELE_GBN_NM", ""),
-                            "sex_gbn_nm": item.get("SEX_GBN_NM", ""),
-                            "tel_no": item.get("TEL_NO", ""),
-                            "e_mail": item.get("E_MAIL", ""),
-                            "mem_title": item.get("MEM_TITLE", "")
-                        }
-                        all_legislators.append(legislator)
-                    
-                    # 다음 페이지로 이동
-                    page_index += 1
-                    
-                    # 모든 데이터를 가져왔는지 확인
-                    if total_count and len(all_legislators) >= total_count:
-                        print(f"모든 데이터({total_count}명)를 가져왔습니다.")
-                        break
-                else:
-                    print(f"예상한 구조(nwvrqwxyaytdsfvhu)를 찾지 못했습니다.")
-                    break
+                # 의원 정보 매핑 (모델에 있는 필드만 포함)
+                for item in items:
+                    legislator = {
+                        "mona_cd": item.get("MONA_CD", ""),
+                        "hg_nm": item.get("HG_NM", ""),
+                        "eng_nm": item.get("ENG_NM", ""),
+                        "bth_date": item.get("BTH_DATE", ""),
+                        "job_res_nm": item.get("JOB_RES_NM", ""),
+                        "poly_nm": item.get("POLY_NM", ""),
+                        "orig_nm": item.get("ORIG_NM", ""),
+                        "cmit_nm": item.get("CMIT_NM", ""),
+                        "reele_gbn_nm": item.get("REELE_GBN_NM", ""),
+                        "sex_gbn_nm": item.get("SEX_GBN_NM", ""),
+                        "tel_no": item.get("TEL_NO", ""),
+                        "e_mail": item.get("E_MAIL", ""),
+                        "mem_title": item.get("MEM_TITLE", "")
+                    }
+                    all_legislators.append(legislator)
             
             print(f"최종 처리된 의원 수: {len(all_legislators)}")
             return all_legislators
@@ -176,79 +259,20 @@ class ApiService:
             # 결과 리스트 초기화
             all_sns_info = []
             
-            # 페이지 정보
-            page_index = 1
-            page_size = 100  # API 기본값
-            total_count = None
-            
-            # 전체 데이터를 가져올 때까지 반복
-            while True:
-                # 페이지 정보를 포함한 API 호출
-                additional_params = {
-                    "pIndex": str(page_index),
-                    "pSize": str(page_size)
-                }
-                
-                print(f"SNS 정보 페이지 {page_index} 요청 중...")
-                response_text = self._make_api_call("legislator_sns", additional_params)
-                
-                if not response_text:
-                    print(f"페이지 {page_index} 응답이 없습니다!")
-                    break
-                
-                # XML 응답 파싱
-                data_dict = parse_xml_to_dict(response_text)
-                
-                # 오류 체크
-                if data_dict.get('error'):
-                    print(f"API 오류: {data_dict.get('message')}")
-                    break
+            # 페이지 단위로 수집 (2페이지부터 병렬 요청)
+            for page_index, items in self._iter_pages("legislator_sns", label="SNS 정보"):
+                print(f"페이지 {page_index}에서 {len(items)}개의 SNS 정보 추출")
                 
-                # 'negnlnyvatsjwocar' 구조 처리 (SNS 정보 API의 응답 구조)
-                if 'negnlnyvatsjwocar' in data_dict:
-                    root = data_dict['negnlnyvatsjwocar']
-                    
-                    # 첫 페이지에서만 총 개수 정보 확인
-                    if total_count is None and 'head' in root:
-                        head = root['head']
-                        total_count = int(head.get('list_total_count', 0))
-                        print(f"총 SNS 정보 수: {total_count}")
-                    
-                    # 'row' 태그에서 SNS 정보 추출
-                    items = root.get('row', [])
-                    
-                    # 단일 항목인 경우 리스트로 변환
-                    if isinstance(items, dict):
-                        items = [items]
-                    
-                    # 페이지에 항목이 없으면 종료
-                    if not items:
-                        print(f"페이지 {page_index}에 항목이 없습니다. 종료합니다.")
-                        break
-                    
-                    print(f"페이지 {page_index}에서 {len(items)}개의 SNS 정보 추출")
-                    
-                    # SNS 정보 매핑
-                    for item in items:
-                        sns_info = {
-                            "mona_cd": item.get("MONA_CD", ""),
-                            "t_url": item.get("T_URL", ""),
-                            "f_url": item.get("F_URL", ""),
-                            "y_url": item.get("Y_URL", ""),
-                            "b_url": item.get("B_URL", "")
-                        }
-                        all_sns_info.append(sns_info)
-                    
-                    # 다음 페이지로 이동
-                    page_index += 1
-                    
-                    # 모든 데이터를 가져왔는지 확인
-                    if total_count and len(all_sns_info) >= total_count:
-                        print(f"모든 SNS 데이터({total_count}개)를 가져왔습니다.")
-                        break
-                else:
-                    print(f"예상한 구조(negnlnyvatsjwocar)를 찾지 못했습니다.")
-                    break
+                # SNS 정보 매핑
+                for item in items:
+                    sns_info = {
+                        "mona_cd": item.get("MONA_CD", ""),
+                        "t_url": item.get("T_URL", ""),
+                        "f_url": item.get("F_URL", ""),
+                        "y_url": item.get("Y_URL", ""),
+                        "b_url": item.get("B_URL", "")
+                    }
+                    all_sns_info.append(sns_info)
             
             print(f"최종 처리된 SNS 정보 수: {len(all_sns_info)}")
             return all_sns_info
@@ -300,42 +324,24 @@ class ApiService:
                     "NAAS_CD": mona_cd
                 }
                 
-                response_text = self._make_api_call("legislator_integrated", additional_params)
+                result = self._stream_rows("legislator_integrated", additional_params)
                 
-                if not response_text:
+                if result is None:
                     print(f"의원(ID: {mona_cd}) 사진 정보를 가져올 수 없습니다.")
                     continue
                 
-                # XML 응답 파싱
-                data_dict = parse_xml_to_dict(response_text)
-                
-                # 오류 체크
-                if data_dict.get('error'):
-                    print(f"API 오류 (의원 ID: {mona_cd}): {data_dict.get('message')}")
-                    continue
-                
-                # 'ALLNAMEMBER' 구조 처리
-                if 'ALLNAMEMBER' in data_dict:
-                    root = data_dict['ALLNAMEMBER']
-                    
-                    # 'row' 태그에서 사진 정보 추출
-                    items = root.get('row', [])
-                    
-                    # 단일 항목인 경우 리스트로 변환
-                    if isinstance(items, dict):
-                        items = [items]
-                    
-                    # 현재 의원의 사진 정보를 찾아 추가
-                    for item in items:
-                        if item.get("NAAS_CD") == mona_cd:
-                            profile_image_url = item.get("NAAS_PIC", "")
-                            if profile_image_url:
-                                image_info = {
-                                    "mona_cd": mona_cd,
-                                    "profile_image_url": profile_image_url
-                                }
-                                all_image_info.append(image_info)
-                                break
+                # 'ALLNAMEMBER' 구조 처리 (스트리밍 파싱) - 현재 의원의 사진 정보를 찾아 추가
+                _, items = result
+                for item in items:
+                    if item.get("NAAS_CD") == mona_cd:
+                        profile_image_url = item.get("NAAS_PIC", "")
+                        if profile_image_url:
+                            image_info = {
+                                "mona_cd": mona_cd,
+                                "profile_image_url": profile_image_url
+                            }
+                            all_image_info.append(image_info)
+                            break
             
             print(f"최종 처리된 사진 정보 수: {len(all_image_info)}")
             return all_image_info
@@ -359,81 +365,22 @@ class ApiService:
             # 결과 리스트 초기화
             all_members = []
             
-            # 페이지 정보
-            page_index = 1
-            page_size = 100  # API 기본값
-            total_count = None
-            
-            # 전체 데이터를 가져올 때까지 반복
-            while True:
-                # 페이지 정보를 포함한 API 호출
-                additional_params = {
-                    "pIndex": str(page_index),
-                    "pSize": str(page_size)
-                }
-                
-                print(f"위원회 멤버십 페이지 {page_index} 요청 중...")
-                response_text = self._make_api_call("committee_members", additional_params)
+            # 페이지 단위로 수집 (2페이지부터 병렬 요청)
+            for page_index, items in self._iter_pages("committee_members", label="위원회 멤버십"):
+                print(f"페이지 {page_index}에서 {len(items)}개의 멤버십 정보 추출")
                 
-                if not response_text:
-                    print(f"페이지 {page_index} 응답이 없습니다!")
-                    break
-                
-                # XML 응답 파싱
-                data_dict = parse_xml_to_dict(response_text)
-                
-                # 오류 체크
-                if data_dict.get('error'):
-                    print(f"API 오류: {data_dict.get('message')}")
-                    break
-                
-                # 'nktulghcadyhmiqxi' 구조 처리 (위원회 멤버십 API의 응답 구조)
-                if 'nktulghcadyhmiqxi' in data_dict:
-                    root = data_dict['nktulghcadyhmiqxi']
-                    
-                    # 첫 페이지에서만 총 개수 정보 확인
-                    if total_count is None and 'head' in root:
-                        head = root['head']
-                        total_count = int(head.get('list_total_count', 0))
-                        print(f"총 위원회 멤버십 수: {total_count}")
-                    
-                    # 'row' 태그에서 위원회 멤버십 정보 추출
-                    items = root.get('row', [])
-                    
-                    # 단일 항목인 경우 리스트로 변환
-                    if isinstance(items, dict):
-                        items = [items]
-                    
-                    # 페이지에 항목이 없으면 종료
-                    if not items:
-                        print(f"페이지 {page_index}에 항목이 없습니다. 종료합니다.")
-                        break
-                    
-                    print(f"페이지 {page_index}에서 {len(items)}개의 멤버십 정보 추출")
-                    
-                    # 멤버십 정보 매핑
-                    for item in items:
-                        member_info = {
-                            "dept_cd": item.get("DEPT_CD", ""),      # 위원회 코드
-                            "dept_nm": item.get("DEPT_NM", ""),      # 위원회명
-                            "job_res_nm": item.get("JOB_RES_NM", ""), # 구성 (위원장, 간사, 위원 등)
-                            "hg_nm": item.get("HG_NM", ""),          # 위원명
-                            "poly_nm": item.get("POLY_NM", ""),      # 정당
-                            "orig_nm": item.get("ORIG_NM", ""),      # 선거구
-                            "mona_cd": item.get("MONA_CD", "")       # 국회의원 코드
-                        }
-                        all_members.append(member_info)
-                    
-                    # 다음 페이지로 이동
-                    page_index += 1
-                    
-                    # 모든 데이터를 가져왔는지 확인
-                    if total_count and len(all_members) >= total_count:
-                        print(f"모든 멤버십 데이터({total_count}개)를 가져왔습니다.")
-                        break
-                else:
-                    print(f"예상한 구조(nktulghcadyhmiqxi)를 찾지 못했습니다.")
-                    break
+                # 멤버십 정보 매핑
+                for item in items:
+                    member_info = {
+                        "dept_cd": item.get("DEPT_CD", ""),      # 위원회 코드
+                        "dept_nm": item.get("DEPT_NM", ""),      # 위원회명
+                        "job_res_nm": item.get("JOB_RES_NM", ""), # 구성 (위원장, 간사, 위원 등)
+                        "hg_nm": item.get("HG_NM", ""),          # 위원명
+                        "poly_nm": item.get("POLY_NM", ""),      # 정당
+                        "orig_nm": item.get("ORIG_NM", ""),      # 선거구
+                        "mona_cd": item.get("MONA_CD", "")       # 국회의원 코드
+                    }
+                    all_members.append(member_info)
             
             print(f"최종 처리된 멤버십 정보 수: {len(all_members)}")
             return all_members
@@ -457,83 +404,24 @@ class ApiService:
             # 결과 리스트 초기화
             all_committees = []
             
-            # 페이지 정보
-            page_index = 1
-            page_size = 100  # API 기본값
-            total_count = None
-            
-            # 전체 데이터를 가져올 때까지 반복
-            while True:
-                # 페이지 정보를 포함한 API 호출
-                additional_params = {
-                    "pIndex": str(page_index),
-                    "pSize": str(page_size)
-                }
-                
-                print(f"위원회 현황 정보 페이지 {page_index} 요청 중...")
-                response_text = self._make_api_call("committee_info", additional_params)
-                
-                if not response_text:
-                    print(f"페이지 {page_index} 응답이 없습니다!")
-                    break
-                
-                # XML 응답 파싱
-                data_dict = parse_xml_to_dict(response_text)
+            # 페이지 단위로 수집 (2페이지부터 병렬 요청)
+            for page_index, items in self._iter_pages("committee_info", label="위원회 현황 정보"):
+                print(f"페이지 {page_index}에서 {len(items)}개의 위원회 정보 추출")
                 
-                # 오류 체크
-                if data_dict.get('error'):
-                    print(f"API 오류: {data_dict.get('message')}")
-                    break
-                
-                # 'nxrvzonlafugpqjuh' 구조 처리 (위원회 현황 정보 API의 응답 구조)
-                if 'nxrvzonlafugpqjuh' in data_dict:
-                    root = data_dict['nxrvzonlafugpqjuh']
-                    
-                    # 첫 페이지에서만 총 개수 정보 확인
-                    if total_count is None and 'head' in root:
-                        head = root['head']
-                        total_count = int(head.get('list_total_count', 0))
-                        print(f"총 위원회 수: {total_count}")
-                    
-                    # 'row' 태그에서 위원회 정보 추출
-                    items = root.get('row', [])
-                    
-                    # 단일 항목인 경우 리스트로 변환
-                    if isinstance(items, dict):
-                        items = [items]
-                    
-                    # 페이지에 항목이 없으면 종료
-                    if not items:
-                        print(f"페이지 {page_index}에 항목이 없습니다. 종료합니다.")
-                        break
-                    
-                    print(f"페이지 {page_index}에서 {len(items)}개의 위원회 정보 추출")
-                    
-                    # 위원회 정보 매핑
-                    for item in items:
-                        committee_info = {
-                            "hr_dept_cd": item.get("HR_DEPT_CD", ""),  # 위원회 코드
-                            "committee_name": item.get("COMMITTEE_NAME", ""),  # 위원회명
-                            "cmt_div_nm": item.get("CMT_DIV_NM", ""),  # 위원회 구분
-                            "hg_nm": item.get("HG_NM", ""),  # 위원장
-                            "hg_nm_list": item.get("HG_NM_LIST", ""),  # 간사
-                            "limit_cnt": item.get("LIMIT_CNT", ""),  # 위원정수
-                            "curr_cnt": item.get("CURR_CNT", ""),  # 현원
-                            "poly99_cnt": item.get("POLY99_CNT", ""),  # 비교섭단체위원수
-                            "poly_cnt": item.get("POLY_CNT", "")  # 교섭단체위원수
-                        }
-                        all_committees.append(committee_info)
-                    
-                    # 다음 페이지로 이동
-                    page_index += 1
-                    
-                    # 모든 데이터를 가져왔는지 확인
-                    if total_count and len(all_committees) >= total_count:
-                        print(f"모든 위원회 데이터({total_count}개)를 가져왔습니다.")
-                        break
-                else:
-                    print(f"예상한 구조(nxrvzonlafugpqjuh)를 찾지 못했습니다.")
-                    break
+                # 위원회 정보 매핑
+                for item in items:
+                    committee_info = {
+                        "hr_dept_cd": item.get("HR_DEPT_CD", ""),  # 위원회 코드
+                        "committee_name": item.get("COMMITTEE_NAME", ""),  # 위원회명
+                        "cmt_div_nm": item.get("CMT_DIV_NM", ""),  # 위원회 구분
+                        "hg_nm": item.get("HG_NM", ""),  # 위원장
+                        "hg_nm_list": item.get("HG_NM_LIST", ""),  # 간사
+                        "limit_cnt": item.get("LIMIT_CNT", ""),  # 위원정수
+                        "curr_cnt": item.get("CURR_CNT", ""),  # 현원
+                        "poly99_cnt": item.get("POLY99_CNT", ""),  # 비교섭단체위원수
+                        "poly_cnt": item.get("POLY_CNT", "")  # 교섭단체위원수
+                    }
+                    all_committees.append(committee_info)
             
             print(f"최종 처리된 위원회 정보 수: {len(all_committees)}")
             return all_committees
@@ -557,78 +445,19 @@ class ApiService:
             # 결과 리스트 초기화
             all_history = []
             
-            # 페이지 정보
-            page_index = 1
-            page_size = 100  # API 기본값
-            total_count = None
-            
-            # 전체 데이터를 가져올 때까지 반복
-            while True:
-                # 페이지 정보를 포함한 API 호출
-                additional_params = {
-                    "pIndex": str(page_index),
-                    "pSize": str(page_size)
-                }
-                
-                print(f"위원회 경력 정보 페이지 {page_index} 요청 중...")
-                response_text = self._make_api_call("committee_history", additional_params)
-                
-                if not response_text:
-                    print(f"페이지 {page_index} 응답이 없습니다!")
-                    break
+            # 페이지 단위로 수집 (2페이지부터 병렬 요청)
+            for page_index, items in self._iter_pages("committee_history", label="위원회 경력 정보"):
+                print(f"페이지 {page_index}에서 {len(items)}개의 위원회 경력 정보 추출")
                 
-                # XML 응답 파싱
-                data_dict = parse_xml_to_dict(response_text)
-                
-                # 오류 체크
-                if data_dict.get('error'):
-                    print(f"API 오류: {data_dict.get('message')}")
-                    break
-                
-                # 'nyzrglyvagmrypezq' 구조 처리 (위원회 경력 API의 응답 구조)
-                if 'nyzrglyvagmrypezq' in data_dict:
-                    root = data_dict['nyzrglyvagmrypezq']
-                    
-                    # 첫 페이지에서만 총 개수 정보 확인
-                    if total_count is None and 'head' in root:
-                        head = root['head']
-                        total_count = int(head.get('list_total_count', 0))
-                        print(f"총 위원회 경력 정보 수: {total_count}")
-                    
-                    # 'row' 태그에서 위원회 경력 정보 추출
-                    items = root.get('row', [])
-                    
-                    # 단일 항목인 경우 리스트로 변환
-                    if isinstance(items, dict):
-                        items = [items]
-                    
-                    # 페이지에 항목이 없으면 종료
-                    if not items:
-                        print(f"페이지 {page_index}에 항목이 없습니다. 종료합니다.")
-                        break
-                    
-                    print(f"페이지 {page_index}에서 {len(items)}개의 위원회 경력 정보 추출")
-                    
-                    # 위원회 경력 정보 매핑
-                    for item in items:
-                        history_info = {
-                            "mona_cd": item.get("MONA_CD", ""),
-                            "hg_nm": item.get("HG_NM", ""),
-                            "frto_date": item.get("FRTO_DATE", ""),
-                            "profile_sj": item.get("PROFILE_SJ", "")
-                        }
-                        all_history.append(history_info)
-                    
-                    # 다음 페이지로 이동
-                    page_index += 1
-                    
-                    # 모든 데이터를 가져왔는지 확인
-                    if total_count and len(all_history) >= total_count:
-                        print(f"모든 위원회 경력 데이터({total_count}개)를 가져왔습니다.")
-                        break
-                else:
-                    print(f"예상한 구조(nyzrglyvagmrypezq)를 찾지 못했습니다.")
-                    break
+                # 위원회 경력 정보 매핑
+                for item in items:
+                    history_info = {
+                        "mona_cd": item.get("MONA_CD", ""),
+                        "hg_nm": item.get("HG_NM", ""),
+                        "frto_date": item.get("FRTO_DATE", ""),
+                        "profile_sj": item.get("PROFILE_SJ", "")
+                    }
+                    all_history.append(history_info)
             
             print(f"최종 처리된 위원회 경력 정보 수: {len(all_history)}")
             return all_history
@@ -639,12 +468,32 @@ class ApiService:
             traceback.print_exc()
             return []
 
-    def fetch_bills(self) -> List[Dict[str, Any]]:
+    def fetch_total_count(self, endpoint_key: str, additional_params: Optional[Dict[str, str]] = None) -> Optional[int]:
+        """
+        엔드포인트의 전체 건수(list_total_count)만 조회 (1건짜리 페이지 요청)
+        
+        Args:
+            endpoint_key: API 엔드포인트 키
+            additional_params: 추가 요청 인자
+                
+        Returns:
+            Optional[int]: 전체 건수 (조회 실패 시 None)
+        """
+        page = self._fetch_page(endpoint_key, 1, 1, additional_params)
+        if page is None:
+            return None
+        return page[0]
+
+    def fetch_bills(self, since: Optional[str] = None, full: bool = False) -> List[Dict[str, Any]]:
         """
         국회의원 발의법률안 API 호출 - 새로운 발의안만 가져오도록 개선
         
+        Args:
+            since: 이 제안일(PROPOSE_DT) 이전의 기존 발의안을 만나면 수집 중단 (None이면 DB의 최근 제안일 사용)
+            full: True이면 중단 없이 전체 발의안을 반환 (처리 결과 등 변경 사항까지 반영할 때 사용)
+        
         Returns:
-            List[Dict[str, Any]]: 새로 추가된 법안 정보 리스트
+            List[Dict[str, Any]]: 새로 추가된 법안 정보 리스트 (full이면 전체)
         """
         try:
             from app.db.database import SessionLocal
@@ -652,9 +501,15 @@ class ApiService:
             
             db = SessionLocal()
             
-            # 가장 최근 발의안의 제안일 확인
-            latest_bill = db.query(Bill).order_by(Bill.propose_dt.desc()).first()
-            latest_date = latest_bill.propose_dt if latest_bill else None
+            # 가장 최근 발의안의 제안일 확인 (수집 상태의 워터마크가 있으면 우선 사용)
+            latest_date = since
+            if latest_date is None:
+                latest_bill = db.query(Bill).order_by(Bill.propose_dt.desc()).first()
+                latest_date = latest_bill.propose_dt if latest_bill else None
+            
+            # 이미 DB에 있는 의안번호 목록 (행마다 조회하지 않도록 한 번에 로드)
+            existing_bill_nos = {bill_no for (bill_no,) in db.query(Bill.bill_no).all()}
+            db.close()
             
             print(f"최근 발의안 제안일: {latest_date}")
             
@@ -662,112 +517,49 @@ class ApiService:
             all_bills = []
             new_bills = []
             
-            # 페이지 정보
-            page_index = 1
-            page_size = 100  # API 기본값
-            total_count = None
-            
-            # 전체 데이터를 가져올 때까지 반복
-            while True:
-                # 페이지 정보를 포함한 API 호출
-                additional_params = {
-                    "pIndex": str(page_index),
-                    "pSize": str(page_size),
-                    "AGE": "22"  # 22대 국회 기준
-                }
-                
-                print(f"법안 정보 페이지 {page_index} 요청 중...")
-                response_text = self._make_api_call("bills", additional_params)
-                
-                if not response_text:
-                    print(f"페이지 {page_index} 응답이 없습니다!")
-                    break
-                
-                # XML 응답 파싱
-                data_dict = parse_xml_to_dict(response_text)
-                
-                # 오류 체크
-                if data_dict.get('error'):
-                    print(f"API 오류: {data_dict.get('message')}")
-                    break
+            # 페이지 단위로 수집 (2페이지부터 병렬 요청, 기존 발의안 발견 시 중단)
+            for page_index, items in self._iter_pages("bills", {"AGE": "22"}, label="법안 정보"):  # 22대 국회 기준
+                print(f"페이지 {page_index}에서 {len(items)}개의 법안 정보 추출")
                 
-                # 'nzmimeepazxkubdpn' 구조 처리 (법안 정보 API의 응답 구조)
-                if 'nzmimeepazxkubdpn' in data_dict:
-                    root = data_dict['nzmimeepazxkubdpn']
-                    
-                    # 첫 페이지에서만 총 개수 정보 확인
-                    if total_count is None and 'head' in root:
-                        head = root['head']
-                        total_count = int(head.get('list_total_count', 0))
-                        print(f"총 법안 수: {total_count}")
-                    
-                    # 'row' 태그에서 법안 정보 추출
-                    items = root.get('row', [])
-                    
-                    # 단일 항목인 경우 리스트로 변환
-                    if isinstance(items, dict):
-                        items = [items]
-                    
-                    # 페이지에 항목이 없으면 종료
-                    if not items:
-                        print(f"페이지 {page_index}에 항목이 없습니다. 종료합니다.")
-                        break
-                    
-                    print(f"페이지 {page_index}에서 {len(items)}개의 법안 정보 추출")
-                    
-                    # 법안 정보 매핑 및 기존 발의안 확인
-                    found_all_existing = False
-                    for item in items:
-                        # 법안 정보 매핑
-                        bill_info = {
-                            "bill_id": item.get("BILL_ID", ""),
-                            "bill_no": item.get("BILL_NO", ""),
-                            "bill_name": item.get("BILL_NAME", ""),
-                            "propose_dt": item.get("PROPOSE_DT", ""),
-                            "detail_link": item.get("DETAIL_LINK", ""),
-                            "proposer": item.get("PROPOSER", ""),
-                            "committee": item.get("COMMITTEE", ""),
-                            "proc_result": item.get("PROC_RESULT", ""),
-                            "main_proposer": item.get("RST_PROPOSER", ""),
-                            "co_proposers": item.get("PUBL_PROPOSER", ""),
-                            "MEMBER_LIST": item.get("MEMBER_LIST", "")
-                        }
-                        
-                        all_bills.append(bill_info)
-                        
-                        # 이미 DB에 있는 발의안인지 확인
-                        bill_no = bill_info["bill_no"]
-                        existing_bill = db.query(Bill).filter(Bill.bill_no == bill_no).first()
-                        
-                        if not existing_bill:
-                            # DB에 없는 새로운 발의안
-                            new_bills.append(bill_info)
-                        else:
-                            # 해당 제안일이 최신 제안일보다 이전이면, 모든 새 법안을 가져왔다고 가정
-                            current_propose_dt = bill_info["propose_dt"]
-                            if latest_date and current_propose_dt <= latest_date:
-                                # 이미 존재하는 발의안이고 최신 발의안보다 이전이면 더 이상 조회 필요 없음
-                                found_all_existing = True
-                                print(f"이미 존재하는 발의안 발견: {bill_no}, 검색 종료")
-                                break
-                    
-                    # 모든 기존 발의안을 찾았으면 종료
-                    if found_all_existing:
-                        break
-                    
-                    # 다음 페이지로 이동
-                    page_index += 1
+                # 법안 정보 매핑 및 기존 발의안 확인
+                found_all_existing = False
+                for item in items:
+                    # 법안 정보 매핑
+                    bill_info = {
+                        "bill_id": item.get("BILL_ID", ""),
+                        "bill_no": item.get("BILL_NO", ""),
+                        "bill_name": item.get("BILL_NAME", ""),
+                        "propose_dt": item.get("PROPOSE_DT", ""),
+                        "detail_link": item.get("DETAIL_LINK", ""),
+                        "proposer": item.get("PROPOSER", ""),
+                        "committee": item.get("COMMITTEE", ""),
+                        "proc_result": item.get("PROC_RESULT", ""),
+                        "main_proposer": item.get("RST_PROPOSER", ""),
+                        "co_proposers": item.get("PUBL_PROPOSER", ""),
+                        "MEMBER_LIST": item.get("MEMBER_LIST", "")
+                    }
                     
-                    # 모든 데이터를 가져왔는지 확인
-                    if total_count and len(all_bills) >= total_count:
-                        print(f"모든 데이터({total_count}개)를 가져왔습니다.")
-                        break
-                else:
-                    print(f"예상한 구조(nzmimeepazxkubdpn)를 찾지 못했습니다.")
+                    all_bills.append(bill_info)
+                    
+                    # 이미 DB에 있는 발의안인지 확인
+                    bill_no = bill_info["bill_no"]
+                    
+                    if full or bill_no not in existing_bill_nos:
+                        # DB에 없는 새로운 발의안 (전체 수집이면 모두 포함)
+                        new_bills.append(bill_info)
+                    else:
+                        # 해당 제안일이 최신 제안일보다 이전이면, 모든 새 법안을 가져왔다고 가정
+                        current_propose_dt = bill_info["propose_dt"]
+                        if latest_date and current_propose_dt <= latest_date:
+                            # 이미 존재하는 발의안이고 최신 발의안보다 이전이면 더 이상 조회 필요 없음
+                            found_all_existing = True
+                            print(f"이미 존재하는 발의안 발견: {bill_no}, 검색 종료")
+                            break
+                
+                # 모든 기존 발의안을 찾았으면 종료
+                if found_all_existing:
                     break
             
-            db.close()
-            
             print(f"전체 법안 수: {len(all_bills)}, 새로 추가된 법안 수: {len(new_bills)}")
             return new_bills
             
@@ -794,50 +586,28 @@ class ApiService:
             additional_params = {}
             
             print("처리 의안통계 요청 중...")
-            response_text = self._make_api_call("processed_bills_stats", additional_params)
+            result = self._stream_rows("processed_bills_stats", additional_params)
             
-            if not response_text:
-                print("응답이 없습니다!")
+            if result is None:
                 return []
             
-            # XML 응답 파싱
-            data_dict = parse_xml_to_dict(response_text)
+            # 'row' 태그에서 통계 정보 추출 (스트리밍 파싱)
+            _, items = result
+            for item in items:
+                stat_info = {
+                    "cmit_nm": item.get("CMIT_NM", ""),
+                    "rcp_cnt": item.get("RCP_CNT", "0"),
+                    "proc_cnt": item.get("PROC_CNT", "0"),
+                    "rsvt_cnt": item.get("RSVT_CNT", "0")
+                }
+                all_stats.append(stat_info)
             
-            # 오류 체크
-            if data_dict.get('error'):
-                print(f"API 오류: {data_dict.get('message')}")
+            # 데이터가 없는 경우
+            if not all_stats:
+                print("처리 의안통계 데이터가 없습니다.")
                 return []
             
-            # 'BILLCNTCMIT' 구조 처리 (처리 의안통계 API의 응답 구조)
-            if 'BILLCNTCMIT' in data_dict:
-                root = data_dict['BILLCNTCMIT']
-                
-                # 'row' 태그에서 통계 정보 추출
-                items = root.get('row', [])
-                
-                # 단일 항목인 경우 리스트로 변환
-                if isinstance(items, dict):
-                    items = [items]
-                
-                # 데이터가 없는 경우
-                if not items:
-                    print("처리 의안통계 데이터가 없습니다.")
-                    return []
-                
-                print(f"총 {len(items)}개의 위원회 통계 정보 추출")
-                
-                # 통계 정보 매핑
-                for item in items:
-                    stat_info = {
-                        "cmit_nm": item.get("CMIT_NM", ""),
-                        "rcp_cnt": item.get("RCP_CNT", "0"),
-                        "proc_cnt": item.get("PROC_CNT", "0"),
-                        "rsvt_cnt": item.get("RSVT_CNT", "0")
-                    }
-                    all_stats.append(stat_info)
-            else:
-                print("예상한 구조(BILLCNTCMIT)를 찾지 못했습니다.")
-                return []
+            print(f"총 {len(all_stats)}개의 위원회 통계 정보 추출")
             
             print(f"처리 의안통계 수집 완료: {len(all_stats)}개 위원회")
             return all_stats
@@ -874,118 +644,58 @@ class ApiService:
             # 결과 리스트 초기화
             voted_bill_ids = []
             
-            # 페이지 정보
-            page_index = 1
-            page_size = 100  # API 기본값
-            total_count = None
-            
-            # 전체 데이터를 가져올 때까지 반복
-            while True:
-                # 페이지 정보를 포함한 API 호출
-                additional_params = {
-                    "pIndex": str(page_index),
-                    "pSize": str(page_size),
-                    "AGE": age
-                }
+            # 페이지 단위로 수집 (2페이지부터 병렬 요청, 기존 표결 발견 시 중단)
+            for page_index, items in self._iter_pages("tvbpmbill11", {"AGE": age}, label="법률안 심사 및 처리(의안검색)"):
+                print(f"페이지 {page_index}에서 {len(items)}개의 법안 정보 추출")
                 
-                print(f"법률안 심사 및 처리(의안검색) 페이지 {page_index} 요청 중...")
-                response_text = self._make_api_call("tvbpmbill11", additional_params)
-                
-                if not response_text:
-                    print(f"페이지 {page_index} 응답이 없습니다!")
-                    break
-                
-                # XML 응답 파싱
-                data_dict = parse_xml_to_dict(response_text)
-                
-                # 오류 체크
-                if data_dict.get('error'):
-                    print(f"API 오류: {data_dict.get('message')}")
-                    break
-                
-                # 'TVBPMBILL11' 구조 처리
-                if 'TVBPMBILL11' in data_dict:
-                    root = data_dict['TVBPMBILL11']
-                    
-                    # 첫 페이지에서만 총 개수 정보 확인
-                    if total_count is None and 'head' in root:
-                        head = root['head']
-                        total_count = int(head.get('list_total_count', 0))
-                        print(f"총 법안 수: {total_count}")
-                    
-                    # 'row' 태그에서 법안 정보 추출
-                    items = root.get('row', [])
-                    
-                    # 단일 항목인 경우 리스트로 변환
-                    if isinstance(items, dict):
-                        items = [items]
-                    
-                    # 페이지에 항목이 없으면 종료
-                    if not items:
-                        print(f"페이지 {page_index}에 항목이 없습니다. 종료합니다.")
-                        break
-                    
-                    print(f"페이지 {page_index}에서 {len(items)}개의 법안 정보 추출")
-                    
-                    # 표결이 있는 법안만 필터링
-                    found_all_existing = False
-                    for item in items:
-                        # 표결 결과 확인
-                        proc_result = item.get("PROC_RESULT_CD", "")
-                        proc_date = item.get("PROC_DT", "")
-                        bill_id = item.get("BILL_ID", "")
+                # 표결이 있는 법안만 필터링
+                found_all_existing = False
+                for item in items:
+                    # 표결 결과 확인
+                    proc_result = item.get("PROC_RESULT_CD", "")
+                    proc_date = item.get("PROC_DT", "")
+                    bill_id = item.get("BILL_ID", "")
+                    
+                    # 수정가결, 원안가결, 부결인 법안만 선택
+                    if proc_result in ["수정가결", "원안가결", "부결"] and bill_id:
+                        # 기존 표결 확인
+                        if latest_date and proc_date <= latest_date:
+                            # 이미 처리된 표결이면 스킵
+                            found_all_existing = True
+                            print(f"이미 처리된 표결 발견 (날짜: {proc_date}), 검색 종료")
+                            break
                         
-                        # 수정가결, 원안가결, 부결인 법안만 선택
-                        if proc_result in ["수정가결", "원안가결", "부결"] and bill_id:
-                            # 기존 표결 확인
-                            if latest_date and proc_date <= latest_date:
-                                # 이미 처리된 표결이면 스킵
-                                found_all_existing = True
-                                print(f"이미 처리된 표결 발견 (날짜: {proc_date}), 검색 종료")
-                                break
-                            
-                            # 기존 법안 DB에 없는 경우, 법안 정보 추가
-                            existing_bill = db.query(Bill).filter(Bill.bill_no == item.get("BILL_NO", "")).first()
+                        # 기존 법안 DB에 없는 경우, 법안 정보 추가
+                        existing_bill = db.query(Bill).filter(Bill.bill_no == item.get("BILL_NO", "")).first()
 
-                            if existing_bill:
-                                # 기존 법안 정보 업데이트
-                                existing_bill.bill_id = bill_id
-                                existing_bill.proc_result = proc_result
-                                # 필요한 다른 필드들 업데이트
-                                bill = existing_bill
-                            else:
-                                # 법안 기본 정보 저장
-                                bill = Bill(
-                                    bill_id=bill_id,
-                                    bill_no=item.get("BILL_NO", ""),
-                                    bill_name=item.get("BILL_NAME", ""),
-                                    law_title=item.get("BILL_NAME", ""),  # law_title이 없으면 bill_name 사용
-                                    propose_dt=item.get("PROPOSE_DT", ""),
-                                    detail_link=item.get("LINK_URL", ""),
-                                    proposer=item.get("PROPOSER", ""),
-                                    committee=item.get("CURR_COMMITTEE", ""),
-                                    proc_result=proc_result,
-                                    main_proposer_id=None  # 대표발의자 정보 없음
-                                )
-                                db.add(bill)
-                                db.flush()
-                            
-                            # 표결이 있는 법안 ID 추가
-                            voted_bill_ids.append(bill_id)
-                    
-                    # 모든 기존 표결을 찾았으면 종료
-                    if found_all_existing:
-                        break
-                    
-                    # 다음 페이지로 이동
-                    page_index += 1
-                    
-                    # 모든 데이터를 가져왔는지 확인
-                    if total_count and (page_index-1) * page_size >= total_count:
-                        print(f"모든 데이터({total_count}개)를 가져왔습니다.")
-                        break
-                else:
-                    print(f"예상한 구조(TVBPMBILL11)를 찾지 못했습니다.")
+                        if existing_bill:
+                            # 기존 법안 정보 업데이트
+                            existing_bill.bill_id = bill_id
+                            existing_bill.proc_result = proc_result
+                            # 필요한 다른 필드들 업데이트
+                            bill = existing_bill
+                        else:
+                            # 법안 기본 정보 저장
+                            bill = Bill(
+                                bill_id=bill_id,
+                                bill_no=item.get("BILL_NO", ""),
+                                bill_name=item.get("BILL_NAME", ""),
+                                law_title=item.get("BILL_NAME", ""),  # law_title이 없으면 bill_name 사용
+                                propose_dt=item.get("PROPOSE_DT", ""),
+                                detail_link=item.get("LINK_URL", ""),
+                                proposer=item.get("PROPOSER", ""),
+                                committee=item.get("CURR_COMMITTEE", ""),
+                                proc_result=proc_result,
+                                main_proposer_id=None  # 대표발의자 정보 없음
+                            )
+                            db.add(bill)
+                            db.flush()
+                        
+                        # 표결이 있는 법안 ID 추가
+                        voted_bill_ids.append(bill_id)
+                
+                # 모든 기존 표결을 찾았으면 종료
+                if found_all_existing:
                     break
             
             db.commit()
@@ -1019,69 +729,47 @@ class ApiService:
             }
             
             print(f"법안 {bill_id}의 표결 정보 요청 중...")
-            response_text = self._make_api_call("vote_results", additional_params)
+            result = self._stream_rows("vote_results", additional_params)
             
-            if not response_text:
+            if result is None:
                 print(f"법안 {bill_id}의 표결 정보를 가져올 수 없습니다.")
                 return None
             
-            # XML 응답 파싱
-            data_dict = parse_xml_to_dict(response_text)
-            
-            # 오류 체크
-            if data_dict.get('error'):
-                print(f"API 오류: {data_dict.get('message')}")
-                return None
-            
-            # 'nojepdqqaweusdfbi' 구조 처리 (표결 정보 API의 응답 구조)
-            if 'nojepdqqaweusdfbi' in data_dict:
-                root = data_dict['nojepdqqaweusdfbi']
-                
-                # 'row' 태그에서 표결 정보 추출
-                items = root.get('row', [])
-                
-                # 단일 항목인 경우 리스트로 변환
-                if isinstance(items, dict):
-                    items = [items]
-                
-                # 표결 결과 없으면 None 반환
-                if not items:
-                    print(f"법안 {bill_id}의 표결 결과가 없습니다.")
-                    return None
-                
-                # 표결 기본 정보 (첫 번째 항목에서 추출)
-                first_item = items[0]
-                vote_date = first_item.get("VOTE_DATE", "")
-                bill_name = first_item.get("BILL_NAME", "")
-                committee = first_item.get("CURR_COMMITTEE", "")
-                law_title = first_item.get("LAW_TITLE", "")
+            # 'row' 태그에서 표결 정보 추출 (스트리밍 파싱)
+            _, items = result
+            first_item = None
+            vote_results = []
+            for item in items:
+                # 표결 기본 정보는 첫 번째 항목에서 추출
+                if first_item is None:
+                    first_item = item
                 
                 # 의원별 표결 결과 추출
-                vote_results = []
-                for item in items:
-                    vote_result = {
-                        "legislator_name": item.get("HG_NM", ""),
-                        "party": item.get("POLY_NM", ""),
-                        "result": item.get("RESULT_VOTE_MOD", "")
-                    }
-                    vote_results.append(vote_result)
-                
-                print(f"법안 {bill_id}의 표결 결과 {len(vote_results)}건 추출 완료")
-                
-                # 결과 딕셔너리 구성
-                vote_info = {
-                    "bill_id": bill_id,
-                    "vote_date": vote_date,
-                    "bill_name": bill_name,
-                    "committee": committee,
-                    "law_title": law_title,
-                    "results": vote_results
+                vote_result = {
+                    "legislator_name": item.get("HG_NM", ""),
+                    "party": item.get("POLY_NM", ""),
+                    "result": item.get("RESULT_VOTE_MOD", "")
                 }
-                
-                return vote_info
-            else:
-                print(f"예상한 구조(nojepdqqaweusdfbi)를 찾지 못했습니다.")
+                vote_results.append(vote_result)
+            
+            # 표결 결과 없으면 None 반환
+            if first_item is None:
+                print(f"법안 {bill_id}의 표결 결과가 없습니다.")
                 return None
+            
+            print(f"법안 {bill_id}의 표결 결과 {len(vote_results)}건 추출 완료")
+            
+            # 결과 딕셔너리 구성
+            vote_info = {
+                "bill_id": bill_id,
+                "vote_date": first_item.get("VOTE_DATE", ""),
+                "bill_name": first_item.get("BILL_NAME", ""),
+                "committee": first_item.get("CURR_COMMITTEE", ""),
+                "law_title": first_item.get("LAW_TITLE", ""),
+                "results": vote_results
+            }
+            
+            return vote_info
                 
         except Exception as e:
             print(f"표결 결과 가져오기 오류: {str(e)}")
@@ -1101,8 +789,7 @@ class ApiService:
         """
         from app.db.database import SessionLocal
         from app.models.legislator import Legislator
-        from app.utils.speech_parser import parse_speech_count_from_nanet
-        from time import sleep
+        from app.services.speech_crawler import SpeechCountCrawler
         
         try:
             print("국회회의록 빅데이터 사이트에서 의원 발언 횟수 수집 시작...")
@@ -1116,20 +803,14 @@ class ApiService:
                 finally:
                     db.close()
             
-            # 결과 리스트 초기화
-            speech_counts = []
+            # 속도 제한을 지키면서 동시에 수집 (재시도 후에도 실패한 의원은 제외)
+            counts = SpeechCountCrawler().crawl(legislator_names)
             
-            # 의원별 발언 횟수 파싱
-            for i, name in enumerate(legislator_names):
-                count = parse_speech_count_from_nanet(name)
-                speech_counts.append({
-                    "name": name,
-                    "count": count
-                })
-                print(f"[{i+1}/{len(legislator_names)}] {name}: {count}회")
-                
-                # 서버 부하 방지를 위한 지연
-                sleep(1)
+            # 결과 리스트 구성 (입력 순서 유지)
+            speech_counts = [
+                {"name": name, "count": counts[name]}
+                for name in legislator_names if name in counts
+            ]
             
             print(f"발언 횟수 수집 완료: {len(speech_counts)}명")
             return speech_counts
@@ -1,8 +1,19 @@
 from sqlalchemy.orm import Session
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from app.models.bill import Bill, BillCoProposer
 
+# HTML 파서 선택 - lxml이 설치되어 있으면 더 빠른 lxml 사용
+try:
+    import lxml  # noqa: F401
+    _HTML_PARSER = "lxml"
+except ImportError:
+    _HTML_PARSER = "html.parser"
+
+# 공동발의자 목록 페이지에서 찬성의원 명단이 들어있는 영역
+_APPROVAL_SECTION_CLASS = "links textType02 mt30"
+
 def get_representative_bills(db: Session, legislator_id: int) -> Dict[str, Any]:
     """
     특정 의원이 대표 발의한 법안 목록 조회
@@ -132,19 +143,20 @@ def get_co_proposers_from_url(url: str) -> List[str]:
         공동발의자 이름 목록
     """
     try:
-        import requests
-        from bs4 import BeautifulSoup
+        from bs4 import BeautifulSoup, SoupStrainer
+        from app.utils.http_cache import cached_get
         
-        # 페이지 요청
-        response = requests.get(url, timeout=10)
+        # 페이지 요청 (디스크 캐시 경유, 공유 세션 사용)
+        response = cached_get(url, category="co_proposers", timeout=10)
         response.raise_for_status()
         
-        # HTML 파싱
-        soup = BeautifulSoup(response.text, 'html.parser')
+        # HTML 파싱 (찬성의원 명단 영역만 파싱하여 전체 트리 생성 비용 절감)
+        soup = BeautifulSoup(response.text, _HTML_PARSER,
+                             parse_only=SoupStrainer('div', class_=_APPROVAL_SECTION_CLASS))
         
         # 찬성의원 섹션 찾기 (div class="links textType02 mt30" 내 p 태그에 '찬성의원 명단'이라는 텍스트가 있음)
         approval_section = None
-        for div in soup.find_all('div', class_='links textType02 mt30'):
+        for div in soup.find_all('div', class_=_APPROVAL_SECTION_CLASS):
             p_tag = div.find('p')
             if p_tag and '찬성의원 명단' in p_tag.text:
                 approval_section = div
@@ -165,6 +177,39 @@ def get_co_proposers_from_url(url: str) -> List[str]:
         print(f"공동발의자 목록 파싱 오류: {str(e)}")
         return []
 
+def prefetch_co_proposers(urls: Iterable[str], max_workers: Optional[int] = None) -> Dict[str, List[str]]:
+    """
+    여러 공동발의자 목록 페이지를 동시에 요청하여 파싱 (DB 저장 전 단계에서 미리 수집)
+    
+    Args:
+        urls: 공동발의자 목록 페이지 URL 목록 (중복은 한 번만 요청)
+        max_workers: 동시 요청 수 (기본값: settings.CO_PROPOSER_FETCH_WORKERS)
+        
+    Returns:
+        URL별 공동발의자 이름 목록 딕셔너리
+    """
+    from app.config import settings
+    
+    unique_urls = list(dict.fromkeys(url for url in urls if url))
+    if not unique_urls:
+        return {}
+    
+    max_workers = max(1, max_workers or settings.CO_PROPOSER_FETCH_WORKERS)
+    print(f"공동발의자 목록 페이지 {len(unique_urls)}개 수집 시작 (동시 요청 {max_workers}개)")
+    
+    results = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(get_co_proposers_from_url, url): url for url in unique_urls}
+        for index, future in enumerate(as_completed(futures), start=1):
+            # get_co_proposers_from_url은 오류 시 빈 목록을 반환함
+            results[futures[future]] = future.result()
+            
+            if index % 50 == 0:
+                print(f"공동발의자 목록 페이지 {index}/{len(unique_urls)}개 수집 완료...")
+    
+    print(f"공동발의자 목록 페이지 수집 완료: {len(results)}개")
+    return results
+
 def format_bill_status(bill: Any) -> str:
     """
     법안 상태(계류중, 가결, 폐기 등) 표시 포맷 변환
@@ -0,0 +1,237 @@
+import threading
+from typing import List, Dict, Any, Optional, Tuple
+
+import numpy as np
+from scipy import sparse
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.models.legislator import Legislator
+from app.models.bill import BillCoProposer
+
+# 진보/보수 정당 구분
+PROGRESSIVE_PARTIES = ["조국혁신당", "더불어민주당", "기본소득당", "진보당", "사회민주당"]
+CONSERVATIVE_PARTIES = ["국민의힘", "개혁신당"]
+
+# 무소속 의원 매핑 (이념 성향 판단용)
+INDEPENDENT_PARTY_MAPPING = {
+    "김상욱": "국민의힘",
+    "우원식": "더불어민주당",
+    "김종민": "더불어민주당"
+}
+
+# 이념 성향 코드 (0: 기타)
+_OTHER, _PROGRESSIVE, _CONSERVATIVE = 0, 1, 2
+
+def get_ideology(party: Optional[str], name: Optional[str] = None) -> str:
+    """
+    정당(무소속은 의원 이름으로 매핑)으로 이념 성향 판단
+
+    Returns:
+        str: "progressive", "conservative", "other"
+    """
+    if party == "무소속" and name in INDEPENDENT_PARTY_MAPPING:
+        party = INDEPENDENT_PARTY_MAPPING[name]
+
+    if party in PROGRESSIVE_PARTIES:
+        return "progressive"
+    if party in CONSERVATIVE_PARTIES:
+        return "conservative"
+    return "other"
+
+class CooperationGraph:
+    """
+    공동발의 관계 그래프
+
+    법안 x 의원 공동발의 행렬을 한 번 읽어 희소 행렬 곱으로 의원 x 의원 공동발의 횟수를 계산
+    (같은 법안을 함께 공동발의한 횟수, 자기 자신은 제외)
+    """
+
+    def __init__(self, legislator_ids: List[int], names: List[Optional[str]], parties: List[Optional[str]],
+                 cowork: sparse.csr_matrix, num_legislators: int):
+        """
+        Args:
+            legislator_ids: 행렬 순서대로의 의원 ID (legislators 테이블에 없는 공동발의자 ID는 뒤쪽에 위치)
+            names: 의원 이름
+            parties: 정당명
+            cowork: 의원 x 의원 공동발의 횟수 (대각 성분 0)
+            num_legislators: legislators 테이블에 있는 의원 수 (앞쪽 행)
+        """
+        self.legislator_ids = np.asarray(legislator_ids)
+        self.index = {legislator_id: i for i, legislator_id in enumerate(legislator_ids)}
+        self.names = names
+        self.parties = parties
+        self.cowork = cowork
+        self.num_legislators = num_legislators
+
+    @classmethod
+    def build(cls, db: Session) -> "CooperationGraph":
+        """
+        DB에서 의원 정보와 공동발의 목록을 각각 한 번씩 조회하여 그래프 생성
+
+        Args:
+            db: 데이터베이스 세션
+
+        Returns:
+            CooperationGraph
+        """
+        legislators = db.execute(select(Legislator.id, Legislator.hg_nm, Legislator.poly_nm)).all()
+        pairs = db.execute(
+            select(BillCoProposer.bill_id, BillCoProposer.legislator_id)
+            .where(BillCoProposer.legislator_id.isnot(None))
+        ).all()
+
+        legislator_ids = [row[0] for row in legislators]
+        names = [row[1] for row in legislators]
+        parties = [row[2] for row in legislators]
+
+        # legislators 테이블에 없는 공동발의자도 협력 상대로는 포함 (이념 성향: 기타)
+        known = set(legislator_ids)
+        for legislator_id in dict.fromkeys(legislator_id for _, legislator_id in pairs):
+            if legislator_id not in known:
+                legislator_ids.append(legislator_id)
+                names.append(None)
+                parties.append(None)
+
+        index = {legislator_id: i for i, legislator_id in enumerate(legislator_ids)}
+        bill_index = {}
+        rows = np.fromiter((bill_index.setdefault(bill_id, len(bill_index)) for bill_id, _ in pairs),
+                           dtype=np.int64, count=len(pairs))
+        cols = np.fromiter((index[legislator_id] for _, legislator_id in pairs), dtype=np.int64, count=len(pairs))
+
+        # 법안 x 의원 행렬 (같은 행이 중복되면 합산되어 기존 self-join 결과와 같은 횟수가 됨)
+        incidence = sparse.csr_matrix(
+            (np.ones(len(pairs), dtype=np.int64), (rows, cols)),
+            shape=(len(bill_index), len(legislator_ids))
+        )
+
+        # 의원 x 의원 공동발의 횟수 = 행렬 전치 곱 (자기 자신 제외)
+        cowork = (incidence.T @ incidence).tocsr()
+        cowork.setdiag(0)
+        cowork.eliminate_zeros()
+
+        return cls(legislator_ids, names, parties, cowork, len(legislators))
+
+    def cooperation_scores(self) -> Dict[int, float]:
+        """
+        의원별 협치 점수 계산 - 이념 성향에 따른 가중치 적용
+        - 다른 이념 성향(진보-보수) 의원과의 공동발의: 가중치 3
+        - 같은 이념 성향이지만 다른 정당 의원과의 공동발의: 가중치 0.1
+        - 점수 = 가중 평균 × 33.33 (최대 100점), 공동발의 상대가 없으면 0점
+
+        Returns:
+            Dict[int, float]: 의원 ID -> 협치 점수 (legislators 테이블의 의원만)
+        """
+        ideology_codes = {"progressive": _PROGRESSIVE, "conservative": _CONSERVATIVE, "other": _OTHER}
+        ideologies = np.array([ideology_codes[get_ideology(party, name)]
+                               for party, name in zip(self.parties, self.names)])
+        party_index = {}
+        party_codes = np.array([party_index.setdefault(party, len(party_index)) for party in self.parties], dtype=int)
+
+        # 협력 상대별 가중치 (행: 의원, 열: 협력 상대)
+        cross_ideology = ((ideologies[:, None] != ideologies[None, :]) &
+                          (ideologies[:, None] != _OTHER) & (ideologies[None, :] != _OTHER))
+        other_party = party_codes[:, None] != party_codes[None, :]
+        weights = np.where(cross_ideology, 3.0, np.where(other_party, 0.1, 0.0))
+
+        total_cooperations = np.asarray(self.cowork.sum(axis=1)).ravel()
+        weighted_scores = np.asarray(self.cowork.multiply(weights).sum(axis=1)).ravel()
+
+        has_coworkers = total_cooperations > 0
+        scores = np.where(
+            has_coworkers,
+            np.minimum(weighted_scores / np.where(has_coworkers, total_cooperations, 1) * 33.33, 100),
+            0
+        )
+
+        return {int(legislator_id): float(score)
+                for legislator_id, score in zip(self.legislator_ids[:self.num_legislators], scores)}
+
+    def top_collaborators(self, legislator_id: int, limit: int = 5) -> List[Tuple[int, int]]:
+        """
+        가장 많이 함께 공동발의한 의원 목록
+
+        Args:
+            legislator_id: 의원 ID
+            limit: 최대 개수
+
+        Returns:
+            List[Tuple[int, int]]: (의원 ID, 공동발의 횟수) 목록 (횟수 내림차순, 같으면 ID 오름차순)
+        """
+        i = self.index.get(legislator_id)
+        if i is None:
+            return []
+
+        row = self.cowork.getrow(i)
+        collaborators = sorted(
+            ((int(self.legislator_ids[j]), int(count)) for j, count in zip(row.indices, row.data)),
+            key=lambda item: (-item[1], item[0])
+        )
+        return collaborators[:limit]
+
+# 프로세스 전역에서 공유하는 그래프 (공동발의/의원 데이터가 바뀌면 다시 생성)
+_graph: Optional[CooperationGraph] = None
+_graph_version = None
+_graph_lock = threading.Lock()
+
+def _data_version(db: Session) -> tuple:
+    # 공동발의/의원 테이블의 건수와 최대 ID, 정당 정보로 변경 여부 판단 (전체를 다시 읽지 않음)
+    co_count, co_max_id = db.execute(select(func.count(BillCoProposer.id), func.max(BillCoProposer.id))).one()
+    legislator_count, legislator_max_id, party_count = db.execute(
+        select(func.count(Legislator.id), func.max(Legislator.id), func.count(func.distinct(Legislator.poly_nm)))
+    ).one()
+    return co_count, co_max_id, legislator_count, legislator_max_id, party_count
+
+def get_cooperation_graph(db: Session, refresh: bool = False) -> CooperationGraph:
+    """
+    공유 공동발의 그래프 반환 (데이터가 바뀌었거나 refresh이면 다시 생성)
+
+    Args:
+        db: 데이터베이스 세션
+        refresh: True이면 항상 다시 생성 (점수 계산 시)
+
+    Returns:
+        CooperationGraph
+    """
+    global _graph, _graph_version
+
+    version = _data_version(db)
+    with _graph_lock:
+        if refresh or _graph is None or _graph_version != version:
+            _graph = CooperationGraph.build(db)
+            _graph_version = version
+        return _graph
+
+def get_top_collaborators(db: Session, legislator_id: int, limit: int = 5) -> List[Dict[str, Any]]:
+    """
+    특정 의원과 가장 많이 함께 공동발의한 의원 목록 조회
+
+    Args:
+        db: 데이터베이스 세션
+        legislator_id: 국회의원 ID
+        limit: 최대 개수
+
+    Returns:
+        List[Dict[str, Any]]: 의원 정보와 공동발의 횟수 목록
+    """
+    collaborators = get_cooperation_graph(db).top_collaborators(legislator_id, limit)
+    if not collaborators:
+        return []
+
+    legislators = {
+        legislator.id: legislator
+        for legislator in db.query(Legislator).filter(Legislator.id.in_([cid for cid, _ in collaborators]))
+    }
+
+    result = []
+    for collaborator_id, count in collaborators:
+        legislator = legislators.get(collaborator_id)
+        if legislator is None:
+            continue
+        result.append({
+            "id": legislator.id,
+            "name": legislator.hg_nm,
+            "party": legislator.poly_nm,
+            "count": count
+        })
+    return result
@@ -1,17 +1,20 @@
 from sqlalchemy.orm import Session
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from scripts.calculate_scores import calculate_participation_scores
+from app.services.legislator_resolver import LegislatorResolver
+from app.services.data_version_service import bump_data_version
 
-def process_attendance_data(raw_data: List[Dict[str, Any]], db: Session) -> None:
+def process_attendance_data(raw_data: List[Dict[str, Any]], db: Session,
+                            resolver: Optional[LegislatorResolver] = None) -> None:
     """
     출석 데이터 처리 및 DB 저장
     
     Args:
         raw_data: 출석 데이터 리스트
         db: 데이터베이스 세션
+        resolver: 의원 이름 -> ID 인덱스 (None인 경우 내부에서 생성)
     """
     from app.models.attendance import Attendance
-    from app.models.legislator import Legislator
     
     try:
         processed_count = 0
@@ -21,8 +24,8 @@ def process_attendance_data(raw_data: List[Dict[str, Any]], db: Session) -> None
         plenary_data = [data for data in raw_data if data['meeting_type'] == '본회의']
         standing_data = [data for data in raw_data if data['meeting_type'] == '상임위']
         
-        # 의원 이름 캐시
-        legislator_name_map = {}
+        # 의원 이름 -> ID 인덱스 (의원 전체를 한 번만 조회)
+        resolver = resolver or LegislatorResolver(db)
         
         print(f"처리할 본회의 데이터: {len(plenary_data)}개")
         print(f"처리할 상임위 데이터: {len(standing_data)}개")
@@ -31,20 +34,16 @@ def process_attendance_data(raw_data: List[Dict[str, Any]], db: Session) -> None
         for data in plenary_data:
             legislator_name = data['legislator_name']
             
-            # 의원 정보 조회 (캐시에 없으면 DB 조회)
-            if legislator_name not in legislator_name_map:
-                legislator = db.query(Legislator).filter(Legislator.hg_nm == legislator_name).first()
-                if not legislator:
-                    print(f"경고: {legislator_name} 의원을 DB에서 찾을 수 없습니다.")
-                    skipped_count += 1
-                    continue
-                legislator_name_map[legislator_name] = legislator
-            else:
-                legislator = legislator_name_map[legislator_name]
+            # 의원 ID 조회
+            legislator_id = resolver.resolve(legislator_name)
+            if legislator_id is None:
+                print(f"경고: {legislator_name} 의원을 DB에서 찾을 수 없습니다.")
+                skipped_count += 1
+                continue
             
             # 새 데이터 추가
             new_attendance = Attendance(
-                legislator_id=legislator.id,
+                legislator_id=legislator_id,
                 committee_id=None,
                 meeting_type='본회의',
                 status=data['status'],
@@ -61,26 +60,22 @@ def process_attendance_data(raw_data: List[Dict[str, Any]], db: Session) -> None
             legislator_name = data['legislator_name']
             status = data['status']
             
-            # 의원 정보 조회 (캐시에 없으면 DB 조회)
-            if legislator_name not in legislator_name_map:
-                legislator = db.query(Legislator).filter(Legislator.hg_nm == legislator_name).first()
-                if not legislator:
-                    print(f"경고: {legislator_name} 의원을 DB에서 찾을 수 없습니다.")
-                    skipped_count += 1
-                    continue
-                legislator_name_map[legislator_name] = legislator
-            else:
-                legislator = legislator_name_map[legislator_name]
+            # 의원 ID 조회
+            legislator_id = resolver.resolve(legislator_name)
+            if legislator_id is None:
+                print(f"경고: {legislator_name} 의원을 DB에서 찾을 수 없습니다.")
+                skipped_count += 1
+                continue
             
             # 의원별, 상태별 카운트 합산
-            key = (legislator.id, status)
+            key = (legislator_id, status)
             if key not in standing_summary:
                 standing_summary[key] = 0
             standing_summary[key] += data.get('count', 0)
         
         # 합산된 상임위 데이터 저장
         for (legislator_id, status), count in standing_summary.items():
-            legislator_name = next((name for name, leg in legislator_name_map.items() if leg.id == legislator_id), "Unknown")
+            legislator_name = resolver.get_name(legislator_id) or "Unknown"
             print(f"상임위 합산 데이터 추가: {legislator_name}, {status}: {count}회")
             
             new_attendance = Attendance(
@@ -96,6 +91,8 @@ def process_attendance_data(raw_data: List[Dict[str, Any]], db: Session) -> None
         
         # 변경사항 커밋
         db.commit()
+        if processed_count > 0:
+            bump_data_version(db, "attendance")
         print(f"\n=== 출석 데이터 처리 결과 ===")
         print(f"추가: {processed_count}개")
         print(f"건너뜀: {skipped_count}개")
@@ -113,7 +110,7 @@ def process_attendance_data(raw_data: List[Dict[str, Any]], db: Session) -> None
         import traceback
         traceback.print_exc()
 
-def process_speech_data(raw_data, db: Session):
+def process_speech_data(raw_data, db: Session, resolver: Optional[LegislatorResolver] = None):
     # 발언 데이터 정리 및 가공
     # 발언 횟수, 키워드 분석
     # 반환: 처리된 발언 데이터
@@ -123,9 +120,9 @@ def process_speech_data(raw_data, db: Session):
     Args:
         raw_data: 회의별 발언 데이터 리스트
         db: 데이터베이스 세션
+        resolver: 의원 이름 -> ID 인덱스 (None인 경우 내부에서 생성)
     """
     from app.models.speech import SpeechByMeeting
-    from app.models.legislator import Legislator
     
     try:
         # 결과 저장용 딕셔너리: {의원ID: Total 값}
@@ -133,47 +130,41 @@ def process_speech_data(raw_data, db: Session):
         processed_count = 0
         skipped_count = 0
         duplicated_count = 0
+        changed_count = 0  # 새로 추가했거나 값이 바뀐 행 수
         
-        # 의원 이름 목록 - 각 의원 정보를 한 번만 조회하기 위함
-        legislator_name_map = {}
+        # 의원 이름 -> ID 인덱스 (의원 전체를 한 번만 조회)
+        resolver = resolver or LegislatorResolver(db)
         
         # 각 발언 데이터를 처리
         for data in raw_data:
             legislator_name = data['legislator_name']
             
-            # 의원 정보가 캐시에 없으면 DB에서 조회
-            if legislator_name not in legislator_name_map:
-                legislator = db.query(Legislator).filter(Legislator.hg_nm == legislator_name).first()
-                if not legislator:
-                    print(f"경고: {legislator_name} 의원을 DB에서 찾을 수 없습니다.")
-                    skipped_count += 1
-                    continue
-                legislator_name_map[legislator_name] = legislator
-            else:
-                legislator = legislator_name_map[legislator_name]
-            
-            if not legislator:
+            # 의원 ID 조회
+            legislator_id = resolver.resolve(legislator_name)
+            if legislator_id is None:
+                print(f"경고: {legislator_name} 의원을 DB에서 찾을 수 없습니다.")
                 skipped_count += 1
                 continue
                 
             # 'Total'은 따로 저장해두고, speech_score 계산에 사용
             if data['meeting_type'] == 'Total':
-                total_speeches[legislator.id] = data['count']
+                total_speeches[legislator_id] = data['count']
                 
             # DB에 저장 (Total 포함)
             existing_speech = db.query(SpeechByMeeting).filter(
-                SpeechByMeeting.legislator_id == legislator.id,
+                SpeechByMeeting.legislator_id == legislator_id,
                 SpeechByMeeting.meeting_type == data['meeting_type']
             ).first()
             
             if existing_speech:
                 # 기존 데이터가 있으면 값을 더해주거나 최대값을 선택
-                print(f"중복 데이터 발견: {legislator.hg_nm} - {data['meeting_type']} (기존: {existing_speech.count}, 새로운: {data['count']})")
+                print(f"중복 데이터 발견: {legislator_name} - {data['meeting_type']} (기존: {existing_speech.count}, 새로운: {data['count']})")
                 
                 # 더 큰 값을 선택하거나, 합산하거나, 최신 값으로 업데이트
                 # 여기서는 더 큰 값을 선택하는 방식으로 처리
                 if data['count'] > existing_speech.count:
                     existing_speech.count = data['count']
+                    changed_count += 1
                     print(f"  -> 더 큰 값으로 업데이트: {data['count']}")
                 else:
                     print(f"  -> 기존 값 유지: {existing_speech.count}")
@@ -182,17 +173,20 @@ def process_speech_data(raw_data, db: Session):
             else:
                 # 새 데이터 추가
                 new_speech = SpeechByMeeting(
-                    legislator_id=legislator.id,
+                    legislator_id=legislator_id,
                     meeting_type=data['meeting_type'],
                     count=data['count']
                 )
                 db.add(new_speech)
-                print(f"새 데이터 추가: {legislator.hg_nm} - {data['meeting_type']}: {data['count']}")
+                changed_count += 1
+                print(f"새 데이터 추가: {legislator_name} - {data['meeting_type']}: {data['count']}")
                 
             processed_count += 1
         
         # 변경사항 커밋
         db.commit()
+        if changed_count > 0:
+            bump_data_version(db, "speech_by_meeting")
         print(f"\n=== 처리 결과 ===")
         print(f"처리 완료: {processed_count}개")
         print(f"건너뜀: {skipped_count}개")
@@ -205,71 +199,66 @@ def process_speech_data(raw_data, db: Session):
         import traceback
         traceback.print_exc()
 
-def process_keyword_data(raw_data: List[Dict[str, Any]], db: Session):
+def process_keyword_data(raw_data: List[Dict[str, Any]], db: Session,
+                         resolver: Optional[LegislatorResolver] = None):
     """
     발언 키워드 데이터 정리 및 가공하여 DB에 저장
     
     Args:
         raw_data: 키워드 데이터 리스트
         db: 데이터베이스 세션
+        resolver: 의원 이름 -> ID 인덱스 (None인 경우 내부에서 생성)
     """
     from app.models.speech import SpeechKeyword
-    from app.models.legislator import Legislator
     
     try:
         processed_count = 0
         skipped_count = 0
         updated_count = 0
         
-        # 의원 이름 캐시
-        legislator_name_map = {}
+        # 의원 이름 -> ID 인덱스 (의원 전체를 한 번만 조회)
+        resolver = resolver or LegislatorResolver(db)
         
         # 각 키워드 데이터를 처리
         for data in raw_data:
             legislator_name = data['legislator_name']
             
-            # 의원 정보가 캐시에 없으면 DB에서 조회
-            if legislator_name not in legislator_name_map:
-                legislator = db.query(Legislator).filter(Legislator.hg_nm == legislator_name).first()
-                if not legislator:
-                    print(f"경고: {legislator_name} 의원을 DB에서 찾을 수 없습니다.")
-                    skipped_count += 1
-                    continue
-                legislator_name_map[legislator_name] = legislator
-            else:
-                legislator = legislator_name_map[legislator_name]
-            
-            if not legislator:
+            # 의원 ID 조회
+            legislator_id = resolver.resolve(legislator_name)
+            if legislator_id is None:
+                print(f"경고: {legislator_name} 의원을 DB에서 찾을 수 없습니다.")
                 skipped_count += 1
                 continue
             
             # 기존 키워드 데이터 확인
             existing_keyword = db.query(SpeechKeyword).filter(
-                SpeechKeyword.legislator_id == legislator.id,
+                SpeechKeyword.legislator_id == legislator_id,
                 SpeechKeyword.keyword == data['keyword']
             ).first()
             
             if existing_keyword:
                 # 기존 데이터가 있으면 값을 비교하여 업데이트
                 if existing_keyword.count != data['count']:
-                    print(f"키워드 업데이트: {legislator.hg_nm} - '{data['keyword']}' (기존: {existing_keyword.count}, 새로운: {data['count']})")
+                    print(f"키워드 업데이트: {legislator_name} - '{data['keyword']}' (기존: {existing_keyword.count}, 새로운: {data['count']})")
                     existing_keyword.count = data['count']
                     updated_count += 1
                 else:
-                    print(f"동일한 데이터 스킵: {legislator.hg_nm} - '{data['keyword']}': {data['count']}")
+                    print(f"동일한 데이터 스킵: {legislator_name} - '{data['keyword']}': {data['count']}")
             else:
                 # 새 키워드 데이터 추가
                 new_keyword = SpeechKeyword(
-                    legislator_id=legislator.id,
+                    legislator_id=legislator_id,
                     keyword=data['keyword'],
                     count=data['count']
                 )
                 db.add(new_keyword)
-                print(f"새 키워드 추가: {legislator.hg_nm} - '{data['keyword']}': {data['count']}")
+                print(f"새 키워드 추가: {legislator_name} - '{data['keyword']}': {data['count']}")
                 processed_count += 1
         
         # 변경사항 커밋
         db.commit()
+        if processed_count or updated_count:
+            bump_data_version(db, "speech_keywords")
         print(f"\n=== 키워드 처리 결과 ===")
         print(f"새로 추가: {processed_count}개")
         print(f"업데이트: {updated_count}개")
@@ -281,295 +270,370 @@ def process_keyword_data(raw_data: List[Dict[str, Any]], db: Session):
         import traceback
         traceback.print_exc()
 
-def process_bill_data(raw_data):
+# process_bill_data_batch에서 upsert하는 법안 컬럼
+BILL_UPSERT_FIELDS = [
+    "bill_id", "bill_name", "propose_dt", "detail_link", "proposer",
+    "committee", "proc_result", "main_proposer_id", "member_list_url"
+]
+
+def _get_upsert_insert(db: Session):
     """
-    법안 데이터 정리 및 가공
-    
+    DB 종류에 맞는 INSERT ... ON CONFLICT 구문 생성 함수 반환
+    """
+    dialect = db.get_bind().dialect.name
+    if dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    elif dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        raise ValueError(f"upsert를 지원하지 않는 DB입니다: {dialect}")
+    return insert
+
+def _build_bill_state(bill_data: Dict[str, Any], resolver: LegislatorResolver,
+                      co_proposer_pages: Optional[Dict[str, List[str]]] = None) -> Optional[Dict[str, Any]]:
+    """
+    API 법안 데이터 하나로 저장할 법안 행과 공동발의자 집합 계산 (DB 접근 없음)
+
+    Args:
+        bill_data: API로부터 받은 원본 법안 데이터
+        resolver: 의원 이름 -> ID 인덱스
+        co_proposer_pages: 미리 수집한 URL별 공동발의자 이름 목록 (없는 URL만 직접 요청)
+
+    Returns:
+        {"row": 법안 컬럼 딕셔너리, "co_proposers": {(의원ID, 대표발의자 여부)}}, 대표발의자를 찾지 못하면 None
+    """
+    from app.services.bill_service import get_co_proposers_from_url
+
+    # 대표발의자 처리 (쉼표로 구분된 여러 발의자 처리)
+    main_proposers_str = bill_data.get("main_proposer", "")
+    if not main_proposers_str:
+        print(f"대표발의자 정보가 없음: 법안: {bill_data.get('bill_name')}")
+        return None
+
+    main_proposer_names = [name.strip() for name in main_proposers_str.split(',')]
+
+    # 첫 번째로 찾은 대표발의자가 main_proposer, 나머지는 공동 대표발의자
+    primary_proposer_id = None
+    co_proposers = {}
+    for name in main_proposer_names:
+        proposer_id = resolver.resolve(name)
+        if proposer_id is None:
+            continue
+        if primary_proposer_id is None:
+            primary_proposer_id = proposer_id
+        elif proposer_id != primary_proposer_id:
+            co_proposers[proposer_id] = True
+
+    # 대표발의자를 하나도 찾지 못한 경우 스킵
+    if primary_proposer_id is None:
+        print(f"대표발의자를 찾을 수 없음: {main_proposers_str}, 법안: {bill_data.get('bill_name')}")
+        return None
+
+    member_list_url = bill_data.get("MEMBER_LIST", "")
+
+    # 일반 공동발의자 이름 (API 값이 없으면 member_list_url에서 파싱)
+    co_proposers_str = bill_data.get("co_proposers", "")
+    if co_proposers_str:
+        co_proposer_names = [name.strip() for name in co_proposers_str.split(',')]
+    elif co_proposer_pages is not None and member_list_url in co_proposer_pages:
+        co_proposer_names = co_proposer_pages[member_list_url]
+    elif member_list_url:
+        print(f"공동발의자 정보가 비어있어 URL에서 파싱합니다: {member_list_url}")
+        co_proposer_names = get_co_proposers_from_url(member_list_url)
+    else:
+        co_proposer_names = []
+
+    for name in co_proposer_names:
+        if not name or name in main_proposer_names:
+            continue
+        co_proposer_id = resolver.resolve(name)
+        if co_proposer_id is not None:
+            co_proposers.setdefault(co_proposer_id, False)
+
+    row = {
+        "bill_no": bill_data.get("bill_no"),
+        "bill_id": bill_data.get("bill_id", ""),
+        "bill_name": bill_data.get("bill_name"),
+        "propose_dt": bill_data.get("propose_dt"),
+        "detail_link": bill_data.get("detail_link"),
+        "proposer": bill_data.get("proposer"),
+        "committee": bill_data.get("committee"),
+        "proc_result": bill_data.get("proc_result"),
+        "main_proposer_id": primary_proposer_id,
+        "member_list_url": member_list_url
+    }
+
+    return {"row": row, "co_proposers": set(co_proposers.items())}
+
+def process_bill_data_batch(raw_data, chunk_size: Optional[int] = None,
+                            resolver: Optional[LegislatorResolver] = None):
+    """
+    법안 데이터 일괄 처리 - 저장할 상태를 메모리에서 계산한 뒤 청크 단위로 반영
+
+    - 공동발의자 목록 페이지: DB 작업 전에 스레드 풀로 동시에 미리 수집
+    - 법안: 값이 바뀐 행만 INSERT ... ON CONFLICT(bill_no) DO UPDATE로 upsert
+    - 공동발의자: 기존 목록과 비교하여 추가/삭제된 행만 반영
+    - 청크마다 한 번 커밋하므로, 변경 없는 데이터를 다시 처리하면 조회만 하고 끝남
+
     Args:
         raw_data: API로부터 받은 원본 법안 데이터
-    
+        chunk_size: 한 번에 처리/커밋할 법안 수 (기본값: settings.BILL_BATCH_SIZE)
+        resolver: 의원 이름 -> ID 인덱스 (None인 경우 내부에서 생성)
+
     Returns:
-        처리된 법안 데이터 리스트
+        처리된 법안 데이터 리스트 (법안 ID, 의안번호와 저장한 법안 컬럼)
     """
+    from app.config import settings
     from app.db.database import SessionLocal
     from app.models.bill import Bill, BillCoProposer
-    from app.models.legislator import Legislator
-    from app.services.bill_service import get_co_proposers_from_url  # 추가된 부분
-    
+    from app.services.bill_service import prefetch_co_proposers
+
+    chunk_size = chunk_size or settings.BILL_BATCH_SIZE
+
     db = SessionLocal()
     processed_bills = []
-    
+    stats = {"inserted": 0, "updated": 0, "unchanged": 0, "skipped": 0,
+             "co_added": 0, "co_removed": 0}
+
     try:
-        # 각 법안 데이터 처리
+        insert = _get_upsert_insert(db)
+
+        # 의원 이름 -> ID 인덱스 (의원 전체를 한 번만 조회)
+        resolver = resolver or LegislatorResolver(db)
+
+        # 1. 공동발의자 정보가 없는 법안의 목록 페이지를 동시에 미리 수집 (DB 트랜잭션 밖에서 네트워크 대기)
+        co_proposer_pages = prefetch_co_proposers(
+            bill_data.get("MEMBER_LIST") for bill_data in raw_data
+            if bill_data.get("main_proposer") and not bill_data.get("co_proposers")
+        )
+
+        # 2. 저장할 상태 계산 (같은 의안번호가 여러 번 나오면 마지막 값 사용)
+        desired = {}
         for bill_data in raw_data:
+            state = _build_bill_state(bill_data, resolver, co_proposer_pages)
+            if state is None or not state["row"]["bill_no"]:
+                stats["skipped"] += 1
+                continue
+            desired[state["row"]["bill_no"]] = state
+
+        bill_nos = list(desired.keys())
+        print(f"법안 일괄 처리 시작: {len(bill_nos)}개 (청크 크기: {chunk_size})")
+
+        # 3. 청크 단위로 반영 (미리 수집한 결과만 사용)
+        for start in range(0, len(bill_nos), chunk_size):
+            chunk = bill_nos[start:start + chunk_size]
+
             try:
-                # 대표발의자 처리 (쉼표로 구분된 여러 발의자 처리)
-                main_proposers_str = bill_data.get("main_proposer", "")
-                if not main_proposers_str:
-                    print(f"대표발의자 정보가 없음: 법안: {bill_data.get('bill_name')}")
-                    continue
-                
-                # 쉼표로 구분된 대표발의자 이름 파싱
-                main_proposer_names = [name.strip() for name in main_proposers_str.split(',')]
-                if not main_proposer_names:
-                    print(f"대표발의자 정보 파싱 실패: {main_proposers_str}, 법안: {bill_data.get('bill_name')}")
-                    continue
-                
-                # 첫 번째 대표발의자 찾기
-                primary_proposer = None
-                for name in main_proposer_names:
-                    proposer = db.query(Legislator).filter(Legislator.hg_nm == name).first()
-                    if proposer:
-                        primary_proposer = proposer
-                        break
-                
-                # 대표발의자를 하나도 찾지 못한 경우 스킵
-                if not primary_proposer:
-                    print(f"대표발의자를 찾을 수 없음: {main_proposers_str}, 법안: {bill_data.get('bill_name')}")
-                    continue
-                
-                # MEMBER_LIST URL 추출
-                member_list_url = bill_data.get("MEMBER_LIST", "")
-                
-                # 기존 법안 정보 확인
-                existing_bill = db.query(Bill).filter(Bill.bill_no == bill_data.get("bill_no")).first()
-                
-                if existing_bill:
-                    # 기존 법안 정보 업데이트
-                    existing_bill.bill_id = bill_data.get("bill_id", "")  # bill_id 필드 추가
-                    existing_bill.bill_name = bill_data.get("bill_name")
-                    existing_bill.propose_dt = bill_data.get("propose_dt")
-                    existing_bill.detail_link = bill_data.get("detail_link")
-                    existing_bill.proposer = bill_data.get("proposer")
-                    existing_bill.committee = bill_data.get("committee")
-                    existing_bill.proc_result = bill_data.get("proc_result")
-                    existing_bill.main_proposer_id = primary_proposer.id
-                    existing_bill.member_list_url = member_list_url
-                    
-                    bill = existing_bill
-                else:
-                    # 새 법안 정보 생성
-                    bill = Bill(
-                        bill_id=bill_data.get("bill_id", ""),  # bill_id 필드 추가
-                        bill_no=bill_data.get("bill_no"),
-                        bill_name=bill_data.get("bill_name"),
-                        propose_dt=bill_data.get("propose_dt"),
-                        detail_link=bill_data.get("detail_link"),
-                        proposer=bill_data.get("proposer"),
-                        committee=bill_data.get("committee"),
-                        proc_result=bill_data.get("proc_result"),
-                        main_proposer_id=primary_proposer.id,
-                        member_list_url=member_list_url
-                    )
-                    db.add(bill)
-                    db.flush()  # ID 할당을 위해 flush
-                
-                # 기존 공동발의자 삭제
-                db.query(BillCoProposer).filter(BillCoProposer.bill_id == bill.id).delete()
-                
-                # 대표발의자 중 첫 번째를 제외한 나머지를 공동발의자로 등록
-                for name in main_proposer_names:
-                    if name == primary_proposer.hg_nm:
+                # 기존 법안 값 조회
+                columns = [Bill.id, Bill.bill_no] + [getattr(Bill, field) for field in BILL_UPSERT_FIELDS]
+                existing = {row.bill_no: row for row in db.query(*columns).filter(Bill.bill_no.in_(chunk)).all()}
+
+                # 새로 추가되거나 값이 바뀐 법안만 upsert
+                upsert_rows = []
+                for bill_no in chunk:
+                    row = desired[bill_no]["row"]
+                    current = existing.get(bill_no)
+                    if current is None:
+                        stats["inserted"] += 1
+                    elif any(getattr(current, field) != row[field] for field in BILL_UPSERT_FIELDS):
+                        stats["updated"] += 1
+                    else:
+                        stats["unchanged"] += 1
                         continue
-                    
-                    co_proposer = db.query(Legislator).filter(Legislator.hg_nm == name).first()
-                    if co_proposer:
-                        co_proposer_rel = BillCoProposer(
-                            bill_id=bill.id,
-                            legislator_id=co_proposer.id,
-                            is_representative=True  # 대표발의자 여부 표시
-                        )
-                        db.add(co_proposer_rel)
-                
-                # 일반 공동발의자 처리
-                co_proposers_str = bill_data.get("co_proposers", "")
-                
-                # 공동발의자 정보가 API에서 제공되는 경우
-                if co_proposers_str:
-                    co_proposer_names = [name.strip() for name in co_proposers_str.split(',')]
-                    
-                    # 공동발의자 정보 DB에 저장
-                    for name in co_proposer_names:
-                        if not name or name in main_proposer_names:
-                            continue
-                        
-                        # 공동발의자 정보 DB에서 조회
-                        co_proposer = db.query(Legislator).filter(Legislator.hg_nm == name).first()
-                        if co_proposer:
-                            # 공동발의자 연결 정보 추가
-                            co_proposer_rel = BillCoProposer(
-                                bill_id=bill.id,
-                                legislator_id=co_proposer.id,
-                                is_representative=False  # 일반 공동발의자
-                            )
-                            db.add(co_proposer_rel)
-                # API에서 공동발의자 정보가 제공되지 않는 경우, member_list_url에서 가져오기
-                elif member_list_url:
-                    try:
-                        print(f"공동발의자 정보가 비어있어 URL에서 파싱합니다: {member_list_url}")
-                        url_co_proposer_names = get_co_proposers_from_url(member_list_url)
-                        
-                        for name in url_co_proposer_names:
-                            if not name or name in main_proposer_names:
-                                continue
-                            
-                            # 공동발의자 정보 DB에서 조회
-                            co_proposer = db.query(Legislator).filter(Legislator.hg_nm == name).first()
-                            if co_proposer:
-                                # 공동발의자 연결 정보 추가
-                                co_proposer_rel = BillCoProposer(
-                                    bill_id=bill.id,
-                                    legislator_id=co_proposer.id,
-                                    is_representative=False  # 일반 공동발의자
-                                )
-                                db.add(co_proposer_rel)
-                    except Exception as e:
-                        print(f"공동발의자 URL 파싱 중 오류 발생: {str(e)}")
-                
-                # 변경사항 저장
+                    upsert_rows.append(row)
+
+                if upsert_rows:
+                    stmt = insert(Bill)
+                    stmt = stmt.on_conflict_do_update(
+                        index_elements=[Bill.bill_no],
+                        set_={field: stmt.excluded[field] for field in BILL_UPSERT_FIELDS}
+                    )
+                    db.execute(stmt, upsert_rows)
+
+                # 법안 ID 확인 (새로 추가된 법안 포함)
+                bill_ids = {bill_no: bill_id for bill_id, bill_no in
+                            db.query(Bill.id, Bill.bill_no).filter(Bill.bill_no.in_(chunk)).all()}
+
+                # 기존 공동발의자 조회
+                existing_co = {}
+                co_rows = db.query(
+                    BillCoProposer.id, BillCoProposer.bill_id,
+                    BillCoProposer.legislator_id, BillCoProposer.is_representative
+                ).filter(BillCoProposer.bill_id.in_(list(bill_ids.values()))).all()
+                for co_row in co_rows:
+                    existing_co.setdefault(co_row.bill_id, []).append(co_row)
+
+                # 공동발의자 차이만 반영
+                co_insert_rows = []
+                co_delete_ids = []
+                for bill_no in chunk:
+                    bill_id = bill_ids[bill_no]
+                    wanted = desired[bill_no]["co_proposers"]
+
+                    kept = set()
+                    for co_row in existing_co.get(bill_id, []):
+                        key = (co_row.legislator_id, bool(co_row.is_representative))
+                        if key in wanted and key not in kept:
+                            kept.add(key)
+                        else:
+                            # 더 이상 없는 공동발의자 또는 중복 행
+                            co_delete_ids.append(co_row.id)
+
+                    for legislator_id, is_representative in wanted - kept:
+                        co_insert_rows.append({
+                            "bill_id": bill_id,
+                            "legislator_id": legislator_id,
+                            "is_representative": is_representative
+                        })
+
+                if co_delete_ids:
+                    db.query(BillCoProposer).filter(
+                        BillCoProposer.id.in_(co_delete_ids)
+                    ).delete(synchronize_session=False)
+                if co_insert_rows:
+                    db.bulk_insert_mappings(BillCoProposer, co_insert_rows)
+
+                # 청크 단위 커밋
                 db.commit()
-                
+
+                stats["co_added"] += len(co_insert_rows)
+                stats["co_removed"] += len(co_delete_ids)
+
                 # 처리된 법안 정보 추가
-                processed_bill = {
-                    "id": bill.id,
-                    "bill_no": bill.bill_no,
-                    "bill_name": bill.bill_name,
-                    "propose_dt": bill.propose_dt,
-                    "detail_link": bill.detail_link,
-                    "proposer": bill.proposer,
-                    "committee": bill.committee,
-                    "proc_result": bill.proc_result,
-                    "main_proposer_id": bill.main_proposer_id,
-                    "member_list_url": bill.member_list_url
-                }
-                processed_bills.append(processed_bill)
-                
+                for bill_no in chunk:
+                    row = desired[bill_no]["row"]
+                    processed_bills.append({
+                        "id": bill_ids[bill_no],
+                        "bill_no": bill_no,
+                        "bill_name": row["bill_name"],
+                        "propose_dt": row["propose_dt"],
+                        "detail_link": row["detail_link"],
+                        "proposer": row["proposer"],
+                        "committee": row["committee"],
+                        "proc_result": row["proc_result"],
+                        "main_proposer_id": row["main_proposer_id"],
+                        "member_list_url": row["member_list_url"]
+                    })
+
+                print(f"{min(start + chunk_size, len(bill_nos))}/{len(bill_nos)}개 법안 처리 완료...")
+
             except Exception as e:
-                print(f"법안 처리 중 오류 발생: {str(e)}, 법안: {bill_data.get('bill_name')}")
-                db.rollback()  # 오류 발생 시 롤백
+                print(f"법안 청크 처리 중 오류 발생: {str(e)}")
+                db.rollback()  # 오류 발생 시 해당 청크만 롤백
                 continue
-        
+
+        # 점수 계산용 데이터 버전 갱신 (실제로 바뀐 경우만)
+        changed_tables = []
+        if stats["inserted"] or stats["updated"]:
+            changed_tables.append("bills")
+        if stats["co_added"] or stats["co_removed"]:
+            changed_tables.append("bill_co_proposers")
+        if changed_tables:
+            bump_data_version(db, *changed_tables)
+
+        print(f"법안 일괄 처리 완료: 추가 {stats['inserted']}개, 변경 {stats['updated']}개, "
+              f"변경 없음 {stats['unchanged']}개, 건너뜀 {stats['skipped']}개 / "
+              f"공동발의자 추가 {stats['co_added']}개, 삭제 {stats['co_removed']}개")
         return processed_bills
     finally:
         db.close()
 
-def process_vote_data(raw_data, db=None):
+def process_vote_batch(vote_data_list: List[Dict[str, Any]], db: Session,
+                       resolver: Optional[LegislatorResolver] = None) -> Dict[str, int]:
     """
-    표결 데이터 정리 및 가공
-    
+    여러 법안의 표결 데이터를 한 트랜잭션으로 저장 (fetch_votes 파이프라인의 쓰기 단계)
+
     Args:
-        raw_data: API로부터 받은 원본 표결 데이터
-        db: 데이터베이스 세션 (None인 경우 내부에서 생성)
-    
+        vote_data_list: fetch_vote_results()가 반환한 표결 정보 리스트
+        db: 데이터베이스 세션
+        resolver: 의원 이름 -> ID 인덱스 (None인 경우 내부에서 생성)
+
     Returns:
-        처리된 표결 데이터
+        저장 통계 딕셔너리 (votes, results, missing_legislators, skipped_bills)
     """
-    from app.db.database import SessionLocal
     from app.models.vote import Vote, VoteResult
     from app.models.bill import Bill
-    from app.models.legislator import Legislator
-    
-    if not raw_data:
-        return None
-    
-    # DB 세션 생성 (외부에서 제공되지 않은 경우)
-    close_db = False
-    if db is None:
-        db = SessionLocal()
-        close_db = True
-    
+
+    stats = {"votes": 0, "results": 0, "missing_legislators": 0, "skipped_bills": 0}
+    if not vote_data_list:
+        return stats
+
     try:
-        bill_id = raw_data.get("bill_id")
-        vote_date = raw_data.get("vote_date")
-        
-        # 법안 ID로 법안 정보 조회
-        bill = db.query(Bill).filter(Bill.bill_id == bill_id).first()
-        if not bill:
-            print(f"bill_id로 법안을 찾을 수 없음: {bill_id}, bill_no로 시도합니다.")
-            # bill_no가 있는 경우 bill_no로도 시도
-            if raw_data.get("bill_no"):
-                bill = db.query(Bill).filter(Bill.bill_no == raw_data.get("bill_no")).first()
-        
-        # 기존 표결 정보 확인
-        existing_vote = db.query(Vote).filter(
-            Vote.bill_id == bill.id,
-            Vote.vote_date == vote_date
-        ).first()
-        
-        if existing_vote:
-            # 기존 표결 결과 삭제
-            db.query(VoteResult).filter(
-                VoteResult.vote_id == existing_vote.id
-            ).delete()
-            
-            vote = existing_vote
-        else:
-            # 새 표결 정보 생성
-            vote = Vote(
-                vote_date=vote_date,
-                bill_id=bill.id
-            )
-            db.add(vote)
-            db.flush()  # ID 할당을 위해 flush
-        
-        # 표결 결과 처리
-        results = raw_data.get("results", [])
-        processed_count = 0
-        missing_legislators = []
-        
-        for result in results:
-            # 의원 이름으로 의원 정보 조회
-            legislator_name = result.get("legislator_name", "")
-            legislator = db.query(Legislator).filter(
-                Legislator.hg_nm == legislator_name
-            ).first()
-            
-            if not legislator:
-                missing_legislators.append(legislator_name)
+        # 배치에 포함된 법안을 한 번에 조회
+        bill_ids = [data.get("bill_id") for data in vote_data_list]
+        bills = {bill.bill_id: bill for bill in db.query(Bill).filter(Bill.bill_id.in_(bill_ids)).all()}
+
+        # 의원 이름 -> ID 인덱스 (의원 전체를 한 번만 조회)
+        resolver = resolver or LegislatorResolver(db)
+
+        # 기존 표결 정보 조회
+        existing_votes = {
+            (vote.bill_id, vote.vote_date): vote
+            for vote in db.query(Vote).filter(Vote.bill_id.in_([bill.id for bill in bills.values()])).all()
+        }
+
+        # 표결 단위로 정리 (같은 표결이 중복되면 마지막 결과 사용)
+        votes = {}
+        for data in vote_data_list:
+            bill = bills.get(data.get("bill_id"))
+            if not bill:
+                print(f"bill_id로 법안을 찾을 수 없음: {data.get('bill_id')}")
+                stats["skipped_bills"] += 1
                 continue
-            
-            # 표결 결과 저장
-            vote_result = VoteResult(
-                vote_id=vote.id,
-                legislator_id=legislator.id,
-                result_vote_mod=result.get("result", "")
-            )
-            db.add(vote_result)
-            processed_count += 1
-        
+
+            key = (bill.id, data.get("vote_date"))
+            vote = existing_votes.get(key)
+            if vote is None:
+                # 새 표결 정보 생성
+                vote = Vote(vote_date=data.get("vote_date"), bill_id=bill.id)
+                db.add(vote)
+                existing_votes[key] = vote
+
+            votes[key] = (vote, data.get("results", []))
+
+        # 기존 표결 결과 삭제 (재수집 시 교체)
+        reused_vote_ids = [vote.id for vote, _ in votes.values() if vote.id is not None]
+        if reused_vote_ids:
+            db.query(VoteResult).filter(
+                VoteResult.vote_id.in_(reused_vote_ids)
+            ).delete(synchronize_session=False)
+
+        db.flush()  # 새 표결 ID 할당
+
+        # 표결 결과를 한 번에 저장
+        result_rows = []
+        for vote, results in votes.values():
+            for result in results:
+                legislator_id = resolver.resolve(result.get("legislator_name", ""), party=result.get("party"))
+                if legislator_id is None:
+                    stats["missing_legislators"] += 1
+                    continue
+
+                result_rows.append({
+                    "vote_id": vote.id,
+                    "legislator_id": legislator_id,
+                    "result_vote_mod": result.get("result", "")
+                })
+
+        if result_rows:
+            db.bulk_insert_mappings(VoteResult, result_rows)
+
         # 변경사항 저장
         db.commit()
-        
-        # 처리 통계 출력
-        print(f"법안 {bill_id}의 표결 결과 처리 완료")
-        print(f"- 전체 표결 수: {len(results)}")
-        print(f"- 처리된 표결 수: {processed_count}")
-        if missing_legislators:
-            print(f"- DB에 없는 의원 수: {len(missing_legislators)}")
-            print(f"- 미확인 의원: {', '.join(missing_legislators[:5])}{'...' if len(missing_legislators) > 5 else ''}")
-        
-        # 처리 결과 반환
-        processed_data = {
-            "vote_id": vote.id,
-            "bill_id": bill.id,
-            "vote_date": vote_date,
-            "total_results": len(results),
-            "processed_results": processed_count,
-            "missing_legislators": len(missing_legislators)
-        }
-        
-        return processed_data
-        
+        if result_rows:
+            bump_data_version(db, "vote_results")
+
+        stats["votes"] = len(votes)
+        stats["results"] = len(result_rows)
+        return stats
+
     except Exception as e:
-        print(f"표결 데이터 처리 중 오류 발생: {str(e)}")
+        print(f"표결 데이터 일괄 처리 중 오류 발생: {str(e)}")
         db.rollback()
         import traceback
         traceback.print_exc()
-        return None
-    finally:
-        # 내부에서 생성한 DB 세션인 경우에만 닫기
-        if close_db:
-            db.close()
+        stats["skipped_bills"] = len(vote_data_list)
+        return stats
 
 def process_asset_data(db: Session):
     """
@@ -591,13 +655,23 @@ def process_asset_data(db: Session):
         db.commit()
         print("모든 의원의 재산 정보 초기화 완료")
         
+        # 여러 연월의 공개 자료가 저장되어 있을 수 있으므로 가장 최근 연월만 사용
+        latest_year_month = db.query(func.max(AssetDetailed.report_year_month)).scalar()
+        
         # AssetDetailed 테이블에서 의원별 총액 계산 (현재가액 기준)
         legislators_assets = db.query(
             AssetDetailed.name,
             func.sum(AssetDetailed.asset_current).label('total_asset')
+        ).filter(
+            AssetDetailed.report_year_month == latest_year_month
         ).group_by(
             AssetDetailed.name
         ).all()
+        print(f"재산 공개 기준 연월: {latest_year_month}")
+        
+        # 의원 이름 -> ID 인덱스 및 의원 객체 (의원 전체를 한 번만 조회)
+        resolver = LegislatorResolver(db)
+        legislators_by_id = {legislator.id: legislator for legislator in db.query(Legislator).all()}
         
         processed_count = 0
         for name, total_asset in legislators_assets:
@@ -605,7 +679,7 @@ def process_asset_data(db: Session):
                 continue
                 
             # 의원 정보 조회
-            legislator = db.query(Legislator).filter(Legislator.hg_nm == name).first()
+            legislator = legislators_by_id.get(resolver.resolve(name))
             if not legislator:
                 print(f"경고: '{name}' 의원을 DB에서 찾을 수 없습니다.")
                 continue
@@ -624,6 +698,7 @@ def process_asset_data(db: Session):
         
         # 최종 커밋
         db.commit()
+        bump_data_version(db, "legislator_assets")
         print(f"의원별 재산 정보 처리 완료: {processed_count}명")
         
     except Exception as e:
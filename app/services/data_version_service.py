@@ -0,0 +1,251 @@
+import json
+import threading
+from datetime import datetime
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session
+from typing import Callable, List, Dict, Optional, Tuple
+
+from app.models.data_version import DataVersion
+
+# 점수 카테고리별 원본 테이블
+SCORE_DEPENDENCIES = {
+    "participation": ["legislators", "attendance"],
+    "legislation": ["legislators", "bills", "bill_co_proposers"],
+    "speech": ["legislators", "speech_by_meeting"],
+    "voting": ["legislators", "vote_results"],
+    "cooperation": ["legislators", "bill_co_proposers"],
+}
+
+# 점수 컬럼 (점수가 없는 의원이 있으면 다시 계산)
+SCORE_FIELDS = {
+    "participation": "participation_score",
+    "legislation": "legislation_score",
+    "speech": "speech_score",
+    "voting": "voting_score",
+    "cooperation": "cooperation_score",
+}
+
+# 기존 DB에 data_versions 테이블이 없을 수 있으므로 최초 사용 시 한 번만 생성
+_table_checked = False
+_table_lock = threading.Lock()
+
+def _ensure_table(db: Session) -> None:
+    global _table_checked
+    if not _table_checked:
+        # 점수 카테고리를 여러 스레드에서 동시에 계산할 때 한 번만 생성하도록 lock 사용
+        with _table_lock:
+            if not _table_checked:
+                DataVersion.__table__.create(bind=db.get_bind(), checkfirst=True)
+                _table_checked = True
+
+# 같은 프로세스에서 데이터 버전을 올렸을 때 호출할 함수 (메모리 캐시 무효화용, 인자: 변경된 테이블명)
+_change_listeners: List[Callable[[Tuple[str, ...]], None]] = []
+
+def add_data_change_listener(listener: Callable[[Tuple[str, ...]], None]) -> None:
+    """
+    데이터 버전 변경 시 호출할 함수 등록 (다른 프로세스의 변경은 get_data_version 비교로 감지)
+
+    Args:
+        listener: 변경된 테이블명 튜플을 받는 함수
+    """
+    if listener not in _change_listeners:
+        _change_listeners.append(listener)
+
+def _notify_data_change(tables: Tuple[str, ...]) -> None:
+    for listener in list(_change_listeners):
+        try:
+            listener(tables)
+        except Exception as e:
+            print(f"데이터 변경 알림 처리 오류: {str(e)}")
+
+def _source_models() -> Dict[str, type]:
+    from app.models.legislator import Legislator
+    from app.models.attendance import Attendance
+    from app.models.bill import Bill, BillCoProposer
+    from app.models.speech import SpeechByMeeting
+    from app.models.vote import VoteResult
+
+    return {model.__tablename__: model
+            for model in (Legislator, Attendance, Bill, BillCoProposer, SpeechByMeeting, VoteResult)}
+
+def bump_data_version(db: Session, *tables: str) -> None:
+    """
+    원본 테이블 버전 증가 (수집/가공 단계에서 데이터를 저장한 뒤 호출)
+
+    Args:
+        db: 데이터베이스 세션
+        tables: 변경된 테이블명
+    """
+    _ensure_table(db)
+    now = datetime.now()
+    for table in tables:
+        result = db.execute(
+            update(DataVersion)
+            .where(DataVersion.name == table)
+            .values(version=DataVersion.version + 1, updated_at=now)
+        )
+        if result.rowcount == 0:
+            db.add(DataVersion(name=table, version=1, updated_at=now))
+    db.commit()
+    _notify_data_change(tables)
+
+def get_table_versions(db: Session, tables: List[str]) -> Dict[str, str]:
+    """
+    원본 테이블의 현재 버전 조회
+
+    버전 카운터에 건수와 최대 ID를 더해, 버전을 올리지 않는 경로(초기화 스크립트 등)로 바뀐 경우도 감지
+
+    Args:
+        db: 데이터베이스 세션
+        tables: 테이블명 목록
+
+    Returns:
+        Dict[str, str]: 테이블명 -> "버전:건수:최대ID"
+    """
+    _ensure_table(db)
+    models = _source_models()
+    counters = dict(db.execute(
+        select(DataVersion.name, DataVersion.version).where(DataVersion.name.in_(tables))
+    ).all())
+
+    versions = {}
+    for table in tables:
+        model = models[table]
+        count, max_id = db.execute(select(func.count(model.id), func.max(model.id))).one()
+        versions[table] = f"{counters.get(table) or 0}:{count}:{max_id or 0}"
+    return versions
+
+def get_data_version_state(db: Session) -> Tuple[str, Optional[datetime]]:
+    """
+    전체 데이터 버전과 마지막 변경 시각 (프로세스 메모리에 올린 데이터/화면 캐시의 무효화 기준)
+
+    수집/점수 계산 단계에서 올린 버전 카운터의 합에 의원 수와 최대 ID를 더해 한 번의 쿼리로 조회
+
+    Args:
+        db: 데이터베이스 세션
+
+    Returns:
+        Tuple[str, Optional[datetime]]: ("카운터 합:의원 수:최대 의원 ID", 마지막 버전 변경 시각)
+    """
+    from app.models.legislator import Legislator
+
+    _ensure_table(db)
+    counter_total = select(func.coalesce(func.sum(DataVersion.version), 0)).scalar_subquery()
+    last_updated = select(func.max(DataVersion.updated_at)).scalar_subquery()
+    total, updated_at, count, max_id = db.execute(
+        select(counter_total, last_updated, func.count(Legislator.id), func.max(Legislator.id))
+    ).one()
+    return f"{total}:{count}:{max_id or 0}", updated_at
+
+def get_data_version(db: Session) -> str:
+    """
+    전체 데이터 버전 (데이터가 바뀌면 달라지는 문자열, get_data_version_state 참고)
+    """
+    return get_data_version_state(db)[0]
+
+def get_source_versions(db: Session, category: str) -> Dict[str, str]:
+    """
+    점수 카테고리가 사용하는 원본 테이블의 현재 버전 (점수 계산 시작 전에 조회)
+    """
+    return get_table_versions(db, SCORE_DEPENDENCIES[category])
+
+def get_counter_versions(db: Session, names: List[str]) -> Dict[str, str]:
+    """
+    버전 카운터만으로 관리하는 데이터(점수, 재산 총액, 위원회 등)의 현재 버전
+
+    Args:
+        db: 데이터베이스 세션
+        names: bump_data_version에 사용한 이름 목록
+
+    Returns:
+        Dict[str, str]: 이름 -> 버전 카운터 (기록이 없으면 "0")
+    """
+    _ensure_table(db)
+    counters = dict(db.execute(
+        select(DataVersion.name, DataVersion.version).where(DataVersion.name.in_(names))
+    ).all())
+    return {name: str(counters.get(name) or 0) for name in names}
+
+def record_consumed_versions(db: Session, name: str, versions: Dict[str, str], commit: bool = True) -> None:
+    """
+    파생 데이터(점수 카테고리, 통계 스냅샷 등)를 만들 때 사용한 원본 버전 저장
+
+    Args:
+        db: 데이터베이스 세션
+        name: 파생 데이터 이름 (예: "score:speech")
+        versions: 계산 시작 전에 조회한 원본 버전
+        commit: False이면 커밋하지 않음 (파생 데이터 저장과 같은 트랜잭션으로 묶을 때)
+    """
+    _ensure_table(db)
+    state = db.query(DataVersion).filter(DataVersion.name == name).first()
+    if not state:
+        state = DataVersion(name=name, version=0)
+        db.add(state)
+
+    state.consumed = json.dumps(versions, sort_keys=True)
+    state.updated_at = datetime.now()
+    if commit:
+        db.commit()
+
+def get_consumed_versions(db: Session, name: str) -> Optional[Dict[str, str]]:
+    """
+    record_consumed_versions로 저장한 원본 버전 (기록이 없으면 None)
+    """
+    _ensure_table(db)
+    consumed = db.execute(select(DataVersion.consumed).where(DataVersion.name == name)).scalar()
+    return json.loads(consumed) if consumed else None
+
+def record_score_versions(db: Session, category: str, versions: Dict[str, str], commit: bool = True) -> None:
+    """
+    점수 카테고리 계산에 사용한 원본 버전 저장
+
+    Args:
+        db: 데이터베이스 세션
+        category: 점수 카테고리
+        versions: get_source_versions로 계산 시작 전에 조회한 버전
+        commit: False이면 커밋하지 않음 (점수 저장과 같은 트랜잭션으로 묶을 때)
+    """
+    record_consumed_versions(db, f"score:{category}", versions, commit=commit)
+
+def get_stale_categories(db: Session, categories: Optional[List[str]] = None) -> Dict[str, str]:
+    """
+    원본 데이터가 바뀌어 다시 계산해야 하는 점수 카테고리 조회
+
+    Args:
+        db: 데이터베이스 세션
+        categories: 확인할 카테고리 (None이면 전체)
+
+    Returns:
+        Dict[str, str]: 다시 계산할 카테고리 -> 사유 (최신인 카테고리는 포함하지 않음)
+    """
+    from app.models.legislator import Legislator
+
+    _ensure_table(db)
+    categories = categories or list(SCORE_DEPENDENCIES)
+    tables = sorted({table for category in categories for table in SCORE_DEPENDENCIES[category]})
+    current = get_table_versions(db, tables)
+    recorded = dict(db.execute(
+        select(DataVersion.name, DataVersion.consumed)
+        .where(DataVersion.name.in_([f"score:{category}" for category in categories]))
+    ).all())
+    total_legislators = db.query(func.count(Legislator.id)).scalar()
+
+    stale = {}
+    for category in categories:
+        consumed = recorded.get(f"score:{category}")
+        if not consumed:
+            stale[category] = "계산 기록 없음"
+            continue
+
+        consumed = json.loads(consumed)
+        changed = [table for table in SCORE_DEPENDENCIES[category] if consumed.get(table) != current[table]]
+        if changed:
+            stale[category] = f"{', '.join(changed)} 변경"
+            continue
+
+        field = getattr(Legislator, SCORE_FIELDS[category])
+        calculated_count = db.query(func.count(Legislator.id)).filter(field.isnot(None)).scalar()
+        if calculated_count < total_legislators:
+            stale[category] = "점수가 없는 의원 있음"
+
+    return stale
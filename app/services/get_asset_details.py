@@ -1,3 +1,4 @@
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from typing import Dict, Any
 from app.models.legislator import Legislator
@@ -30,7 +31,8 @@ def get_legislator_asset_details(db: Session, legislator_id: int) -> Dict[str, A
     if not legislator:
         return None
     
-    # 의원 재산 상세 정보 조회
+    # 의원 재산 상세 정보 조회 (가장 최근 연월의 공개 자료만)
+    latest_year_month = db.query(func.max(AssetDetailed.report_year_month)).scalar()
     asset_details = db.query(
         AssetDetailed.asset_category,
         AssetDetailed.relation_to_self,
@@ -43,7 +45,8 @@ def get_legislator_asset_details(db: Session, legislator_id: int) -> Dict[str, A
         AssetDetailed.asset_decrease,
         AssetDetailed.reason_for_change
     ).filter(
-        AssetDetailed.mona_code == legislator.mona_cd
+        AssetDetailed.mona_code == legislator.mona_cd,
+        AssetDetailed.report_year_month == latest_year_month
     ).order_by(
         AssetDetailed.asset_current.desc()
     ).all()
@@ -0,0 +1,91 @@
+from sqlalchemy.orm import Session
+from typing import Dict, List, Optional, NamedTuple
+
+from app.models.legislator import Legislator
+
+class _LegislatorKey(NamedTuple):
+    id: int
+    name: str
+    party: Optional[str]
+    mona_cd: Optional[str]
+
+class LegislatorResolver:
+    """
+    의원 이름(또는 국회의원 코드)으로 의원 ID를 찾는 메모리 인덱스
+
+    의원 전체를 한 번만 조회해 두고, 데이터 처리 단계에서는 행마다 DB를 조회하지 않고 O(1)로 찾음.
+    동명이인은 국회의원 코드(mona_cd) 또는 정당으로 구분하고, 구분할 수 없으면 ID가 가장 작은 의원을 반환
+    (기존 hg_nm 기준 first() 조회와 동일한 결과)
+    """
+
+    def __init__(self, db: Session):
+        # DB 세션으로 인덱스 생성
+        self.reload(db)
+
+    def reload(self, db: Session) -> None:
+        """
+        의원 목록을 다시 읽어 인덱스 재구성 (의원 정보가 추가/변경된 경우 호출)
+
+        Args:
+            db: 데이터베이스 세션
+        """
+        rows = db.query(
+            Legislator.id, Legislator.hg_nm, Legislator.poly_nm, Legislator.mona_cd
+        ).order_by(Legislator.id).all()
+
+        self._by_name: Dict[str, List[_LegislatorKey]] = {}
+        self._by_mona_cd: Dict[str, _LegislatorKey] = {}
+        self._by_id: Dict[int, _LegislatorKey] = {}
+
+        for row in rows:
+            key = _LegislatorKey(row.id, row.hg_nm, row.poly_nm, row.mona_cd)
+            self._by_id[key.id] = key
+            if key.name:
+                self._by_name.setdefault(key.name, []).append(key)
+            if key.mona_cd:
+                self._by_mona_cd[key.mona_cd] = key
+
+    def resolve(self, name: Optional[str], party: Optional[str] = None,
+                mona_cd: Optional[str] = None) -> Optional[int]:
+        """
+        의원 ID 조회
+
+        Args:
+            name: 의원 이름
+            party: 정당명 (동명이인 구분용, 선택)
+            mona_cd: 국회의원 코드 (있으면 우선 사용, 선택)
+
+        Returns:
+            의원 ID (찾지 못하면 None)
+        """
+        # 국회의원 코드가 있으면 가장 정확하므로 우선 사용
+        if mona_cd and mona_cd in self._by_mona_cd:
+            return self._by_mona_cd[mona_cd].id
+
+        candidates = self._by_name.get(name)
+        if not candidates:
+            return None
+
+        # 동명이인이면 정당으로 구분
+        if len(candidates) > 1 and party:
+            for candidate in candidates:
+                if candidate.party == party:
+                    return candidate.id
+
+        return candidates[0].id
+
+    def get_name(self, legislator_id: int) -> Optional[str]:
+        """
+        의원 ID로 이름 조회 (로그 출력용)
+        """
+        key = self._by_id.get(legislator_id)
+        return key.name if key else None
+
+    def is_homonym(self, name: str) -> bool:
+        """
+        동명이인 여부 확인
+        """
+        return len(self._by_name.get(name, [])) > 1
+
+    def __len__(self) -> int:
+        return len(self._by_id)
@@ -2,12 +2,13 @@ from sqlalchemy.orm import Session
 from typing import List, Dict, Any, Optional
 import os
 
-from app.models.legislator import Legislator
 from app.models.sns import LegislatorSNS
-from app.models.committee import Committee, CommitteeHistory
+from app.models.committee import CommitteeHistory
+from app.services.legislator_store import get_legislator_store
+from app.services.shared_cache import get_shared_value
 from app.utils.image_path_helper import ImagePathHelper
 
-def get_filter_options(db: Session) -> Dict[str, List[str]]:
+def compute_filter_options(db: Session) -> Dict[str, List[str]]:
     """
     필터 옵션(정당, 위원회, 초선/재선, 선거구) 데이터 조회
     
@@ -17,20 +18,19 @@ def get_filter_options(db: Session) -> Dict[str, List[str]]:
     Returns:
         필터 옵션 딕셔너리
     """
-    # 정당 목록 조회
-    parties = db.query(Legislator.poly_nm).distinct().all()
-    party_list = [party[0] for party in parties if party[0]]
+    store = get_legislator_store(db)
+    
+    # 정당 목록 (의원 ID 순서로 처음 나온 순서)
+    party_list = list(store.by_party)
     
-    # 위원회 목록 조회 - 상임위원회와 상설특별위원회만 필터링
-    committees = db.query(Committee.dept_nm).filter(
-        (Committee.cmt_div_nm.like('%상임위원회%')) | 
-        (Committee.cmt_div_nm.like('%상설특별위원회%'))
-    ).distinct().all()
-    committee_list = [committee[0] for committee in committees if committee[0]]
+    # 위원회 목록 - 상임위원회와 상설특별위원회만 필터링 (위원회명 순)
+    committee_list = sorted({
+        committee_name for committee_name, division in store.committees
+        if committee_name and division and ('상임위원회' in division or '상설특별위원회' in division)
+    })
     
     # 초선/재선 목록 조회
-    terms = db.query(Legislator.reele_gbn_nm).distinct().all()
-    term_list = [term[0] for term in terms if term[0]]
+    term_list = list(store.by_term)
     
     # 초선/재선 목록 정렬 (숫자 추출 후 정렬)
     def term_sort_key(term):
@@ -48,31 +48,8 @@ def get_filter_options(db: Session) -> Dict[str, List[str]]:
     
     term_list.sort(key=term_sort_key)
     
-    # 선거구 정보 수집 - 광역시/도 단위와 의원 수 함께 계산
-    district_counts = {}
-    legislators = db.query(Legislator).all()
-    
-    for legislator in legislators:
-        district = legislator.orig_nm
-        if not district:
-            continue
-            
-        # 세종특별자치시는 '기타'로 분류
-        if district.startswith('세종특별자치시'):
-            region = '기타'
-        elif ' ' in district:
-            region = district.split(' ')[0]  # 첫 번째 공백을 기준으로 광역시/도 추출
-        else:
-            region = district  # '비례대표'와 같이 공백이 없는 경우
-            
-        # 지역별 의원 수 카운트
-        if region in district_counts:
-            district_counts[region] += 1
-        else:
-            district_counts[region] = 1
-    
-    # 의원 수 기준으로 내림차순 정렬
-    district_list = sorted(district_counts.keys(), key=lambda x: district_counts[x], reverse=True)
+    # 선거구 정보 - 광역시/도 단위 의원 수 기준으로 내림차순 정렬
+    district_list = sorted(store.by_region, key=lambda region: len(store.by_region[region]), reverse=True)
     
     # 필터 옵션 딕셔너리 생성
     filter_options = {
@@ -84,6 +61,23 @@ def get_filter_options(db: Session) -> Dict[str, List[str]]:
     
     return filter_options
 
+# 랭킹/의원 목록 화면마다 사용하는 필터 옵션 (의원 정보/위원회/위원회 멤버십 수집 시 무효화)
+_filter_options = get_shared_value(
+    "filter_options", compute_filter_options, ["legislators", "committees", "committee_members"]
+)
+
+def get_filter_options(db: Session) -> Dict[str, List[str]]:
+    """
+    필터 옵션 데이터 (공유 캐시, 데이터가 바뀌었을 때만 다시 계산)
+    
+    Args:
+        db: 데이터베이스 세션
+    
+    Returns:
+        필터 옵션 딕셔너리
+    """
+    return _filter_options.get(db)
+
 def _get_optimized_image_url(profile_image_url: str, image_type: str = "list") -> str:
     """
     최적화된 이미지 URL 생성
@@ -124,32 +118,25 @@ def filter_legislators(
     Returns:
         필터링된 국회의원 목록
     """
-    # 기본 쿼리
-    query = db.query(Legislator)
+    # 정당/선수는 색인으로 조회
+    legislators = get_legislator_store(db).filter(party=party, term=term)
     
     # 필터 조건 적용
     if name:
-        query = query.filter(Legislator.hg_nm.like(f'%{name}%'))
-    
-    if party:
-        query = query.filter(Legislator.poly_nm == party)
+        legislators = [legislator for legislator in legislators if legislator.hg_nm and name in legislator.hg_nm]
     
     if district:
         if district == '기타':
             # '기타' 카테고리는 세종특별자치시 선거구를 포함
-            query = query.filter(Legislator.orig_nm.like('세종특별자치시%'))
+            prefix = '세종특별자치시'
         else:
             # 광역시/도 단위로 선택한 경우, 해당 지역으로 시작하는 모든 선거구 포함
-            query = query.filter(Legislator.orig_nm.like(f'{district}%'))
-    
-    if term:
-        query = query.filter(Legislator.reele_gbn_nm == term)
+            prefix = district
+        legislators = [legislator for legislator in legislators
+                       if legislator.orig_nm and legislator.orig_nm.startswith(prefix)]
     
-    # 기본 정렬 (이름 오름차순)
-    query = query.order_by(Legislator.hg_nm)
-    
-    # 쿼리 실행
-    legislators = query.all()
+    # 기본 정렬 (이름 오름차순, 이름이 없으면 맨 앞)
+    legislators = sorted(legislators, key=lambda legislator: (legislator.hg_nm is not None, legislator.hg_nm or ''))
     
     # ORM 객체를 dict로 변환
     result = []
@@ -186,19 +173,13 @@ def get_legislators_list(
     Returns:
         국회의원 목록
     """
-    query = db.query(Legislator)
+    legislators = get_legislator_store(db).filter(party=party, term=term)
     
     # 필터링 적용
     if name:
-        query = query.filter(Legislator.hg_nm.contains(name))
-    if party:
-        query = query.filter(Legislator.poly_nm == party)
+        legislators = [legislator for legislator in legislators if legislator.hg_nm and name in legislator.hg_nm]
     if district:
-        query = query.filter(Legislator.orig_nm == district)
-    if term:
-        query = query.filter(Legislator.reele_gbn_nm == term)
-    
-    legislators = query.all()
+        legislators = [legislator for legislator in legislators if legislator.orig_nm == district]
     
     result = []
     for legislator in legislators:
@@ -224,15 +205,14 @@ def get_legislator_detail(db: Session, legislator_id: int) -> Optional[Dict]:
     Returns:
         국회의원 상세 정보
     """
-    legislator = db.query(Legislator).filter(Legislator.id == legislator_id).first()
+    store = get_legislator_store(db)
+    legislator = store.get(legislator_id)
     
     if not legislator:
         return None
     
     # 스탯 계산
-    overall_rank = db.query(Legislator).filter(
-        Legislator.overall_score >= legislator.overall_score
-    ).count()
+    overall_rank = store.overall_rank_of(legislator)
     
     result = {
         "id": legislator.id,
@@ -272,7 +252,7 @@ def get_legislator_stats(db: Session, legislator_id: int) -> Dict[str, Any]:
         의원 스탯 정보 딕셔너리
     """
     # 의원 정보 조회
-    legislator = db.query(Legislator).filter(Legislator.id == legislator_id).first()
+    legislator = get_legislator_store(db).get(legislator_id)
     
     if not legislator:
         return None
@@ -0,0 +1,204 @@
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.legislator import Legislator
+from app.models.committee import Committee, CommitteeMember
+from app.services.data_version_service import get_data_version
+
+# 메모리에 올리는 의원 컬럼 (Legislator와 같은 속성명으로 접근)
+LEGISLATOR_FIELDS = (
+    "id", "hg_nm", "eng_nm", "bth_date", "poly_nm", "orig_nm", "cmit_nm", "reele_gbn_nm", "sex_gbn_nm",
+    "tel_no", "e_mail", "mem_title", "profile_image_url", "tier", "overall_rank",
+    "participation_score", "legislation_score", "speech_score", "voting_score", "cooperation_score",
+    "overall_score", "asset",
+)
+
+# 랭킹 카테고리별 점수 컬럼 (알 수 없는 카테고리는 종합 점수)
+SCORE_COLUMNS = {
+    "overall": "overall_score",
+    "participation": "participation_score",
+    "legislation": "legislation_score",
+    "speech": "speech_score",
+    "voting": "voting_score",
+    "cooperation": "cooperation_score",
+}
+
+def get_region(district: Optional[str]) -> Optional[str]:
+    """
+    선거구에서 광역시/도 추출 (세종특별자치시는 '기타', '비례대표'처럼 공백이 없으면 그대로)
+    """
+    if not district:
+        return None
+    if district.startswith('세종특별자치시'):
+        return '기타'
+    if ' ' in district:
+        return district.split(' ')[0]
+    return district
+
+class LegislatorRow:
+    """
+    의원 한 명의 읽기 전용 데이터 (__slots__로 의원 300명 내외를 작게 유지)
+    """
+    __slots__ = LEGISLATOR_FIELDS
+
+    def __init__(self, values: Iterable):
+        for field, value in zip(LEGISLATOR_FIELDS, values):
+            setattr(self, field, value)
+
+def _index_by(rows: List[LegislatorRow], key) -> Dict[str, List[LegislatorRow]]:
+    # 값이 없는 의원은 제외, 그룹 순서와 그룹 내 순서는 의원 ID 순서 (처음 나온 순서)
+    index = {}
+    for row in rows:
+        value = key(row)
+        if value:
+            index.setdefault(value, []).append(row)
+    return index
+
+class LegislatorStore:
+    """
+    의원 테이블의 프로세스 메모리 사본
+
+    의원 전체와 위원회 멤버십을 한 번씩 읽어 ID/정당/선수/성별/위원회/지역별 색인을 만들고,
+    조회 전용 서비스(필터 옵션, 랭킹, 의원 목록/검색, 상세)는 DB 대신 이 사본을 사용
+    """
+
+    def __init__(self, rows: List[LegislatorRow], committees: List[Tuple[str, Optional[str]]],
+                 memberships: List[Tuple[str, int]]):
+        """
+        Args:
+            rows: 의원 목록 (ID 오름차순)
+            committees: (위원회명, 위원회 구분) 목록
+            memberships: (위원회명, 의원 ID) 목록 (멤버십 ID 오름차순)
+        """
+        self.rows = rows
+        self.committees = committees
+        self.by_id = {row.id: row for row in rows}
+        self.by_party = _index_by(rows, lambda row: row.poly_nm)
+        self.by_term = _index_by(rows, lambda row: row.reele_gbn_nm)
+        self.by_gender = _index_by(rows, lambda row: row.sex_gbn_nm)
+        self.by_region = _index_by(rows, lambda row: get_region(row.orig_nm))
+
+        # 같은 의원의 멤버십이 중복 저장된 경우에도 위원회별로 한 번만 (처음 나온 순서 유지)
+        self.by_committee = {}
+        seen = set()
+        for committee_name, legislator_id in memberships:
+            row = self.by_id.get(legislator_id)
+            if committee_name and row is not None and (committee_name, legislator_id) not in seen:
+                seen.add((committee_name, legislator_id))
+                self.by_committee.setdefault(committee_name, []).append(row)
+
+    @classmethod
+    def build(cls, db: Session) -> "LegislatorStore":
+        """
+        DB에서 의원, 위원회, 위원회 멤버십을 각각 한 번씩 조회하여 생성
+
+        Args:
+            db: 데이터베이스 세션
+
+        Returns:
+            LegislatorStore
+        """
+        columns = [getattr(Legislator, field) for field in LEGISLATOR_FIELDS]
+        rows = [LegislatorRow(values) for values in db.execute(select(*columns).order_by(Legislator.id)).all()]
+        committees = [tuple(row) for row in db.execute(
+            select(Committee.dept_nm, Committee.cmt_div_nm).order_by(Committee.id)
+        ).all()]
+        memberships = [tuple(row) for row in db.execute(
+            select(Committee.dept_nm, CommitteeMember.legislator_id)
+            .join(Committee, Committee.id == CommitteeMember.committee_id)
+            .order_by(CommitteeMember.id)
+        ).all()]
+        return cls(rows, committees, memberships)
+
+    def get(self, legislator_id: int) -> Optional[LegislatorRow]:
+        return self.by_id.get(legislator_id)
+
+    def filter(self, party: Optional[str] = None, committee: Optional[str] = None, term: Optional[str] = None,
+               gender: Optional[str] = None) -> List[LegislatorRow]:
+        """
+        조건에 맞는 의원 목록 (가장 작은 색인에서 시작, ID 오름차순)
+        """
+        candidates = []
+        if party:
+            candidates.append(self.by_party.get(party, []))
+        if committee:
+            candidates.append(self.by_committee.get(committee, []))
+        if term:
+            candidates.append(self.by_term.get(term, []))
+        if gender:
+            candidates.append(self.by_gender.get(gender, []))
+        if not candidates:
+            return list(self.rows)
+
+        candidates.sort(key=len)
+        rows = candidates[0]
+        for other in candidates[1:]:
+            other_ids = {row.id for row in other}
+            rows = [row for row in rows if row.id in other_ids]
+        return rows
+
+    @staticmethod
+    def sort_by_score(rows: List[LegislatorRow], category: str = 'overall',
+                      descending: bool = True) -> List[LegislatorRow]:
+        """
+        점수 순 정렬 (SQLite ORDER BY와 같이 점수가 없는 의원은 내림차순이면 맨 뒤, 오름차순이면 맨 앞)
+        """
+        field = SCORE_COLUMNS.get(category, "overall_score")
+
+        def key(row):
+            score = getattr(row, field)
+            return (score is not None, score if score is not None else 0)
+
+        return sorted(rows, key=key, reverse=descending)
+
+    def search(self, name: str) -> List[LegislatorRow]:
+        """
+        이름에 검색어가 포함된 의원 목록 (이름 오름차순)
+        """
+        return sorted((row for row in self.rows if row.hg_nm and name in row.hg_nm), key=lambda row: row.hg_nm)
+
+    def overall_rank_of(self, row: LegislatorRow) -> int:
+        """
+        종합 점수가 같거나 높은 의원 수 (점수가 없으면 0)
+        """
+        if row.overall_score is None:
+            return 0
+        return sum(1 for other in self.rows if other.overall_score is not None
+                   and other.overall_score >= row.overall_score)
+
+# 프로세스 전역에서 공유하는 사본 (수집/점수 계산으로 데이터 버전이 바뀌면 다시 생성)
+_store: Optional[LegislatorStore] = None
+_store_version = None
+_store_lock = threading.Lock()
+
+def get_legislator_store(db: Session, refresh: bool = False) -> LegislatorStore:
+    """
+    공유 의원 사본 반환 (데이터 버전이 바뀌었거나 refresh이면 다시 생성)
+
+    Args:
+        db: 데이터베이스 세션
+        refresh: True이면 항상 다시 생성
+
+    Returns:
+        LegislatorStore
+    """
+    global _store, _store_version
+
+    version = get_data_version(db)
+    with _store_lock:
+        if refresh or _store is None or _store_version != version:
+            _store = LegislatorStore.build(db)
+            _store_version = version
+        return _store
+
+def invalidate_legislator_store() -> None:
+    """
+    공유 의원 사본 폐기 (같은 프로세스에서 버전을 올리지 않고 의원 데이터를 바꾼 경우)
+    """
+    global _store, _store_version
+    with _store_lock:
+        _store = None
+        _store_version = None
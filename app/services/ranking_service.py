@@ -1,8 +1,7 @@
 from sqlalchemy.orm import Session
 from typing import List, Dict, Any, Optional, Tuple, Union
 
-from app.models.legislator import Legislator
-from app.models.committee import Committee, CommitteeMember
+from app.services.legislator_store import get_legislator_store
 from app.utils.image_path_helper import ImagePathHelper
 
 def get_top_legislators(db: Session, count: int = 5, category: str = 'overall', image_type: str = 'thumb') -> List[Dict[str, Any]]:
@@ -18,27 +17,9 @@ def get_top_legislators(db: Session, count: int = 5, category: str = 'overall',
     Returns:
         상위 N명 국회의원 정보 리스트
     """
-    # 카테고리에 따른 정렬 기준 설정
-    if category == 'overall':
-        sort_column = Legislator.overall_score
-    elif category == 'participation':
-        sort_column = Legislator.participation_score
-    elif category == 'legislation':
-        sort_column = Legislator.legislation_score
-    elif category == 'speech':
-        sort_column = Legislator.speech_score
-    elif category == 'voting':
-        sort_column = Legislator.voting_score
-    elif category == 'cooperation':
-        sort_column = Legislator.cooperation_score
-    else:
-        sort_column = Legislator.overall_score  # 기본값
-    
-    # 데이터베이스 쿼리 실행 - 높은 점수순으로 정렬
-    legislators = db.query(Legislator) \
-        .order_by(sort_column.desc()) \
-        .limit(count) \
-        .all()
+    # 메모리 사본에서 높은 점수순으로 정렬 (카테고리에 따른 정렬 기준, 알 수 없는 카테고리는 종합 점수)
+    store = get_legislator_store(db)
+    legislators = store.sort_by_score(store.rows, category, descending=True)[:count]
     
     # ORM 객체를 dict로 변환하여 반환
     result = []
@@ -71,7 +52,7 @@ def get_top_legislators(db: Session, count: int = 5, category: str = 'overall',
     return result
 
 def get_bottom_legislators(db: Session, count: int = 5, category: str = 'overall', image_type: str = 'thumb') -> List[Dict[str, Any]]:
-    # 호출: db.query(Legislator)로 특정 카테고리 기준 하위 N명 조회
+    # 호출: get_legislator_store(db)로 특정 카테고리 기준 하위 N명 조회
     # 반환: 의원 목록
     """
     특정 카테고리 기준 하위 N명의 국회의원을 조회하는 함수
@@ -85,27 +66,9 @@ def get_bottom_legislators(db: Session, count: int = 5, category: str = 'overall
     Returns:
         하위 N명 국회의원 정보 리스트
     """
-    # 카테고리에 따른 정렬 기준 설정
-    if category == 'overall':
-        sort_column = Legislator.overall_score
-    elif category == 'participation':
-        sort_column = Legislator.participation_score
-    elif category == 'legislation':
-        sort_column = Legislator.legislation_score
-    elif category == 'speech':
-        sort_column = Legislator.speech_score
-    elif category == 'voting':
-        sort_column = Legislator.voting_score
-    elif category == 'cooperation':
-        sort_column = Legislator.cooperation_score
-    else:
-        sort_column = Legislator.overall_score  # 기본값
-    
-    # 데이터베이스 쿼리 실행 - 낮은 점수순으로 정렬
-    legislators = db.query(Legislator) \
-        .order_by(sort_column.asc()) \
-        .limit(count) \
-        .all()
+    # 메모리 사본에서 낮은 점수순으로 정렬 (카테고리에 따른 정렬 기준, 알 수 없는 카테고리는 종합 점수)
+    store = get_legislator_store(db)
+    legislators = store.sort_by_score(store.rows, category, descending=False)[:count]
     
     # ORM 객체를 dict로 변환
     result = []
@@ -148,8 +111,7 @@ def get_legislators_by_filter(
     asset_group: Optional[str] = None,
     image_type: str = 'thumb'
 ) -> List[Dict[str, Any]]:
-    # 호출: db.query(Legislator)로 기본 쿼리 시작
-    # 필터 조건에 따라 쿼리 구성
+    # 호출: get_legislator_store(db)의 색인으로 필터 조건 적용
     # 카테고리에 따라 정렬 기준 변경
     # 반환: 필터링된 의원 목록
     """
@@ -169,22 +131,10 @@ def get_legislators_by_filter(
     Returns:
         필터링된 국회의원 랭킹 리스트
     """
-    # 기본 쿼리
-    query = db.query(Legislator)
+    store = get_legislator_store(db)
     
-    # 필터 조건 적용
-    if party:
-        query = query.filter(Legislator.poly_nm == party)
-    
-    if committee:
-        # 위원회 멤버십 테이블과 조인 필요
-        query = query.join(CommitteeMember).join(Committee).filter(Committee.dept_nm == committee)
-    
-    if term:
-        query = query.filter(Legislator.reele_gbn_nm == term)
-    
-    if gender:
-        query = query.filter(Legislator.sex_gbn_nm == gender)
+    # 필터 조건 적용 (정당/위원회 멤버십/선수/성별 색인)
+    legislators = store.filter(party=party, committee=committee, term=term, gender=gender)
     
     if age_group:
         # 나이대 필터링 로직 (생년월일 기반)
@@ -194,24 +144,8 @@ def get_legislators_by_filter(
         # 재산 구간 필터링 로직
         pass
     
-    # 카테고리에 따른 정렬 기준 설정
-    if category == 'overall':
-        sort_column = Legislator.overall_score
-    elif category == 'participation':
-        sort_column = Legislator.participation_score
-    elif category == 'legislation':
-        sort_column = Legislator.legislation_score
-    elif category == 'speech':
-        sort_column = Legislator.speech_score
-    elif category == 'voting':
-        sort_column = Legislator.voting_score
-    elif category == 'cooperation':
-        sort_column = Legislator.cooperation_score
-    else:
-        sort_column = Legislator.overall_score  # 기본값
-    
-    # 데이터베이스 쿼리 실행 - 점수 높은 순으로 정렬
-    legislators = query.order_by(sort_column.desc()).all()
+    # 카테고리에 따른 정렬 기준으로 점수 높은 순 정렬
+    legislators = store.sort_by_score(legislators, category, descending=True)
     
     # ORM 객체를 dict로 변환
     result = []
@@ -0,0 +1,101 @@
+import copy
+import threading
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.services.data_version_service import add_data_change_listener, get_data_version
+
+class SharedValue:
+    """
+    모든 요청이 공유하는 전역 값(평균 스탯, 필터 옵션 등)의 메모이제이션
+
+    - 관련 테이블의 데이터 버전이 올라가면(같은 프로세스의 점수 계산/수집) 바로 무효화
+    - 다른 프로세스에서 바꾼 경우도 전체 데이터 버전을 비교하여 다시 계산
+    - 반환값은 복사본이므로 호출하는 쪽에서 수정해도 캐시에는 영향 없음
+    """
+
+    def __init__(self, name: str, compute: Callable[[Session], Any], tables: Iterable[str]):
+        """
+        Args:
+            name: 캐시 이름 (통계 출력용)
+            compute: 값을 계산하는 함수 (DB 세션 -> 값)
+            tables: 값에 영향을 주는 데이터 버전 이름 (bump_data_version의 테이블명)
+        """
+        self.name = name
+        self.compute = compute
+        self.tables = set(tables)
+        self.value = None
+        self.version = None
+        self.lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "invalidations": 0}
+
+    def get(self, db: Session) -> Any:
+        version = get_data_version(db)
+        with self.lock:
+            if self.version is not None and self.version == version:
+                self.stats["hits"] += 1
+                return copy.deepcopy(self.value)
+            self.stats["misses"] += 1
+
+        value = self.compute(db)
+        with self.lock:
+            self.value = value
+            self.version = version
+        return copy.deepcopy(value)
+
+    def invalidate(self) -> None:
+        with self.lock:
+            if self.version is not None:
+                self.stats["invalidations"] += 1
+            self.value = None
+            self.version = None
+
+    def on_data_change(self, tables: Tuple[str, ...]) -> None:
+        if self.tables.intersection(tables):
+            self.invalidate()
+
+    def summary(self) -> Dict[str, Any]:
+        with self.lock:
+            stats = dict(self.stats)
+        requests_count = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / requests_count * 100, 1) if requests_count else 0
+        return stats
+
+# 이름 -> 공유 값 (get_shared_value로 등록)
+_values: Dict[str, SharedValue] = {}
+_values_lock = threading.Lock()
+
+def get_shared_value(name: str, compute: Callable[[Session], Any], tables: Iterable[str]) -> SharedValue:
+    """
+    공유 값 등록 (같은 이름은 한 번만 등록하고, 데이터 변경 알림을 받도록 연결)
+
+    Args:
+        name: 캐시 이름
+        compute: 값을 계산하는 함수
+        tables: 값에 영향을 주는 데이터 버전 이름
+
+    Returns:
+        SharedValue
+    """
+    with _values_lock:
+        shared = _values.get(name)
+        if shared is None:
+            shared = SharedValue(name, compute, tables)
+            _values[name] = shared
+            add_data_change_listener(shared.on_data_change)
+        return shared
+
+def invalidate_shared_values(name: Optional[str] = None) -> None:
+    """
+    공유 값 무효화 (name이 없으면 전체)
+    """
+    for shared_name, shared in list(_values.items()):
+        if name is None or shared_name == name:
+            shared.invalidate()
+
+def get_shared_cache_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    공유 값별 적중/미적중/무효화 횟수와 적중률
+    """
+    return {name: shared.summary() for name, shared in list(_values.items())}
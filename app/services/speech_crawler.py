@@ -0,0 +1,146 @@
+import os
+import json
+import time
+import random
+import threading
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional, Tuple
+
+from app.config import settings
+from app.utils.rate_limiter import RateLimiter
+from app.utils.speech_parser import parse_speech_count_from_nanet
+
+class SpeechCountCrawler:
+    """
+    국회회의록 빅데이터 사이트 발언 횟수 크롤러
+
+    - 토큰 버킷으로 초당 요청 수를 제한하면서 여러 의원을 동시에 요청 (캐시 적중 시에는 토큰을 쓰지 않음)
+    - 실패한 요청은 지수 백오프로 재시도
+    - 완료한 의원은 체크포인트 파일에 기록하여 중단 후 다시 실행하면 이어서 수집
+    """
+
+    def __init__(self, rate: Optional[float] = None, max_workers: Optional[int] = None,
+                 max_retries: Optional[int] = None, checkpoint_path: Optional[str] = None):
+        """
+        Args:
+            rate: 초당 최대 요청 수 (기본값: settings.SPEECH_CRAWL_RATE, 0이면 제한 없음)
+            max_workers: 동시 요청 수 (기본값: settings.SPEECH_CRAWL_WORKERS)
+            max_retries: 실패 시 재시도 횟수 (기본값: settings.SPEECH_CRAWL_MAX_RETRIES)
+            checkpoint_path: 체크포인트 파일 경로 (기본값: settings.SPEECH_CRAWL_CHECKPOINT, 빈 값이면 사용 안 함)
+        """
+        self.rate = settings.SPEECH_CRAWL_RATE if rate is None else rate
+        self.max_workers = max(1, max_workers or settings.SPEECH_CRAWL_WORKERS)
+        self.max_retries = settings.SPEECH_CRAWL_MAX_RETRIES if max_retries is None else max_retries
+        self.checkpoint_path = settings.SPEECH_CRAWL_CHECKPOINT if checkpoint_path is None else checkpoint_path
+        self.rate_limiter = RateLimiter(self.rate)
+        self.lock = threading.Lock()
+
+    def _load_checkpoint(self) -> Tuple[Dict[str, int], Optional[str]]:
+        """
+        체크포인트에서 이미 수집한 결과와 최초 수집 시작 시각 읽기 (유효 기간이 지난 체크포인트는 무시)
+        """
+        if not self.checkpoint_path or not os.path.exists(self.checkpoint_path):
+            return {}, None
+
+        try:
+            with open(self.checkpoint_path, "r", encoding="utf-8") as f:
+                checkpoint = json.load(f)
+
+            started_at = checkpoint.get("started_at")
+            if datetime.now() - datetime.fromisoformat(started_at) > timedelta(hours=settings.SPEECH_CRAWL_CHECKPOINT_HOURS):
+                print("체크포인트가 오래되어 처음부터 다시 수집합니다.")
+                return {}, None
+
+            return {name: int(count) for name, count in checkpoint.get("counts", {}).items()}, started_at
+        except Exception as e:
+            print(f"체크포인트 읽기 오류: {str(e)}")
+            return {}, None
+
+    def _save_checkpoint(self, counts: Dict[str, int], started_at: str) -> None:
+        """
+        체크포인트 저장 (임시 파일에 쓴 뒤 교체하여 중간에 중단되어도 파일이 깨지지 않도록 함)
+        """
+        if not self.checkpoint_path:
+            return
+
+        directory = os.path.dirname(self.checkpoint_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        temp_path = f"{self.checkpoint_path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump({"started_at": started_at, "counts": counts}, f, ensure_ascii=False)
+        os.replace(temp_path, self.checkpoint_path)
+
+    def _fetch_with_retry(self, name: str) -> int:
+        """
+        의원 한 명의 발언 횟수 요청 (실패 시 지수 백오프로 재시도)
+        """
+        for attempt in range(self.max_retries + 1):
+            try:
+                return parse_speech_count_from_nanet(
+                    name, raise_on_error=True, before_request=self.rate_limiter.acquire
+                )
+            except Exception as e:
+                if attempt >= self.max_retries:
+                    raise
+
+                # 1초, 2초, 4초 ... 대기 (동시에 재시도가 몰리지 않도록 약간의 지터 추가)
+                wait = settings.SPEECH_CRAWL_BACKOFF * (2 ** attempt) + random.uniform(0, 0.5)
+                print(f"{name} 발언 횟수 요청 실패 ({str(e)}), {wait:.1f}초 후 재시도 ({attempt + 1}/{self.max_retries})")
+                time.sleep(wait)
+
+    def crawl(self, legislator_names: List[str]) -> Dict[str, int]:
+        """
+        의원별 발언 횟수 수집
+
+        Args:
+            legislator_names: 의원 이름 목록 (동명이인은 한 번만 요청)
+
+        Returns:
+            Dict[str, int]: 의원 이름별 발언 횟수 (재시도 후에도 실패한 의원은 제외)
+        """
+        names = list(dict.fromkeys(name for name in legislator_names if name))
+
+        # 체크포인트에서 이어서 수집
+        # (이어서 수집할 때는 최초 시작 시각을 유지하여 체크포인트 유효 기간이 늘어나지 않도록 함)
+        counts, started_at = self._load_checkpoint()
+        counts = {name: count for name, count in counts.items() if name in names}
+        if not counts or not started_at:
+            started_at = datetime.now().isoformat()
+        if counts:
+            print(f"체크포인트에서 {len(counts)}명의 발언 횟수를 불러왔습니다. 나머지를 이어서 수집합니다.")
+
+        pending = [name for name in names if name not in counts]
+        failed = []
+        start_time = time.time()
+
+        print(f"발언 횟수 수집 시작: {len(pending)}명 (동시 요청 {self.max_workers}개, 초당 {self.rate}건)")
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {executor.submit(self._fetch_with_retry, name): name for name in pending}
+
+            for index, future in enumerate(as_completed(futures), start=1):
+                name = futures[future]
+                try:
+                    count = future.result()
+                except Exception as e:
+                    print(f"{name} 발언 횟수 수집 실패: {str(e)}")
+                    failed.append(name)
+                    continue
+
+                with self.lock:
+                    counts[name] = count
+                    self._save_checkpoint(counts, started_at)
+
+                print(f"[{index}/{len(pending)}] {name}: {count}회")
+
+        elapsed = time.time() - start_time
+        print(f"발언 횟수 수집 완료: {len(counts)}명 성공, {len(failed)}명 실패 ({elapsed:.1f}초)")
+
+        # 모두 성공했으면 체크포인트 삭제 (다음 실행은 새로 수집)
+        if not failed and self.checkpoint_path and os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
+
+        return counts
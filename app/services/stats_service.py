@@ -1,3 +1,4 @@
+from sqlalchemy import and_, case, join, literal, outerjoin, select
 from sqlalchemy.orm import Session
 from sqlalchemy.sql import func
 from typing import List, Dict, Any, Optional, Tuple
@@ -5,9 +6,10 @@ from typing import List, Dict, Any, Optional, Tuple
 from app.models.bill import Bill
 from app.models.legislator import Legislator
 from app.models.committee import Committee, CommitteeMember
+from app.services.shared_cache import get_shared_value
 from app.utils.image_path_helper import ImagePathHelper
 
-def get_average_stats(db: Session) -> Dict[str, Any]:
+def compute_average_stats(db: Session) -> Dict[str, Any]:
     """
     모든 의원의 평균 스탯 계산
     
@@ -39,246 +41,366 @@ def get_average_stats(db: Session) -> Dict[str, Any]:
     
     return avg_stats
 
-### 잡다한 랭킹 - 홈 ###
-def get_party_average_stats(db: Session, stat: str = 'asset') -> Dict[str, Any]:
+# 의원 상세 화면마다 사용하는 평균 스탯 (점수 계산/의원 정보 수집 시 무효화)
+_average_stats = get_shared_value("average_stats", compute_average_stats, ["scores", "legislators"])
+
+def get_average_stats(db: Session) -> Dict[str, Any]:
     """
-    정당별 특정 통계의 평균값 계산
+    모든 의원의 평균 스탯 (공유 캐시, 데이터가 바뀌었을 때만 다시 계산)
     
     Args:
         db: 데이터베이스 세션
-        stat: 계산할 통계 항목 (기본값: 'asset')
     
     Returns:
-        정당별 평균 통계 딕셔너리
+        평균 스탯 딕셔너리
     """
-    # 정당 목록 조회
-    party_query = db.query(Legislator.poly_nm).distinct().all()
-    parties = [party[0] for party in party_query if party[0]]
+    return _average_stats.get(db)
+
+# 재산 통계에서 제외하는 의원
+ASSET_EXCLUDED_NAME = '백선희'
+
+# 잡다한 랭킹 나이대/재산 구간
+AGE_GROUPS = ["30대 이하", "40대", "50대", "60대", "70대 이상"]
+ASSET_GROUPS = ["0-20 백분위", "20-40 백분위", "40-60 백분위", "60-80 백분위", "80-100 백분위"]
+
+def _term_sort_key(term: str) -> int:
+    # 초선, 재선, "3선", "4선" ... 순서 (숫자를 찾지 못한 경우 맨 뒤)
+    if term == "초선":
+        return 1
+    elif term == "재선":
+        return 2
+    for char in term:
+        if char.isdigit():
+            return int(char)
+    return 999
+
+def _round_score(value: Optional[float]) -> float:
+    return round(value, 1) if value else 0
+
+def _round_asset(value: Optional[float]) -> float:
+    # 재산은 억 단위로 표시 (10^8으로 나눔)
+    return round(value / 100000000, 1) if value else 0
+
+def asset_column(exclude: bool = True):
+    """
+    재산 집계용 컬럼 (exclude이면 백선희 의원은 NULL로 처리하여 평균/합계에서 제외)
+    """
+    if not exclude:
+        return Legislator.asset
+    return case((Legislator.hg_nm != ASSET_EXCLUDED_NAME, Legislator.asset))
+
+def age_band_expression(current_year: int = 2025):
+    """
+    생년 기준 나이대 SQL 식 (AGE_GROUPS 중 하나, 생년월일이 없으면 NULL)
     
-    # 정당별 평균 통계 계산
-    result = {}
-    for party in parties:
-        # 통계 항목에 따라 다른 컬럼 선택
-        if stat == 'asset':
-            avg_value = db.query(func.avg(Legislator.asset)).filter(
-                Legislator.poly_nm == party,
-                Legislator.hg_nm != '백선희'  # 백선희 의원 제외
-            ).scalar()
-            # 재산은 억 단위로 표시 (10^8으로 나눔)
-            avg_value = round(avg_value / 100000000, 1) if avg_value else 0
-        elif stat == 'overall_score':
-            avg_value = db.query(func.avg(Legislator.overall_score)).filter(
-                Legislator.poly_nm == party
-            ).scalar()
-            avg_value = round(avg_value, 1) if avg_value else 0
-        elif stat == 'participation_score':
-            avg_value = db.query(func.avg(Legislator.participation_score)).filter(
-                Legislator.poly_nm == party
-            ).scalar()
-            avg_value = round(avg_value, 1) if avg_value else 0
-        elif stat == 'legislation_score':
-            avg_value = db.query(func.avg(Legislator.legislation_score)).filter(
-                Legislator.poly_nm == party
-            ).scalar()
-            avg_value = round(avg_value, 1) if avg_value else 0
-        else:
-            avg_value = 0
-        
-        result[party] = avg_value
+    Args:
+        current_year: 기준 연도 (기본값: 2025년)
+    """
+    birth_year = func.substr(Legislator.bth_date, 1, 4)
+    return case(
+        # 30대 이하: 1986년생 이후 (39세 이하)
+        (birth_year >= str(current_year - 39), "30대 이하"),
+        # 40대: 1976~1985년생 (40~49세)
+        (and_(birth_year >= str(current_year - 49), birth_year <= str(current_year - 40)), "40대"),
+        # 50대: 1966~1975년생 (50~59세)
+        (and_(birth_year >= str(current_year - 59), birth_year <= str(current_year - 50)), "50대"),
+        # 60대: 1956~1965년생 (60~69세)
+        (and_(birth_year >= str(current_year - 69), birth_year <= str(current_year - 60)), "60대"),
+        # 70대 이상: 1955년생 이전 (70세 이상)
+        (birth_year <= str(current_year - 70), "70대 이상"),
+    )
+
+def asset_band_expression(percentile_ranges: Dict[str, Tuple[int, int]]):
+    """
+    재산 백분위 구간 SQL 식 (첫 구간은 최소값 포함, 나머지 구간은 최소값 초과, 어느 구간에도 속하지 않으면 NULL)
     
-    return result
+    Args:
+        percentile_ranges: get_asset_percentile_ranges 결과
+    """
+    conditions = []
+    for i, (asset_group, (asset_min, asset_max)) in enumerate(percentile_ranges.items()):
+        # 첫 구간은 최소값 포함, 나머지 구간은 최소값 초과
+        lower = Legislator.asset >= asset_min if i == 0 else Legislator.asset > asset_min
+        conditions.append((and_(lower, Legislator.asset <= asset_max), asset_group))
+    return case(*conditions) if conditions else literal(None)
 
-def get_term_average_stats(db: Session, stat: str = 'overall_score') -> Dict[str, Any]:
+def aggregate_by(db: Session, key, metrics: Dict[str, Any], filters: Optional[List[Any]] = None,
+                 select_from=None, order_by: Optional[List[Any]] = None) -> Dict[Any, Dict[str, Any]]:
     """
-    초선/재선별 특정 통계의 평균값 계산
+    그룹별 집계 - 모든 그룹을 한 번의 GROUP BY 쿼리로 계산
     
     Args:
         db: 데이터베이스 세션
-        stat: 계산할 통계 항목 (기본값: 'overall_score')
+        key: 그룹 키 SQL 식 (컬럼, age_band_expression() 등) 또는 여러 식의 튜플
+        metrics: 결과 이름 -> 집계 식 (func.avg(...), func.count(...) 등)
+        filters: WHERE 조건 목록
+        select_from: 조회 대상 (테이블/조인, 기본값: Legislator)
+        order_by: 그룹 순서 (기본값: 처음 나타난 순서, 즉 그룹별 최소 의원 ID 순)
     
     Returns:
-        초선/재선별 평균 통계 딕셔너리
+        Dict[Any, Dict[str, Any]]: 그룹 값(튜플 키이면 튜플) -> {결과 이름: 값}
     """
-    # 초선/재선 구분 목록 조회
-    term_query = db.query(Legislator.reele_gbn_nm).distinct().all()
-    terms = [term[0] for term in term_query if term[0]]
+    keys = list(key) if isinstance(key, (tuple, list)) else [key]
+    query = select(
+        *[expr.label(f"group_{i}") for i, expr in enumerate(keys)],
+        *[expr.label(name) for name, expr in metrics.items()]
+    ).select_from(select_from if select_from is not None else Legislator)
     
-    # 초선/재선별 순서 정렬
-    def term_sort_key(term):
-        if term == "초선":
-            return 1
-        elif term == "재선":
-            return 2
-        else:
-            # "3선", "4선", "5선" 등에서 숫자만 추출
-            for char in term:
-                if char.isdigit():
-                    return int(char)
-            return 999  # 숫자를 찾지 못한 경우 큰 숫자 반환
-    
-    terms.sort(key=term_sort_key)
+    if filters:
+        query = query.where(*filters)
+    query = query.group_by(*keys).order_by(*(order_by if order_by is not None else [func.min(Legislator.id)]))
     
-    # 초선/재선별 평균 통계 계산
     result = {}
-    for term in terms:
-        # 통계 항목에 따라 다른 컬럼 선택
-        if stat == 'overall_score':
-            avg_value = db.query(func.avg(Legislator.overall_score)).filter(
-                Legislator.reele_gbn_nm == term
-            ).scalar()
-        elif stat == 'asset':
-            avg_value = db.query(func.avg(Legislator.asset)).filter(
-                Legislator.reele_gbn_nm == term,
-                Legislator.hg_nm != '백선희'  # 백선희 의원 제외
-            ).scalar()
-            # 재산은 억 단위로 표시 (10^8으로 나눔)
-            avg_value = round(avg_value / 100000000, 1) if avg_value else 0
-            return result
-        elif stat == 'participation_score':
-            avg_value = db.query(func.avg(Legislator.participation_score)).filter(
-                Legislator.reele_gbn_nm == term
-            ).scalar()
-        elif stat == 'legislation_score':
-            avg_value = db.query(func.avg(Legislator.legislation_score)).filter(
-                Legislator.reele_gbn_nm == term
-            ).scalar()
-        else:
-            avg_value = 0
-            
-        result[term] = round(avg_value, 1) if avg_value else 0
-    
+    for row in db.execute(query):
+        group = tuple(row[:len(keys)]) if len(keys) > 1 else row[0]
+        result[group] = {name: row[len(keys) + i] for i, name in enumerate(metrics)}
     return result
 
-### 잡다한 랭킹 - 정당 ###
-def get_party_average_scores(db: Session) -> Dict[str, float]:
+def _tier_distributions(db: Session, key, filters: Optional[List[Any]] = None, select_from=None) -> Dict[Any, Dict[str, int]]:
+    # 그룹별 티어 분포 (그룹은 처음 나타난 순서, 그룹 안에서는 티어명 순)
+    rows = aggregate_by(db, (key, Legislator.tier),
+                        {"count": func.count(Legislator.id), "first_id": func.min(Legislator.id)},
+                        filters=filters, select_from=select_from, order_by=[Legislator.tier])
+    first_ids = {}
+    for (group, _), values in rows.items():
+        first_ids[group] = min(first_ids.get(group, values["first_id"]), values["first_id"])
+
+    distributions = {group: {} for group in sorted(first_ids, key=first_ids.get)}
+    for (group, tier), values in rows.items():
+        distributions[group][tier] = values["count"]
+    return distributions
+
+def _score_summaries(db: Session, key, filters: Optional[List[Any]] = None, select_from=None) -> Dict[Any, Dict[str, Any]]:
+    # 그룹별 종합점수 평균/최대/최소, 평균 재산, 의원 수, 티어 분포 (쿼리 두 번)
+    stats = aggregate_by(db, key, {
+        "avg": func.avg(Legislator.overall_score),
+        "max": func.max(Legislator.overall_score),
+        "min": func.min(Legislator.overall_score),
+        "avg_asset": func.avg(Legislator.asset),
+        "count": func.count(Legislator.id)
+    }, filters=filters, select_from=select_from)
+    distributions = _tier_distributions(db, key, filters=filters, select_from=select_from)
+    for group, values in stats.items():
+        values["tier_distribution"] = distributions.get(group, {})
+    return stats
+
+def get_stats_summaries(db: Session, group_by: str) -> Dict[str, Dict[str, Any]]:
     """
-    정당별 평균 종합점수 조회 (의원 수 기준 정렬)
+    모든 그룹의 통계 요약을 한 번에 계산 (그룹마다 쿼리를 반복하지 않고 GROUP BY 두 번으로 계산)
     
     Args:
         db: 데이터베이스 세션
+        group_by: 'party', 'committee', 'term', 'age', 'gender', 'asset'
     
     Returns:
-        정당별 평균 종합점수 딕셔너리 (의원 수 기준 정렬)
+        그룹명 -> 통계 요약 딕셔너리
     """
-    # 정당별 의원 수 조회 및 내림차순 정렬
-    party_counts = db.query(
-        Legislator.poly_nm, 
-        func.count(Legislator.id).label('count')
-    ).group_by(
-        Legislator.poly_nm
-    ).order_by(  # 이 부분이 빠져있었습니다!
-        func.count(Legislator.id).desc()
-    ).all()
+    empty = {"avg": 0, "max": 0, "min": 0, "avg_asset": 0, "count": 0, "tier_distribution": {}}
     
-    # 의원 수 기준으로 정렬된 정당 목록 생성
-    party_list = [party[0] for party in party_counts if party[0]]
+    if group_by == "party":
+        summaries = _score_summaries(db, Legislator.poly_nm)
+        return {
+            party: {
+                "avg": _round_score(values["avg"]),
+                "max": _round_score(values["max"]),
+                "min": _round_score(values["min"]),
+                "tier_distribution": values["tier_distribution"]
+            }
+            for party, values in summaries.items() if party
+        }
     
-    # 정당별 평균 종합점수 계산
-    result = {}
-    for party in party_list:
-        # 해당 정당 의원들의 평균 종합점수 계산
-        avg_score = db.query(func.avg(Legislator.overall_score)).filter(
-            Legislator.poly_nm == party
-        ).scalar()
+    if group_by == "committee":
+        # 위원회 소속 의원 (같은 의원이 중복 등록된 경우 통계에는 한 번만 반영)
+        members = select(CommitteeMember.committee_id, CommitteeMember.legislator_id).distinct().subquery()
+        member_join = join(members, Legislator, Legislator.id == members.c.legislator_id)
+        summaries = _score_summaries(db, members.c.committee_id, select_from=member_join)
+        member_counts = dict(db.execute(
+            select(CommitteeMember.committee_id, func.count(CommitteeMember.legislator_id))
+            .group_by(CommitteeMember.committee_id)
+        ).all())
         
-        # 결과 딕셔너리에 추가 (None인 경우 0으로 처리)
-        result[party] = round(avg_score, 1) if avg_score else 0
+        result = {}
+        for committee in db.query(Committee).all():
+            if committee.dept_nm in result:
+                continue
+            values = summaries.get(committee.id)
+            member_count = member_counts.get(committee.id, 0)
+            if not member_count:
+                result[committee.dept_nm] = {
+                    "avg": 0,
+                    "max": 0,
+                    "min": 0,
+                    "tier_distribution": {},
+                    "member_count": 0,
+                    "processing_ratio": 0 if not committee.rcp_cnt else round((committee.proc_cnt / committee.rcp_cnt) * 100, 1)
+                }
+                continue
+            
+            processing_ratio = 0
+            if committee.rcp_cnt and committee.rcp_cnt > 0:
+                processing_ratio = (committee.proc_cnt / committee.rcp_cnt) * 100
+            result[committee.dept_nm] = {
+                "avg": _round_score(values["avg"]) if values else 0,
+                "max": _round_score(values["max"]) if values else 0,
+                "min": _round_score(values["min"]) if values else 0,
+                "tier_distribution": values["tier_distribution"] if values else {},
+                "member_count": member_count,
+                "processing_ratio": round(processing_ratio, 1)
+            }
+        return result
+    
+    if group_by in ("term", "gender", "age"):
+        key = {"term": Legislator.reele_gbn_nm, "gender": Legislator.sex_gbn_nm, "age": age_band_expression()}[group_by]
+        summaries = _score_summaries(db, key)
+        groups = AGE_GROUPS if group_by == "age" else [group for group in summaries if group]
+        result = {}
+        for group in groups:
+            values = summaries.get(group)
+            if values is None:
+                result[group] = dict(empty)
+                continue
+            result[group] = {
+                "avg": _round_score(values["avg"]),
+                "max": _round_score(values["max"]),
+                "min": _round_score(values["min"]),
+                "avg_asset": _round_asset(values["avg_asset"]),  # 억 단위
+                "count": values["count"] or 0,
+                "tier_distribution": values["tier_distribution"]
+            }
+        return result
+    
+    if group_by == "asset":
+        percentile_ranges = get_asset_percentile_ranges(db)
+        summaries = _score_summaries(db, asset_band_expression(percentile_ranges)) if percentile_ranges else {}
+        result = {}
+        for asset_group in ASSET_GROUPS:
+            values = summaries.get(asset_group) if asset_group in percentile_ranges else None
+            result[asset_group] = {
+                "avg_score": _round_score(values["avg"]) if values else 0,
+                "max_score": _round_score(values["max"]) if values else 0,
+                "min_score": _round_score(values["min"]) if values else 0,
+                "avg_asset": _round_asset(values["avg_asset"]) if values else 0,  # 억 단위
+                "count": values["count"] if values else 0,
+                "tier_distribution": values["tier_distribution"] if values else {}
+            }
+        return result
     
-    return result
+    raise ValueError(f"알 수 없는 그룹: {group_by}")
 
-def get_party_average_bill_counts(db: Session) -> Dict[str, float]:
+### 잡다한 랭킹 - 홈 ###
+def get_party_average_stats(db: Session, stat: str = 'asset') -> Dict[str, Any]:
     """
-    정당별 평균 대표발의안수 조회 (의원 수 기준 정렬)
+    정당별 특정 통계의 평균값 계산
     
     Args:
         db: 데이터베이스 세션
+        stat: 계산할 통계 항목 (기본값: 'asset')
     
     Returns:
-        정당별 평균 대표발의안수 딕셔너리 (의원 수 기준 정렬)
+        정당별 평균 통계 딕셔너리
     """
-    # 정당별 의원 수 조회
-    party_counts = db.query(
-        Legislator.poly_nm, 
-        func.count(Legislator.id).label('count')
-    ).group_by(
-        Legislator.poly_nm
-    ).order_by(
-        func.count(Legislator.id).desc()
-    ).all()
+    # 통계 항목에 따라 다른 컬럼 선택 (재산은 백선희 의원 제외)
+    columns = {
+        'asset': asset_column(),
+        'overall_score': Legislator.overall_score,
+        'participation_score': Legislator.participation_score,
+        'legislation_score': Legislator.legislation_score
+    }
+    column = columns.get(stat)
     
-    # 의원 수 기준으로 정렬된 정당 목록 생성
-    party_list = [party[0] for party in party_counts if party[0]]
+    # 정당별 평균 통계 계산 (한 번의 GROUP BY)
+    groups = aggregate_by(db, Legislator.poly_nm, {
+        "avg": func.avg(column) if column is not None else func.count(Legislator.id)
+    })
     
-    # 정당별 평균 대표발의안수 계산
     result = {}
-    for party in party_list:
-        # 해당 정당 의원들의 ID 목록
-        legislator_ids = db.query(Legislator.id).filter(
-            Legislator.poly_nm == party
-        ).all()
-        legislator_ids = [id[0] for id in legislator_ids]
-        
-        if not legislator_ids:
-            result[party] = 0
+    for party, values in groups.items():
+        if not party:
             continue
-        
-        # 각 의원별 대표발의안수 계산
-        bill_counts = []
-        for legislator_id in legislator_ids:
-            count = db.query(func.count(Bill.id)).filter(
-                Bill.main_proposer_id == legislator_id
-            ).scalar()
-            bill_counts.append(count)
-        
-        # 평균 계산
-        avg_count = sum(bill_counts) / len(legislator_ids) if legislator_ids else 0
-        result[party] = round(avg_count, 1)
+        if column is None:
+            result[party] = 0
+        elif stat == 'asset':
+            result[party] = _round_asset(values["avg"])
+        else:
+            result[party] = _round_score(values["avg"])
     
     return result
 
-def get_party_stats_summary(db: Session, party_name: str) -> Dict[str, Any]:
+def get_term_average_stats(db: Session, stat: str = 'overall_score') -> Dict[str, Any]:
     """
-    특정 정당의 통계 요약 정보 조회
+    초선/재선별 특정 통계의 평균값 계산
     
     Args:
         db: 데이터베이스 세션
-        party_name: 정당명
+        stat: 계산할 통계 항목 (기본값: 'overall_score')
     
     Returns:
-        정당 통계 요약 딕셔너리
+        초선/재선별 평균 통계 딕셔너리
     """
-    # 해당 정당 의원들의 점수 통계
-    stats = db.query(
-        func.avg(Legislator.overall_score).label("avg"),
-        func.max(Legislator.overall_score).label("max"),
-        func.min(Legislator.overall_score).label("min")
-    ).filter(
-        Legislator.poly_nm == party_name
-    ).first()
+    # 재산은 get_term_average_assets 사용 (기존과 같이 빈 결과 반환)
+    if stat == 'asset':
+        return {}
     
-    # 티어 분포 계산
-    tier_query = db.query(
-        Legislator.tier, 
-        func.count(Legislator.id).label("count")
-    ).filter(
-        Legislator.poly_nm == party_name
-    ).group_by(
-        Legislator.tier
-    ).all()
+    columns = {
+        'overall_score': Legislator.overall_score,
+        'participation_score': Legislator.participation_score,
+        'legislation_score': Legislator.legislation_score
+    }
+    column = columns.get(stat)
     
-    tier_distribution = {}
-    for tier, count in tier_query:
-        tier_distribution[tier] = count
+    # 초선/재선별 평균 통계 계산 (한 번의 GROUP BY)
+    groups = aggregate_by(db, Legislator.reele_gbn_nm, {
+        "avg": func.avg(column) if column is not None else func.count(Legislator.id)
+    })
     
-    # 결과 딕셔너리 구성
-    result = {
-        "avg": round(stats.avg, 1) if stats.avg else 0,
-        "max": round(stats.max, 1) if stats.max else 0,
-        "min": round(stats.min, 1) if stats.min else 0,
-        "tier_distribution": tier_distribution
-    }
+    # 초선/재선별 순서 정렬
+    terms = sorted((term for term in groups if term), key=_term_sort_key)
+    return {term: _round_score(groups[term]["avg"]) if column is not None else 0 for term in terms}
+
+### 잡다한 랭킹 - 정당 ###
+def get_party_average_scores(db: Session) -> Dict[str, float]:
+    """
+    정당별 평균 종합점수 조회 (의원 수 기준 정렬)
     
-    return result
+    Args:
+        db: 데이터베이스 세션
+    
+    Returns:
+        정당별 평균 종합점수 딕셔너리 (의원 수 기준 정렬)
+    """
+    # 정당별 의원 수와 평균 종합점수를 한 번에 조회 (의원 수 내림차순)
+    groups = aggregate_by(db, Legislator.poly_nm, {
+        "count": func.count(Legislator.id),
+        "avg": func.avg(Legislator.overall_score)
+    }, order_by=[func.count(Legislator.id).desc()])
+    
+    # 결과 딕셔너리 구성 (None인 경우 0으로 처리)
+    return {party: _round_score(values["avg"]) for party, values in groups.items() if party}
+
+def get_party_average_bill_counts(db: Session) -> Dict[str, float]:
+    """
+    정당별 평균 대표발의안수 조회 (의원 수 기준 정렬)
+    
+    Args:
+        db: 데이터베이스 세션
+    
+    Returns:
+        정당별 평균 대표발의안수 딕셔너리 (의원 수 기준 정렬)
+    """
+    # 의원별 대표발의안수
+    bill_counts = select(
+        Bill.main_proposer_id.label("legislator_id"),
+        func.count(Bill.id).label("count")
+    ).group_by(Bill.main_proposer_id).subquery()
+    
+    # 정당별 평균 대표발의안수 (대표발의안이 없는 의원은 0건으로 포함, 의원 수 내림차순)
+    groups = aggregate_by(db, Legislator.poly_nm, {
+        "count": func.count(Legislator.id),
+        "avg": func.avg(func.coalesce(bill_counts.c.count, 0))
+    }, select_from=outerjoin(Legislator, bill_counts, bill_counts.c.legislator_id == Legislator.id),
+       order_by=[func.count(Legislator.id).desc()])
+    
+    return {party: round(values["avg"] or 0, 1) for party, values in groups.items() if party}
 
 def get_legislators_by_party(db: Session, party_name: str) -> List[Dict[str, Any]]:
     """
@@ -372,111 +494,18 @@ def get_committee_average_scores(db: Session) -> Dict[str, float]:
     Returns:
         위원회별 평균 종합점수 딕셔너리
     """
-    # 위원회 목록 조회
-    committees = db.query(Committee).all()
-    
-    # 위원회별 평균 종합점수 계산
-    result = {}
-    for committee in committees:
-        # 해당 위원회 소속 의원들의 ID 조회
-        member_ids = db.query(CommitteeMember.legislator_id).filter(
-            CommitteeMember.committee_id == committee.id
-        ).all()
-        member_ids = [mid[0] for mid in member_ids]
-        
-        if not member_ids:
-            result[committee.dept_nm] = 0
-            continue
-        
-        # 해당 위원회 소속 의원들의 평균 종합점수 계산
-        avg_score = db.query(func.avg(Legislator.overall_score)).filter(
-            Legislator.id.in_(member_ids)
-        ).scalar()
-        
-        result[committee.dept_nm] = round(avg_score, 1) if avg_score else 0
-    
-    return result
-
-def get_committee_stats_summary(db: Session, committee_name: str) -> Dict[str, Any]:
-    """
-    특정 위원회의 통계 요약 정보 조회
-    
-    Args:
-        db: 데이터베이스 세션
-        committee_name: 위원회명
-        
-    Returns:
-        위원회 통계 요약 딕셔너리
-    """
-    # 위원회 정보 조회
-    committee = db.query(Committee).filter(Committee.dept_nm == committee_name).first()
-    
-    if not committee:
-        return {
-            "avg": 0,
-            "max": 0,
-            "min": 0,
-            "tier_distribution": {},
-            "member_count": 0,
-            "processing_ratio": 0
-        }
-    
-    # 위원회 소속 의원 ID 목록 조회
-    member_ids = db.query(CommitteeMember.legislator_id).filter(
-        CommitteeMember.committee_id == committee.id
-    ).all()
-    member_ids = [mid[0] for mid in member_ids]
-    
-    # 의원 수가 0인 경우
-    if not member_ids:
-        return {
-            "avg": 0,
-            "max": 0,
-            "min": 0,
-            "tier_distribution": {},
-            "member_count": 0,
-            "processing_ratio": 0 if not committee.rcp_cnt else round((committee.proc_cnt / committee.rcp_cnt) * 100, 1)
-        }
-    
-    # 위원회 소속 의원들의 점수 통계
-    stats = db.query(
-        func.avg(Legislator.overall_score).label("avg"),
-        func.max(Legislator.overall_score).label("max"),
-        func.min(Legislator.overall_score).label("min")
-    ).filter(
-        Legislator.id.in_(member_ids)
-    ).first()
-    
-    # 티어 분포 계산
-    tier_query = db.query(
-        Legislator.tier,
-        func.count(Legislator.id).label("count")
-    ).filter(
-        Legislator.id.in_(member_ids)
-    ).group_by(
-        Legislator.tier
-    ).all()
-    
-    tier_distribution = {}
-    for tier, count in tier_query:
-        tier_distribution[tier] = count
-    
-    # 처리 비율 계산
-    processing_ratio = 0
-    if committee.rcp_cnt and committee.rcp_cnt > 0:
-        processing_ratio = (committee.proc_cnt / committee.rcp_cnt) * 100
-    
-    # 결과 딕셔너리 구성
-    result = {
-        "avg": round(stats.avg, 1) if stats.avg else 0,
-        "max": round(stats.max, 1) if stats.max else 0,
-        "min": round(stats.min, 1) if stats.min else 0,
-        "tier_distribution": tier_distribution,
-        "member_count": len(member_ids),
-        "processing_ratio": round(processing_ratio, 1)
-    }
-    
-    return result
+    # 위원회 소속 의원 (같은 의원이 중복 등록된 경우 한 번만 반영)
+    members = select(CommitteeMember.committee_id, CommitteeMember.legislator_id).distinct().subquery()
+    
+    # 위원회별 평균 종합점수 계산 (소속 의원이 없는 위원회도 포함, 위원회 ID 순)
+    groups = aggregate_by(db, Committee.id, {
+        "name": func.min(Committee.dept_nm),
+        "avg": func.avg(Legislator.overall_score)
+    }, select_from=outerjoin(Committee, members, members.c.committee_id == Committee.id)
+       .outerjoin(Legislator, Legislator.id == members.c.legislator_id),
+       order_by=[Committee.id])
+    
+    return {values["name"]: _round_score(values["avg"]) for values in groups.values()}
 
 def get_legislators_by_committee(db: Session, committee_name: str) -> List[Dict[str, Any]]:
     """
@@ -552,45 +581,12 @@ def get_tier_distribution_by_term(db: Session) -> Dict[str, Dict[str, int]]:
     Returns:
         초선/재선별 티어 분포 딕셔너리
     """
-    # 초선/재선 구분 목록 조회
-    term_query = db.query(Legislator.reele_gbn_nm).distinct().all()
-    terms = [term[0] for term in term_query if term[0]]
+    # 선수 x 티어 의원 수를 한 번에 조회
+    distributions = _tier_distributions(db, Legislator.reele_gbn_nm)
     
     # 순서 정렬 - 선수에 따라 정렬
-    def term_sort_key(term):
-        if term == "초선":
-            return 1
-        elif term == "재선":
-            return 2
-        else:
-            # "3선", "4선", "5선" 등에서 숫자만 추출
-            for char in term:
-                if char.isdigit():
-                    return int(char)
-            return 999  # 숫자를 찾지 못한 경우 큰 숫자 반환
-    
-    terms.sort(key=term_sort_key)
-    
-    # 초선/재선별 티어 분포 계산
-    result = {}
-    for term in terms:
-        # 해당 선수 의원들의 티어 분포 조회
-        tier_distribution = db.query(
-            Legislator.tier, func.count(Legislator.id).label('count')
-        ).filter(
-            Legislator.reele_gbn_nm == term
-        ).group_by(
-            Legislator.tier
-        ).all()
-        
-        # 결과 딕셔너리 구성
-        term_result = {}
-        for tier, count in tier_distribution:
-            term_result[tier] = count
-            
-        result[term] = term_result
-    
-    return result
+    terms = sorted((term for term in distributions if term), key=_term_sort_key)
+    return {term: distributions[term] for term in terms}
 
 def get_term_average_assets(db: Session) -> Dict[str, float]:
     """
@@ -602,86 +598,12 @@ def get_term_average_assets(db: Session) -> Dict[str, float]:
     Returns:
         초선/재선별 평균 재산 딕셔너리
     """
-    # 초선/재선 구분 목록 조회
-    term_query = db.query(Legislator.reele_gbn_nm).distinct().all()
-    terms = [term[0] for term in term_query if term[0]]
-    
-    # 초선/재선별 순서 정렬
-    def term_sort_key(term):
-        if term == "초선":
-            return 1
-        elif term == "재선":
-            return 2
-        else:
-            # "3선", "4선", "5선" 등에서 숫자만 추출
-            for char in term:
-                if char.isdigit():
-                    return int(char)
-            return 999  # 숫자를 찾지 못한 경우 큰 숫자 반환
-    
-    terms.sort(key=term_sort_key)
-    
-    # 초선/재선별 평균 재산 계산
-    result = {}
-    for term in terms:
-        # 해당 선수 의원들의 평균 재산 계산
-        avg_asset = db.query(func.avg(Legislator.asset)).filter(
-            Legislator.reele_gbn_nm == term,
-            Legislator.hg_nm != '백선희'  # 백선희 의원 제외
-        ).scalar()
-        
-        # 억 단위로 변환
-        result[term] = round(avg_asset / 100000000, 1) if avg_asset else 0
-    
-    return result
-
-def get_term_stats_summary(db: Session, term: str) -> Dict[str, Any]:
-    """
-    특정 선수(초선/재선 등) 의원들의 통계 요약 계산
+    # 선수별 평균 재산 (백선희 의원 제외)
+    groups = aggregate_by(db, Legislator.reele_gbn_nm, {"avg": func.avg(asset_column())})
     
-    Args:
-        db: 데이터베이스 세션
-        term: 선수 구분 (초선, 재선 등)
-        
-    Returns:
-        선수별 통계 요약 딕셔너리
-    """
-    # 해당 선수 의원들의 점수 통계
-    stats = db.query(
-        func.avg(Legislator.overall_score).label("avg"),
-        func.max(Legislator.overall_score).label("max"),
-        func.min(Legislator.overall_score).label("min"),
-        func.avg(Legislator.asset).label("avg_asset"),
-        func.count(Legislator.id).label("count")
-    ).filter(
-        Legislator.reele_gbn_nm == term
-    ).first()
-    
-    # 티어 분포 계산
-    tier_query = db.query(
-        Legislator.tier,
-        func.count(Legislator.id).label("count")
-    ).filter(
-        Legislator.reele_gbn_nm == term
-    ).group_by(
-        Legislator.tier
-    ).all()
-    
-    tier_distribution = {}
-    for tier, count in tier_query:
-        tier_distribution[tier] = count
-    
-    # 결과 딕셔너리 구성
-    result = {
-        "avg": round(stats.avg, 1) if stats.avg else 0,
-        "max": round(stats.max, 1) if stats.max else 0,
-        "min": round(stats.min, 1) if stats.min else 0,
-        "avg_asset": round(stats.avg_asset / 100000000, 1) if stats.avg_asset else 0,  # 억 단위
-        "count": stats.count,
-        "tier_distribution": tier_distribution
-    }
-    
-    return result
+    # 초선/재선별 순서 정렬, 억 단위로 변환
+    terms = sorted((term for term in groups if term), key=_term_sort_key)
+    return {term: _round_asset(groups[term]["avg"]) for term in terms}
 
 def get_legislators_by_term(db: Session, term: str) -> List[Dict[str, Any]]:
     """
@@ -743,31 +665,9 @@ def get_tier_distribution_by_gender(db: Session) -> Dict[str, Dict[str, int]]:
     Returns:
         성별 티어 분포 딕셔너리
     """
-    # 성별 목록 조회
-    gender_query = db.query(Legislator.sex_gbn_nm).distinct().all()
-    genders = [gender[0] for gender in gender_query if gender[0]]
-    
-    # 성별 티어 분포 계산
-    result = {}
-    for gender in genders:
-        # 해당 성별 의원들의 티어 분포 조회
-        tier_distribution = db.query(
-            Legislator.tier,
-            func.count(Legislator.id).label("count")
-        ).filter(
-            Legislator.sex_gbn_nm == gender
-        ).group_by(
-            Legislator.tier
-        ).all()
-        
-        # 결과 딕셔너리 구성
-        gender_result = {}
-        for tier, count in tier_distribution:
-            gender_result[tier] = count
-            
-        result[gender] = gender_result
-    
-    return result
+    # 성별 x 티어 의원 수를 한 번에 조회
+    distributions = _tier_distributions(db, Legislator.sex_gbn_nm)
+    return {gender: tiers for gender, tiers in distributions.items() if gender}
 
 def get_gender_average_assets(db: Session) -> Dict[str, float]:
     """
@@ -779,70 +679,9 @@ def get_gender_average_assets(db: Session) -> Dict[str, float]:
     Returns:
         성별 평균 재산 딕셔너리
     """
-    # 성별 목록 조회
-    gender_query = db.query(Legislator.sex_gbn_nm).distinct().all()
-    genders = [gender[0] for gender in gender_query if gender[0]]
-    
-    # 성별 평균 재산 계산
-    result = {}
-    for gender in genders:
-        # 해당 성별 의원들의 평균 재산 계산
-        avg_asset = db.query(func.avg(Legislator.asset)).filter(
-            Legislator.sex_gbn_nm == gender,
-            Legislator.hg_nm != '백선희'  # 백선희 의원 제외
-        ).scalar()
-        
-        result[gender] = round(avg_asset / 100000000, 1) if avg_asset else 0
-    
-    return result
-
-def get_gender_stats_summary(db: Session, gender: str) -> Dict[str, Any]:
-    """
-    특정 성별 의원들의 통계 요약 계산
-    
-    Args:
-        db: 데이터베이스 세션
-        gender: 성별
-        
-    Returns:
-        성별 통계 요약 딕셔너리
-    """
-    # 해당 성별 의원들의 점수 통계
-    stats = db.query(
-        func.avg(Legislator.overall_score).label("avg"),
-        func.max(Legislator.overall_score).label("max"),
-        func.min(Legislator.overall_score).label("min"),
-        func.avg(Legislator.asset).label("avg_asset"),
-        func.count(Legislator.id).label("count")
-    ).filter(
-        Legislator.sex_gbn_nm == gender
-    ).first()
-    
-    # 티어 분포 계산
-    tier_query = db.query(
-        Legislator.tier,
-        func.count(Legislator.id).label("count")
-    ).filter(
-        Legislator.sex_gbn_nm == gender
-    ).group_by(
-        Legislator.tier
-    ).all()
-    
-    tier_distribution = {}
-    for tier, count in tier_query:
-        tier_distribution[tier] = count
-    
-    # 결과 딕셔너리 구성
-    result = {
-        "avg": round(stats.avg, 1) if stats.avg else 0,
-        "max": round(stats.max, 1) if stats.max else 0,
-        "min": round(stats.min, 1) if stats.min else 0,
-        "avg_asset": round(stats.avg_asset / 100000000, 1) if stats.avg_asset else 0,  # 억 단위
-        "count": stats.count,
-        "tier_distribution": tier_distribution
-    }
-    
-    return result
+    # 성별 평균 재산 (백선희 의원 제외)
+    groups = aggregate_by(db, Legislator.sex_gbn_nm, {"avg": func.avg(asset_column())})
+    return {gender: _round_asset(values["avg"]) for gender, values in groups.items() if gender}
 
 def get_legislator_asset_details(db: Session, legislator_id: int) -> Dict[str, Any]:
     """
@@ -953,46 +792,9 @@ def get_age_average_scores(db: Session) -> Dict[str, float]:
     Returns:
         나이대별 평균 종합점수 딕셔너리
     """
-    # 현재 연도 (2025년)
-    current_year = 2025
-    
-    # 나이대별 평균 종합점수 계산
-    result = {}
-    
-    # 30대 이하: 1986년생 이후 (39세 이하)
-    avg_score = db.query(func.avg(Legislator.overall_score)).filter(
-        func.substr(Legislator.bth_date, 1, 4) >= str(current_year - 39)
-    ).scalar()
-    result["30대 이하"] = round(avg_score, 1) if avg_score else 0
-    
-    # 40대: 1976~1985년생 (40~49세)
-    avg_score = db.query(func.avg(Legislator.overall_score)).filter(
-        func.substr(Legislator.bth_date, 1, 4) >= str(current_year - 49),
-        func.substr(Legislator.bth_date, 1, 4) <= str(current_year - 40)
-    ).scalar()
-    result["40대"] = round(avg_score, 1) if avg_score else 0
-    
-    # 50대: 1966~1975년생 (50~59세)
-    avg_score = db.query(func.avg(Legislator.overall_score)).filter(
-        func.substr(Legislator.bth_date, 1, 4) >= str(current_year - 59),
-        func.substr(Legislator.bth_date, 1, 4) <= str(current_year - 50)
-    ).scalar()
-    result["50대"] = round(avg_score, 1) if avg_score else 0
-    
-    # 60대: 1956~1965년생 (60~69세)
-    avg_score = db.query(func.avg(Legislator.overall_score)).filter(
-        func.substr(Legislator.bth_date, 1, 4) >= str(current_year - 69),
-        func.substr(Legislator.bth_date, 1, 4) <= str(current_year - 60)
-    ).scalar()
-    result["60대"] = round(avg_score, 1) if avg_score else 0
-    
-    # 70대 이상: 1955년생 이전 (70세 이상)
-    avg_score = db.query(func.avg(Legislator.overall_score)).filter(
-        func.substr(Legislator.bth_date, 1, 4) <= str(current_year - 70)
-    ).scalar()
-    result["70대 이상"] = round(avg_score, 1) if avg_score else 0
-    
-    return result
+    # 나이대별 평균 종합점수 계산 (한 번의 GROUP BY, 해당 의원이 없는 나이대는 0)
+    groups = aggregate_by(db, age_band_expression(), {"avg": func.avg(Legislator.overall_score)})
+    return {age_group: _round_score(groups.get(age_group, {}).get("avg")) for age_group in AGE_GROUPS}
 
 def get_age_average_assets(db: Session) -> Dict[str, float]:
     """
@@ -1004,135 +806,9 @@ def get_age_average_assets(db: Session) -> Dict[str, float]:
     Returns:
         나이대별 평균 재산 딕셔너리
     """
-    # 현재 연도 (2025년)
-    current_year = 2025
-    
-    # 나이대별 평균 재산 계산
-    result = {}
-    
-    # 30대 이하: 1986년생 이후 (39세 이하)
-    avg_asset = db.query(func.avg(Legislator.asset)).filter(
-        func.substr(Legislator.bth_date, 1, 4) >= str(current_year - 39),
-        Legislator.hg_nm != '백선희'  # 백선희 의원 제외
-    ).scalar()
-    result["30대 이하"] = round(avg_asset / 100000000, 1) if avg_asset else 0
-    
-    # 40대: 1976~1985년생 (40~49세)
-    avg_asset = db.query(func.avg(Legislator.asset)).filter(
-        func.substr(Legislator.bth_date, 1, 4) >= str(current_year - 49),
-        func.substr(Legislator.bth_date, 1, 4) <= str(current_year - 40),
-        Legislator.hg_nm != '백선희'  # 백선희 의원 제외
-    ).scalar()
-    result["40대"] = round(avg_asset / 100000000, 1) if avg_asset else 0
-    
-    # 50대: 1966~1975년생 (50~59세)
-    avg_asset = db.query(func.avg(Legislator.asset)).filter(
-        func.substr(Legislator.bth_date, 1, 4) >= str(current_year - 59),
-        func.substr(Legislator.bth_date, 1, 4) <= str(current_year - 50),
-        Legislator.hg_nm != '백선희'  # 백선희 의원 제외
-    ).scalar()
-    result["50대"] = round(avg_asset / 100000000, 1) if avg_asset else 0
-    
-    # 60대: 1956~1965년생 (60~69세)
-    avg_asset = db.query(func.avg(Legislator.asset)).filter(
-        func.substr(Legislator.bth_date, 1, 4) >= str(current_year - 69),
-        func.substr(Legislator.bth_date, 1, 4) <= str(current_year - 60),
-        Legislator.hg_nm != '백선희'  # 백선희 의원 제외
-    ).scalar()
-    result["60대"] = round(avg_asset / 100000000, 1) if avg_asset else 0
-    
-    # 70대 이상: 1955년생 이전 (70세 이상)
-    avg_asset = db.query(func.avg(Legislator.asset)).filter(
-        func.substr(Legislator.bth_date, 1, 4) <= str(current_year - 70),
-        Legislator.hg_nm != '백선희'  # 백선희 의원 제외
-    ).scalar()
-    result["70대 이상"] = round(avg_asset / 100000000, 1) if avg_asset else 0
-    
-    return result
-
-def get_age_stats_summary(db: Session, age_group: str) -> Dict[str, Any]:
-    """
-    특정 나이대 의원들의 통계 요약 계산
-    
-    Args:
-        db: 데이터베이스 세션
-        age_group: 나이대 ('30대 이하', '40대', '50대', '60대', '70대 이상')
-        
-    Returns:
-        나이대별 통계 요약 딕셔너리
-    """
-    # 현재 연도 (2025년)
-    current_year = 2025
-    
-    # 나이대에 따른 쿼리 필터 설정
-    if age_group == "30대 이하":
-        # 1986년생 이후 (39세 이하)
-        base_query = db.query(Legislator).filter(
-            func.substr(Legislator.bth_date, 1, 4) >= str(current_year - 39)
-        )
-    elif age_group == "40대":
-        # 1976~1985년생 (40~49세)
-        base_query = db.query(Legislator).filter(
-            func.substr(Legislator.bth_date, 1, 4) >= str(current_year - 49),
-            func.substr(Legislator.bth_date, 1, 4) <= str(current_year - 40)
-        )
-    elif age_group == "50대":
-        # 1966~1975년생 (50~59세)
-        base_query = db.query(Legislator).filter(
-            func.substr(Legislator.bth_date, 1, 4) >= str(current_year - 59),
-            func.substr(Legislator.bth_date, 1, 4) <= str(current_year - 50)
-        )
-    elif age_group == "60대":
-        # 1956~1965년생 (60~69세)
-        base_query = db.query(Legislator).filter(
-            func.substr(Legislator.bth_date, 1, 4) >= str(current_year - 69),
-            func.substr(Legislator.bth_date, 1, 4) <= str(current_year - 60)
-        )
-    elif age_group == "70대 이상":
-        # 1955년생 이전 (70세 이상)
-        base_query = db.query(Legislator).filter(
-            func.substr(Legislator.bth_date, 1, 4) <= str(current_year - 70)
-        )
-    else:
-        return {
-            "avg": 0,
-            "max": 0,
-            "min": 0,
-            "avg_asset": 0,
-            "count": 0,
-            "tier_distribution": {}
-        }
-    
-    # 해당 나이대 의원들의 점수 통계
-    stats = base_query.with_entities(
-        func.avg(Legislator.overall_score).label("avg"),
-        func.max(Legislator.overall_score).label("max"),
-        func.min(Legislator.overall_score).label("min"),
-        func.avg(Legislator.asset).label("avg_asset"),
-        func.count(Legislator.id).label("count")
-    ).first()
-    
-    # 티어 분포 계산
-    tier_query = base_query.with_entities(
-        Legislator.tier,
-        func.count(Legislator.id).label("count")
-    ).group_by(Legislator.tier).all()
-    
-    tier_distribution = {}
-    for tier, count in tier_query:
-        tier_distribution[tier] = count
-    
-    # 결과 딕셔너리 구성
-    result = {
-        "avg": round(stats.avg, 1) if stats.avg else 0,
-        "max": round(stats.max, 1) if stats.max else 0,
-        "min": round(stats.min, 1) if stats.min else 0,
-        "avg_asset": round(stats.avg_asset / 100000000, 1) if stats.avg_asset else 0,  # 억 단위
-        "count": stats.count or 0,
-        "tier_distribution": tier_distribution
-    }
-    
-    return result
+    # 나이대별 평균 재산 계산 (백선희 의원 제외, 해당 의원이 없는 나이대는 0)
+    groups = aggregate_by(db, age_band_expression(), {"avg": func.avg(asset_column())})
+    return {age_group: _round_asset(groups.get(age_group, {}).get("avg")) for age_group in AGE_GROUPS}
 
 def get_legislators_by_age_group(db: Session, age_group: str) -> List[Dict[str, Any]]:
     """
@@ -1419,96 +1095,6 @@ def get_asset_percentile_ranges(db: Session) -> Dict[str, Tuple[int, int]]:
     
     return percentile_ranges
 
-def get_asset_stats_summary(db: Session, asset_group: str) -> Dict[str, Any]:
-    """
-    특정 재산 구간 의원들의 통계 요약 계산
-    
-    Args:
-        db: 데이터베이스 세션
-        asset_group: 재산 구간 ('0-20 백분위', '20-40 백분위', '40-60 백분위', '60-80 백분위', '80-100 백분위')
-        
-    Returns:
-        재산 구간별 통계 요약 딕셔너리
-    """
-    # 백분위 기반 자산 범위 계산
-    percentile_ranges = get_asset_percentile_ranges(db)
-    
-    if not percentile_ranges or asset_group not in percentile_ranges:
-        return {
-            "avg_score": 0,
-            "max_score": 0,
-            "min_score": 0,
-            "avg_asset": 0,
-            "count": 0,
-            "tier_distribution": {}
-        }
-    
-    # 선택한 백분위 범위 가져오기
-    asset_min, asset_max = percentile_ranges[asset_group]
-    
-    # 해당 재산 구간 의원들의 통계
-    # get_legislators_by_asset_group와 같은 조건 적용
-    if asset_group == "0-20 백분위":
-        stats = db.query(
-            func.avg(Legislator.overall_score).label("avg_score"),
-            func.max(Legislator.overall_score).label("max_score"),
-            func.min(Legislator.overall_score).label("min_score"),
-            func.avg(Legislator.asset).label("avg_asset"),
-            func.count(Legislator.id).label("count")
-        ).filter(
-            Legislator.asset >= asset_min,
-            Legislator.asset <= asset_max
-        ).first()
-        
-        # 티어 분포 계산
-        tier_query = db.query(
-            Legislator.tier,
-            func.count(Legislator.id).label("count")
-        ).filter(
-            Legislator.asset >= asset_min,
-            Legislator.asset <= asset_max
-        ).group_by(
-            Legislator.tier
-        ).all()
-    else:
-        stats = db.query(
-            func.avg(Legislator.overall_score).label("avg_score"),
-            func.max(Legislator.overall_score).label("max_score"),
-            func.min(Legislator.overall_score).label("min_score"),
-            func.avg(Legislator.asset).label("avg_asset"),
-            func.count(Legislator.id).label("count")
-        ).filter(
-            Legislator.asset > asset_min,
-            Legislator.asset <= asset_max
-        ).first()
-        
-        # 티어 분포 계산
-        tier_query = db.query(
-            Legislator.tier,
-            func.count(Legislator.id).label("count")
-        ).filter(
-            Legislator.asset > asset_min,
-            Legislator.asset <= asset_max
-        ).group_by(
-            Legislator.tier
-        ).all()
-    
-    tier_distribution = {}
-    for tier, count in tier_query:
-        tier_distribution[tier] = count
-    
-    # 결과 딕셔너리 구성
-    result = {
-        "avg_score": round(stats.avg_score, 1) if stats.avg_score else 0,
-        "max_score": round(stats.max_score, 1) if stats.max_score else 0,
-        "min_score": round(stats.min_score, 1) if stats.min_score else 0,
-        "avg_asset": round(stats.avg_asset / 100000000, 1) if stats.avg_asset else 0,  # 억 단위
-        "count": stats.count or 0,
-        "tier_distribution": tier_distribution
-    }
-    
-    return result
-
 def get_legislators_by_asset_group(db: Session, asset_group: str) -> List[Dict[str, Any]]:
     """
     특정 재산 구간 의원 목록 조회
@@ -0,0 +1,209 @@
+import json
+import time
+import threading
+from datetime import datetime
+from sqlalchemy import delete, func, select
+from sqlalchemy.orm import Session
+from typing import Any, Callable, Dict, List
+
+from app.models.legislator import Legislator
+from app.models.committee import Committee
+from app.models.stats_snapshot import StatsSnapshot
+from app.services import stats_service
+from app.services.data_version_service import (
+    bump_data_version, get_consumed_versions, get_counter_versions, get_table_versions, record_consumed_versions
+)
+
+# 선수 순서 (초선부터 9선까지)
+TERM_ORDER = {"초선": 1, "재선": 2, "3선": 3, "4선": 4, "5선": 5, "6선": 6, "7선": 7, "8선": 8, "9선": 9}
+
+def get_party_names(db: Session) -> List[str]:
+    """
+    의원 수 내림차순 정당 목록
+    """
+    party_counts = db.query(
+        Legislator.poly_nm,
+        func.count(Legislator.id).label("count")
+    ).group_by(
+        Legislator.poly_nm
+    ).order_by(
+        func.count(Legislator.id).desc()
+    ).all()
+    return [party_name for party_name, count in party_counts if party_name]
+
+def get_committee_names(db: Session) -> List[str]:
+    """
+    위원회 목록
+    """
+    return [committee[0] for committee in db.query(Committee.dept_nm).distinct().all()]
+
+def get_term_names(db: Session) -> List[str]:
+    """
+    선수 목록 (초선, 재선, 3선 ... 순서)
+    """
+    terms = [term[0] for term in db.query(Legislator.reele_gbn_nm).distinct().all() if term[0]]
+    return sorted(terms, key=lambda x: TERM_ORDER.get(x, 999))
+
+def get_gender_names(db: Session) -> List[str]:
+    """
+    성별 목록 ('남', '여' 순서)
+    """
+    genders = [gender[0] for gender in db.query(Legislator.sex_gbn_nm).distinct().all() if gender[0]]
+    if '남' in genders and '여' in genders:
+        genders = ['남', '여']
+    return genders
+
+# 스냅샷 항목별 계산 함수 (stats_service 결과를 그대로 저장, 그룹별 통계 요약은 모든 그룹을 한 번에 계산)
+SNAPSHOT_BUILDERS: Dict[str, Callable[[Session], Any]] = {
+    # 홈
+    "party_asset_stats": lambda db: stats_service.get_party_average_stats(db, stat='asset'),
+    "term_score_stats": lambda db: stats_service.get_term_average_stats(db, stat='overall_score'),
+    # 정당
+    "parties": get_party_names,
+    "party_scores": stats_service.get_party_average_scores,
+    "party_bills": stats_service.get_party_average_bill_counts,
+    "party_stats_summary": lambda db: stats_service.get_stats_summaries(db, "party"),
+    # 위원회
+    "committees": get_committee_names,
+    "committee_processing_ratios": stats_service.get_committee_processing_ratio,
+    "committee_scores": stats_service.get_committee_average_scores,
+    "committee_stats_summary": lambda db: stats_service.get_stats_summaries(db, "committee"),
+    # 초선/재선
+    "terms": get_term_names,
+    "term_tier_distribution": stats_service.get_tier_distribution_by_term,
+    "term_assets": stats_service.get_term_average_assets,
+    "term_stats_summary": lambda db: stats_service.get_stats_summaries(db, "term"),
+    # 나이
+    "age_scores": stats_service.get_age_average_scores,
+    "age_assets": stats_service.get_age_average_assets,
+    "age_stats_summary": lambda db: stats_service.get_stats_summaries(db, "age"),
+    # 성별
+    "genders": get_gender_names,
+    "gender_tier_distribution": stats_service.get_tier_distribution_by_gender,
+    "gender_assets": stats_service.get_gender_average_assets,
+    "gender_stats_summary": lambda db: stats_service.get_stats_summaries(db, "gender"),
+    # 재산
+    "asset_correlation_chart": lambda db: stats_service.get_score_asset_correlation(db, for_chart=True),
+    "asset_correlation_table": lambda db: stats_service.get_score_asset_correlation(db, for_chart=False),
+    "party_asset_ratio": stats_service.get_party_asset_ratio,
+    "asset_stats_summary": lambda db: stats_service.get_stats_summaries(db, "asset"),
+}
+
+# 스냅샷이 사용하는 원본 데이터 (legislators, bills는 건수/최대 ID 포함, 나머지는 버전 카운터)
+SNAPSHOT_TABLE_SOURCES = ["legislators", "bills"]
+SNAPSHOT_COUNTER_SOURCES = ["scores", "legislator_assets", "committees", "committee_members"]
+SNAPSHOT_VERSION_NAME = "snapshot:stats"
+
+def get_snapshot_source_versions(db: Session) -> Dict[str, str]:
+    """
+    스냅샷이 사용하는 원본 데이터의 현재 버전
+    """
+    versions = get_table_versions(db, SNAPSHOT_TABLE_SOURCES)
+    versions.update(get_counter_versions(db, SNAPSHOT_COUNTER_SOURCES))
+    return versions
+
+def is_stats_snapshot_stale(db: Session) -> bool:
+    """
+    스냅샷을 만든 뒤 원본 데이터(의원, 법안, 점수, 재산, 위원회, 위원회 멤버십)가 바뀌었는지 확인
+    """
+    return get_consumed_versions(db, SNAPSHOT_VERSION_NAME) != get_snapshot_source_versions(db)
+
+# 기존 DB에 stats_snapshots 테이블이 없을 수 있으므로 최초 사용 시 한 번만 생성
+_table_checked = False
+_table_lock = threading.Lock()
+
+# 조회 중 재생성이 여러 요청에서 동시에 일어나지 않도록 사용
+_rebuild_lock = threading.Lock()
+
+def _ensure_table(db: Session) -> None:
+    global _table_checked
+    if not _table_checked:
+        with _table_lock:
+            if not _table_checked:
+                StatsSnapshot.__table__.create(bind=db.get_bind(), checkfirst=True)
+                _table_checked = True
+
+def rebuild_stats_snapshot(db: Session) -> int:
+    """
+    잡다한 랭킹 통계 스냅샷 전체 재생성 (점수 계산 마지막 단계에서 호출)
+
+    Args:
+        db: 데이터베이스 세션
+
+    Returns:
+        int: 저장한 통계 항목 수 (계산 중 오류가 난 항목은 제외되어 조회 시 직접 계산)
+    """
+    _ensure_table(db)
+    start_time = time.time()
+    versions = get_snapshot_source_versions(db)
+
+    payloads = {}
+    for name, builder in SNAPSHOT_BUILDERS.items():
+        try:
+            payloads[name] = json.dumps(builder(db), ensure_ascii=False)
+        except Exception as e:
+            db.rollback()
+            print(f"통계 스냅샷 항목 계산 오류 ({name}): {str(e)}")
+
+    try:
+        now = datetime.now()
+        db.execute(delete(StatsSnapshot))
+        db.add_all([StatsSnapshot(name=name, payload=payload, updated_at=now) for name, payload in payloads.items()])
+        record_consumed_versions(db, SNAPSHOT_VERSION_NAME, versions, commit=False)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    bump_data_version(db, "stats_snapshot")
+
+    print(f"통계 스냅샷 재생성 완료: {len(payloads)}/{len(SNAPSHOT_BUILDERS)}개 항목 ({time.time() - start_time:.3f}초)")
+    return len(payloads)
+
+def refresh_stats_snapshot(db: Session) -> bool:
+    """
+    원본 데이터가 바뀌었으면 스냅샷 재생성 (수집 단계 마지막, 점수 재계산이 없을 때 호출)
+
+    Args:
+        db: 데이터베이스 세션
+
+    Returns:
+        bool: 재생성했으면 True
+    """
+    _ensure_table(db)
+    with _rebuild_lock:
+        if not is_stats_snapshot_stale(db):
+            return False
+        rebuild_stats_snapshot(db)
+        return True
+
+def get_stats_snapshot(db: Session, *names: str) -> Dict[str, Any]:
+    """
+    통계 스냅샷 조회 (요청한 항목을 한 번의 쿼리로 조회)
+
+    원본 데이터가 스냅샷 이후 바뀌었으면(다른 프로세스의 수집 등) 먼저 재생성하고,
+    스냅샷이 아직 없는 항목(점수 계산 전 등)은 stats_service로 직접 계산
+
+    Args:
+        db: 데이터베이스 세션
+        names: 통계 항목명 (SNAPSHOT_BUILDERS의 키)
+
+    Returns:
+        Dict[str, Any]: 항목명 -> 통계 결과
+    """
+    _ensure_table(db)
+    try:
+        refresh_stats_snapshot(db)
+    except Exception as e:
+        db.rollback()
+        print(f"통계 스냅샷 재생성 오류: {str(e)}")
+
+    rows = db.execute(
+        select(StatsSnapshot.name, StatsSnapshot.payload).where(StatsSnapshot.name.in_(names))
+    ).all()
+    result = {name: json.loads(payload) for name, payload in rows}
+
+    for name in names:
+        if name not in result:
+            result[name] = SNAPSHOT_BUILDERS[name](db)
+
+    return result
@@ -0,0 +1,103 @@
+import json
+import hashlib
+from datetime import datetime
+from sqlalchemy.orm import Session
+from typing import List, Dict, Any, Optional
+
+from app.models.sync_state import SyncState
+
+# 기존 DB에 sync_states 테이블이 없을 수 있으므로 최초 사용 시 한 번만 생성
+_table_checked = False
+
+def _ensure_table(db: Session) -> None:
+    global _table_checked
+    if not _table_checked:
+        SyncState.__table__.create(bind=db.get_bind(), checkfirst=True)
+        _table_checked = True
+
+def compute_rows_hash(rows: List[Dict[str, Any]]) -> str:
+    """
+    API 응답 행 목록의 해시 계산 (행 순서와 무관)
+
+    Args:
+        rows: API 응답 행 목록
+
+    Returns:
+        str: SHA-256 해시 문자열
+    """
+    row_hashes = sorted(
+        hashlib.sha256(json.dumps(row, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")).hexdigest()
+        for row in rows
+    )
+    return hashlib.sha256("".join(row_hashes).encode("utf-8")).hexdigest()
+
+def get_sync_state(db: Session, endpoint: str) -> Optional[SyncState]:
+    """
+    엔드포인트의 마지막 수집 상태 조회
+
+    Args:
+        db: 데이터베이스 세션
+        endpoint: 수집 대상 키
+
+    Returns:
+        SyncState 또는 None (수집 기록이 없는 경우)
+    """
+    _ensure_table(db)
+    return db.query(SyncState).filter(SyncState.endpoint == endpoint).first()
+
+def update_sync_state(db: Session, endpoint: str, watermark: Optional[str] = None,
+                      total_count: Optional[int] = None, row_hash: Optional[str] = None) -> None:
+    """
+    엔드포인트의 수집 상태 저장 (None인 값은 기존 값 유지)
+
+    Args:
+        db: 데이터베이스 세션
+        endpoint: 수집 대상 키
+        watermark: 마지막으로 반영한 기준값
+        total_count: 전체 건수
+        row_hash: 수집 데이터 해시
+    """
+    state = get_sync_state(db, endpoint)
+    if not state:
+        state = SyncState(endpoint=endpoint)
+        db.add(state)
+
+    if watermark is not None:
+        state.watermark = watermark
+    if total_count is not None:
+        state.total_count = total_count
+    if row_hash is not None:
+        state.row_hash = row_hash
+    state.synced_at = datetime.now()
+
+    db.commit()
+
+def is_unchanged(db: Session, endpoint: str, row_hash: str) -> bool:
+    """
+    마지막으로 반영한 데이터와 해시가 같은지 확인
+
+    Args:
+        db: 데이터베이스 세션
+        endpoint: 수집 대상 키
+        row_hash: 이번에 수집한 데이터의 해시
+
+    Returns:
+        bool: 변경이 없으면 True
+    """
+    state = get_sync_state(db, endpoint)
+    return state is not None and state.row_hash == row_hash
+
+def reset_sync_state(db: Session, endpoint: Optional[str] = None) -> None:
+    """
+    수집 상태 초기화 (endpoint가 None이면 전체) - 다음 수집 시 전체 데이터를 다시 반영
+
+    Args:
+        db: 데이터베이스 세션
+        endpoint: 수집 대상 키
+    """
+    _ensure_table(db)
+    query = db.query(SyncState)
+    if endpoint:
+        query = query.filter(SyncState.endpoint == endpoint)
+    query.delete(synchronize_session=False)
+    db.commit()
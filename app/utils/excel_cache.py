@@ -0,0 +1,144 @@
+import os
+import pickle
+import hashlib
+from typing import Any, Callable, Dict, List, Optional
+
+from app.config import settings
+
+# 파싱 결과 형식이 바뀌면 올려서 기존 캐시를 무효화
+EXCEL_CACHE_VERSION = 2
+
+def file_sha256(file_path: str) -> str:
+    """
+    파일 내용의 SHA-256 해시
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def get_cache_path(kind: str, file_path: str) -> str:
+    """
+    원본 엑셀 파일과 파싱 종류에 대한 캐시 파일 경로 (원본 절대 경로 기준)
+    """
+    source = os.path.abspath(file_path)
+    key = hashlib.sha1(f"{kind}:{source}".encode("utf-8")).hexdigest()[:12]
+    stem = os.path.splitext(os.path.basename(file_path))[0]
+    return os.path.join(settings.EXCEL_CACHE_DIR, f"{stem}.{kind}.{key}.pkl")
+
+def load_cached_records(kind: str, file_path: str) -> Optional[List[Dict[str, Any]]]:
+    """
+    원본 파일이 바뀌지 않았으면 캐시된 파싱 결과 반환
+
+    수정 시각과 크기가 같으면 바로 사용하고, 다르면 내용 해시를 비교하여
+    내용이 같으면(복사/체크아웃 등으로 수정 시각만 바뀐 경우) 수정 시각을 갱신한 뒤 사용
+
+    Args:
+        kind: 파싱 종류 (EXCEL_PARSERS의 키)
+        file_path: 원본 엑셀 파일 경로
+
+    Returns:
+        파싱 결과 레코드 목록 또는 None (캐시가 없거나 원본이 바뀐 경우)
+    """
+    if not settings.EXCEL_CACHE_ENABLED:
+        return None
+
+    cache_path = get_cache_path(kind, file_path)
+    if not os.path.exists(cache_path):
+        return None
+
+    try:
+        with open(cache_path, "rb") as f:
+            entry = pickle.load(f)
+
+        if entry.get("version") != EXCEL_CACHE_VERSION or entry.get("kind") != kind:
+            return None
+
+        stat = os.stat(file_path)
+        if entry["mtime"] == stat.st_mtime and entry["size"] == stat.st_size:
+            return entry["records"]
+
+        if entry["size"] == stat.st_size and entry["sha256"] == file_sha256(file_path):
+            entry["mtime"] = stat.st_mtime
+            _write_entry(cache_path, entry)
+            return entry["records"]
+    except Exception as e:
+        print(f"엑셀 캐시 읽기 오류 ({cache_path}): {str(e)}")
+
+    return None
+
+def store_cached_records(kind: str, file_path: str, records: List[Dict[str, Any]]) -> None:
+    """
+    파싱 결과를 원본 파일의 수정 시각, 크기, 내용 해시와 함께 저장
+
+    Args:
+        kind: 파싱 종류
+        file_path: 원본 엑셀 파일 경로
+        records: 파싱 결과 레코드 목록
+    """
+    if not settings.EXCEL_CACHE_ENABLED:
+        return
+
+    try:
+        stat = os.stat(file_path)
+        entry = {
+            "version": EXCEL_CACHE_VERSION,
+            "kind": kind,
+            "source": os.path.abspath(file_path),
+            "mtime": stat.st_mtime,
+            "size": stat.st_size,
+            "sha256": file_sha256(file_path),
+            "records": records,
+        }
+        _write_entry(get_cache_path(kind, file_path), entry)
+    except Exception as e:
+        print(f"엑셀 캐시 저장 오류 ({file_path}): {str(e)}")
+
+def _write_entry(cache_path: str, entry: Dict[str, Any]) -> None:
+    # 임시 파일에 쓴 뒤 교체하여 여러 프로세스가 동시에 써도 파일이 깨지지 않도록 함
+    os.makedirs(os.path.dirname(cache_path) or ".", exist_ok=True)
+    temp_path = f"{cache_path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as f:
+        pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temp_path, cache_path)
+
+def cached_parse(kind: str, file_path: str, parser: Callable[[str], List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """
+    캐시를 거쳐 엑셀 파일 파싱 (원본이 바뀌지 않았으면 openpyxl을 전혀 사용하지 않음)
+
+    Args:
+        kind: 파싱 종류
+        file_path: 원본 엑셀 파일 경로
+        parser: 파싱 함수 (파일 경로 -> 레코드 목록)
+
+    Returns:
+        List[Dict[str, Any]]: 파싱 결과 레코드 목록
+    """
+    records = load_cached_records(kind, file_path)
+    if records is not None:
+        return records
+
+    records = parser(file_path)
+    # 파싱 실패(빈 결과)는 저장하지 않아 다음 실행에서 다시 시도
+    if records:
+        store_cached_records(kind, file_path, records)
+    return records
+
+def clear_excel_cache() -> int:
+    """
+    엑셀 캐시 전체 삭제
+
+    Returns:
+        int: 삭제한 캐시 파일 수
+    """
+    cache_dir = settings.EXCEL_CACHE_DIR
+    if not os.path.isdir(cache_dir):
+        return 0
+
+    removed = 0
+    for name in os.listdir(cache_dir):
+        if name.endswith(".pkl"):
+            os.remove(os.path.join(cache_dir, name))
+            removed += 1
+    return removed
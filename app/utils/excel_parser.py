@@ -1,7 +1,7 @@
 import pandas as pd
 import os
 import re
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Union, Tuple, Iterator
 from sqlalchemy.orm import Session
 from app.models.assetdetailed import AssetDetailed
 
@@ -49,7 +49,7 @@ def parse_attendance_excel(file_path: str) -> List[Dict[str, Any]]:
         else:
             try:
                 # 엑셀 시트 확인
-                xls = pd.ExcelFile(file_path)
+                xls = pd.ExcelFile(file_path, engine=get_excel_engine())
                 sheets = xls.sheet_names
                 
                 if '22대' in sheets:
@@ -70,63 +70,153 @@ def parse_attendance_excel(file_path: str) -> List[Dict[str, Any]]:
         return []
 
 
-def parse_plenary_attendance_excel(file_path: str) -> List[Dict[str, Any]]:
+# 출석 상태 컬럼 (엑셀 컬럼명이자 Attendance.status 값, 순서 유지)
+ATTENDANCE_STATUSES = ["회의일수", "출석", "결석", "청가", "출장", "결석신고서"]
+
+# 본회의 출석 엑셀의 22대 총계 위치 (의원명 0열, 총계 15~20열, 5행부터 데이터)
+_PLENARY_NAME_COLUMN = 0
+_PLENARY_TOTAL_COLUMNS = list(range(15, 21))
+_PLENARY_DATA_START_ROW = 4
+
+def get_excel_engine() -> Optional[str]:
+    """
+    pandas.read_excel에 사용할 엔진 반환
+
+    settings.EXCEL_ENGINE이 "auto"이면 python-calamine이 설치된 경우 calamine(openpyxl보다 수 배 빠름),
+    아니면 pandas 기본 엔진(openpyxl) 사용
+    """
+    from app.config import settings
+
+    engine = settings.EXCEL_ENGINE
+    if engine != "auto":
+        return engine or None
+
+    try:
+        import python_calamine  # noqa: F401
+        return "calamine"
+    except ImportError:
+        return None
+
+def _valid_name_mask(names: pd.Series) -> pd.Series:
+    # 의원명이 비어있는 행 제외 (NaN, 빈 문자열)
+    return names.notna() & (names.astype(str) != "")
+
+def _to_count_frame(frame: pd.DataFrame, label: str) -> pd.DataFrame:
+    """
+    상태 컬럼을 정수로 변환 (빈 값은 0, 숫자로 변환할 수 없는 값은 경고 후 0)
+    """
+    counts = frame.apply(pd.to_numeric, errors="coerce")
+    invalid = counts.isna() & frame.notna()
+    if invalid.any().any():
+        print(f"경고: {label} 파일에서 정수로 변환할 수 없는 값 {int(invalid.sum().sum())}개를 0으로 처리합니다.")
+    return counts.fillna(0).astype(int)
+
+def attendance_frame_to_records(frame: pd.DataFrame, meeting_type: str,
+                                include_committee_id: bool = False) -> List[Dict[str, Any]]:
+    """
+    의원별 출석 현황(의원명 인덱스 x 상태 컬럼)을 (의원, 상태)별 레코드 목록으로 일괄 변환
+
+    Args:
+        frame: legislator_name을 인덱스로, ATTENDANCE_STATUSES를 컬럼으로 가지는 DataFrame
+        meeting_type: 회의 구분 (본회의/상임위)
+        include_committee_id: committee_id(None) 키 포함 여부
+
+    Returns:
+        List[Dict[str, Any]]: 출석 데이터 리스트 (의원 순서, 상태 순서 유지)
+    """
+    long_frame = frame[ATTENDANCE_STATUSES].stack().reset_index()
+    long_frame.columns = ["legislator_name", "status", "count"]
+    long_frame.insert(1, "meeting_type", meeting_type)
+    if include_committee_id:
+        long_frame["committee_id"] = None
+    long_frame = long_frame[["legislator_name", "meeting_type", "status", "count"] +
+                            (["committee_id"] if include_committee_id else [])]
+
+    records = long_frame.to_dict("records")
+    # numpy 정수를 파이썬 int로 변환 (DB 저장/JSON 직렬화 호환)
+    for record in records:
+        record["count"] = int(record["count"])
+    return records
+
+def read_plenary_attendance(file_path: str, sheet_name: str = '22대',
+                            only_needed_columns: bool = True) -> pd.DataFrame:
+    """
+    본회의 출석 엑셀에서 의원별 22대 총계를 DataFrame으로 읽기
+
+    Args:
+        file_path: 엑셀 파일 경로
+        sheet_name: 읽을 시트명
+        only_needed_columns: True이면 의원명과 총계 컬럼만 읽음
+
+    Returns:
+        pd.DataFrame: legislator_name 인덱스, ATTENDANCE_STATUSES 컬럼 (정수)
+    """
+    usecols = [_PLENARY_NAME_COLUMN] + _PLENARY_TOTAL_COLUMNS if only_needed_columns else None
+    df = pd.read_excel(file_path, sheet_name=sheet_name, header=None, usecols=usecols,
+                       engine=get_excel_engine())
+
+    print(f"본회의 출석 엑셀 데이터 형태: {df.shape}")
+
+    # 22대 총계 데이터만 사용
+    data = df.iloc[_PLENARY_DATA_START_ROW:]
+    names = data[_PLENARY_NAME_COLUMN]
+    data = data[_valid_name_mask(names)]
+
+    counts = _to_count_frame(data[_PLENARY_TOTAL_COLUMNS], file_path)
+    counts.columns = ATTENDANCE_STATUSES
+    counts.index = data[_PLENARY_NAME_COLUMN].astype(str).str.strip().rename("legislator_name")
+    return counts
+
+def read_standing_committee_attendance(file_path: str, sheet_name: Union[str, int] = 0,
+                                       only_needed_columns: bool = True) -> pd.DataFrame:
+    """
+    상임위 출석 엑셀에서 의원별 상태별 합계를 DataFrame으로 읽기 (같은 의원의 여러 행은 합산)
+
+    Args:
+        file_path: 엑셀 파일 경로
+        sheet_name: 읽을 시트명 또는 순서
+        only_needed_columns: True이면 의원명과 상태 컬럼만 읽음
+
+    Returns:
+        pd.DataFrame: legislator_name 인덱스, ATTENDANCE_STATUSES 컬럼 (정수)
+    """
+    needed = {"의원명", *ATTENDANCE_STATUSES}
+    usecols = (lambda column: column in needed) if only_needed_columns else None
+    df = pd.read_excel(file_path, sheet_name=sheet_name, usecols=usecols, engine=get_excel_engine())
+
+    print(f"상임위 출석 엑셀 데이터 형태: {df.shape}")
+    print(f"컬럼명: {df.columns.tolist()}")
+
+    df = df[_valid_name_mask(df['의원명'])]
+
+    # 없는 상태 컬럼은 0으로 처리
+    status_frame = df.reindex(columns=ATTENDANCE_STATUSES)
+    counts = _to_count_frame(status_frame, file_path)
+    counts.index = df['의원명'].astype(str).str.strip().rename("legislator_name")
+
+    # 의원별 합산 (처음 나온 순서 유지)
+    return counts.groupby(level=0, sort=False).sum()
+
+def parse_plenary_attendance_excel(file_path: str, as_frame: bool = False,
+                                   sheet_name: str = '22대', only_needed_columns: bool = True):
     """
     본회의 출석 현황 엑셀 파일을 파싱
     
     Args:
         file_path: 엑셀 파일 경로
+        as_frame: True이면 레코드 목록 대신 의원별 DataFrame 반환
+        sheet_name: 읽을 시트명
+        only_needed_columns: True이면 필요한 컬럼만 읽음
     
     Returns:
-        List[Dict[str, Any]]: 출석 데이터 리스트
+        List[Dict[str, Any]]: 출석 데이터 리스트 (as_frame이면 pd.DataFrame)
     """
     try:
-        # 엑셀 파일 로드 (시트명: '22대')
-        df = pd.read_excel(file_path, sheet_name='22대', header=None)
+        counts = read_plenary_attendance(file_path, sheet_name, only_needed_columns)
+        if as_frame:
+            return counts
         
-        print(f"본회의 출석 엑셀 데이터 형태: {df.shape}")
-        
-        # 결과 리스트 초기화
-        attendance_data = []
-        
-        # 22대 총계 데이터만 파싱하도록 변경
-        for idx, row in enumerate(df.iloc[4:].iterrows(), 5):
-            row_idx, row_data = row
-            
-            # 의원명 추출
-            legislator_name = row_data[0]
-            
-            # 빈 행 건너뛰기
-            if pd.isna(legislator_name) or not legislator_name:
-                continue
-            
-            # 실제 22대 총계 데이터 위치 (15~20열)
-            total_days = row_data[15] if pd.notna(row_data[15]) else 0  # 회의일수
-            attended = row_data[16] if pd.notna(row_data[16]) else 0    # 출석
-            absent = row_data[17] if pd.notna(row_data[17]) else 0      # 결석
-            leave = row_data[18] if pd.notna(row_data[18]) else 0       # 청가
-            trip = row_data[19] if pd.notna(row_data[19]) else 0        # 출장
-            report = row_data[20] if pd.notna(row_data[20]) else 0      # 결석신고서
-            
-            # 각 상태별로 데이터 생성
-            statuses = [
-                ("회의일수", total_days),
-                ("출석", attended),
-                ("결석", absent),
-                ("청가", leave),
-                ("출장", trip),
-                ("결석신고서", report)
-            ]
-            
-            # 각 출석 상태별로 데이터 생성
-            for status, count in statuses:
-                attendance_data.append({
-                    "legislator_name": str(legislator_name).strip(),
-                    "meeting_type": "본회의",
-                    "status": status,
-                    "count": int(count),
-                    "committee_id": None
-                })
+        attendance_data = attendance_frame_to_records(counts, "본회의", include_committee_id=True)
         
         print(f"본회의 출석 데이터 파싱 완료: {len(attendance_data)}개")
         return attendance_data
@@ -135,74 +225,29 @@ def parse_plenary_attendance_excel(file_path: str) -> List[Dict[str, Any]]:
         print(f"본회의 출석 엑셀 파일 파싱 오류 ({file_path}): {str(e)}")
         import traceback
         traceback.print_exc()
-        return []
+        return pd.DataFrame(columns=ATTENDANCE_STATUSES) if as_frame else []
 
-def parse_standing_committee_attendance_excel(file_path: str) -> List[Dict[str, Any]]:
+def parse_standing_committee_attendance_excel(file_path: str, as_frame: bool = False,
+                                              sheet_name: Union[str, int] = 0,
+                                              only_needed_columns: bool = True):
     """
     상임위 출석 현황 엑셀 파일을 파싱 (단순화된 버전)
     
     Args:
         file_path: 엑셀 파일 경로
+        as_frame: True이면 레코드 목록 대신 의원별 DataFrame 반환
+        sheet_name: 읽을 시트명 또는 순서
+        only_needed_columns: True이면 필요한 컬럼만 읽음
     
     Returns:
-        List[Dict[str, Any]]: 출석 데이터 리스트
+        List[Dict[str, Any]]: 출석 데이터 리스트 (as_frame이면 pd.DataFrame)
     """
     try:
-        # 엑셀 파일 로드
-        df = pd.read_excel(file_path)
+        counts = read_standing_committee_attendance(file_path, sheet_name, only_needed_columns)
+        if as_frame:
+            return counts
         
-        print(f"상임위 출석 엑셀 데이터 형태: {df.shape}")
-        print(f"컬럼명: {df.columns.tolist()}")
-        
-        # 의원별 상태별 카운트를 저장할 딕셔너리
-        legislator_counts = {}
-        
-        # 각 행 처리
-        for _, row in df.iterrows():
-            # 의원명 확인
-            legislator_name = row['의원명']
-            if pd.isna(legislator_name) or not legislator_name:
-                continue
-            
-            # 문자열로 변환 및 공백 제거
-            legislator_name = str(legislator_name).strip()
-            
-            # 의원별 상태별 카운트 초기화
-            if legislator_name not in legislator_counts:
-                legislator_counts[legislator_name] = {
-                    "회의일수": 0,
-                    "출석": 0,
-                    "결석": 0,
-                    "청가": 0,
-                    "출장": 0,
-                    "결석신고서": 0
-                }
-            
-            # 각 상태별 값 추출 및 합산
-            for status in ["회의일수", "출석", "결석", "청가", "출장", "결석신고서"]:
-                if status in row:
-                    value = row[status]
-                    if not pd.isna(value):
-                        try:
-                            # 문자열이나 숫자를 정수로 변환 시도
-                            count = int(value)
-                            legislator_counts[legislator_name][status] += count
-                        except (ValueError, TypeError):
-                            # 변환 불가능한 경우 경고 출력
-                            print(f"경고: '{legislator_name}' 의원의 '{status}' 값 '{value}'를 정수로 변환할 수 없습니다.")
-        
-        # 결과 리스트 생성
-        attendance_data = []
-        
-        # 합산된 의원별 데이터를 결과 형식으로 변환
-        for legislator_name, status_counts in legislator_counts.items():
-            for status, count in status_counts.items():
-                attendance_data.append({
-                    "legislator_name": legislator_name,
-                    "meeting_type": "상임위",
-                    "status": status,
-                    "count": count
-                })
+        attendance_data = attendance_frame_to_records(counts, "상임위")
         
         print(f"상임위 출석 데이터 파싱 완료: {len(attendance_data)}개")
         return attendance_data
@@ -211,8 +256,7 @@ def parse_standing_committee_attendance_excel(file_path: str) -> List[Dict[str,
         print(f"상임위 출석 엑셀 파일 파싱 오류 ({file_path}): {str(e)}")
         import traceback
         traceback.print_exc()
-        return []
-    
+        return pd.DataFrame(columns=ATTENDANCE_STATUSES) if as_frame else []
 
 def parse_speech_keywords_excel(file_path: str) -> List[Dict[str, Any]]:
     """
@@ -375,109 +419,163 @@ def parse_speech_by_meeting_excel(file_path: str) -> List[Dict[str, Any]]:
         return []
     
 
-def parse_asset_excel(file_path: str, db: Session) -> int:
+# 재산 엑셀 컬럼 -> AssetDetailed 필드 (문자열 컬럼)
+ASSET_TEXT_COLUMNS = {
+    "monaCode": "mona_code",
+    "구분": "role_group",
+    "소속": "affiliation",
+    "직위": "position",
+    "이름": "name",
+    "재산구분": "asset_category",
+    "본인과의 관계": "relation_to_self",
+    "재산의종류": "asset_type",
+    "변동사유": "reason_for_change",
+}
+
+# 재산 엑셀 컬럼 -> AssetDetailed 필드 (천원 단위 금액, 컬럼이 없을 때 기본값)
+# 파일에 따라 '감소액' 또는 '감 소액'으로 컬럼명이 다를 수 있음
+ASSET_AMOUNT_COLUMNS = [
+    (["종전가액"], "asset_previous", 0),
+    (["증가액"], "asset_increase", 0),
+    (["증가액실거래가격"], "asset_increase_real", None),
+    (["감소액", "감 소액"], "asset_decrease", 0),
+    (["감소액실거래가격"], "asset_decrease_real", None),
+    (["현재가액"], "asset_current", 0),
+]
+
+def _to_amount_series(values: pd.Series) -> pd.Series:
+    """
+    금액 컬럼을 일괄로 정수 변환 (쉼표 제거, 빈 값/변환 실패는 None)
+    """
+    text = values.astype(str).str.replace(",", "", regex=False).str.strip()
+    numbers = pd.to_numeric(text.where(values.notna()), errors="coerce")
+    failed = numbers.isna() & values.notna() & (text != "")
+    if failed.any():
+        print(f"숫자 변환 실패 {int(failed.sum())}개: {values[failed].head(5).tolist()} (None 사용)")
+    # int(float(value))와 같이 소수점 이하는 버림 (float64로 되돌아가지 않도록 object Series로 생성)
+    return pd.Series([None if pd.isna(value) else int(value) for value in numbers],
+                     index=values.index, dtype=object)
+
+def _to_text_series(values: pd.Series) -> pd.Series:
+    return values.astype(object).where(values.notna(), None)
+
+def read_asset_excel(file_path: str) -> pd.DataFrame:
+    """
+    재산 엑셀 파일을 읽어 AssetDetailed 필드명을 컬럼으로 하는 DataFrame으로 일괄 변환
+
+    Args:
+        file_path: 엑셀 파일 경로
+
+    Returns:
+        pd.DataFrame: AssetDetailed 필드 컬럼 (id 제외), 'NO'가 없는 행은 제외
+    """
+    df = pd.read_excel(file_path, engine=get_excel_engine())
+
+    print(f"엑셀 파일 형태: {df.shape}")
+    print(f"컬럼명: {df.columns.tolist()}")
+
+    # 'NO'가 없는 행 건너뛰기 (헤더 또는 빈 행)
+    if 'NO' not in df.columns:
+        print("'NO' 컬럼이 없습니다.")
+        return pd.DataFrame()
+
+    row_no = pd.to_numeric(df['NO'], errors="coerce")
+    df = df[row_no.notna()]
+    row_no = row_no[row_no.notna()]
+
+    # 연월 정보 설정 (파일에서 직접 가져옴)
+    year_month = ""
+    if '연월' in df.columns and len(df) and not pd.isna(df['연월'].iloc[0]):
+        year_month = str(df['연월'].iloc[0])
+
+    result = pd.DataFrame(index=df.index)
+    result["report_year_month"] = year_month
+    result["row_no"] = row_no.astype(int)
+
+    for column, field in ASSET_TEXT_COLUMNS.items():
+        result[field] = _to_text_series(df[column]) if column in df.columns else ""
+
+    # 소재지 데이터 처리 - '소재지 면적 등 권리의 명세' 컬럼에서 추출
+    if '소재지 면적 등 권리의 명세' in df.columns:
+        location = df['소재지 면적 등 권리의 명세']
+        result["location"] = location.astype(str).str.strip().where(location.notna(), "")
+    else:
+        result["location"] = ""
+    result["area_sqm"] = ""  # 통합 컬럼을 사용하므로 빈 문자열
+    result["rights_detail"] = ""  # 통합 컬럼을 사용하므로 빈 문자열
+
+    for columns, field, default in ASSET_AMOUNT_COLUMNS:
+        column = next((c for c in columns if c in df.columns), None)
+        result[field] = _to_amount_series(df[column]) if column else default
+
+    return result.reset_index(drop=True)
+
+def load_asset_records(db: Session, records: List[Dict[str, Any]], chunk_size: Optional[int] = None) -> Dict[str, int]:
+    """
+    재산 상세 레코드를 청크 단위로 일괄 저장
+    파일에 들어 있는 연월의 기존 행은 먼저 삭제하므로 같은 파일(또는 행 수가 달라진 재공개 파일)을 다시 넣어도
+    중복/잔여 행이 남지 않음 (다른 연월의 데이터는 유지)
+
+    Args:
+        db: 데이터베이스 세션
+        records: AssetDetailed 필드명을 키로 하는 레코드 목록
+        chunk_size: 한 번에 저장/커밋할 행 수 (기본값: settings.ASSET_BATCH_SIZE)
+
+    Returns:
+        Dict[str, int]: {"inserted": 추가 수, "deleted": 삭제한 기존 행 수}
+    """
+    from sqlalchemy import delete
+    from app.config import settings
+
+    chunk_size = chunk_size or settings.ASSET_BATCH_SIZE
+    stats = {"inserted": 0, "deleted": 0}
+    if not records:
+        return stats
+
+    # 대상 연월의 기존 행 삭제 (첫 번째 청크와 같은 트랜잭션으로 커밋)
+    year_months = {record["report_year_month"] for record in records}
+    result = db.execute(delete(AssetDetailed).where(AssetDetailed.report_year_month.in_(year_months)))
+    stats["deleted"] = result.rowcount or 0
+
+    for start in range(0, len(records), chunk_size):
+        chunk = records[start:start + chunk_size]
+        db.bulk_insert_mappings(AssetDetailed, chunk)
+        db.commit()
+
+        stats["inserted"] += len(chunk)
+        print(f"{start + len(chunk)}/{len(records)}개 처리 완료...")
+
+    return stats
+
+def parse_asset_excel(file_path: str, db: Session, chunk_size: Optional[int] = None) -> int:
     """
     재산 엑셀 파일을 파싱하여 AssetDetailed 모델로 DB에 저장
     
     Args:
         file_path: 엑셀 파일 경로
         db: 데이터베이스 세션
+        chunk_size: 한 번에 저장/커밋할 행 수 (기본값: settings.ASSET_BATCH_SIZE)
     
     Returns:
         int: 처리된 레코드 수
     """
+    import time
+
     try:
-        # 엑셀 파일 읽기
-        df = pd.read_excel(file_path)
-        
-        print(f"엑셀 파일 형태: {df.shape}")
-        print(f"컬럼명: {df.columns.tolist()}")
-        
-        # 컬럼명 출력 (디버깅용)
-        for i, col in enumerate(df.columns):
-            print(f"{i}: {col}")
-        
-        # 샘플 데이터 출력 (디버깅용)
-        print("\n첫 번째 행의 데이터:")
-        first_row = df.iloc[0]
-        for col in df.columns:
-            print(f"{col}: {first_row.get(col, 'N/A')}")
-        
-        # 연월 정보 설정 (파일에서 직접 가져옴)
-        year_month = ""
-        if '연월' in df.columns and not pd.isna(df['연월'].iloc[0]):
-            year_month = str(df['연월'].iloc[0])
-        
-        # 처리된 레코드 수
-        processed_count = 0
-        
-        # 각 행 처리
-        for idx, row in df.iterrows():
-            try:
-                # 'NO'가 없는 행 건너뛰기 (헤더 또는 빈 행)
-                if 'NO' not in row or pd.isna(row['NO']):
-                    continue
-                
-                # 숫자 컬럼 안전하게 변환
-                asset_previous = _safe_int_conversion(row.get('종전가액', 0))
-                asset_increase = _safe_int_conversion(row.get('증가액', 0))
-                asset_increase_real = _safe_int_conversion(row.get('증가액실거래가격', None))
-                
-                # 파일에 따라 '감소액' 또는 '감 소액'으로 컬럼명이 다를 수 있음
-                decrease_col = '감소액' if '감소액' in df.columns else '감 소액'
-                asset_decrease = _safe_int_conversion(row.get(decrease_col, 0))
-                
-                asset_decrease_real = _safe_int_conversion(row.get('감소액실거래가격', None))
-                asset_current = _safe_int_conversion(row.get('현재가액', 0))
-                
-                # 소재지 데이터 처리 - '소재지 면적 등 권리의 명세' 컬럼에서 추출
-                location = ""
-                if '소재지 면적 등 권리의 명세' in df.columns:
-                    location_val = row.get('소재지 면적 등 권리의 명세')
-                    if pd.notna(location_val):
-                        location = str(location_val).strip()
-                        # 디버깅용 출력
-                        print(f"행 {idx}: 소재지 면적 등 권리의 명세 = '{location}'")
-                
-                # AssetDetailed 모델에 매핑
-                asset_detail = AssetDetailed(
-                    report_year_month=year_month,
-                    row_no=int(row['NO']),
-                    mona_code=row.get('monaCode', ''),
-                    role_group=row.get('구분', ''),
-                    affiliation=row.get('소속', ''),
-                    position=row.get('직위', ''),
-                    name=row.get('이름', ''),
-                    asset_category=row.get('재산구분', ''),
-                    relation_to_self=row.get('본인과의 관계', ''),
-                    asset_type=row.get('재산의종류', ''),
-                    location=location,  # '소재지 면적 등 권리의 명세' 컬럼 값 사용
-                    area_sqm="",  # 통합 컬럼을 사용하므로 빈 문자열
-                    rights_detail="",  # 통합 컬럼을 사용하므로 빈 문자열
-                    asset_previous=asset_previous,
-                    asset_increase=asset_increase,
-                    asset_increase_real=asset_increase_real,
-                    asset_decrease=asset_decrease,
-                    asset_decrease_real=asset_decrease_real,
-                    asset_current=asset_current,
-                    reason_for_change=row.get('변동사유', '')
-                )
-                
-                db.add(asset_detail)
-                processed_count += 1
-                
-                # 20개마다 커밋 및 로그 출력
-                if processed_count % 20 == 0:
-                    db.commit()
-                    print(f"{processed_count}개 처리 완료...")
-                
-            except Exception as e:
-                print(f"행 {idx} 처리 중 오류 발생: {str(e)}")
-                continue
-        
-        # 마지막 커밋
-        db.commit()
-        print(f"재산 상세 데이터 처리 완료: {processed_count}개")
+        start_time = time.time()
+
+        # 엑셀 파일 읽기 및 일괄 변환
+        df = read_asset_excel(file_path)
+        records = df.to_dict("records")
+        parsed_time = time.time()
+
+        stats = load_asset_records(db, records, chunk_size)
+        elapsed = time.time() - start_time
+        processed_count = stats["inserted"]
+
+        rows_per_second = processed_count / elapsed if elapsed > 0 else 0
+        print(f"재산 상세 데이터 처리 완료: {processed_count}개 (기존 {stats['deleted']}개 교체), "
+              f"파싱 {parsed_time - start_time:.2f}초, 저장 {time.time() - parsed_time:.2f}초, 초당 {rows_per_second:.0f}행")
         
         return processed_count
         
@@ -488,16 +586,90 @@ def parse_asset_excel(file_path: str, db: Session) -> int:
         traceback.print_exc()
         return 0
 
-def _safe_int_conversion(value, default=None):
-    """천원 단위 금액을 안전하게 정수로 변환"""
-    if pd.isna(value) or value == '':
-        return default
-    
+
+def parse_asset_records(file_path: str) -> List[Dict[str, Any]]:
+    """
+    재산 엑셀 파일을 DB에 저장하지 않고 AssetDetailed 레코드 목록으로만 파싱 (저장은 load_asset_records)
+
+    Args:
+        file_path: 엑셀 파일 경로
+
+    Returns:
+        List[Dict[str, Any]]: AssetDetailed 필드명을 키로 하는 레코드 목록
+    """
     try:
-        # 쉼표 제거 후 정수 변환
-        if isinstance(value, str):
-            value = value.replace(',', '')
-        return int(float(value))
-    except (ValueError, TypeError):
-        print(f"숫자 변환 실패: {value}, 기본값 {default} 사용")
-        return default
\ No newline at end of file
+        records = read_asset_excel(file_path).to_dict("records")
+        print(f"재산 상세 데이터 파싱 완료: {len(records)}개")
+        return records
+    except Exception as e:
+        print(f"재산 엑셀 파일 파싱 오류: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return []
+
+# 엑셀 종류별 파싱 함수 (프로세스 풀에서 이름으로 찾아 호출)
+EXCEL_PARSERS = {
+    "speech_by_meeting": parse_speech_by_meeting_excel,
+    "keywords": parse_speech_keywords_excel,
+    "attendance": parse_attendance_excel,
+    "asset": parse_asset_records,
+}
+
+def _parse_excel_job(kind: str, file_path: str) -> List[Dict[str, Any]]:
+    from app.utils.excel_cache import cached_parse
+    return cached_parse(kind, file_path, EXCEL_PARSERS[kind])
+
+def parse_excel_files(jobs: List[Tuple[str, str]], max_workers: Optional[int] = None) -> Iterator[Tuple[str, str, List[Dict[str, Any]]]]:
+    """
+    여러 엑셀 파일을 프로세스 풀에서 병렬로 파싱 (openpyxl 파싱은 CPU를 많이 사용하므로 스레드 대신 프로세스 사용)
+
+    원본이 바뀌지 않은 파일은 엑셀 캐시(excel_cache)의 파싱 결과를 그대로 사용하고 나머지만 파싱함
+    모든 파일을 한 번에 제출하고 결과는 제출한 순서대로 반환하므로,
+    호출한 쪽에서 앞 파일을 DB에 저장하는 동안 뒤 파일은 계속 파싱됨
+
+    Args:
+        jobs: (종류, 파일 경로) 목록 - 종류는 EXCEL_PARSERS의 키
+        max_workers: 프로세스 수 (기본값: settings.EXCEL_PARSE_WORKERS, 0이면 CPU 코어 수, 1이면 현재 프로세스에서 순차 파싱)
+
+    Returns:
+        (종류, 파일 경로, 레코드 목록)을 하나씩 반환하는 이터레이터 (파싱 실패 시 빈 목록)
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    from app.config import settings
+    from app.utils.excel_cache import load_cached_records
+
+    # 캐시 확인은 현재 프로세스에서 (적중한 파일은 프로세스 풀에 보내지 않음)
+    cached = {}
+    for index, (kind, file_path) in enumerate(jobs):
+        records = load_cached_records(kind, file_path)
+        if records is not None:
+            cached[index] = records
+    pending = [(index, kind, file_path) for index, (kind, file_path) in enumerate(jobs) if index not in cached]
+    if settings.EXCEL_CACHE_ENABLED:
+        print(f"엑셀 캐시: {len(cached)}개 파일 재사용, {len(pending)}개 파일 파싱")
+
+    if max_workers is None:
+        max_workers = settings.EXCEL_PARSE_WORKERS
+    max_workers = min(max_workers or os.cpu_count() or 1, len(pending))
+
+    if max_workers <= 1:
+        for index, (kind, file_path) in enumerate(jobs):
+            records = cached[index] if index in cached else _parse_excel_job(kind, file_path)
+            yield kind, file_path, records
+        return
+
+    print(f"엑셀 파일 {len(pending)}개를 {max_workers}개 프로세스로 파싱합니다.")
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {index: executor.submit(_parse_excel_job, kind, file_path) for index, kind, file_path in pending}
+
+        for index, (kind, file_path) in enumerate(jobs):
+            if index in cached:
+                yield kind, file_path, cached[index]
+                continue
+
+            try:
+                records = futures[index].result()
+            except Exception as e:
+                print(f"엑셀 파일 파싱 오류 ({file_path}): {str(e)}")
+                records = []
+            yield kind, file_path, records
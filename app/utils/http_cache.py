@@ -0,0 +1,296 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+import requests
+from typing import Callable, Dict, Optional, Any
+
+from app.config import settings
+from app.utils.http_client import get_session
+
+# 캐시 키에서 제외할 요청 인자 (API 키는 응답 내용과 무관하고 디스크에 남기지 않음)
+_IGNORED_PARAMS = {"Key"}
+
+class CachedResponse:
+    """
+    캐시에 저장된 응답 (requests.Response에서 사용하는 속성만 제공)
+    """
+
+    def __init__(self, url: str, status_code: int, content: bytes,
+                 headers: Dict[str, str], encoding: Optional[str], from_cache: bool):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers
+        self.encoding = encoding
+        self.from_cache = from_cache
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding or "utf-8", errors="replace")
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"{self.status_code} Error: {self.url}")
+
+class HttpCache:
+    """
+    URL과 요청 인자를 키로 하는 디스크(SQLite) HTTP 응답 캐시
+
+    - 분류(category)별 TTL: 만료 전에는 네트워크 요청 없이 캐시 반환
+    - 만료 후에는 ETag/Last-Modified로 조건부 요청하여 304이면 캐시 재사용
+    - 전체 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은 응답부터 삭제
+    - 오프라인 모드: 만료 여부와 관계없이 캐시만 사용하고 네트워크 요청 안 함
+    """
+
+    def __init__(self, path: str, ttls: Dict[str, int], max_bytes: int, offline: bool = False):
+        """
+        Args:
+            path: 캐시 DB 파일 경로
+            ttls: 분류별 유효 시간(초) ("default" 키는 기본값, 0이면 항상 재검증)
+            max_bytes: 캐시 최대 크기(바이트)
+            offline: 오프라인 재생 모드 여부
+        """
+        self.path = path
+        self.ttls = ttls
+        self.max_bytes = max_bytes
+        self.offline = offline
+        self.lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "revalidated": 0, "stored": 0, "evicted": 0, "offline_misses": 0}
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # 여러 스레드에서 공유하므로 lock으로 직렬화
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                category TEXT,
+                url TEXT,
+                status_code INTEGER,
+                headers TEXT,
+                encoding TEXT,
+                body BLOB,
+                etag TEXT,
+                last_modified TEXT,
+                size INTEGER,
+                fetched_at REAL,
+                accessed_at REAL
+            )
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS ix_responses_accessed_at ON responses (accessed_at)")
+        self.conn.commit()
+
+        self.total_bytes = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    @staticmethod
+    def make_key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """
+        URL과 요청 인자로 캐시 키 생성 (인자 순서와 무관)
+        """
+        items = sorted((str(k), str(v)) for k, v in (params or {}).items()
+                       if k not in _IGNORED_PARAMS and v is not None)
+        raw = url + "?" + json.dumps(items, ensure_ascii=False)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get_ttl(self, category: str) -> int:
+        return self.ttls.get(category, self.ttls.get("default", 0))
+
+    def get(self, url: str, params: Optional[Dict[str, Any]] = None,
+            category: str = "default", timeout: Optional[float] = None,
+            cacheable: Optional[Callable[[bytes], bool]] = None,
+            before_request: Optional[Callable[[], None]] = None) -> CachedResponse:
+        """
+        캐시를 거쳐 GET 요청
+
+        Args:
+            url: 요청 URL
+            params: 요청 인자
+            category: TTL 분류 (API 엔드포인트 키, "co_proposers", "nanet_speech" 등)
+            timeout: 요청 타임아웃(초)
+            cacheable: 응답 본문을 저장해도 되는지 판단하는 함수 (오류 응답을 저장하지 않기 위함, 선택)
+            before_request: 네트워크 요청 직전에 호출할 함수 (속도 제한 등, 캐시 적중 시에는 호출 안 함)
+
+        Returns:
+            CachedResponse: 응답 (from_cache로 캐시 사용 여부 확인)
+        """
+        key = self.make_key(url, params)
+        now = time.time()
+
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT status_code, headers, encoding, body, etag, last_modified, fetched_at "
+                "FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+        if row:
+            status_code, headers, encoding, body, etag, last_modified, fetched_at = row
+            cached = CachedResponse(url, status_code, body, json.loads(headers), encoding, True)
+
+            # 유효 기간 내이거나 오프라인 모드이면 그대로 사용
+            if self.offline or now - fetched_at < self.get_ttl(category):
+                self._touch(key, now)
+                self._count("hits")
+                return cached
+        else:
+            cached = None
+            etag = last_modified = None
+
+        if self.offline:
+            self._count("offline_misses")
+            raise requests.exceptions.ConnectionError(f"오프라인 모드: 캐시에 없는 요청입니다 ({url})")
+
+        # 만료된 캐시가 있으면 조건부 요청
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+        if before_request is not None:
+            before_request()
+
+        response = get_session().get(url, params=params, headers=headers or None,
+                                     timeout=timeout or settings.HTTP_TIMEOUT)
+
+        if response.status_code == 304 and cached is not None:
+            with self.lock:
+                self.conn.execute(
+                    "UPDATE responses SET fetched_at = ?, accessed_at = ? WHERE key = ?", (now, now, key)
+                )
+                self.conn.commit()
+            self._count("revalidated")
+            return cached
+
+        self._count("misses")
+        result = CachedResponse(url, response.status_code, response.content,
+                                dict(response.headers), response.encoding, False)
+
+        # 정상 응답만 저장
+        if response.status_code == 200 and (cacheable is None or cacheable(result.content)):
+            self._store(key, category, url, result, now)
+
+        return result
+
+    def _store(self, key: str, category: str, url: str, response: CachedResponse, now: float) -> None:
+        """
+        응답 저장 후 최대 크기를 넘으면 오래 사용하지 않은 응답부터 삭제
+        """
+        size = len(response.content)
+        if size > self.max_bytes:
+            return
+
+        with self.lock:
+            old = self.conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            self.conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, category, url, status_code, headers, encoding, body, etag, last_modified, size, fetched_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, category, url, response.status_code, json.dumps(response.headers), response.encoding,
+                 response.content, response.headers.get("ETag"), response.headers.get("Last-Modified"),
+                 size, now, now)
+            )
+            self.total_bytes += size - (old[0] if old else 0)
+            self.stats["stored"] += 1
+
+            if self.total_bytes > self.max_bytes:
+                # 최대 크기의 90%까지 줄여서 저장할 때마다 삭제가 반복되지 않도록 함
+                target = self.max_bytes * 0.9
+                evict_keys = []
+                for evict_key, evict_size in self.conn.execute(
+                    "SELECT key, size FROM responses WHERE key != ? ORDER BY accessed_at", (key,)
+                ):
+                    if self.total_bytes <= target:
+                        break
+                    evict_keys.append((evict_key,))
+                    self.total_bytes -= evict_size
+
+                self.conn.executemany("DELETE FROM responses WHERE key = ?", evict_keys)
+                self.stats["evicted"] += len(evict_keys)
+
+            self.conn.commit()
+
+    def _touch(self, key: str, now: float) -> None:
+        with self.lock:
+            self.conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            self.conn.commit()
+
+    def _count(self, name: str) -> None:
+        with self.lock:
+            self.stats[name] += 1
+
+    def clear(self) -> None:
+        """
+        캐시 전체 삭제
+        """
+        with self.lock:
+            self.conn.execute("DELETE FROM responses")
+            self.conn.commit()
+            self.total_bytes = 0
+
+    def summary(self) -> str:
+        """
+        적중률 등 통계 문자열 (로그 출력용)
+        """
+        stats = dict(self.stats)
+        requests_count = stats["hits"] + stats["revalidated"] + stats["misses"]
+        hit_rate = (stats["hits"] + stats["revalidated"]) / requests_count * 100 if requests_count else 0
+        return (f"HTTP 캐시: 적중 {stats['hits']}건, 재검증(304) {stats['revalidated']}건, "
+                f"다운로드 {stats['misses']}건 (적중률 {hit_rate:.1f}%), "
+                f"저장 {stats['stored']}건, 삭제 {stats['evicted']}건, "
+                f"오프라인 누락 {stats['offline_misses']}건, 크기 {self.total_bytes / 1024 / 1024:.1f}MB")
+
+# 프로세스 전역에서 공유하는 캐시
+_cache: HttpCache = None
+_cache_lock = threading.Lock()
+
+def get_cache() -> Optional[HttpCache]:
+    """
+    공유 HTTP 캐시 반환 (HTTP_CACHE_ENABLED가 False이면 None)
+    """
+    global _cache
+
+    if not settings.HTTP_CACHE_ENABLED:
+        return None
+
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = HttpCache(
+                    settings.HTTP_CACHE_PATH,
+                    settings.HTTP_CACHE_TTL,
+                    int(settings.HTTP_CACHE_MAX_MB * 1024 * 1024),
+                    offline=settings.HTTP_CACHE_OFFLINE
+                )
+
+    return _cache
+
+def cached_get(url: str, params: Optional[Dict[str, Any]] = None,
+               category: str = "default", timeout: Optional[float] = None,
+               cacheable: Optional[Callable[[bytes], bool]] = None,
+               before_request: Optional[Callable[[], None]] = None):
+    """
+    캐시를 거쳐 GET 요청 (캐시를 사용하지 않으면 공유 세션으로 바로 요청)
+
+    Args:
+        url: 요청 URL
+        params: 요청 인자
+        category: TTL 분류
+        timeout: 요청 타임아웃(초)
+        cacheable: 응답 본문을 저장해도 되는지 판단하는 함수 (선택)
+        before_request: 네트워크 요청 직전에 호출할 함수 (선택)
+
+    Returns:
+        CachedResponse 또는 requests.Response
+    """
+    cache = get_cache()
+    if cache is None:
+        if before_request is not None:
+            before_request()
+        return get_session().get(url, params=params, timeout=timeout or settings.HTTP_TIMEOUT)
+    return cache.get(url, params=params, category=category, timeout=timeout,
+                     cacheable=cacheable, before_request=before_request)
@@ -0,0 +1,35 @@
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+
+from app.config import settings
+
+# 프로세스 전역에서 공유하는 세션 (keep-alive 커넥션 재사용)
+_session: requests.Session = None
+_session_lock = threading.Lock()
+
+def get_session() -> requests.Session:
+    """
+    공유 HTTP 세션 반환 - 최초 호출 시 커넥션 풀 크기를 설정하여 생성
+
+    Returns:
+        requests.Session: 커넥션 풀이 설정된 세션
+    """
+    global _session
+
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+
+                # 병렬 요청 수보다 풀이 작으면 커넥션이 버려지므로 가장 큰 값 사용
+                pool_size = max(settings.HTTP_POOL_SIZE, settings.API_MAX_WORKERS,
+                                settings.VOTE_FETCH_WORKERS, settings.CO_PROPOSER_FETCH_WORKERS,
+                                settings.SPEECH_CRAWL_WORKERS)
+                adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+
+                _session = session
+
+    return _session
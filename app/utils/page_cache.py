@@ -0,0 +1,247 @@
+import re
+import hashlib
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode
+
+from fastapi import Request
+from starlette.responses import Response
+
+from app.config import settings
+
+# 캐시하는 화면 경로 (DB 상태와 요청 인자만으로 결과가 정해지는 화면)
+CACHEABLE_PATHS = [
+    re.compile(r"^/$"),
+    re.compile(r"^/ranking(/[^/]+)?$"),
+    re.compile(r"^/misc-ranking(/.*)?$"),
+    re.compile(r"^/champions/\d+$"),
+]
+
+class CachedPage:
+    """
+    캐시에 저장된 렌더링 결과
+    """
+    __slots__ = ("body", "status_code", "headers", "etag", "last_modified")
+
+    def __init__(self, body: bytes, status_code: int, headers: Dict[str, str], etag: str, last_modified: str):
+        self.body = body
+        self.status_code = status_code
+        self.headers = headers
+        self.etag = etag
+        self.last_modified = last_modified
+
+class PageCache:
+    """
+    경로 + 정규화한 요청 인자 + 전체 데이터 버전을 키로 하는 메모리 화면 캐시
+
+    - 데이터 버전(수집/점수 계산 시 증가)이 바뀌면 이전 버전의 화면은 모두 삭제
+    - 전체 크기가 max_bytes를 넘거나 개수가 max_entries를 넘으면 가장 오래 사용하지 않은 화면부터 삭제
+    - 응답에 ETag/Last-Modified를 붙이고 조건부 요청이 일치하면 304 반환
+    """
+
+    def __init__(self, max_bytes: int, max_entries: int):
+        """
+        Args:
+            max_bytes: 캐시 최대 크기(바이트)
+            max_entries: 최대 화면 수
+        """
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.entries: "OrderedDict[str, CachedPage]" = OrderedDict()
+        self.total_bytes = 0
+        self.version = None
+        self.lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "not_modified": 0, "stored": 0, "evicted": 0}
+
+    @staticmethod
+    def make_key(path: str, query: str, version: str) -> str:
+        # 요청 인자 순서만 다른 요청은 같은 키 (빈 값도 화면이 달라질 수 있으므로 유지)
+        normalized = urlencode(sorted(parse_qsl(query, keep_blank_values=True)))
+        return f"{version}|{path}?{normalized}"
+
+    def get(self, key: str, version: str) -> Optional[CachedPage]:
+        with self.lock:
+            if version != self.version:
+                # 데이터 버전이 바뀌면 이전 버전 화면은 다시 쓰지 않으므로 모두 삭제
+                self.stats["evicted"] += len(self.entries)
+                self.entries.clear()
+                self.total_bytes = 0
+                self.version = version
+
+            page = self.entries.get(key)
+            if page is None:
+                self.stats["misses"] += 1
+                return None
+
+            self.entries.move_to_end(key)
+            self.stats["hits"] += 1
+            return page
+
+    def put(self, key: str, version: str, page: CachedPage) -> None:
+        """
+        화면 저장 후 최대 크기/개수를 넘으면 오래 사용하지 않은 화면부터 삭제
+        """
+        size = len(page.body)
+        if size > self.max_bytes:
+            return
+
+        with self.lock:
+            # 렌더링하는 동안 데이터 버전이 바뀌었으면 저장하지 않음
+            if version != self.version:
+                return
+
+            old = self.entries.pop(key, None)
+            if old is not None:
+                self.total_bytes -= len(old.body)
+            self.entries[key] = page
+            self.total_bytes += size
+            self.stats["stored"] += 1
+
+            while self.entries and (self.total_bytes > self.max_bytes or len(self.entries) > self.max_entries):
+                _, evicted = self.entries.popitem(last=False)
+                self.total_bytes -= len(evicted.body)
+                self.stats["evicted"] += 1
+
+    def count_not_modified(self) -> None:
+        with self.lock:
+            self.stats["not_modified"] += 1
+
+    def clear(self) -> None:
+        """
+        캐시 전체 삭제
+        """
+        with self.lock:
+            self.entries.clear()
+            self.total_bytes = 0
+
+    def summary(self) -> str:
+        """
+        적중률 등 통계 문자열 (로그 출력용)
+        """
+        stats = dict(self.stats)
+        requests_count = stats["hits"] + stats["misses"]
+        hit_rate = stats["hits"] / requests_count * 100 if requests_count else 0
+        return (f"화면 캐시: 적중 {stats['hits']}건, 렌더링 {stats['misses']}건 (적중률 {hit_rate:.1f}%), "
+                f"304 응답 {stats['not_modified']}건, 저장 {stats['stored']}건, 삭제 {stats['evicted']}건, "
+                f"{len(self.entries)}개 {self.total_bytes / 1024 / 1024:.1f}MB")
+
+# 프로세스 전역에서 공유하는 캐시
+_cache: PageCache = None
+_cache_lock = threading.Lock()
+
+def get_page_cache() -> Optional[PageCache]:
+    """
+    공유 화면 캐시 반환 (PAGE_CACHE_ENABLED가 False이면 None)
+    """
+    global _cache
+
+    if not settings.PAGE_CACHE_ENABLED:
+        return None
+
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = PageCache(int(settings.PAGE_CACHE_MAX_MB * 1024 * 1024), settings.PAGE_CACHE_MAX_ENTRIES)
+
+    return _cache
+
+def is_cacheable_path(path: str) -> bool:
+    return any(pattern.match(path) for pattern in CACHEABLE_PATHS)
+
+# 버전 변경 기록이 없는 DB의 Last-Modified 기준
+_started_at = datetime.now()
+
+def _current_data_version() -> Tuple[str, str]:
+    # 전체 데이터 버전과 Last-Modified 값 (버전 변경 기록이 없으면 서버 시작 시각)
+    from app.db.database import SessionLocal
+    from app.services.data_version_service import get_data_version_state
+
+    db = SessionLocal()
+    try:
+        version, updated_at = get_data_version_state(db)
+    finally:
+        db.close()
+
+    # DB에는 로컬 시각으로 저장되어 있으므로 UTC로 변환하여 HTTP 날짜 형식으로 표시
+    return version, format_datetime((updated_at or _started_at).astimezone(timezone.utc), usegmt=True)
+
+def _weak_etag(tag: str) -> str:
+    # W/ 접두사 제거 (압축 프록시 등이 약한 ETag로 바꾼 경우도 같은 화면으로 비교)
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+def _not_modified(request: Request, page: CachedPage) -> bool:
+    # If-None-Match가 있으면 ETag로만 비교(약한 비교)하고, 없으면 If-Modified-Since로 비교
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        if if_none_match.strip() == "*":
+            return True
+        return _weak_etag(page.etag) in [_weak_etag(tag) for tag in if_none_match.split(",")]
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            return parsedate_to_datetime(if_modified_since) >= parsedate_to_datetime(page.last_modified)
+        except (TypeError, ValueError):
+            return False
+    return False
+
+def _page_response(request: Request, page: CachedPage, cache: PageCache, cache_status: str) -> Response:
+    headers = {
+        "ETag": page.etag,
+        "Last-Modified": page.last_modified,
+        "Cache-Control": "no-cache",  # 브라우저는 저장하되 매번 재검증 (데이터가 바뀌면 바로 반영)
+        "X-Page-Cache": cache_status,
+    }
+    if _not_modified(request, page):
+        cache.count_not_modified()
+        return Response(status_code=304, headers=headers)
+
+    headers.update(page.headers)
+    return Response(content=page.body, status_code=page.status_code, headers=headers)
+
+async def page_cache_middleware(request: Request, call_next):
+    """
+    렌더링한 HTML 화면을 메모리에 캐시하는 미들웨어 (GET 요청, CACHEABLE_PATHS만)
+
+    Args:
+        request: 요청
+        call_next: 다음 처리 단계 (라우터)
+
+    Returns:
+        캐시된 화면, 304 응답, 또는 새로 렌더링한 화면
+    """
+    cache = get_page_cache()
+    if cache is None or request.method != "GET" or not is_cacheable_path(request.url.path):
+        return await call_next(request)
+
+    try:
+        version, last_modified = _current_data_version()
+    except Exception as e:
+        # 버전을 알 수 없으면 캐시하지 않고 그대로 처리
+        print(f"화면 캐시 데이터 버전 조회 오류: {str(e)}")
+        return await call_next(request)
+
+    key = cache.make_key(request.url.path, request.url.query, version)
+    page = cache.get(key, version)
+    if page is not None:
+        return _page_response(request, page, cache, "HIT")
+
+    response = await call_next(request)
+
+    # 정상적으로 렌더링한 HTML만 저장 (리다이렉트, 오류, JSON 응답은 그대로 반환)
+    content_type = response.headers.get("content-type", "")
+    if response.status_code != 200 or not content_type.startswith("text/html"):
+        return response
+
+    body = b"".join([chunk async for chunk in response.body_iterator])
+    headers = {name: value for name, value in response.headers.items()
+               if name.lower() not in ("content-length", "etag", "last-modified", "cache-control")}
+    etag = f'"{hashlib.sha1(body).hexdigest()[:20]}"'
+    page = CachedPage(body, response.status_code, headers, etag, last_modified)
+    cache.put(key, version, page)
+
+    return _page_response(request, page, cache, "MISS")
@@ -0,0 +1,42 @@
+import threading
+import time
+
+class RateLimiter:
+    """
+    토큰 버킷 방식의 요청 속도 제한기 (여러 스레드에서 공유 가능)
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Args:
+            rate: 초당 허용 요청 수 (0 이하이면 제한 없음)
+            burst: 한 번에 몰아서 보낼 수 있는 최대 요청 수
+        """
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """
+        토큰 하나를 사용할 수 있을 때까지 대기
+        """
+        if not self.rate or self.rate <= 0:
+            return
+
+        while True:
+            with self.lock:
+                # 지난 시간만큼 토큰 충전
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                # 다음 토큰이 생길 때까지 남은 시간
+                wait = (1 - self.tokens) / self.rate
+
+            time.sleep(wait)
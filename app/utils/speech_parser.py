@@ -1,6 +1,9 @@
 import requests
 from bs4 import BeautifulSoup
 import urllib.parse
+from typing import Callable, Optional
+
+from app.utils.http_cache import cached_get
 
 # 먼저 모든 모델을 명시적으로 임포트하여 순환 참조 문제 해결
 from app.models.legislator import Legislator
@@ -11,12 +14,15 @@ from app.models.attendance import Attendance
 from app.models.bill import Bill, BillCoProposer
 from app.models.vote import Vote, VoteResult
 
-def parse_speech_count_from_nanet(legislator_name: str) -> int:
+def parse_speech_count_from_nanet(legislator_name: str, raise_on_error: bool = False,
+                                  before_request: Optional[Callable[[], None]] = None) -> int:
     """
     국회회의록 빅데이터 사이트에서 의원의 발언 횟수를 파싱하는 함수
     
     Args:
         legislator_name: 국회의원 이름
+        raise_on_error: True이면 요청/파싱 오류 시 0 대신 예외 발생 (재시도하는 크롤러용)
+        before_request: 캐시에 없어 실제 요청을 보내기 직전에 호출할 함수 (속도 제한용, 선택)
     
     Returns:
         int: 발언 횟수 (실패 시 0 반환)
@@ -28,8 +34,8 @@ def parse_speech_count_from_nanet(legislator_name: str) -> int:
         # URL 구성 - 22대 국회 필터링
         url = f"https://dataset.nanet.go.kr/list?srchQ=&srchQList%5B0%5D.srchKey=&srchQList%5B0%5D.srchGb=total&srchQList%5B0%5D.srchIdx=total&srchQList%5B0%5D.srchQ={encoded_name}&srchQList%5B0%5D.srchDisp={encoded_name}&srchQList%5B0%5D.srchCond=AND&orgId=NAM&_orgId=NAM&sort=score%3Adesc&srchGb=total&srchIdx=&searchType=+&srchCond=&srchDisp={encoded_name}&chkReSrchQ=N&recordCountPerPage=10&pageNo=1&phraseSearch=&phraseField=&searchWord=&tabGb=speaker&menuGb=list&speaker=&speakerId=&conferNum=&facetOrgSubId=&facetDaeNum=22&facetClassCode=&facetCommName=&facetCommSubName=&facetMeetingYear=&facetFrequency=&facetMemberName=&dtl_orgId=&dtl_orgSubId=&dtl_daeNums=&dtl_classCode=&dtl_subClassCode=&dtl_commNames=&dtl_startFrequency=&dtl_endFrequency=&dtl_startMeetingDate=&dtl_endMeetingDate="
         
-        # 웹 페이지 요청
-        response = requests.get(url, timeout=10)
+        # 웹 페이지 요청 (디스크 캐시 경유)
+        response = cached_get(url, category="nanet_speech", timeout=10, before_request=before_request)
         
         if response.status_code == 200:
             # HTML 파싱
@@ -56,9 +62,13 @@ def parse_speech_count_from_nanet(legislator_name: str) -> int:
             
             return 0
         else:
+            if raise_on_error:
+                raise requests.exceptions.HTTPError(f"HTTP 오류: {response.status_code} - {legislator_name}")
             print(f"HTTP 오류: {response.status_code} - {legislator_name}")
             return 0
             
     except Exception as e:
+        if raise_on_error:
+            raise
         print(f"발언 횟수 파싱 중 오류 발생: {str(e)} - {legislator_name}")
         return 0
\ No newline at end of file
@@ -1,5 +1,7 @@
+import io
 import xmltodict
-from typing import Dict, Any, Optional
+import xml.etree.ElementTree as ET
+from typing import Dict, Any, Optional, Iterator, Tuple, Union
 
 def parse_xml_to_dict(xml_string: str) -> Dict[str, Any]:
     """
@@ -28,4 +30,88 @@ def parse_xml_to_dict(xml_string: str) -> Dict[str, Any]:
         
     except Exception as e:
         print(f"XML 파싱 오류: {str(e)}")
-        return {'error': True, 'message': str(e)}
\ No newline at end of file
+        return {'error': True, 'message': str(e)}
+
+def _element_text(element) -> Optional[str]:
+    # xmltodict와 같은 값이 되도록 앞뒤 공백 제거, 빈 태그는 None
+    if element.text is None:
+        return None
+    text = element.text.strip()
+    return text or None
+
+def stream_xml_rows(xml_data: Union[str, bytes], row_tag: str = "row") -> Tuple[Dict[str, Any], Iterator[Dict[str, Optional[str]]]]:
+    """
+    XML 응답을 전체 딕셔너리로 만들지 않고 row 단위로 읽는 스트리밍 파서
+
+    head(list_total_count, 결과 코드)는 첫 row 전까지만 읽어서 바로 반환하고,
+    row는 반복할 때마다 하나씩 파싱한 뒤 메모리에서 해제하므로 페이지 크기와 관계없이 메모리 사용량이 일정함
+
+    Args:
+        xml_data: XML 형식의 문자열 또는 바이트
+        row_tag: 행 태그 이름
+
+    Returns:
+        (head, rows) 튜플
+        - head: {"root": 루트 태그, "list_total_count": 총 개수(int 또는 None), "code": 결과 코드,
+                 "message": 결과 메시지, "error": 오류 여부}
+        - rows: {태그: 값} 형태의 평평한 딕셔너리를 하나씩 반환하는 이터레이터
+          (row 도중 XML이 깨져 있으면 반복 중에 ET.ParseError 발생)
+    """
+    if isinstance(xml_data, str):
+        xml_data = xml_data.encode("utf-8")
+
+    head = {"root": None, "list_total_count": None, "code": None, "message": None, "error": False}
+    events = ET.iterparse(io.BytesIO(xml_data), events=("start", "end"))
+    root = None
+    first_row = None
+
+    try:
+        # 1. 첫 row가 시작되기 전까지 head 정보만 읽음
+        for event, element in events:
+            if root is None:
+                root = element
+                head["root"] = element.tag
+                continue
+
+            if event == "start":
+                if element.tag == row_tag:
+                    first_row = element
+                    break
+                continue
+
+            tag = element.tag
+            if tag == "list_total_count":
+                text = _element_text(element)
+                head["list_total_count"] = int(text) if text and text.isdigit() else None
+            elif tag in ("CODE", "returnReasonCode"):
+                head["code"] = _element_text(element)
+            elif tag in ("MESSAGE", "errMsg"):
+                head["message"] = _element_text(element)
+    except ET.ParseError as e:
+        print(f"XML 파싱 오류: {str(e)}")
+        head["error"] = True
+        head["message"] = str(e)
+        return head, iter(())
+
+    # 결과 코드 확인 (INFO-000: 정상, OpenAPI 공통 오류 응답은 00이 정상)
+    if head["root"] == "OpenAPI_ServiceResponse" and head["code"] != "00":
+        head["error"] = True
+        print(f"API 응답 오류: {head['message'] or '알 수 없는 오류'}")
+    elif head["code"] and head["code"].startswith("ERROR"):
+        head["error"] = True
+
+    def iter_rows() -> Iterator[Dict[str, Optional[str]]]:
+        if first_row is None:
+            return
+        try:
+            for event, element in events:
+                if event == "end" and element.tag == row_tag:
+                    yield {child.tag: _element_text(child) for child in element}
+                    # 처리한 row는 루트에서 제거하여 메모리 해제
+                    root.clear()
+        except ET.ParseError as e:
+            # 중간에 잘린 응답을 일부 row만으로 정상 처리하지 않도록 호출한 쪽에 전달
+            print(f"XML 파싱 오류: {str(e)}")
+            raise
+
+    return head, iter_rows()
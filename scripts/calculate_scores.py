@@ -1,6 +1,9 @@
 import sys
 import os
-from sqlalchemy import func
+import time
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from sqlalchemy import func, select, update
 from sqlalchemy.orm import Session
 
 # 프로젝트 루트 디렉토리 추가
@@ -17,6 +20,8 @@ from app.models.vote import Vote, VoteResult
 
 from app.db.database import SessionLocal
 from app.services.tier_service import TierService
+from app.services.data_version_service import bump_data_version, get_source_versions, record_score_versions
+from app.services.stats_snapshot_service import rebuild_stats_snapshot
 
 def calculate_all_scores():
     """
@@ -26,22 +31,157 @@ def calculate_all_scores():
     db = SessionLocal()
     try:
         print("Calculating all scores...")
-        calculate_participation_scores(db)
-        calculate_legislation_scores(db)
-        calculate_speech_scores(db)
-        calculate_voting_scores(db)
-        calculate_cooperation_scores(db)
-        calculate_overall_scores(db)
-        update_tiers(db)
-        update_rankings(db)
+        # 카테고리 점수는 병렬로 계산하여 한 번에 저장
+        calculate_category_scores(db)
+        # 종합 점수, 티어, 순위는 한 번에 계산
+        finalize_scores(db)
+        # 잡다한 랭킹 통계 스냅샷 재생성
+        rebuild_stats_snapshot(db)
         print("Score calculation completed.")
     finally:
         db.close()
 
-def calculate_participation_scores(db: Session):
+def _bulk_update_scores(db: Session, field: str, scores: Dict[int, Optional[float]]) -> None:
+    """
+    의원별 점수를 한 번의 UPDATE(executemany)로 저장하고 커밋
+    
+    Args:
+        db: 데이터베이스 세션
+        field: Legislator 점수 필드명
+        scores: 의원 ID -> 점수
+    """
+    if scores:
+        db.execute(update(Legislator), [{"id": legislator_id, field: score} for legislator_id, score in scores.items()])
+    db.commit()
+
+def load_attendance_totals(db: Session) -> Dict[int, Dict[str, int]]:
+    """
+    의원별 본회의/상임위 출석 수와 회의 수를 한 번의 쿼리로 조회
+    
+    기존 방식(.first())과 같은 값이 되도록 (의원, 회의구분, 상태)별로 가장 먼저 저장된 행을 사용
+    
+    Args:
+        db: 데이터베이스 세션
+    
+    Returns:
+        Dict[int, Dict[str, int]]: 의원 ID -> {"plenary_attendance", "plenary_meetings",
+                                              "standing_attendance", "standing_meetings"}
+    """
+    keys = {
+        ("본회의", "출석"): "plenary_attendance",
+        ("본회의", "회의일수"): "plenary_meetings",
+        ("상임위", "출석"): "standing_attendance",
+        ("상임위", "회의일수"): "standing_meetings",
+    }
+    
+    first_ids = (
+        select(func.min(Attendance.id))
+        .where(Attendance.meeting_type.in_(["본회의", "상임위"]), Attendance.status.in_(["출석", "회의일수"]))
+        .group_by(Attendance.legislator_id, Attendance.meeting_type, Attendance.status)
+    )
+    rows = db.execute(
+        select(Attendance.legislator_id, Attendance.meeting_type, Attendance.status, Attendance.count)
+        .where(Attendance.id.in_(first_ids))
+    ).all()
+    
+    totals = {}
+    for legislator_id, meeting_type, status, count in rows:
+        totals.setdefault(legislator_id, dict.fromkeys(keys.values(), 0))[keys[(meeting_type, status)]] = count or 0
+    return totals
+
+def compute_participation_scores(db: Session) -> Dict[int, float]:
+    """
+    의원별 참여 점수(출석률) 계산 (DB에 저장하지 않음)
+    
+    참여 점수 = (본회의 출석 + 상임위 출석) / (본회의 회의 수 + 상임위 회의 수) × 100 - 결석 페널티
+    결석 페널티 = 결석률 × 가중치(1.5) × 100
+    
+    Args:
+        db: 데이터베이스 세션
+    
+    Returns:
+        Dict[int, float]: 의원 ID -> 참여 점수
+    """
+    legislator_ids = db.execute(select(Legislator.id)).scalars().all()
+    totals = load_attendance_totals(db)
+    
+    def column(key):
+        return np.array([totals.get(legislator_id, {}).get(key, 0) for legislator_id in legislator_ids], dtype=float)
+    
+    plenary_attendance = column("plenary_attendance")
+    plenary_meetings = column("plenary_meetings")
+    standing_attendance = column("standing_attendance")
+    standing_meetings = column("standing_meetings")
+    
+    # 결석 횟수, 전체 출석/회의 수
+    total_absences = (plenary_meetings - plenary_attendance) + (standing_meetings - standing_attendance)
+    total_attendance = plenary_attendance + standing_attendance
+    total_meetings = plenary_meetings + standing_meetings
+    
+    # 기본 출석률 - 결석 페널티 (결석률에 가중치 1.5 적용), 회의 수가 0이면 0점
+    has_meetings = total_meetings > 0
+    safe_meetings = np.where(has_meetings, total_meetings, 1)
+    base_attendance_rate = (total_attendance / safe_meetings) * 100
+    absence_penalty = (total_absences / safe_meetings) * 1.5 * 100
+    participation_scores = np.where(has_meetings, np.clip(base_attendance_rate - absence_penalty, 0, 100), 0)
+    
+    # 기존 방식과 같은 값이 되도록 파이썬 round 사용
+    return {
+        legislator_id: round(float(score), 1) if meetings else 0
+        for legislator_id, score, meetings in zip(legislator_ids, participation_scores, has_meetings)
+    }
+
+def calculate_participation_scores(db: Session, legacy: bool = False):
     """
     의원별 참여 점수(출석률) 계산하여 DB 업데이트
     
+    출석 현황은 한 번의 쿼리로 모아서 계산하고, 점수는 한 번의 UPDATE로 저장 (compute_participation_scores)
+    
+    Args:
+        db: 데이터베이스 세션
+        legacy: True이면 기존 의원별 조회 방식으로 계산 (성능 비교용)
+    """
+    if legacy:
+        return calculate_participation_scores_legacy(db)
+    
+    print("참여 점수(출석률) 계산 시작...")
+    _calculate_category(db, "participation")
+
+def benchmark_participation_scores(db: Session, repeat: int = 3) -> Dict[str, float]:
+    """
+    참여 점수 계산의 기존 방식과 집계 쿼리 방식 실행 시간 비교 (두 방식의 결과가 같은지도 확인)
+    
+    Args:
+        db: 데이터베이스 세션
+        repeat: 방식별 반복 횟수
+    
+    Returns:
+        Dict[str, float]: 방식별 평균 실행 시간(초)
+    """
+    import io
+    import contextlib
+    
+    results = {}
+    timings = {}
+    for legacy in (True, False):
+        name = "legacy" if legacy else "grouped"
+        elapsed = 0.0
+        for _ in range(repeat):
+            start_time = time.time()
+            with contextlib.redirect_stdout(io.StringIO()):
+                calculate_participation_scores(db, legacy=legacy)
+            elapsed += time.time() - start_time
+        timings[name] = elapsed / repeat
+        results[name] = dict(db.execute(select(Legislator.id, Legislator.participation_score)).all())
+    
+    print(f"참여 점수 계산: 기존 {timings['legacy']:.3f}초, 집계 쿼리 {timings['grouped']:.3f}초 "
+          f"(결과 일치: {results['legacy'] == results['grouped']})")
+    return timings
+
+def calculate_participation_scores_legacy(db: Session):
+    """
+    의원별 참여 점수(출석률) 계산하여 DB 업데이트 (의원별로 Attendance를 4번씩 조회하는 기존 방식, 성능 비교용)
+    
     참여 점수 = (본회의 출석 + 상임위 출석) / (본회의 회의 수 + 상임위 회의 수) × 100 - 결석 페널티
     결석 페널티 = 결석률 × 가중치(1.5) × 100
     
@@ -140,591 +280,525 @@ def calculate_participation_scores(db: Session):
         import traceback
         traceback.print_exc()
 
-def calculate_legislation_scores(db: Session):
+def load_legislation_counts(db: Session) -> Dict[str, list]:
+    """
+    의원별 대표발의안 수, 공동발의안 수, 대표발의 법안 처리 결과를 한 번의 집계 쿼리로 조회
+    
+    Args:
+        db: 데이터베이스 세션
+    
+    Returns:
+        Dict[str, list]: 컬럼명 -> 의원 순서대로의 값 목록
+            ("id", "main_bills_count", "co_bills_count", "original_pass", "modified_pass", "alternative")
+    """
+    from sqlalchemy import case
+    
+    def count_result(result):
+        return func.sum(case((Bill.proc_result == result, 1), else_=0))
+    
+    main_counts = (
+        select(
+            Bill.main_proposer_id.label("legislator_id"),
+            func.count(Bill.id).label("main_bills_count"),
+            count_result("원안가결").label("original_pass"),
+            count_result("수정가결").label("modified_pass"),
+            count_result("대안반영폐기").label("alternative"),
+        )
+        .group_by(Bill.main_proposer_id)
+        .subquery()
+    )
+    co_counts = (
+        select(BillCoProposer.legislator_id, func.count(BillCoProposer.id).label("co_bills_count"))
+        .group_by(BillCoProposer.legislator_id)
+        .subquery()
+    )
+    
+    columns = ["id", "main_bills_count", "co_bills_count", "original_pass", "modified_pass", "alternative"]
+    rows = db.execute(
+        select(
+            Legislator.id,
+            func.coalesce(main_counts.c.main_bills_count, 0),
+            func.coalesce(co_counts.c.co_bills_count, 0),
+            func.coalesce(main_counts.c.original_pass, 0),
+            func.coalesce(main_counts.c.modified_pass, 0),
+            func.coalesce(main_counts.c.alternative, 0),
+        )
+        .outerjoin(main_counts, main_counts.c.legislator_id == Legislator.id)
+        .outerjoin(co_counts, co_counts.c.legislator_id == Legislator.id)
+    ).all()
+    
+    return {name: [row[index] for row in rows] for index, name in enumerate(columns)}
+
+def compute_legislation_scores(db: Session) -> Dict[int, float]:
     """
-    입법활동 점수 계산
+    입법활동 점수 계산 (DB에 저장하지 않음)
     - 대표발의 활동량(60%): 대표발의안 수 / 최대 대표발의안 수 × 100
     - 공동발의 활동량(20%): 공동발의안 수 / 최대 공동발의안 수 × 100
     - 법안 통과 성공률(20%): (원안가결×1.2 + 수정가결×1.0 + 대안반영×0.8) / 대표발의안 수 × 100
+    
+    Args:
+        db: 데이터베이스 세션
+    
+    Returns:
+        Dict[int, float]: 의원 ID -> 입법활동 점수
     """
-    try:
-        # 모든 의원 조회
-        legislators = db.query(Legislator).all()
-        
-        # 의원별 대표발의안 수, 공동발의안 수, 대표발의 법안 처리 결과 집계
-        legislator_scores = []
-        max_main_count = 0
-        max_co_count = 0
-        
-        for legislator in legislators:
-            # 대표발의안 수 조회
-            main_bills_count = db.query(Bill).filter(
-                Bill.main_proposer_id == legislator.id
-            ).count()
-            
-            # 공동발의안 수 조회
-            co_bills_count = db.query(BillCoProposer).filter(
-                BillCoProposer.legislator_id == legislator.id
-            ).count()
-            
-            # 법안 처리 결과 집계
-            bills = db.query(Bill).filter(
-                Bill.main_proposer_id == legislator.id
-            ).all()
-            
-            # 처리 결과별 합계
-            original_pass = 0  # 원안가결
-            modified_pass = 0  # 수정가결
-            alternative = 0   # 대안반영폐기
-            
-            for bill in bills:
-                if bill.proc_result == "원안가결":
-                    original_pass += 1
-                elif bill.proc_result == "수정가결":
-                    modified_pass += 1
-                elif bill.proc_result == "대안반영폐기":
-                    alternative += 1
-            
-            # 의원별 데이터 저장
-            legislator_scores.append({
-                "id": legislator.id,
-                "main_bills_count": main_bills_count,
-                "co_bills_count": co_bills_count,
-                "original_pass": original_pass,
-                "modified_pass": modified_pass,
-                "alternative": alternative
-            })
-            
-            # 최대값 갱신
-            if main_bills_count > max_main_count:
-                max_main_count = main_bills_count
-            if co_bills_count > max_co_count:
-                max_co_count = co_bills_count
-        
-        # 최대값이 0인 경우 처리 (0으로 나누기 방지)
-        if max_main_count == 0:
-            max_main_count = 1
-        if max_co_count == 0:
-            max_co_count = 1
-        
-        # 의원별 점수 계산 및 DB 업데이트
-        for score_data in legislator_scores:
-            legislator_id = score_data["id"]
-            
-            # 대표발의 활동량 (60%)
-            main_activity = (score_data["main_bills_count"] / max_main_count) * 100 * 0.6
-            
-            # 공동발의 활동량 (20%)
-            co_activity = (score_data["co_bills_count"] / max_co_count) * 100 * 0.2
-            
-            # 법안 통과 성공률 (20%)
-            if score_data["main_bills_count"] > 0:
-                pass_rate = (
-                    (score_data["original_pass"] * 1.2 + 
-                     score_data["modified_pass"] * 1.0 + 
-                     score_data["alternative"] * 0.8) / 
-                    score_data["main_bills_count"] * 100 * 0.2
-                )
-            else:
-                pass_rate = 0
-            
-            # 총점 계산 (최대 100점)
-            total_score = min(main_activity + co_activity + pass_rate, 100)
-            
-            # DB 업데이트
-            legislator = db.query(Legislator).filter(Legislator.id == legislator_id).first()
-            if legislator:
-                legislator.legislation_score = total_score
-        
-        # 변경사항 저장
-        db.commit()
-        print(f"입법활동 점수 계산 완료: {len(legislator_scores)}명")
-        
-    except Exception as e:
-        db.rollback()
-        print(f"입법활동 점수 계산 중 오류 발생: {str(e)}")
-        import traceback
-        traceback.print_exc()
+    # 의원별 대표발의안 수, 공동발의안 수, 대표발의 법안 처리 결과 집계
+    counts = load_legislation_counts(db)
+    main_bills_count = np.array(counts["main_bills_count"], dtype=float)
+    co_bills_count = np.array(counts["co_bills_count"], dtype=float)
+    original_pass = np.array(counts["original_pass"], dtype=float)
+    modified_pass = np.array(counts["modified_pass"], dtype=float)
+    alternative = np.array(counts["alternative"], dtype=float)
+    
+    # 최대값 (0인 경우 0으로 나누기 방지를 위해 1)
+    max_main_count = main_bills_count.max(initial=0) or 1
+    max_co_count = co_bills_count.max(initial=0) or 1
+    
+    # 대표발의 활동량 (60%)
+    main_activity = (main_bills_count / max_main_count) * 100 * 0.6
+    
+    # 공동발의 활동량 (20%)
+    co_activity = (co_bills_count / max_co_count) * 100 * 0.2
+    
+    # 법안 통과 성공률 (20%), 대표발의안이 없으면 0
+    has_main = main_bills_count > 0
+    pass_rate = np.where(
+        has_main,
+        (original_pass * 1.2 + modified_pass * 1.0 + alternative * 0.8) / np.where(has_main, main_bills_count, 1) * 100 * 0.2,
+        0
+    )
+    
+    # 총점 계산 (최대 100점)
+    total_scores = np.minimum(main_activity + co_activity + pass_rate, 100)
+    return {legislator_id: float(score) for legislator_id, score in zip(counts["id"], total_scores)}
+
+def calculate_legislation_scores(db: Session):
+    """
+    입법활동 점수 계산하여 DB 업데이트
+    
+    의원별 건수는 한 번의 집계 쿼리로 조회하고, 점수는 NumPy로 한 번에 계산하여 한 번의 UPDATE로 저장
+    (compute_legislation_scores)
+    """
+    _calculate_category(db, "legislation")
+
+def compute_speech_scores(db: Session) -> Dict[int, float]:
+    """
+    의정발언 점수 계산 - 로그 스케일 적용 (DB에 저장하지 않음)
+    
+    Args:
+        db: 데이터베이스 세션
+    
+    Returns:
+        Dict[int, float]: 의원 ID -> 의정발언 점수 (최소 5점)
+    """
+    import math
+    
+    legislator_ids = db.execute(select(Legislator.id)).scalars().all()
+    
+    # 의원별 발언 횟수 (기존 방식과 같이 의원별로 가장 먼저 저장된 행 사용)
+    first_ids = select(func.min(SpeechByMeeting.id)).group_by(SpeechByMeeting.legislator_id)
+    counts = dict(db.execute(
+        select(SpeechByMeeting.legislator_id, SpeechByMeeting.count).where(SpeechByMeeting.id.in_(first_ids))
+    ).all())
+    speech_data = {legislator_id: counts.get(legislator_id) or 0 for legislator_id in legislator_ids}
+    
+    # 최대값이 0인 경우 처리 (0으로 나누기 방지)
+    max_speech_count = max(speech_data.values(), default=0)
+    if max_speech_count == 0:
+        max_speech_count = 1
+        print("경고: 최대 발언 횟수가 0입니다!")
+    
+    scores = {}
+    for legislator_id, speech_count in speech_data.items():
+        # 발언 수가 0인 경우 처리
+        if speech_count == 0:
+            normalized_score = 0
+        else:
+            # 로그 스케일 사용 (상한값을 100으로 조정)
+            log_max = math.log(max_speech_count + 1)  # +1로 log(0) 방지
+            log_current = math.log(speech_count + 1)  # +1로 log(0) 방지
+            normalized_score = (log_current / log_max) * 100
+        
+        # 최소 점수 설정 (0점 방지)
+        scores[legislator_id] = max(normalized_score, 5)
+    
+    return scores
 
 def calculate_speech_scores(db: Session):
     """
-    의정발언 점수 계산 - 로그 스케일 적용
+    의정발언 점수 계산하여 DB 업데이트 - 로그 스케일 적용 (compute_speech_scores)
     """
-    try:
-        # 모든 의원 조회
-        legislators = db.query(Legislator).all()
-        
-        # 발언 데이터 조회 (SpeechByMeeting 테이블)
-        speech_data = {}
-        max_speech_count = 0
-        
-        # 모든 의원의 발언 횟수 조회
-        for legislator in legislators:
-            # 의원별 발언 횟수 조회
-            speech_record = db.query(SpeechByMeeting).filter(
-                SpeechByMeeting.legislator_id == legislator.id
-            ).first()
-            
-            # 발언 횟수 저장
-            speech_count = speech_record.count if speech_record else 0
-            speech_data[legislator.id] = speech_count
-            
-            # 최대 발언 횟수 갱신
-            if speech_count > max_speech_count:
-                max_speech_count = speech_count
-        
-        # 최대값이 0인 경우 처리 (0으로 나누기 방지)
-        if max_speech_count == 0:
-            max_speech_count = 1
-            print("경고: 최대 발언 횟수가 0입니다!")
-        
-        # 각 의원별 점수 계산 및 DB 업데이트
-        import math
-        for legislator in legislators:
-            # 발언 횟수 로그 정규화 (100점 만점)
-            speech_count = speech_data.get(legislator.id, 0)
-            
-            # 발언 수가 0인 경우 처리
-            if speech_count == 0:
-                normalized_score = 0
-            else:
-                # 로그 스케일 사용 (상한값을 100으로 조정)
-                log_max = math.log(max_speech_count + 1)  # +1로 log(0) 방지
-                log_current = math.log(speech_count + 1)  # +1로 log(0) 방지
-                normalized_score = (log_current / log_max) * 100
-            
-            # 최소 점수 설정 (0점 방지)
-            normalized_score = max(normalized_score, 5)
-            
-            # DB 업데이트
-            legislator.speech_score = normalized_score
-        
-        # 변경사항 저장
-        db.commit()
-        print(f"의정발언 점수 계산 완료: {len(legislators)}명")
-        
-        # 간단한 통계 정보 출력
-        avg_score = sum(legislator.speech_score for legislator in legislators) / len(legislators)
-        print(f"의정발언 점수 평균: {avg_score:.1f}")
-        
-    except Exception as e:
-        db.rollback()
-        print(f"의정발언 점수 계산 중 오류 발생: {str(e)}")
-        import traceback
-        traceback.print_exc()
+    _calculate_category(db, "speech")
 
-def calculate_voting_scores(db: Session):
+def load_vote_tallies(db: Session) -> Dict[int, Dict[str, int]]:
+    """
+    의원별 표결 결과 유형별 횟수를 한 번의 GROUP BY 쿼리로 조회 (VoteResult 객체를 만들지 않음)
+    
+    Args:
+        db: 데이터베이스 세션
+    
+    Returns:
+        Dict[int, Dict[str, int]]: 의원 ID -> {"participation": 찬성/반대, "abstention": 기권, "absent": 불참 또는 기타}
     """
-    표결 책임성 점수 계산
+    rows = db.execute(
+        select(VoteResult.legislator_id, VoteResult.result_vote_mod, func.count(VoteResult.id))
+        .group_by(VoteResult.legislator_id, VoteResult.result_vote_mod)
+    ).all()
+    
+    tallies = {}
+    for legislator_id, result_vote_mod, count in rows:
+        tally = tallies.setdefault(legislator_id, {"participation": 0, "abstention": 0, "absent": 0})
+        if result_vote_mod in ["찬성", "반대"]:
+            tally["participation"] += count
+        elif result_vote_mod == "기권":
+            tally["abstention"] += count
+        else:  # 불참 또는 기타
+            tally["absent"] += count
+    return tallies
+
+def compute_voting_scores(db: Session) -> Dict[int, float]:
+    """
+    표결 책임성 점수 계산 (DB에 저장하지 않음)
     - 표결 참여율 계산: (기권표+불참 제외 나머지) / 전체 표결 × 100
     - 감점 요소 반영: 표결 참여율 - (기권 횟수 × 0.5 + 불참 횟수 × 1.0) / 전체 표결 수 × 10
     - 최소 0점, 최대 100점으로 제한
+    
+    표결 결과는 의원별/유형별 건수로만 집계하므로 표결 기록이 늘어나도 메모리 사용량이 일정함
+    
+    Args:
+        db: 데이터베이스 세션
+    
+    Returns:
+        Dict[int, float]: 의원 ID -> 표결 책임성 점수
     """
-    try:
-        # 모든 의원 조회
-        legislators = db.query(Legislator).all()
-        
-        # 의원별 표결 데이터 처리
-        for legislator in legislators:
-            # 해당 의원의 모든 표결 결과 조회
-            vote_results = db.query(VoteResult).filter(
-                VoteResult.legislator_id == legislator.id
-            ).all()
-            
-            # 표결 데이터가 없는 경우
-            if not vote_results:
-                # 데이터 없음 = 0점 처리
-                legislator.voting_score = 0
-                continue
-            
-            # 전체 표결 수
-            total_votes = len(vote_results)
-            
-            # 각 유형별 표결 수 계산
-            participation_count = 0  # 참여 (찬성 또는 반대)
-            abstention_count = 0     # 기권
-            absent_count = 0         # 불참
-            
-            for result in vote_results:
-                if result.result_vote_mod in ["찬성", "반대"]:
-                    participation_count += 1
-                elif result.result_vote_mod == "기권":
-                    abstention_count += 1
-                else:  # 불참 또는 기타
-                    absent_count += 1
-            
-            # 표결 참여율 계산 (0-100 범위)
-            participation_rate = (participation_count / total_votes) * 100 if total_votes > 0 else 0
-            
-            # 감점 요소 계산 (0-100 범위)
-            penalty = ((abstention_count * 0.5 + absent_count * 1.0) / total_votes) * 10 if total_votes > 0 else 0
-            
-            # 최종 표결 책임성 점수 계산 (감점 적용)
-            voting_score = participation_rate - penalty
-            
-            # 최소 0점, 최대 100점으로 제한
-            voting_score = max(0, min(100, voting_score))
-            
-            # DB에 점수 업데이트
-            legislator.voting_score = voting_score
-        
-        # 변경사항 저장
-        db.commit()
-        print(f"표결 책임성 점수 계산 완료: {len(legislators)}명")
-        
-        # 간단한 통계 출력
-        avg_score = sum(leg.voting_score for leg in legislators if leg.voting_score is not None) / len([leg for leg in legislators if leg.voting_score is not None])
-        print(f"표결 책임성 점수 평균: {avg_score:.1f}")
-        
-    except Exception as e:
-        db.rollback()
-        print(f"표결 책임성 점수 계산 중 오류 발생: {str(e)}")
-        import traceback
-        traceback.print_exc()
+    legislator_ids = db.execute(select(Legislator.id)).scalars().all()
+    tallies = load_vote_tallies(db)
+    
+    def column(key):
+        return np.array([tallies.get(legislator_id, {}).get(key, 0) for legislator_id in legislator_ids], dtype=float)
+    
+    participation_count = column("participation")  # 참여 (찬성 또는 반대)
+    abstention_count = column("abstention")        # 기권
+    absent_count = column("absent")                # 불참
+    
+    # 전체 표결 수 (표결 데이터가 없으면 0점)
+    total_votes = participation_count + abstention_count + absent_count
+    has_votes = total_votes > 0
+    safe_total = np.where(has_votes, total_votes, 1)
+    
+    # 표결 참여율 - 감점 (0-100 범위)
+    participation_rate = (participation_count / safe_total) * 100
+    penalty = ((abstention_count * 0.5 + absent_count * 1.0) / safe_total) * 10
+    voting_scores = np.where(has_votes, np.clip(participation_rate - penalty, 0, 100), 0)
+    
+    return {legislator_id: float(score) for legislator_id, score in zip(legislator_ids, voting_scores)}
+
+def calculate_voting_scores(db: Session):
+    """
+    표결 책임성 점수 계산하여 DB 업데이트 (compute_voting_scores)
+    """
+    _calculate_category(db, "voting")
+
+def compute_cooperation_scores(db: Session) -> Dict[int, float]:
+    """
+    협치/초당적 활동 점수 계산 - 이념 성향에 따른 가중치 적용 (DB에 저장하지 않음)
+    
+    공동발의 관계를 희소 행렬로 한 번 읽어 의원 x 의원 공동발의 횟수를 계산하고 (cooperation_service),
+    이념 성향 가중치를 행렬 연산으로 적용
+    
+    Args:
+        db: 데이터베이스 세션
+    
+    Returns:
+        Dict[int, float]: 의원 ID -> 협치 점수
+    """
+    from app.services.cooperation_service import get_cooperation_graph
+    
+    # 점수 계산 시에는 항상 최신 데이터로 그래프 생성 (다른 기능에서 재사용)
+    return get_cooperation_graph(db, refresh=True).cooperation_scores()
 
 def calculate_cooperation_scores(db: Session):
     """
-    협치/초당적 활동 점수 계산 - 이념 성향에 따른 가중치 적용
+    협치/초당적 활동 점수 계산하여 DB 업데이트 (compute_cooperation_scores)
+    """
+    _calculate_category(db, "cooperation")
+
+# 카테고리별 (표시 이름, Legislator 점수 필드, 계산 함수)
+SCORE_CATEGORIES = {
+    "participation": ("참여", "participation_score", compute_participation_scores),
+    "legislation": ("입법활동", "legislation_score", compute_legislation_scores),
+    "speech": ("의정발언", "speech_score", compute_speech_scores),
+    "voting": ("표결 책임성", "voting_score", compute_voting_scores),
+    "cooperation": ("협치/초당적 활동", "cooperation_score", compute_cooperation_scores),
+}
+
+def _calculate_category(db: Session, category: str) -> None:
+    """
+    카테고리 하나의 점수를 계산하여 저장하고, 계산에 사용한 원본 데이터 버전 기록
     """
+    label, field, compute = SCORE_CATEGORIES[category]
     try:
-        # SQLAlchemy text() 함수 임포트 추가
-        from sqlalchemy import text
-        
-        # 진보/보수 정당 구분
-        progressive_parties = ["조국혁신당", "더불어민주당", "기본소득당", "진보당", "사회민주당"]
-        conservative_parties = ["국민의힘", "개혁신당"]
-        
-        # 모든 의원과 그들의 정당 정보를 한 번에 조회하여 캐싱
-        all_legislators = db.query(Legislator).all()
-        legislator_parties = {leg.id: leg.poly_nm for leg in all_legislators}
+        start_time = time.time()
+        versions = get_source_versions(db, category)
         
-        # 무소속 의원 매핑
-        independent_mapping = {
-            "김상욱": "국민의힘",
-            "우원식": "더불어민주당",
-            "김종민": "더불어민주당"
-        }
-        
-        # 각 의원별 이념 성향 캐싱
-        legislator_ideologies = {}
-        for leg_id, party in legislator_parties.items():
-            leg = next((l for l in all_legislators if l.id == leg_id), None)
-            
-            # 무소속 처리
-            if party == "무소속" and leg and leg.hg_nm in independent_mapping:
-                party = independent_mapping[leg.hg_nm]
-            
-            if party in progressive_parties:
-                legislator_ideologies[leg_id] = "progressive"
-            elif party in conservative_parties:
-                legislator_ideologies[leg_id] = "conservative"
-            else:
-                legislator_ideologies[leg_id] = "other"
-        
-        # 각 의원별 점수 계산
-        for legislator in all_legislators:
-            # 의원 자신의 성향
-            leg_id = legislator.id
-            leg_ideology = legislator_ideologies.get(leg_id, "other")
-            
-            # 해당 의원이 함께 발의한 다른 의원들의 정당 통계 가져오기
-            # text() 함수로 SQL 쿼리 감싸기
-            coworker_query = text("""
-            SELECT b.legislator_id, COUNT(*) as count
-            FROM bill_co_proposers a
-            JOIN bill_co_proposers b ON a.bill_id = b.bill_id AND b.legislator_id != :leg_id
-            WHERE a.legislator_id = :leg_id
-            GROUP BY b.legislator_id
-            """)
-            
-            coworkers = db.execute(coworker_query, {"leg_id": leg_id}).fetchall()
-            
-            if not coworkers:
-                legislator.cooperation_score = 0
-                continue
-            
-            # 성향 다른 의원과의 협력 비율 계산
-            total_cooperations = sum(count for _, count in coworkers)
-            weighted_score = 0
-            
-            for coworker_id, count in coworkers:
-                coworker_ideology = legislator_ideologies.get(coworker_id, "other")
-                
-                # 다른 이념 성향과의 협력은 높은 가중치
-                if leg_ideology != coworker_ideology and leg_ideology != "other" and coworker_ideology != "other":
-                    weighted_score += count * 3
-                # 같은 이념 성향의 다른 정당과의 협력은 매우 낮은 가중치
-                elif legislator_parties.get(leg_id) != legislator_parties.get(coworker_id):
-                    weighted_score += count * 0.1
-            
-            # 총 협력 수로 나누어 가중 평균 구하기
-            cooperation_score = min((weighted_score / total_cooperations) * 33.33, 100)
-            
-            # DB 업데이트
-            legislator.cooperation_score = cooperation_score
+        scores = compute(db)
+        _bulk_update_scores(db, field, scores)
+        record_score_versions(db, category, versions)
         
-        # 변경사항 저장
-        db.commit()
-        print(f"협치/초당적 활동 점수 계산 완료: {len(all_legislators)}명")
+        print(f"{label} 점수 계산 완료: {len(scores)}명 ({time.time() - start_time:.3f}초)")
         
         # 간단한 통계 출력
-        valid_scores = [leg.cooperation_score for leg in all_legislators if leg.cooperation_score is not None]
-        if valid_scores:
-            avg_score = sum(valid_scores) / len(valid_scores)
-            print(f"협치/초당적 활동 점수 평균: {avg_score:.1f}")
+        if scores:
+            avg_score = sum(scores.values()) / len(scores)
+            print(f"{label} 점수 평균: {avg_score:.1f}")
         
     except Exception as e:
         db.rollback()
-        print(f"협치/초당적 활동 점수 계산 중 오류 발생: {str(e)}")
+        print(f"{label} 점수 계산 중 오류 발생: {str(e)}")
         import traceback
         traceback.print_exc()
 
-def calculate_overall_scores(db: Session):
+def compute_category_scores(db: Session, categories: List[str],
+                            max_workers: Optional[int] = None) -> Dict[str, Tuple[Dict[str, str], Dict[int, float]]]:
     """
-    종합 점수 계산 - 각 스탯에 스케일된 값 저장 및 종합 점수 계산
+    여러 카테고리 점수를 동시에 계산 (DB에 저장하지 않음)
+    
+    카테고리마다 원본 테이블과 점수 필드가 다르므로 스레드별로 별도의 읽기 세션을 열어 병렬로 계산
+    (메모리 DB는 연결마다 DB가 달라지므로 현재 세션으로 순차 계산)
+    
+    Args:
+        db: 데이터베이스 세션 (순차 계산 시 사용)
+        categories: 계산할 카테고리 목록 (SCORE_CATEGORIES의 키)
+        max_workers: 동시 계산 수 (기본값: settings.SCORE_WORKERS)
+    
+    Returns:
+        Dict[str, Tuple]: 카테고리 -> (계산 전에 조회한 원본 데이터 버전, 의원 ID -> 점수)
+                          (오류가 난 카테고리는 제외)
     """
-    try:
-        # 모든 의원 조회
-        legislators = db.query(Legislator).all()
-        
-        print("종합 점수 계산 시작...")
-        
-        # 각 카테고리별 현재 계산된 점수의 통계 분석
-        # (NULL이 아닌 값만 대상으로)
-        category_stats = {}
-        
-        # 각 카테고리별로 통계 계산
-        for category in ['participation_score', 'legislation_score', 'speech_score', 
-                         'voting_score', 'cooperation_score']:
-            # NULL이 아닌 점수만 필터링
-            non_null_values = [getattr(leg, category) for leg in legislators 
-                              if getattr(leg, category) is not None]
-            
-            if non_null_values:
-                category_stats[category] = {
-                    'min': min(non_null_values),
-                    'max': max(non_null_values),
-                    'avg': sum(non_null_values) / len(non_null_values),
-                    'count': len(non_null_values)
-                }
-                print(f"{category}: 최소={category_stats[category]['min']:.1f}, "
-                      f"최대={category_stats[category]['max']:.1f}, "
-                      f"평균={category_stats[category]['avg']:.1f}, "
-                      f"개수={category_stats[category]['count']}")
-            else:
-                category_stats[category] = {
-                    'min': 0,
-                    'max': 0,
-                    'avg': 0,
-                    'count': 0
-                }
-                print(f"{category}: 계산된 값 없음")
-        
-        # 시각적 효과를 위한 목표 분포 설정
-        TARGET_MIN = 5  # 최소 점수
-        TARGET_MAX = 100  # 최대 점수
-        
-        # 의원별 종합 점수 계산 및 DB 업데이트
-        for legislator in legislators:
-            # 각 카테고리별 스케일링 적용
-            scaled_scores = {}
-            
-            for category in ['participation_score', 'legislation_score', 'speech_score', 
-                            'voting_score', 'cooperation_score']:
-                # 원본 점수 (NULL인 경우 None 그대로 유지)
-                original_score = getattr(legislator, category)
-                
-                # 해당 카테고리의 통계 정보
-                stats = category_stats[category]
-                
-                # 스케일링 적용 조건: 
-                # 1. 원본 점수가 있고 (NULL이 아님)
-                # 2. 해당 카테고리의 최대값과 최소값이 다르며 (분포가 있음)
-                # 3. 계산된 값이 하나 이상 있음
-                if (original_score is not None and 
-                    stats['max'] != stats['min'] and 
-                    stats['count'] > 0):
-                    
-                    # 최소-최대 정규화 후 목표 범위로 스케일링
-                    normalized = (original_score - stats['min']) / (stats['max'] - stats['min'])
-                    scaled = TARGET_MIN + normalized * (TARGET_MAX - TARGET_MIN)
-                    scaled_scores[category] = scaled
-                    
-                    # 스케일된 점수 저장 (각 스탯에 직접 반영)
-                    setattr(legislator, category, scaled)
-                elif original_score is None:
-                    # NULL인 경우 그대로 유지
-                    scaled_scores[category] = None
-                else:
-                    # 분포가 없거나 단일 값인 경우 (최대=최소) TARGET_MIN으로 설정
-                    scaled_scores[category] = TARGET_MIN
-                    setattr(legislator, category, TARGET_MIN)
-            
-            # 종합 점수 계산 (NULL이면 0으로 처리)
-            participation = scaled_scores['participation_score'] or 0
-            legislation = scaled_scores['legislation_score'] or 0
-            speech = scaled_scores['speech_score'] or 0
-            voting = scaled_scores['voting_score'] or 0
-            cooperation = scaled_scores['cooperation_score'] or 0
-            
-            # 가중치에 따른 종합 점수 계산
-            overall_score = (
-                participation * 0.1 +  # 참여도 (10%)
-                legislation * 0.4 +     # 입법활동 (40%)
-                speech * 0.3 +         # 의정발언 (30%)
-                voting * 0.1 +          # 표결 책임성 (10%)
-                cooperation * 0.1       # 협치/초당적 활동 (10%)
-            )
-            
-            # 종합 점수 저장
-            legislator.overall_score = overall_score
-        
-        # 변경사항 저장
-        db.commit()
-        print(f"종합 점수 계산 완료: {len(legislators)}명")
-        
-    except Exception as e:
-        db.rollback()
-        print(f"종합 점수 계산 중 오류 발생: {str(e)}")
-        import traceback
-        traceback.print_exc()
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+    from app.config import settings
+    from app.db.database import is_memory_db
+    
+    def compute(session: Session, category: str):
+        versions = get_source_versions(session, category)
+        return versions, SCORE_CATEGORIES[category][2](session)
+    
+    def compute_in_new_session(category: str):
+        session = SessionLocal()
+        try:
+            return compute(session, category)
+        finally:
+            session.close()
+    
+    max_workers = 1 if is_memory_db else min(max_workers or settings.SCORE_WORKERS, len(categories))
+    results = {}
+    
+    if max_workers <= 1:
+        for category in categories:
+            try:
+                results[category] = compute(db, category)
+            except Exception as e:
+                db.rollback()
+                print(f"{SCORE_CATEGORIES[category][0]} 점수 계산 중 오류 발생: {str(e)}")
+                import traceback
+                traceback.print_exc()
+        return results
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(compute_in_new_session, category): category for category in categories}
+        for future in as_completed(futures):
+            category = futures[future]
+            try:
+                results[category] = future.result()
+            except Exception as e:
+                print(f"{SCORE_CATEGORIES[category][0]} 점수 계산 중 오류 발생: {str(e)}")
+                import traceback
+                traceback.print_exc()
+    
+    return results
 
-def update_tiers(db: Session):
+def apply_category_scores(db: Session, results: Dict[str, Tuple[Dict[str, str], Dict[int, float]]]) -> None:
     """
-    종합 점수 분포에 따른 티어 할당
+    계산한 카테고리 점수를 한 트랜잭션으로 저장 (의원당 모든 카테고리 필드를 한 번에 UPDATE)
     
     Args:
         db: 데이터베이스 세션
+        results: compute_category_scores 결과
     """
+    rows = {}
+    for category, (_, scores) in results.items():
+        field = SCORE_CATEGORIES[category][1]
+        for legislator_id, score in scores.items():
+            rows.setdefault(legislator_id, {"id": legislator_id})[field] = score
+    
     try:
-        print("티어 업데이트 시작...")
-        
-        # 티어 서비스 인스턴스 생성
-        tier_service = TierService(db)
-        
-        # 의원들을 종합점수 기준으로 내림차순 정렬
-        legislators = db.query(Legislator).order_by(Legislator.overall_score.desc()).all()
-        
-        if not legislators:
-            print("티어 업데이트 실패: 의원 데이터가 없습니다.")
-            return
-        
-        total_legislators = len(legislators)
-        print(f"총 {total_legislators}명의 의원 티어를 업데이트합니다.")
-        
-        # 각 티어의 목표 인원수 계산
-        tier_limits = {}
-        accumulated = 0
-        
-        for tier, percentage in tier_service.tiers.items():
-            # 각 티어별 의원 수 계산 (비율에 따라)
-            count = round(total_legislators * percentage / 100)
-            tier_limits[tier] = {
-                'start': accumulated,
-                'end': accumulated + count - 1  # 인덱스는 0부터 시작하므로 -1
-            }
-            accumulated += count
-        
-        # 모든 티어를 합했을 때 전체 의원수와 맞지 않는 경우 보정
-        if accumulated != total_legislators:
-            # 남은 인원을 마지막 티어에 추가
-            last_tier = list(tier_limits.keys())[-1]
-            tier_limits[last_tier]['end'] += (total_legislators - accumulated)
-        
-        # 각 의원의 티어 할당
-        for i, legislator in enumerate(legislators):
-            # 해당 인덱스가 속하는 티어 찾기
-            assigned_tier = None
-            for tier, limit in tier_limits.items():
-                if limit['start'] <= i <= limit['end']:
-                    assigned_tier = tier
-                    break
-            
-            # 티어 업데이트
-            if assigned_tier:
-                legislator.tier = assigned_tier
-        
-        # 변경사항 저장
+        if rows:
+            db.execute(update(Legislator), list(rows.values()))
+        for category, (versions, _) in results.items():
+            record_score_versions(db, category, versions, commit=False)
         db.commit()
-        
-        # 티어 분포 통계 출력
-        tier_distribution = {}
-        for legislator in legislators:
-            if legislator.tier in tier_distribution:
-                tier_distribution[legislator.tier] += 1
-            else:
-                tier_distribution[legislator.tier] = 1
-        
-        print("티어 분포:")
-        for tier, count in tier_distribution.items():
-            percentage = (count / total_legislators) * 100
-            print(f"  {tier}: {count}명 ({percentage:.1f}%)")
-        
-        print("티어 업데이트 완료")
-        
-    except Exception as e:
+    except Exception:
         db.rollback()
-        print(f"티어 업데이트 중 오류 발생: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        raise
+
+def calculate_category_scores(db: Session, categories: Optional[List[str]] = None,
+                              max_workers: Optional[int] = None) -> List[str]:
+    """
+    카테고리 점수 병렬 계산 후 한 번에 저장 (종합 점수/티어/순위 계산 전 단계)
+    
+    Args:
+        db: 데이터베이스 세션
+        categories: 계산할 카테고리 목록 (None이면 전체)
+        max_workers: 동시 계산 수 (기본값: settings.SCORE_WORKERS)
+    
+    Returns:
+        List[str]: 계산하여 저장한 카테고리 목록
+    """
+    categories = categories or list(SCORE_CATEGORIES)
+    start_time = time.time()
+    
+    results = compute_category_scores(db, categories, max_workers)
+    apply_category_scores(db, results)
+    
+    for category in categories:
+        if category in results:
+            scores = results[category][1]
+            avg_score = sum(scores.values()) / len(scores) if scores else 0
+            print(f"{SCORE_CATEGORIES[category][0]} 점수 계산 완료: {len(scores)}명 (평균 {avg_score:.1f})")
+    print(f"카테고리 점수 계산/저장 완료: {len(results)}/{len(categories)}개 ({time.time() - start_time:.3f}초)")
+    
+    return [category for category in categories if category in results]
+
+def get_tier_ranges(tiers: Dict[str, float], total: int) -> List[Tuple[str, int, int]]:
+    """
+    티어별 비율로 정렬 순서상의 구간 계산 (비율로 반올림한 인원 수, 남는 인원은 마지막 티어)
+    
+    Args:
+        tiers: 티어 -> 비율(%) (TierService.tiers, 상위 티어부터)
+        total: 전체 의원 수
+    
+    Returns:
+        List[Tuple[str, int, int]]: (티어, 시작 인덱스, 끝 인덱스) 목록 (끝 인덱스 포함)
+    """
+    ranges = []
+    accumulated = 0
+    for tier, percentage in tiers.items():
+        count = round(total * percentage / 100)
+        ranges.append((tier, accumulated, accumulated + count - 1))
+        accumulated += count
+    
+    # 모든 티어를 합했을 때 전체 의원수와 맞지 않는 경우 남은 인원을 마지막 티어에 반영
+    if ranges and accumulated != total:
+        tier, start, end = ranges[-1]
+        ranges[-1] = (tier, start, end + (total - accumulated))
+    
+    return ranges
 
-def update_rankings(db: Session):
+def finalize_scores(db: Session) -> None:
     """
-    종합 점수 기준 순위(overall_rank) 업데이트
+    종합 점수, 티어, 순위를 한 번에 계산하여 저장
+    
+    의원 데이터를 한 번만 읽어 NumPy 배열로 계산 (정렬 한 번, UPDATE 한 번, 커밋 한 번)
+    - 종합 점수: 카테고리 점수를 TARGET_MIN~TARGET_MAX로 정규화한 뒤 가중 합 (점수가 없는 카테고리는 0점)
+    - 티어: 종합 점수 순으로 TierService의 비율만큼 상위 티어부터 배정
+    - 순위: 종합 점수 내림차순 (동점이면 같은 순위, 다음 순위는 건너뜀)
+    - 동점자는 의원 ID 오름차순으로 정렬하여 티어 경계에서도 항상 같은 결과
     
     Args:
         db: 데이터베이스 세션
     """
+    categories = ['participation_score', 'legislation_score', 'speech_score', 'voting_score', 'cooperation_score']
+    weights = {
+        'participation_score': 0.1,  # 참여도 (10%)
+        'legislation_score': 0.4,    # 입법활동 (40%)
+        'speech_score': 0.3,         # 의정발언 (30%)
+        'voting_score': 0.1,         # 표결 책임성 (10%)
+        'cooperation_score': 0.1     # 협치/초당적 활동 (10%)
+    }
+    
+    # 시각적 효과를 위한 목표 분포 설정
+    TARGET_MIN = 5  # 최소 점수
+    TARGET_MAX = 100  # 최대 점수
+    
     try:
-        print("랭킹 업데이트 시작...")
-        
-        # 종합 점수 기준으로 의원들을 내림차순 정렬
-        legislators = db.query(Legislator).order_by(Legislator.overall_score.desc()).all()
+        print("종합 점수/티어/순위 계산 시작...")
+        start_time = time.time()
         
-        if not legislators:
-            print("랭킹 업데이트 실패: 의원 데이터가 없습니다.")
+        rows = db.execute(select(Legislator.id, Legislator.tier, *[getattr(Legislator, c) for c in categories])).all()
+        if not rows:
+            print("종합 점수 계산 실패: 의원 데이터가 없습니다.")
             return
         
-        # 순위 할당 (동점자는 같은 순위 적용)
-        current_rank = 1
-        previous_score = None
-        skipped_ranks = 0
+        total = len(rows)
+        ids = np.array([row[0] for row in rows])
         
-        for i, legislator in enumerate(legislators):
-            current_score = legislator.overall_score
+        # 카테고리별 최소-최대 정규화 (NULL은 그대로 유지하고 종합 점수에서는 0으로 처리)
+        scaled = {}
+        overall = np.zeros(total)
+        for offset, category in enumerate(categories, start=2):
+            values = np.array([row[offset] for row in rows], dtype=float)  # None -> nan
+            present = ~np.isnan(values)
             
-            # 점수가 없는 경우 가장 낮은 순위 부여
-            if current_score is None:
-                legislator.overall_rank = len(legislators)
-                continue
-            
-            # 이전 점수와 비교 (첫 번째 의원 또는 점수가 다른 경우)
-            if previous_score is None or current_score != previous_score:
-                # 새로운 순위 = 현재 기본 순위 + 건너뛴 순위 수
-                current_rank = i + 1
-                skipped_ranks = 0
+            if present.any():
+                low, high = values[present].min(), values[present].max()
+                print(f"{category}: 최소={low:.1f}, 최대={high:.1f}, "
+                      f"평균={values[present].mean():.1f}, 개수={int(present.sum())}")
             else:
-                # 동점자는 같은 순위 유지 (skipped_ranks는 증가하지 않음)
-                skipped_ranks += 1
-            
-            # 순위 업데이트
-            legislator.overall_rank = current_rank
+                low = high = 0
+                print(f"{category}: 계산된 값 없음")
             
-            # 현재 점수를 이전 점수로 저장
-            previous_score = current_score
-        
-        # 변경사항 저장
+            if high != low:
+                category_scaled = TARGET_MIN + (values - low) / (high - low) * (TARGET_MAX - TARGET_MIN)
+            else:
+                # 분포가 없거나 단일 값인 경우 (최대=최소) TARGET_MIN
+                category_scaled = np.full(total, float(TARGET_MIN))
+            category_scaled[~present] = np.nan
+            
+            scaled[category] = category_scaled
+            overall += np.where(present, category_scaled, 0) * weights[category]
+        
+        # 종합 점수 내림차순 정렬 (동점이면 의원 ID 오름차순)
+        order = np.lexsort((ids, -overall))
+        sorted_scores = overall[order]
+        
+        # 순위 (동점자는 같은 순위, 다음 순위는 건너뜀)
+        positions = np.arange(1, total + 1)
+        new_score = np.r_[True, sorted_scores[1:] != sorted_scores[:-1]]
+        ranks = np.empty(total, dtype=int)
+        ranks[order] = np.maximum.accumulate(np.where(new_score, positions, 0))
+        
+        # 티어 (정렬 순서상의 구간, 어느 구간에도 속하지 않으면 기존 티어 유지)
+        tiers = np.array([row[1] for row in rows], dtype=object)
+        sorted_tiers = tiers[order]
+        for tier, tier_start, tier_end in get_tier_ranges(TierService(db).tiers, total):
+            sorted_tiers[tier_start:max(tier_end + 1, tier_start)] = tier
+        tiers[order] = sorted_tiers
+        
+        # 한 번의 UPDATE로 저장
+        updates = []
+        for i, legislator_id in enumerate(ids.tolist()):
+            values = {"id": legislator_id, "overall_score": float(overall[i]),
+                      "tier": tiers[i], "overall_rank": int(ranks[i])}
+            for category in categories:
+                score = scaled[category][i]
+                values[category] = None if np.isnan(score) else float(score)
+            updates.append(values)
+        db.execute(update(Legislator), updates)
         db.commit()
+        bump_data_version(db, "scores")
         
-        # 간단한 통계 출력
-        min_rank = min(leg.overall_rank for leg in legislators if leg.overall_rank is not None)
-        max_rank = max(leg.overall_rank for leg in legislators if leg.overall_rank is not None)
+        # 티어 분포 통계 출력
+        print("티어 분포:")
+        for tier in dict.fromkeys(sorted_tiers):
+            count = int(np.sum(sorted_tiers == tier))
+            print(f"  {tier}: {count}명 ({count / total * 100:.1f}%)")
         
-        print(f"총 {len(legislators)}명의 의원 랭킹 업데이트 완료 (순위 범위: {min_rank}-{max_rank})")
+        print(f"종합 점수/티어/순위 계산 완료: {total}명 (순위 범위: {ranks.min()}-{ranks.max()}, "
+              f"{time.time() - start_time:.3f}초)")
         
     except Exception as e:
         db.rollback()
-        print(f"랭킹 업데이트 중 오류 발생: {str(e)}")
+        print(f"종합 점수/티어/순위 계산 중 오류 발생: {str(e)}")
         import traceback
         traceback.print_exc()
 
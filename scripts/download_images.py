@@ -13,6 +13,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from app.models.legislator import Legislator
 from app.config import settings
+from app.services.data_version_service import bump_data_version
 
 # 모든 모델을 명시적으로 임포트
 from app.models.legislator import Legislator
@@ -51,6 +52,7 @@ def download_images():
         except:
             print("진행 상황 파일을 읽는 중 오류가 발생했습니다. 새로 시작합니다.")
     
+    updated_count = 0
     try:
         # 모든 의원 정보 조회
         legislators = db.query(Legislator).all()
@@ -78,6 +80,7 @@ def download_images():
                 if legislator.profile_image_url != local_path:
                     legislator.profile_image_url = local_path
                     db.commit()
+                    updated_count += 1
                 
                 # 진행 상황 업데이트
                 downloaded_mona_cds.append(legislator.mona_cd)
@@ -139,6 +142,7 @@ def download_images():
                     # DB에 로컬 경로 업데이트
                     legislator.profile_image_url = local_path
                     db.commit()
+                    updated_count += 1
                     
                     print(f"[{idx+1}/{total}] {legislator.hg_nm} 의원 사진 다운로드 완료")
                     success = True
@@ -168,6 +172,9 @@ def download_images():
         print(f"\n총 {total}명 중 {success_count}명의 의원 사진 다운로드 완료")
     
     finally:
+        # 의원 사진 경로가 바뀌었으면 (중간에 중단된 경우 포함) 데이터 버전을 올려 캐시된 화면에 반영
+        if updated_count:
+            bump_data_version(db, "legislator_images")
         db.close()
 
 if __name__ == "__main__":
@@ -1,5 +1,7 @@
 import sys
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from sqlalchemy.orm import Session
 
 from app.db.database import SessionLocal
@@ -15,41 +17,50 @@ from app.models.sns import LegislatorSNS
 
 from app.models.legislator import Legislator
 from app.services.api_service import ApiService
-from app.utils.excel_parser import parse_attendance_excel, parse_speech_keywords_excel, parse_speech_by_meeting_excel
-from app.services.data_processing import process_attendance_data, process_speech_data, process_bill_data, process_vote_data
-from app.services.data_processing import process_keyword_data
+from app.services.data_processing import process_attendance_data, process_speech_data, process_bill_data_batch
+from app.services.data_processing import process_keyword_data, process_vote_batch
+from app.services.legislator_resolver import LegislatorResolver
+from app.utils.rate_limiter import RateLimiter
+from app.utils.http_cache import get_cache
+from app.services.sync_service import compute_rows_hash, get_sync_state, update_sync_state, is_unchanged
+from app.services.data_version_service import bump_data_version
+from app.services.stats_snapshot_service import refresh_stats_snapshot
+from app.config import settings
 from scripts.calculate_scores import calculate_speech_scores
 from app.models.attendance import Attendance
 
-def fetch_all_data():
+def fetch_all_data(full: bool = False):
     """
     모든 데이터 수집 함수 호출
+    
+    Args:
+        full: True이면 수집 상태(워터마크/해시)를 무시하고 전체 데이터를 다시 반영
     """
     # DB 세션 생성
     db = SessionLocal()
     try:
-        print("데이터 수집을 시작합니다...")
+        print(f"데이터 수집을 시작합니다... ({'전체' if full else '증분'} 수집)")
         
         # 의원 정보 수집
-        fetch_legislators(db)
+        fetch_legislators(db, full=full)
         
         # 법안 정보 수집
-        fetch_bills(db)
+        fetch_bills(db, full=full)
         
         # 표결 정보 수집
         fetch_votes(db)
         
         # 위원회 현황 정보 수집
-        fetch_committee_info(db)
+        fetch_committee_info(db, full=full)
 
         # 처리 의안통계 수집
-        fetch_processed_bills_stats(db)
+        fetch_processed_bills_stats(db, full=full)
 
         # 위원회 정보 수집 (의원-위원회 매핑)
-        fetch_committees(db)
+        fetch_committees(db, full=full)
 
         # 위원회 경력 정보 수집 
-        fetch_committee_history(db)
+        fetch_committee_history(db, full=full)
         
         # 발언 횟수 수집 및 업데이트 
         fetch_speech_counts(db)
@@ -57,6 +68,9 @@ def fetch_all_data():
         # 엑셀 데이터 수집
         fetch_excel_data(db)
         
+        # 위원회/위원회 멤버십/재산 등 통계 원본이 바뀌었으면 잡다한 랭킹 통계 스냅샷 재생성
+        refresh_stats_snapshot(db)
+        
         print("모든 데이터 수집이 완료되었습니다.")
     except Exception as e:
         print(f"데이터 수집 중 오류 발생: {e}")
@@ -64,23 +78,30 @@ def fetch_all_data():
         # DB 세션 닫기
         db.close()
 
-def fetch_legislators(db: Session):
+        # HTTP 캐시 적중률 출력
+        cache = get_cache()
+        if cache is not None:
+            print(cache.summary())
+
+def fetch_legislators(db: Session, full: bool = False):
     """
     국회의원 정보, SNS 정보, 사진 정보 수집
 
     # ApiService 인스턴스 생성
     # 호출: api_service.fetch_legislators_info()로 의원 정보 수집
     # 호출: api_service.fetch_legislators_sns()로 의원 SNS 정보 수집
-    # 호출: api_service.fetch_legislator_images()로 의원 사진 정보 수집
+    # 수집 상태(sync_states)의 해시와 비교하여 변경이 없으면 스킵
+    # 호출: api_service.fetch_legislator_images()로 의원 사진 정보 수집 (증분 수집 시 새 의원만)
     # 국회의원코드(mona_cd)를 기준으로 사진 정보 매핑 딕셔너리 생성
     # 의원 정보에 사진 URL 추가 (이미지 없는 경우 기본 이미지 경로 설정)
     # 국회의원 및 SNS 정보 DB에 저장
+    
+    Args:
+        db: 데이터베이스 세션
+        full: True이면 변경 여부와 관계없이 전체 반영
     """
     # 기존 데이터 확인
     existing_data = db.query(Legislator).count()
-    if existing_data > 0:
-        print(f"이미 {existing_data}명의 의원 정보가 있습니다. 스킵합니다.")
-        return
     
     # API 서비스 인스턴스 생성
     api_service = ApiService()
@@ -91,28 +112,48 @@ def fetch_legislators(db: Session):
     # SNS 정보 수집
     sns_info = api_service.fetch_legislators_sns()
     
-    # 사진 정보 수집
-    image_info = api_service.fetch_legislator_images()
+    if not legislators_info:
+        print("수집된 의원 정보가 없습니다.")
+        return
+    
+    # 마지막 수집 이후 변경 여부 확인
+    info_hash = compute_rows_hash(legislators_info)
+    sns_hash = compute_rows_hash(sns_info)
+    if (existing_data > 0 and not full
+            and is_unchanged(db, "legislator_info", info_hash)
+            and is_unchanged(db, "legislator_sns", sns_hash)):
+        print(f"의원 정보 변경 없음 ({existing_data}명). 스킵합니다.")
+        return
+    
+    # 사진 정보 수집 (증분 수집이면 DB에 없는 새 의원만)
+    existing_mona_cds = {mona_cd for (mona_cd,) in db.query(Legislator.mona_cd).all()}
+    if full:
+        image_targets = legislators_info
+    else:
+        image_targets = [info for info in legislators_info if info['mona_cd'] not in existing_mona_cds]
+    image_info = api_service.fetch_legislator_images(image_targets) if image_targets else []
     
     # 사진 정보를 국회의원 코드 기준으로 매핑
     image_dict = {}
     for item in image_info:
         image_dict[item['mona_cd']] = item['profile_image_url']
     
+    # SNS 정보를 국회의원 코드 기준으로 매핑
+    sns_dict = {item['mona_cd']: item for item in sns_info}
+    
     # 의원 정보 처리 및 DB 저장
     for info in legislators_info:
         # 기존 의원 정보 확인
         legislator = db.query(Legislator).filter(Legislator.mona_cd == info['mona_cd']).first()
         
-        # 사진 URL 설정
-        profile_image_url = image_dict.get(info['mona_cd'], "/static/images/legislators/default.png")
-        
         if legislator:
             # 기존 의원 정보 업데이트
             for key, value in info.items():
                 if hasattr(legislator, key):
                     setattr(legislator, key, value)
-            legislator.profile_image_url = profile_image_url
+            # 새로 수집한 사진이 있을 때만 사진 URL 변경
+            if info['mona_cd'] in image_dict:
+                legislator.profile_image_url = image_dict[info['mona_cd']]
         else:
             # 새 의원 정보 생성
             legislator = Legislator(
@@ -129,7 +170,7 @@ def fetch_legislators(db: Session):
                 tel_no=info.get('tel_no'),
                 e_mail=info.get('e_mail'),
                 mem_title=info.get('mem_title'),
-                profile_image_url=profile_image_url
+                profile_image_url=image_dict.get(info['mona_cd'], "/static/images/legislators/default.png")
             )
             db.add(legislator)
         
@@ -137,7 +178,7 @@ def fetch_legislators(db: Session):
         db.commit()
         
         # SNS 정보 처리
-        sns_item = next((item for item in sns_info if item['mona_cd'] == info['mona_cd']), None)
+        sns_item = sns_dict.get(info['mona_cd'])
         if sns_item:
             # 기존 SNS 정보 확인
             sns = db.query(LegislatorSNS).filter(LegislatorSNS.legislator_id == legislator.id).first()
@@ -162,44 +203,94 @@ def fetch_legislators(db: Session):
             # SNS 정보 변경사항 저장
             db.commit()
     
+    # 수집 상태 저장
+    update_sync_state(db, "legislator_info", total_count=len(legislators_info), row_hash=info_hash)
+    bump_data_version(db, "legislators")
+    update_sync_state(db, "legislator_sns", total_count=len(sns_info), row_hash=sns_hash)
+    
     print(f"의원 정보 수집 완료: {len(legislators_info)}명")
 
-def fetch_bills(db: Session):
+def fetch_bills(db: Session, full: bool = False):
     """
     법안 정보 수집
     
     # ApiService 인스턴스 생성
-    # 호출: api_service.fetch_bills()로 법안 정보 수집
-    # 호출: process_bill_data()로 데이터 처리
-    # DB에 저장
+    # 호출: api_service.fetch_bills()로 전체 법안 정보 수집
+    # 수집한 행의 해시가 마지막 수집 때와 같으면 스킵 (처리 결과만 바뀐 경우도 감지)
+    # 호출: process_bill_data_batch()로 새로 추가되었거나 값이 바뀐 법안만 처리
+    # DB에 청크 단위 upsert 후 수집 상태 저장
+    
+    Args:
+        db: 데이터베이스 세션
+        full: True이면 변경 여부와 관계없이 전체 법안을 다시 반영
     """
     # 기존 데이터 확인
     existing_count = db.query(Bill).count()
-    if existing_count > 0:
-        print(f"이미 {existing_count}개의 법안 정보가 있습니다. 새로운 법안만 가져옵니다.")
+    if full:
+        print("전체 법안 정보를 다시 가져옵니다.")
+    elif existing_count > 0:
+        print(f"이미 {existing_count}개의 법안 정보가 있습니다. 새로 추가되었거나 바뀐 법안만 반영합니다.")
     else:
         print("법안 정보가 없습니다. 모든 법안을 가져옵니다.")
     
     # ApiService 인스턴스 생성
     api_service = ApiService()
     
-    # 법안 정보 수집
+    # 법안 정보 수집 (처리 결과는 오래된 법안에서도 바뀌므로 워터마크에서 멈추지 않고 전체 수집)
     print("법안 정보 수집 시작...")
-    bills_data = api_service.fetch_bills()
+    bills_data = api_service.fetch_bills(full=True)
     
     if not bills_data:
-        print("수집된 새로운 법안 정보가 없습니다.")
+        print("수집된 법안 정보가 없습니다.")
         return
     
-    # 처리된 법안 정보를 DB에 저장
-    processed_bills = process_bill_data(bills_data)
+    # 마지막 수집 이후 변경 여부 확인
+    total_count = len(bills_data)
+    row_hash = compute_rows_hash(bills_data)
+    if existing_count > 0 and not full and is_unchanged(db, "bills", row_hash):
+        print(f"법안 정보 변경 없음 ({len(bills_data)}건). 스킵합니다.")
+        return
     
-    print(f"새로운 법안 정보 수집 완료: {len(processed_bills)}개")
+    # 기존 법안과 비교하여 새로 추가되었거나 값(처리 결과 등)이 바뀐 법안만 처리
+    if existing_count > 0 and not full:
+        compare_fields = ["bill_name", "propose_dt", "detail_link", "proposer", "committee", "proc_result"]
+        existing = {row.bill_no: row for row in db.query(
+            Bill.bill_no, *[getattr(Bill, field) for field in compare_fields]
+        ).all()}
+        bills_data = [
+            bill for bill in bills_data
+            if bill["bill_no"] not in existing
+            or any(getattr(existing[bill["bill_no"]], field) != bill[field] for field in compare_fields)
+        ]
+        print(f"새로 추가되었거나 바뀐 법안: {len(bills_data)}개")
+    
+    # 처리된 법안 정보를 DB에 청크 단위로 upsert
+    processed_bills = process_bill_data_batch(bills_data) if bills_data else []
+    
+    # 워터마크(저장된 법안의 최근 제안일), 전체 건수, 해시 저장
+    state = get_sync_state(db, "bills")
+    propose_dates = [bill["propose_dt"] for bill in processed_bills if bill.get("propose_dt")]
+    if state and state.watermark:
+        propose_dates.append(state.watermark)
+    update_sync_state(db, "bills", watermark=max(propose_dates) if propose_dates else None,
+                      total_count=total_count, row_hash=row_hash)
+    
+    print(f"법안 정보 수집 완료: {len(processed_bills)}개 반영")
 
-def fetch_votes(db: Session):
+def fetch_votes(db: Session, max_workers: int = None, rate_limit: float = None, batch_size: int = None):
     """
-    표결 정보 수집
+    표결 정보 수집 - 여러 스레드가 법안별 표결 결과를 동시에 받아오고, 메인 스레드가 모아서 일괄 저장
+    
+    Args:
+        db: 데이터베이스 세션
+        max_workers: 동시 요청 수 (기본값: settings.VOTE_FETCH_WORKERS)
+        rate_limit: 초당 최대 요청 수 (기본값: settings.VOTE_FETCH_RATE, 0이면 제한 없음)
+        batch_size: 한 트랜잭션에 저장할 법안 수 (기본값: settings.VOTE_BATCH_SIZE)
     """
+    max_workers = max_workers or settings.VOTE_FETCH_WORKERS
+    rate_limit = settings.VOTE_FETCH_RATE if rate_limit is None else rate_limit
+    batch_size = batch_size or settings.VOTE_BATCH_SIZE
+    
     # API 서비스 인스턴스 생성
     api_service = ApiService()
     
@@ -210,33 +301,77 @@ def fetch_votes(db: Session):
         print("표결이 있는 법안이 없습니다.")
         return
     
-    print(f"총 {len(voted_bill_ids)}개의 법안에 대한 표결 정보를 수집합니다.")
+    total = len(voted_bill_ids)
+    print(f"총 {total}개의 법안에 대한 표결 정보를 수집합니다. (동시 요청: {max_workers}, 초당 요청 제한: {rate_limit or '없음'})")
     
-    # 각 법안에 대한 표결 정보 수집 및 처리
-    for index, bill_id in enumerate(voted_bill_ids):
-        # 진행 상황 출력
-        print(f"[{index+1}/{len(voted_bill_ids)}] 법안 {bill_id}의 표결 정보 수집 중...")
-        
-        # 표결 정보 수집
-        vote_data = api_service.fetch_vote_results(bill_id)
-        
-        if not vote_data:
-            print(f"법안 {bill_id}의 표결 정보를 가져올 수 없습니다.")
-            continue
-        
-        # 표결 데이터 처리
-        from app.services.data_processing import process_vote_data
-        processed_data = process_vote_data(vote_data, db)
-        
-        if not processed_data:
-            print(f"법안 {bill_id}의 표결 데이터 처리에 실패했습니다.")
-            continue
+    # 요청 속도 제한 (모든 작업 스레드가 공유)
+    limiter = RateLimiter(rate_limit)
+    
+    # 의원 이름 -> ID 인덱스 (모든 배치에서 공유)
+    resolver = LegislatorResolver(db)
+    
+    def fetch(bill_id):
+        limiter.acquire()
+        return api_service.fetch_vote_results(bill_id)
+    
+    start_time = time.time()
+    pending = []
+    fetched_count = 0
+    failed_count = 0
+    saved = {"votes": 0, "results": 0, "missing_legislators": 0, "skipped_bills": 0}
+    
+    def flush():
+        # 모아둔 표결 데이터를 한 트랜잭션으로 저장
+        stats = process_vote_batch(pending, db, resolver)
+        for key, value in stats.items():
+            saved[key] += value
+        pending.clear()
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(fetch, bill_id): bill_id for bill_id in voted_bill_ids}
         
-        print(f"법안 {bill_id}의 표결 정보 처리 완료: {processed_data['processed_results']}/{processed_data['total_results']} 결과 처리됨")
+        for future in as_completed(futures):
+            bill_id = futures[future]
+            fetched_count += 1
+            
+            try:
+                vote_data = future.result()
+            except Exception as e:
+                print(f"법안 {bill_id}의 표결 정보 요청 중 오류 발생: {str(e)}")
+                vote_data = None
+            
+            if vote_data:
+                pending.append(vote_data)
+            else:
+                failed_count += 1
+                print(f"법안 {bill_id}의 표결 정보를 가져올 수 없습니다.")
+            
+            # 배치 크기만큼 모이면 저장
+            if len(pending) >= batch_size:
+                flush()
+            
+            # 진행 상황 및 처리량 출력
+            if fetched_count % 10 == 0 or fetched_count == total:
+                elapsed = time.time() - start_time
+                throughput = fetched_count / elapsed if elapsed > 0 else 0
+                print(f"[{fetched_count}/{total}] 표결 정보 수집 중... ({throughput:.1f}건/초, 저장된 표결 결과: {saved['results']}건)")
+    
+    # 남은 데이터 저장
+    if pending:
+        flush()
+    
+    elapsed = time.time() - start_time
+    print(f"표결 정보 수집 완료: {saved['votes']}개 표결, {saved['results']}개 결과 저장 "
+          f"(실패: {failed_count}개, 법안 없음: {saved['skipped_bills']}개, 미확인 의원: {saved['missing_legislators']}건, "
+          f"소요 시간: {elapsed:.1f}초)")
 
-def fetch_committee_info(db: Session):
+def fetch_committee_info(db: Session, full: bool = False):
     """
     위원회 현황 정보 수집 - 상임위원회와 상설특별위원회만 필터링하여 저장
+    
+    Args:
+        db: 데이터베이스 세션
+        full: True이면 변경 여부와 관계없이 전체 반영
     """
     print("위원회 현황 정보 수집 시작...")
     
@@ -255,6 +390,12 @@ def fetch_committee_info(db: Session):
         print("수집된 위원회 정보가 없습니다.")
         return
 
+    # 마지막 수집 이후 변경 여부 확인
+    row_hash = compute_rows_hash(committee_data)
+    if existing_count > 0 and not full and is_unchanged(db, "committee_info", row_hash):
+        print("위원회 현황 정보 변경 없음. 스킵합니다.")
+        return
+
     # 위원회 정보 처리 및 DB 저장
     processed_count = 0
     skipped_count = 0
@@ -345,11 +486,17 @@ def fetch_committee_info(db: Session):
     
     # 마지막 커밋
     db.commit()
+    update_sync_state(db, "committee_info", total_count=len(committee_data), row_hash=row_hash)
+    bump_data_version(db, "committees")
     print(f"위원회 현황 정보 수집 완료: 총 {processed_count}개 (업데이트: {updated_count}개, 필터링: {filtered_count}개, 스킵: {skipped_count}개)")
 
-def fetch_processed_bills_stats(db: Session):
+def fetch_processed_bills_stats(db: Session, full: bool = False):
     """
     처리 의안통계(위원회별) 수집
+    
+    Args:
+        db: 데이터베이스 세션
+        full: True이면 변경 여부와 관계없이 전체 반영
     """
     print("처리 의안통계(위원회별) 수집 시작...")
     
@@ -363,6 +510,12 @@ def fetch_processed_bills_stats(db: Session):
         print("수집된 처리 의안통계가 없습니다.")
         return
     
+    # 마지막 수집 이후 변경 여부 확인
+    row_hash = compute_rows_hash(stats_data)
+    if not full and is_unchanged(db, "processed_bills_stats", row_hash):
+        print("처리 의안통계 변경 없음. 스킵합니다.")
+        return
+    
     # 위원회별 통계 정보 업데이트
     updated_count = 0
     not_found_count = 0
@@ -400,20 +553,23 @@ def fetch_processed_bills_stats(db: Session):
     
     # 마지막 커밋
     db.commit()
+    update_sync_state(db, "processed_bills_stats", total_count=len(stats_data), row_hash=row_hash)
+    bump_data_version(db, "committees")
     
     print(f"처리 의안통계 업데이트 완료: 총 {updated_count}개 위원회 (찾지 못한 위원회: {not_found_count}개)")
 
-def fetch_committees(db: Session):
+def fetch_committees(db: Session, full: bool = False):
     """
     위원회 멤버십 정보 수집 및 DB 저장 - 상임위원회와 상설특별위원회만 필터링
+    
+    Args:
+        db: 데이터베이스 세션
+        full: True이면 변경 여부와 관계없이 전체 반영
     """
     from app.models.committee import Committee, CommitteeMember
     
     # 기존 데이터 확인
     existing_count = db.query(CommitteeMember).count()
-    if existing_count > 0:
-        print(f"이미 {existing_count}개의 위원회 멤버십 정보가 있습니다. 스킵합니다.")
-        return
     
     # API 서비스 인스턴스 생성
     api_service = ApiService()
@@ -426,6 +582,12 @@ def fetch_committees(db: Session):
         print("수집된 위원회 멤버십 정보가 없습니다.")
         return
     
+    # 마지막 수집 이후 변경 여부 확인
+    row_hash = compute_rows_hash(members_data)
+    if existing_count > 0 and not full and is_unchanged(db, "committee_members", row_hash):
+        print(f"위원회 멤버십 정보 변경 없음 ({existing_count}개). 스킵합니다.")
+        return
+    
     # 현재 DB에 있는 상임위원회와 상설특별위원회 목록 가져오기
     valid_committees = db.query(Committee).filter(
         (Committee.cmt_div_nm.like('%상임위원회%')) | 
@@ -496,9 +658,13 @@ def fetch_committees(db: Session):
                 CommitteeMember.legislator_id == legislator.id
             ).first()
             
-            if not existing_membership:
+            role = member.get("job_res_nm", "위원")  # 기본값은 '위원'
+            if existing_membership:
+                # 직책이 바뀐 경우에만 업데이트
+                if existing_membership.role != role:
+                    existing_membership.role = role
+            else:
                 # 위원회 멤버십 정보 저장
-                role = member.get("job_res_nm", "위원")  # 기본값은 '위원'
                 committee_member = CommitteeMember(
                     committee_id=committee.id,
                     legislator_id=legislator.id,
@@ -519,17 +685,20 @@ def fetch_committees(db: Session):
     
     # 마지막 커밋
     db.commit()
+    update_sync_state(db, "committee_members", total_count=len(members_data), row_hash=row_hash)
+    bump_data_version(db, "committee_members")
     print(f"위원회 멤버십 정보 수집 완료: {processed_count}개 (필터링: {filtered_count}개, 스킵: {skipped_count}개)")
 
-def fetch_committee_history(db: Session):
+def fetch_committee_history(db: Session, full: bool = False):
     """
-    국회의원 위원회 경력 정보 수집
+    국회의원 위원회 경력 정보 수집 - 변경이 있으면 기존 경력을 지우고 다시 저장
+    
+    Args:
+        db: 데이터베이스 세션
+        full: True이면 변경 여부와 관계없이 전체 반영
     """
     # 기존 데이터 확인
     existing_count = db.query(CommitteeHistory).count()
-    if existing_count > 0:
-        print(f"이미 {existing_count}개의 위원회 경력 정보가 있습니다. 스킵합니다.")
-        return
     
     # API 서비스 인스턴스 생성
     api_service = ApiService()
@@ -542,6 +711,16 @@ def fetch_committee_history(db: Session):
         print("수집된 위원회 경력 정보가 없습니다.")
         return
     
+    # 마지막 수집 이후 변경 여부 확인
+    row_hash = compute_rows_hash(history_data)
+    if existing_count > 0 and not full and is_unchanged(db, "committee_history", row_hash):
+        print(f"위원회 경력 정보 변경 없음 ({existing_count}개). 스킵합니다.")
+        return
+    
+    # 경력은 고유 키가 없으므로 기존 데이터를 지우고 다시 저장 (첫 커밋 때 함께 반영)
+    if existing_count > 0:
+        db.query(CommitteeHistory).delete(synchronize_session=False)
+    
     # 위원회 경력 정보 처리 및 DB 저장
     processed_count = 0
     for history in history_data:
@@ -567,6 +746,8 @@ def fetch_committee_history(db: Session):
     
     # 마지막 커밋
     db.commit()
+    update_sync_state(db, "committee_history", total_count=len(history_data), row_hash=row_hash)
+    bump_data_version(db, "committee_history")
     print(f"위원회 경력 정보 수집 완료: {processed_count}개")
 
 def fetch_speech_counts(db: Session):
@@ -579,7 +760,7 @@ def fetch_speech_counts(db: Session):
     from app.models.legislator import Legislator
     from app.models.speech import SpeechByMeeting
     from app.utils.speech_parser import parse_speech_count_from_nanet
-    from time import sleep
+    from app.services.speech_crawler import SpeechCountCrawler
     
     try:
         print("국회회의록 발언 횟수 업데이트를 시작합니다...")
@@ -613,66 +794,75 @@ def fetch_speech_counts(db: Session):
         # 전체 의원 조회
         legislators = db.query(Legislator).all()
         
+        # 발언 횟수 동시 수집 (속도 제한/재시도/체크포인트는 크롤러에서 처리)
+        crawler = SpeechCountCrawler()
+        speech_counts = crawler.crawl([legislator.hg_nm for legislator in legislators])
+        
+        # 기존 발언 횟수 기록 (의원별 first() 조회 대신 한 번에 로드, 의원별 첫 번째 기록 사용)
+        existing_records = {}
+        for record in db.query(SpeechByMeeting).order_by(SpeechByMeeting.id).all():
+            existing_records.setdefault(record.legislator_id, record)
+        
         updated_count = 0
         
-        for i, legislator in enumerate(legislators):
-            try:
-                # 발언 횟수 파싱
-                speech_count = parse_speech_count_from_nanet(legislator.hg_nm)
-                
-                # 발언 횟수 저장
-                existing_record = db.query(SpeechByMeeting).filter(
-                    SpeechByMeeting.legislator_id == legislator.id
-                ).first()
-                
-                if existing_record:
-                    # 기존 데이터 업데이트
-                    existing_record.count = speech_count
-                else:
-                    # 새 데이터 생성 (meeting_type은 빈 문자열로 설정하여 실질적으로 사용하지 않음)
-                    new_record = SpeechByMeeting(
-                        legislator_id=legislator.id,
-                        meeting_type="",  # 빈 문자열로 설정
-                        count=speech_count
-                    )
-                    db.add(new_record)
-                
-                updated_count += 1
-                print(f"[{i+1}/{len(legislators)}] {legislator.hg_nm}: {speech_count}회")
-                
-                # 20명마다 커밋
-                if updated_count % 20 == 0:
-                    db.commit()
-                    print(f"{updated_count}명 업데이트 완료, 중간 저장")
-                
-                # 서버 부하 방지를 위한 지연
-                sleep(1)
-                
-            except Exception as e:
-                print(f"{legislator.hg_nm} 의원 업데이트 중 오류 발생: {str(e)}")
+        for legislator in legislators:
+            # 수집에 실패한 의원은 기존 값 유지
+            if legislator.hg_nm not in speech_counts:
                 continue
+            
+            speech_count = speech_counts[legislator.hg_nm]
+            existing_record = existing_records.get(legislator.id)
+            
+            if existing_record:
+                # 기존 데이터 업데이트 (값이 같으면 변경 없음)
+                if existing_record.count == speech_count:
+                    continue
+                existing_record.count = speech_count
+            else:
+                # 새 데이터 생성 (meeting_type은 빈 문자열로 설정하여 실질적으로 사용하지 않음)
+                new_record = SpeechByMeeting(
+                    legislator_id=legislator.id,
+                    meeting_type="",  # 빈 문자열로 설정
+                    count=speech_count
+                )
+                db.add(new_record)
+            
+            updated_count += 1
         
         # 최종 변경사항 저장
         db.commit()
+        if updated_count > 0:
+            bump_data_version(db, "speech_by_meeting")
         print(f"발언 횟수 업데이트 완료: 총 {updated_count}명 업데이트됨")
         
     except Exception as e:
         print(f"발언 횟수 업데이트 중 오류 발생: {str(e)}")
         db.rollback()
 
-def fetch_excel_data(db: Session):
+def fetch_excel_data(db: Session, max_workers: int = None):
     """
     엑셀 파일에서 데이터 수집
+
+    엑셀 파싱은 프로세스 풀에서 병렬로 수행하고 (파싱 결과는 레코드 목록),
+    DB 저장은 현재 프로세스에서 파일 순서대로 수행
+    
+    Args:
+        db: 데이터베이스 세션
+        max_workers: 엑셀 파싱 프로세스 수 (기본값: settings.EXCEL_PARSE_WORKERS)
     """
     import os
     import glob
-    from app.utils.excel_parser import parse_speech_by_meeting_excel, parse_asset_excel
+    from app.utils.excel_parser import parse_excel_files, load_asset_records
     from app.services.data_processing import process_speech_data, process_keyword_data, process_asset_data
     
     print("엑셀 데이터 수집 시작...")
+    start_time = time.time()
+    
+    # 의원 이름 -> ID 인덱스 (모든 엑셀 처리 단계에서 공유)
+    resolver = LegislatorResolver(db)
 
-    # 1. 회의별 발언 데이터 처리 
-    # 엑셀 파일 경로 설정
+    # 1. 처리할 파일 목록 수집
+    # 회의별 발언 엑셀 파일 경로 설정
     speech_by_meeting_dir = "data/excel/speech/speech_by_meeting"
     
     # 폴더가 존재하는지 확인하고 없으면 생성
@@ -682,72 +872,19 @@ def fetch_excel_data(db: Session):
         print("발언 데이터가 없습니다. 먼저 엑셀 파일을 넣으세요.")
         return
     
-    # 회의별 발언 엑셀 파일 처리
-    processed_count = 0
     speech_files = glob.glob(os.path.join(speech_by_meeting_dir, "*_speech_by_meeting.xlsx"))
-    total_files = len(speech_files)
-    
-    print(f"총 {total_files}개의 회의별 발언 파일 발견됨")
-    
-    for file_path in speech_files:
-        filename = os.path.basename(file_path)
-        print(f"파일 처리 중 ({processed_count+1}/{total_files}): {filename}")
-        
-        try:
-            # 회의별 발언 데이터 파싱
-            speech_data = parse_speech_by_meeting_excel(file_path)
-            
-            # 데이터 확인
-            if not speech_data:
-                print(f"  - 파일에서 데이터를 찾을 수 없음: {filename}")
-                continue
-                
-            print(f"  - {len(speech_data)}개의 회의별 발언 데이터 발견")
-            
-            # 데이터 처리 및 DB 저장
-            process_speech_data(speech_data, db)
-            processed_count += 1
-            
-        except Exception as e:
-            print(f"  - 파일 처리 오류: {filename}, 오류: {str(e)}")
-    
-    print(f"회의별 발언 데이터 처리 완료: {processed_count}/{total_files}개 파일")
+    print(f"총 {len(speech_files)}개의 회의별 발언 파일 발견됨")
 
-    # 2. 키워드 데이터 처리
+    # 키워드 파일
     keywords_dir = "data/excel/speech/keywords"
-    
+    keyword_files = []
     if os.path.exists(keywords_dir):
-        processed_count = 0
         keyword_files = glob.glob(os.path.join(keywords_dir, "*_speech_keywords.xlsx"))
-        total_files = len(keyword_files)
-        
-        print(f"\n총 {total_files}개의 키워드 파일 발견됨")
-        
-        for file_path in keyword_files:
-            filename = os.path.basename(file_path)
-            print(f"파일 처리 중 ({processed_count+1}/{total_files}): {filename}")
-            
-            try:
-                keyword_data = parse_speech_keywords_excel(file_path)
-                
-                if not keyword_data:
-                    print(f"  - 파일에서 데이터를 찾을 수 없음: {filename}")
-                    continue
-                    
-                print(f"  - {len(keyword_data)}개의 키워드 데이터 발견")
-                process_keyword_data(keyword_data, db)
-                processed_count += 1
-                
-            except Exception as e:
-                print(f"  - 파일 처리 오류: {filename}, 오류: {str(e)}")
-        
-        print(f"키워드 데이터 처리 완료: {processed_count}/{total_files}개 파일")
+        print(f"총 {len(keyword_files)}개의 키워드 파일 발견됨")
     else:
         print(f"키워드 폴더가 없습니다: {keywords_dir}")
-    
 
-    # 3. 출석 데이터 처리
-    print("\n=== 출석 데이터 수집 ===")
+    # 출석 파일
     attendance_plenary_dir = "data/excel/attendance/plenary"
     attendance_standing_dir = "data/excel/attendance/standing_committee"
     
@@ -767,41 +904,77 @@ def fetch_excel_data(db: Session):
     
     print(f"본회의 출석 파일: {len(plenary_files)}개")
     print(f"상임위 출석 파일: {len(standing_files)}개")
+
+    # 재산 파일
+    asset_dir = "data/excel/asset"
+    asset_files = []
     
-    # 모든 출석 데이터 수집
-    all_attendance_data = []
-    processed_count = 0
-    
-    # 본회의 파일 처리
-    for file_path in plenary_files:
-        filename = os.path.basename(file_path)
-        print(f"파일 처리 중 ({processed_count+1}/{len(plenary_files) + len(standing_files)}): {filename}")
+    # 폴더 존재 확인 및 생성
+    if not os.path.exists(asset_dir):
+        os.makedirs(asset_dir, exist_ok=True)
+        print(f"폴더 생성: {asset_dir}")
+        print("재산 데이터가 없습니다. 먼저 엑셀 파일을 넣으세요.")
+    else:
+        # 재산 파일 목록 가져오기 (asset_2025_03.xlsx 이름을 기본으로)
+        asset_files = [os.path.join(asset_dir, "asset_2025_03.xlsx")]
         
-        try:
-            attendance_data = parse_attendance_excel(file_path)
-            if attendance_data:
-                all_attendance_data.extend(attendance_data)
-                processed_count += 1
-                print(f"  - {len(attendance_data)}개의 출석 데이터 추출")
-        except Exception as e:
-            print(f"  - 파일 처리 오류: {filename}, 오류: {str(e)}")
-    
-    # 상임위 파일 처리
-    for file_path in standing_files:
+        # 지정된 파일이 없으면 모든 엑셀 파일 확인
+        if not os.path.exists(asset_files[0]):
+            print(f"기본 파일명 'asset_2025_03.xlsx'을 찾을 수 없습니다. 다른 엑셀 파일을 확인합니다.")
+            asset_files = glob.glob(os.path.join(asset_dir, "*.xlsx"))
+            
+        # 임시 파일 필터링
+        asset_files = [f for f in asset_files if os.path.exists(f) and '~$' not in os.path.basename(f)]
+        print(f"재산 엑셀 파일: {len(asset_files)}개")
+
+    # 2. 전체 파일을 병렬로 파싱하면서 제출 순서대로 DB에 저장
+    jobs = ([("speech_by_meeting", f) for f in speech_files] +
+            [("keywords", f) for f in keyword_files] +
+            [("attendance", f) for f in plenary_files + standing_files] +
+            [("asset", f) for f in asset_files])
+    processed_counts = {"speech_by_meeting": 0, "keywords": 0, "attendance": 0, "asset": 0}
+    all_attendance_data = []
+
+    for kind, file_path, records in parse_excel_files(jobs, max_workers):
         filename = os.path.basename(file_path)
-        print(f"파일 처리 중 ({processed_count+1}/{len(plenary_files) + len(standing_files)}): {filename}")
         
         try:
-            attendance_data = parse_attendance_excel(file_path)
-            if attendance_data:
-                all_attendance_data.extend(attendance_data)
-                processed_count += 1
-                print(f"  - {len(attendance_data)}개의 출석 데이터 추출")
+            # 데이터 확인
+            if not records:
+                print(f"  - 파일에서 데이터를 찾을 수 없음: {filename}")
+                continue
+
+            if kind == "speech_by_meeting":
+                print(f"{filename}: {len(records)}개의 회의별 발언 데이터 발견")
+                process_speech_data(records, db, resolver)
+            elif kind == "keywords":
+                print(f"{filename}: {len(records)}개의 키워드 데이터 발견")
+                process_keyword_data(records, db, resolver)
+            elif kind == "attendance":
+                # 출석 데이터는 모든 파일을 모은 뒤 한 번에 처리
+                all_attendance_data.extend(records)
+                print(f"{filename}: {len(records)}개의 출석 데이터 추출")
+            elif kind == "asset":
+                stats = load_asset_records(db, records)
+                print(f"{filename}: {stats['inserted']}개의 재산 상세 데이터 저장 완료 "
+                      f"(같은 연월의 기존 {stats['deleted']}개 교체)")
+            
+            processed_counts[kind] += 1
+            
         except Exception as e:
+            db.rollback()
             print(f"  - 파일 처리 오류: {filename}, 오류: {str(e)}")
     
-    # 출석 데이터 처리
-    if all_attendance_data:
+    print(f"회의별 발언 데이터 처리 완료: {processed_counts['speech_by_meeting']}/{len(speech_files)}개 파일")
+    print(f"키워드 데이터 처리 완료: {processed_counts['keywords']}/{len(keyword_files)}개 파일")
+
+    # 3. 출석 데이터 처리
+    print("\n=== 출석 데이터 수집 ===")
+    attendance_hash = compute_rows_hash(all_attendance_data) if all_attendance_data else None
+    if all_attendance_data and is_unchanged(db, "attendance_excel", attendance_hash):
+        # 마지막으로 반영한 출석 파일과 내용이 같으면 삭제/재저장하지 않음 (데이터 버전 유지)
+        print(f"출석 데이터 변경 없음 ({len(all_attendance_data)}개). 스킵합니다.")
+    elif all_attendance_data:
         print(f"\n총 {len(all_attendance_data)}개의 출석 데이터 처리 중...")
         
         # 기존 출석 데이터 모두 초기화
@@ -810,71 +983,34 @@ def fetch_excel_data(db: Session):
         print(f"기존 출석 데이터 {deleted_count}개 삭제됨")
         
         # 모든 출석 데이터 한 번에 처리
-        process_attendance_data(all_attendance_data, db)
+        process_attendance_data(all_attendance_data, db, resolver)
+        update_sync_state(db, "attendance_excel", total_count=len(all_attendance_data), row_hash=attendance_hash)
     else:
         print("처리할 출석 데이터가 없습니다.")
     
-    print(f"출석 데이터 처리 완료: {processed_count}개 파일")
+    print(f"출석 데이터 처리 완료: {processed_counts['attendance']}개 파일")
     
     # 4. 재산 데이터 처리
+    # (재산 상세는 파일의 연월 단위로 교체하고, 의원별 총 재산은 가장 최근 연월 기준으로 계산)
     print("\n=== 재산 데이터 수집 ===")
-    asset_dir = "data/excel/asset"
-    
-    # 폴더 존재 확인 및 생성
-    if not os.path.exists(asset_dir):
-        os.makedirs(asset_dir, exist_ok=True)
-        print(f"폴더 생성: {asset_dir}")
-        print("재산 데이터가 없습니다. 먼저 엑셀 파일을 넣으세요.")
+    if asset_files:
+        # 의원별 총 재산을 Legislator.asset 필드에 처리
+        if processed_counts["asset"] > 0:
+            process_asset_data(db)
+            # 재산 통계는 점수 재계산 대상이 아니므로 여기서 스냅샷 갱신
+            refresh_stats_snapshot(db)
+        
+        print(f"재산 데이터 처리 완료: {processed_counts['asset']}개 파일")
     else:
-        # 재산 파일 목록 가져오기 (asset_2025_03.xlsx 이름을 기본으로)
-        asset_files = [os.path.join(asset_dir, "asset_2025_03.xlsx")]
-        
-        # 지정된 파일이 없으면 모든 엑셀 파일 확인
-        if not os.path.exists(asset_files[0]):
-            print(f"기본 파일명 'asset_2025_03.xlsx'을 찾을 수 없습니다. 다른 엑셀 파일을 확인합니다.")
-            asset_files = glob.glob(os.path.join(asset_dir, "*.xlsx"))
-            
-        # 임시 파일 필터링
-        asset_files = [f for f in asset_files if os.path.exists(f) and '~$' not in os.path.basename(f)]
-        
-        if asset_files:
-            print(f"재산 엑셀 파일: {len(asset_files)}개")
-            
-            # AssetDetailed 테이블 초기화 - 항상 데이터 삭제 후 시작
-            from app.models.assetdetailed import AssetDetailed
-            existing_count = db.query(AssetDetailed).count()
-            if existing_count > 0:
-                print(f"기존 AssetDetailed 데이터 {existing_count}개 삭제 중...")
-                db.query(AssetDetailed).delete()
-                db.commit()
-                print("AssetDetailed 테이블 초기화 완료")
-            
-            # 재산 파일 처리
-            processed_count = 0
-            for file_path in asset_files:
-                filename = os.path.basename(file_path)
-                print(f"파일 처리 중: {filename}")
-                
-                try:
-                    # 이미 구현된 parse_asset_excel 함수 사용
-                    from app.utils.excel_parser import parse_asset_excel
-                    records_count = parse_asset_excel(file_path, db)
-                    if records_count > 0:
-                        processed_count += 1
-                        print(f"  - {records_count}개의 재산 상세 데이터 저장 완료")
-                except Exception as e:
-                    print(f"  - 파일 처리 오류: {filename}, 오류: {str(e)}")
-            
-            # 의원별 총 재산을 Legislator.asset 필드에 처리
-            if processed_count > 0:
-                from app.services.data_processing import process_asset_data
-                process_asset_data(db)
-            
-            print(f"재산 데이터 처리 완료: {processed_count}개 파일")
-        else:
-            print("처리할 재산 데이터 파일이 없습니다.")
+        print("처리할 재산 데이터 파일이 없습니다.")
     
-    print("\n엑셀 데이터 수집 완료")
+    print(f"\n엑셀 데이터 수집 완료 ({time.time() - start_time:.1f}초)")
 
 if __name__ == "__main__":
-    fetch_all_data()
\ No newline at end of file
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="국회 데이터 수집")
+    parser.add_argument("--full", action="store_true", help="수집 상태를 무시하고 전체 데이터를 다시 반영")
+    args = parser.parse_args()
+    
+    fetch_all_data(full=args.full)
\ No newline at end of file
@@ -15,6 +15,7 @@ from app.models.speech import SpeechKeyword, SpeechByMeeting
 from app.models.attendance import Attendance
 from app.models.bill import Bill, BillCoProposer
 from app.models.vote import Vote, VoteResult
+from app.services.data_version_service import bump_data_version
 
 def reset_scores(db: Session = None):
     """
@@ -45,6 +46,7 @@ def reset_scores(db: Session = None):
         })
         
         db.commit()
+        bump_data_version(db, "scores")
         print(f"초기화 완료: {result}명의 의원 점수가 초기화되었습니다.")
         
     except Exception as e:
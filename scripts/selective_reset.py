@@ -13,6 +13,9 @@ from app.models.vote import Vote, VoteResult
 from app.models.speech import SpeechKeyword, SpeechByMeeting
 from app.models.attendance import Attendance
 from app.models.sns import LegislatorSNS
+from app.models.sync_state import SyncState
+from app.models.data_version import DataVersion
+from app.models.stats_snapshot import StatsSnapshot
 
 def reset_selected_tables(preserve_legislators=True, preserve_bills=False, preserve_votes=False):
     """
@@ -38,6 +41,9 @@ def reset_selected_tables(preserve_legislators=True, preserve_bills=False, prese
             CommitteeMember.__tablename__,  # 위원회 멤버십
             CommitteeHistory.__tablename__,  # 위원회 경력
             Committee.__tablename__,  # 위원회
+            SyncState.__tablename__,  # 수집 상태 (초기화된 테이블을 다시 전체 수집하도록)
+            DataVersion.__tablename__,  # 데이터 버전 (초기화 후 점수를 다시 계산하도록)
+            StatsSnapshot.__tablename__,  # 통계 스냅샷 (점수 계산 시 다시 생성)
         ]
         
         # 표결 정보를 보존하지 않을 경우 표결 관련 테이블도 재생성 대상에 추가